@@ -1,7 +1,19 @@
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.security import get_current_active_user
+from app.infra.async_repository import run_read_only
+from app.infra.loading import ALBUM_WITH_COVER
+from app.infra.pagination import InvalidCursorError, paginate
+from app.infra.read_models import dump_page
+from app.domain.album import Album
+from app.services.album_service import AlbumService
+from app.services.group_service import GroupService
 
 router = APIRouter(prefix="/albums", tags=["albums"])
 
@@ -23,16 +35,32 @@ class AlbumResponse(BaseModel):
     auto_criteria: Optional[str]
     is_public: bool
     cover_photo_id: Optional[int]
+    cover_photo_url: Optional[str] = None
     created_by_id: int
     group_id: Optional[int]
     is_active: bool
     photo_count: int = 0
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
 
+class AlbumListResponse(BaseModel):
+    items: List[AlbumResponse]
+    next_cursor: Optional[str] = None
+
+
+class UserAlbumResponse(AlbumResponse):
+    permission: str  # 'owner', 'admin', 'edit', 'view'
+
+
+class UserAlbumListResponse(BaseModel):
+    items: List[UserAlbumResponse]
+    next_cursor: Optional[str] = None
+
+
 class AlbumUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
@@ -41,7 +69,21 @@ class AlbumUpdate(BaseModel):
 
 
 class AlbumPhotoAdd(BaseModel):
-    photo_ids: List[int]
+    photo_ids: List[int] = Field(..., min_length=1, max_length=settings.max_bulk_photo_ids)
+
+
+class AlbumPhotoRemove(BaseModel):
+    photo_ids: List[int] = Field(..., min_length=1, max_length=settings.max_bulk_photo_ids)
+
+
+class AlbumPhotoAddResponse(BaseModel):
+    added: int
+    skipped: int  # 이미 앨범에 있거나, 없거나, 볼 수 없는 사진
+
+
+class AlbumPhotoRemoveResponse(BaseModel):
+    removed: int
+    skipped: int  # 앨범에 없던 사진
 
 
 class AlbumShareCreate(BaseModel):
@@ -71,6 +113,35 @@ async def create_album(album_data: AlbumCreate):
     )
 
 
+@router.get("/mine", response_model=UserAlbumListResponse)
+async def get_my_albums(
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """내 앨범 목록 조회 (만든/공유받은/가입한 그룹의 앨범, 최근 수정순, 앨범별 유효 권한 포함)"""
+    try:
+        rows = await run_read_only(
+            db,
+            lambda session: AlbumService(session).get_user_albums(
+                current_user.id, limit=limit, cursor=cursor, profile=ALBUM_WITH_COVER
+            )
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    page = paginate(rows, limit, key=lambda row: (row[0].updated_at, row[0].id))
+    page["items"] = [
+        UserAlbumResponse(**AlbumResponse.model_validate(album).model_dump(), permission=permission)
+        for album, permission in rows
+    ]
+    return page
+
+
 @router.get("/{album_id}", response_model=AlbumResponse)
 async def get_album(album_id: int):
     """앨범 정보 조회"""
@@ -81,19 +152,59 @@ async def get_album(album_id: int):
     )
 
 
-@router.get("/", response_model=List[AlbumResponse])
+@router.get("/", response_model=AlbumListResponse)
 async def get_albums(
     album_type: Optional[str] = None,
     group_id: Optional[int] = None,
     created_by: Optional[int] = None,
-    skip: int = 0,
-    limit: int = 50
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """앨범 목록 조회"""
-    # TODO: AlbumService를 통한 앨범 목록 조회
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Get albums not implemented yet"
+    """앨범 목록 조회 (최근 수정순, next_cursor로 다음 페이지 조회)
+
+    그룹을 지정하면 그룹 멤버만 조회할 수 있고, 지정하지 않으면 본인이 만든 앨범을 조회
+    """
+    if group_id is not None:
+        is_member = await run_read_only(
+            db,
+            lambda session: GroupService(session).is_member(group_id, current_user.id)
+        )
+        if not is_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not a member of this group"
+            )
+    elif created_by is None:
+        created_by = current_user.id
+    elif created_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot list albums created by other users"
+        )
+
+    try:
+        albums = await run_read_only(
+            db,
+            lambda session: AlbumService(session).get_album_cards(
+                created_by_id=created_by,
+                group_id=group_id,
+                album_type=album_type,
+                limit=limit,
+                cursor=cursor
+            )
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    # 읽기 모델을 응답 모델 검증 없이 바로 JSON으로 직렬화
+    return Response(
+        dump_page(albums, limit, key=lambda album: (album.updated_at, album.id)),
+        media_type="application/json"
     )
 
 
@@ -117,24 +228,68 @@ async def delete_album(album_id: int):
     )
 
 
-@router.post("/{album_id}/photos")
-async def add_photos_to_album(album_id: int, photo_data: AlbumPhotoAdd):
-    """앨범에 사진 추가"""
-    # TODO: AlbumService를 통한 앨범에 사진 추가
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Add photos to album not implemented yet"
-    )
+def _editable_album(service: AlbumService, album_id: int, user_id: int) -> Album:
+    """편집 권한이 있는 앨범 조회 (없으면 404, 권한이 없으면 403)"""
+    album = service.get_album_by_id(album_id)
+    if not album:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Album not found"
+        )
+    if not service.can_edit_album(album, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No permission to edit this album"
+        )
+    return album
+
+
+@router.post("/{album_id}/photos", response_model=AlbumPhotoAddResponse)
+async def add_photos_to_album(
+    album_id: int,
+    photo_data: AlbumPhotoAdd,
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """앨범에 사진 일괄 추가 (본인이 올렸거나 속한 그룹의 사진만 추가)"""
+    def _add(session: Session):
+        service = AlbumService(session)
+        _editable_album(service, album_id, current_user.id)
+        return service.add_photos_to_album(album_id, photo_data.photo_ids, user_id=current_user.id)
+
+    return await db.run_sync(_add)
 
 
-@router.delete("/{album_id}/photos/{photo_id}")
-async def remove_photo_from_album(album_id: int, photo_id: int):
+@router.delete("/{album_id}/photos", response_model=AlbumPhotoRemoveResponse)
+async def remove_photos_from_album(
+    album_id: int,
+    photo_data: AlbumPhotoRemove,
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """앨범에서 사진 일괄 제거"""
+    def _remove(session: Session):
+        service = AlbumService(session)
+        _editable_album(service, album_id, current_user.id)
+        return service.remove_photos_from_album(album_id, photo_data.photo_ids)
+
+    return await db.run_sync(_remove)
+
+
+@router.delete("/{album_id}/photos/{photo_id}", response_model=AlbumPhotoRemoveResponse)
+async def remove_photo_from_album(
+    album_id: int,
+    photo_id: int,
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
     """앨범에서 사진 제거"""
-    # TODO: AlbumService를 통한 앨범에서 사진 제거
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Remove photo from album not implemented yet"
-    )
+    def _remove(session: Session):
+        service = AlbumService(session)
+        _editable_album(service, album_id, current_user.id)
+        return service.remove_photos_from_album(album_id, [photo_id])
+
+    return await db.run_sync(_remove)
 
 
 @router.post("/{album_id}/share", response_model=AlbumShareResponse)
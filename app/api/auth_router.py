@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel, EmailStr
+from redis.asyncio import Redis
 from app.services.auth_service import AuthService
-from app.core.database import get_db
-from sqlalchemy.orm import Session
+from app.core.database import get_async_db
+from app.core.redis import get_redis
+from app.core.security import AuthContext, get_auth_context
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 security = HTTPBearer()
@@ -35,46 +38,68 @@ class LogoutResponse(BaseModel):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(
+    login_data: LoginRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis)
+):
     """사용자 로그인
 
     Args:
         login_data: 이메일과 비밀번호
+        request: 요청 (클라이언트 IP와 User-Agent)
         db: 데이터베이스 세션
+        redis_client: 공유 Redis 클라이언트
 
     Returns:
         JWT 액세스 토큰과 리프레시 토큰
 
     Raises:
-        HTTPException: 인증 실패 시
+        HTTPException: 인증 실패 시, 시도 제한을 넘은 경우 (429)
     """
-    auth_service = AuthService(db)
-    return await auth_service.login(login_data.email, login_data.password)
+    auth_service = AuthService(db, redis_client)
+    return await auth_service.login(
+        login_data.email,
+        login_data.password,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent")
+    )
 
 
 @router.post("/logout", response_model=LogoutResponse)
-async def logout(token: str = Depends(security), db: Session = Depends(get_db)):
+async def logout(
+    token: str = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis)
+):
     """사용자 로그아웃
 
     Args:
         token: Bearer 토큰
         db: 데이터베이스 세션
+        redis_client: 공유 Redis 클라이언트
 
     Returns:
         로그아웃 성공 메시지
     """
-    auth_service = AuthService(db)
+    auth_service = AuthService(db, redis_client)
     await auth_service.logout(token.credentials)
     return LogoutResponse(message="Successfully logged out")
 
 
 @router.post("/refresh", response_model=LoginResponse)
-async def refresh_token(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+async def refresh_token(
+    refresh_data: RefreshRequest,
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis)
+):
     """토큰 갱신
 
     Args:
         refresh_data: 리프레시 토큰
         db: 데이터베이스 세션
+        redis_client: 공유 Redis 클라이언트
 
     Returns:
         새로운 액세스 토큰과 리프레시 토큰
@@ -82,20 +107,25 @@ async def refresh_token(refresh_data: RefreshRequest, db: Session = Depends(get_
     Raises:
         HTTPException: 토큰이 유효하지 않을 시
     """
-    auth_service = AuthService(db)
+    auth_service = AuthService(db, redis_client)
     return await auth_service.refresh_token(refresh_data.refresh_token)
 
 
 @router.get("/me")
-async def get_current_user_profile(token: str = Depends(security), db: Session = Depends(get_db)):
+async def get_current_user_profile(
+    context: AuthContext = Depends(get_auth_context),
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis)
+):
     """현재 인증된 사용자 프로필 조회
 
     Args:
-        token: Bearer 토큰
+        context: 인증 결과 (토큰, 세션, 폐기 여부를 확인한 주체와 세션)
         db: 데이터베이스 세션
+        redis_client: 공유 Redis 클라이언트
 
     Returns:
         사용자 프로필 정보
     """
-    auth_service = AuthService(db)
-    return await auth_service.get_current_user(token.credentials)
\ No newline at end of file
+    auth_service = AuthService(db, redis_client)
+    return await auth_service.get_profile(context)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
+from typing import Literal, Optional
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.config import settings
+from app.core.database import get_async_db, get_async_session_factory
+from app.core.security import get_current_active_user
+from app.infra.async_repository import run_read_only
+from app.services.export_service import EXPORT_MEDIA_TYPES, ExportService
+from app.services.group_service import GroupService
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+@router.get("/{kind}")
+async def export_metadata(
+    kind: Literal["photos", "faces", "albums"],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    group_id: Optional[int] = None,
+    taken_from: Optional[datetime] = None,
+    taken_to: Optional[datetime] = None,
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory)
+):
+    """사진/얼굴/앨범 메타데이터 내보내기 (NDJSON 또는 CSV 스트리밍)
+
+    그룹을 지정하면 그룹 멤버만 내보낼 수 있고, 지정하지 않으면 본인의 데이터를 내보냄.
+    taken_from/taken_to는 사진 촬영 시각 기준 필터 (사진/얼굴)
+    """
+    if group_id is not None:
+        is_member = await run_read_only(
+            db,
+            lambda session: GroupService(session).is_member(group_id, current_user.id)
+        )
+        if not is_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not a member of this group"
+            )
+
+    scope = {"group_id": group_id, "user_id": current_user.id}
+    if kind != "albums":
+        scope.update(taken_from=taken_from, taken_to=taken_to)
+
+    async def body():
+        # 요청 세션은 본문 전송 전에 닫히므로 스트리밍 동안 사용할 세션을 따로 연다
+        async with session_factory() as session:
+            async for chunk in ExportService(session).export(
+                kind, format, batch_size=settings.export_batch_size, **scope
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{kind}.{format}"'}
+    )
@@ -1,7 +1,15 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.security import require_admin
+from app.infra.async_repository import run_read_only
+from app.infra.pagination import InvalidCursorError
+from app.infra.read_models import dump_page
+from app.services.face_service import FaceService
 
 router = APIRouter(prefix="/faces", tags=["faces"])
 
@@ -27,6 +35,11 @@ class FaceResponse(BaseModel):
         from_attributes = True
 
 
+class FaceListResponse(BaseModel):
+    items: List[FaceResponse]
+    next_cursor: Optional[str] = None
+
+
 class FaceIdentify(BaseModel):
     user_id: int
 
@@ -68,16 +81,31 @@ class FaceCollectionResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/unidentified", response_model=List[FaceResponse])
+@router.get("/unidentified", response_model=FaceListResponse)
 async def get_unidentified_faces(
-    skip: int = 0,
-    limit: int = 50
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    current_user=Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """미식별 얼굴 목록 조회"""
-    # TODO: FaceService를 통한 미식별 얼굴 목록 조회
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Get unidentified faces not implemented yet"
+    """미식별 얼굴 목록 조회 (관리자 전용, 최신순, next_cursor로 다음 페이지 조회)"""
+    try:
+        faces = await run_read_only(
+            db,
+            lambda session: FaceService(session).get_unidentified_face_cards(
+                limit=limit, cursor=cursor
+            )
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    # 읽기 모델을 응답 모델 검증 없이 바로 JSON으로 직렬화
+    return Response(
+        dump_page(faces, limit, key=lambda face: (face.created_at, face.id)),
+        media_type="application/json"
     )
 
 
@@ -1,7 +1,16 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.security import get_current_active_user, run_password_hashes
+from app.domain.roster import RosterImportResult
+from app.services.group_service import GroupService
+from app.services.roster_service import RosterFormatError, RosterService, parse_roster
 
 router = APIRouter(prefix="/groups", tags=["groups"])
 
@@ -24,6 +33,7 @@ class GroupResponse(BaseModel):
     is_active: bool
     is_public: bool
     max_members: int
+    member_count: int = 0
     created_by_id: int
     created_at: datetime
 
@@ -107,4 +117,60 @@ async def get_group_members(group_id: int):
     raise HTTPException(
         status_code=status.HTTP_501_NOT_IMPLEMENTED,
         detail="Get group members not implemented yet"
-    )
\ No newline at end of file
+    )
+
+
+@router.post("/{group_id}/roster", response_model=RosterImportResult)
+async def import_roster(
+    group_id: int,
+    file: UploadFile = File(...),
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """명단(CSV 또는 JSON) 일괄 가져오기 (그룹 관리자 전용)
+
+    열/키: email, username, password, full_name(선택), role(member/admin, 선택).
+    이미 가입한 이메일은 그룹에만 추가하고, 가져오지 못한 행은 errors에 행 번호와 사유로 담는다.
+    """
+    is_json = (file.filename or "").lower().endswith(".json") or file.content_type == "application/json"
+    try:
+        rows = parse_roster(await file.read(), "json" if is_json else "csv", settings.roster_max_rows)
+    except RosterFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    def _prepare(session: Session):
+        if not GroupService(session).is_admin(group_id, current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only group admins can import a roster"
+            )
+        plan = RosterService(session).prepare(group_id, rows)
+        if plan is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Group not found"
+            )
+        return plan
+
+    plan = await db.run_sync(_prepare)
+    # 해싱은 수십 초 걸릴 수 있으므로 읽기 트랜잭션을 끝내 커넥션을 풀에 돌려준 뒤,
+    # 이벤트 루프 밖 공유 해싱 풀(로그인과 같은 풀, 자리 일부만 사용)에서 실행
+    await db.rollback()
+    hashed = await run_password_hashes(plan.passwords, settings.roster_hash_workers)
+
+    try:
+        return await db.run_sync(lambda session: RosterService(session).apply(plan, hashed))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except IntegrityError:
+        # prepare 이후 다른 요청이 명단의 이메일/사용자명으로 가입함 (아무것도 추가하지 않음)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Some roster users were registered concurrently, please retry"
+        )
@@ -1,7 +1,17 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, status, Form
+from fastapi import APIRouter, UploadFile, File, HTTPException, status, Form, Depends, Query, Response
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.security import get_current_active_user
+from app.infra.async_repository import run_read_only
+from app.infra.loading import PHOTO_DETAIL
+from app.infra.pagination import InvalidCursorError
+from app.infra.read_models import dump_page
+from app.services.group_service import GroupService
+from app.services.photo_service import PhotoService
 
 router = APIRouter(prefix="/photos", tags=["photos"])
 
@@ -25,6 +35,7 @@ class PhotoResponse(BaseModel):
     group_id: Optional[int]
     is_processed: bool
     is_active: bool
+    face_count: int = 0
     taken_at: Optional[datetime]
     created_at: datetime
 
@@ -32,6 +43,11 @@ class PhotoResponse(BaseModel):
         from_attributes = True
 
 
+class PhotoListResponse(BaseModel):
+    items: List[PhotoResponse]
+    next_cursor: Optional[str] = None
+
+
 class PhotoUpdate(BaseModel):
     group_id: Optional[int] = None
 
@@ -47,6 +63,22 @@ class PhotoTagResponse(BaseModel):
         from_attributes = True
 
 
+class PhotoFaceResponse(BaseModel):
+    id: int
+    confidence: float
+    bounding_box: dict
+    identified_user_id: Optional[int]
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+
+
+class PhotoDetailResponse(PhotoResponse):
+    tags: List[PhotoTagResponse]
+    faces: List[PhotoFaceResponse]
+
+
 @router.post("/upload", response_model=PhotoResponse, status_code=status.HTTP_201_CREATED)
 async def upload_photo(
     file: UploadFile = File(...),
@@ -65,28 +97,91 @@ async def upload_photo(
     )
 
 
-@router.get("/{photo_id}", response_model=PhotoResponse)
-async def get_photo(photo_id: int):
-    """사진 정보 조회"""
-    # TODO: PhotoService를 통한 사진 조회
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Get photo not implemented yet"
-    )
-
-
-@router.get("/", response_model=List[PhotoResponse])
+@router.get("/{photo_id}", response_model=PhotoDetailResponse)
+async def get_photo(
+    photo_id: int,
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """사진 상세 조회 (태그, 얼굴 포함)
+
+    업로드한 사용자 또는 사진이 속한 그룹의 멤버만 조회할 수 있음
+    """
+    def _load(session):
+        photo = PhotoService(session).get_photo_by_id(photo_id, profile=PHOTO_DETAIL)
+        if photo is None:
+            return None, False
+        allowed = photo.uploaded_by_id == current_user.id or (
+            photo.group_id is not None
+            and GroupService(session).is_member(photo.group_id, current_user.id)
+        )
+        return photo, allowed
+
+    photo, allowed = await run_read_only(db, _load)
+    if photo is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Photo not found"
+        )
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No permission to view this photo"
+        )
+    return photo
+
+
+@router.get("/", response_model=PhotoListResponse)
 async def get_photos(
     group_id: Optional[int] = None,
     uploaded_by: Optional[int] = None,
-    skip: int = 0,
-    limit: int = 50
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    current_user=Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """사진 목록 조회"""
-    # TODO: PhotoService를 통한 사진 목록 조회
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Get photos not implemented yet"
+    """사진 목록 조회 (최신순, next_cursor로 다음 페이지 조회)
+
+    그룹을 지정하면 그룹 멤버만 조회할 수 있고, 지정하지 않으면 본인이 업로드한 사진을 조회
+    """
+    if group_id is not None:
+        is_member = await run_read_only(
+            db,
+            lambda session: GroupService(session).is_member(group_id, current_user.id)
+        )
+        if not is_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not a member of this group"
+            )
+    elif uploaded_by is None:
+        uploaded_by = current_user.id
+    elif uploaded_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot list photos uploaded by other users"
+        )
+
+    try:
+        photos = await run_read_only(
+            db,
+            lambda session: PhotoService(session).get_photo_cards(
+                group_id=group_id,
+                uploaded_by_id=uploaded_by,
+                limit=limit,
+                cursor=cursor
+            )
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    # 읽기 모델을 응답 모델 검증 없이 바로 JSON으로 직렬화
+    return Response(
+        dump_page(photos, limit, key=lambda photo: (photo.created_at, photo.id)),
+        media_type="application/json"
     )
 
 
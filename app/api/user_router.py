@@ -2,8 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.core.principal import Principal
 from app.core.security import get_current_active_user
-from app.domain.user import User
+from app.infra.async_repository import AsyncUserRepository
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -46,9 +49,15 @@ async def create_user(user_data: UserCreate):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
-    """현재 로그인된 사용자 정보 조회"""
-    return current_user
+async def get_current_user_info(
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """현재 로그인된 사용자 정보 조회 (인증 주체에는 프로필 컬럼이 없으므로 사용자를 조회)"""
+    user = await AsyncUserRepository(db).get_by_id(current_user.id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
 
 
 @router.get("/{user_id}", response_model=UserResponse)
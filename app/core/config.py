@@ -1,26 +1,71 @@
-from pydantic_settings import BaseSettings
 from typing import Optional
+from app.core.pooling import DatabaseSettings
 
 
-class Settings(BaseSettings):
-    """애플리케이션 설정"""
+class Settings(DatabaseSettings):
+    """애플리케이션 설정 (데이터베이스 연결/풀 설정은 DatabaseSettings에서 상속)"""
 
     # 애플리케이션 기본 설정
     app_name: str = "Dandle Backend API"
     app_version: str = "1.0.0"
     debug: bool = False
 
-    # 데이터베이스 설정
-    database_url: str = "sqlite:///./dandle_dev.db"
+    # 비정규화 카운터 설정
+    counter_reconcile_interval_seconds: float = 3600.0  # 비정규화 카운터 복구 주기 (0이면 비활성화)
+
+    # 소프트 삭제 행 보존 설정
+    retention_days: float = 30.0  # 소프트 삭제 후 영구 삭제까지 보존 기간
+    retention_interval_seconds: float = 86400.0  # 보존 기간 정리 주기 (0이면 비활성화)
+    retention_batch_size: int = 500  # 정리 배치(트랜잭션) 하나의 행 수
+
+    # 파티션 유지 설정 (DB_PARTITIONING=range인 PostgreSQL에서만 실행)
+    partition_maintenance_interval_seconds: float = 86400.0  # 미래 파티션 생성/오래된 파티션 분리 주기 (0이면 비활성화)
 
     # Redis 설정
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 50  # 프로세스당 최대 커넥션 수 (모두 사용 중이면 대기)
+    redis_pool_timeout_seconds: float = 2.0  # 커넥션을 기다리는 최대 시간
+    redis_socket_timeout_seconds: float = 2.0  # 명령 응답을 기다리는 최대 시간
+    redis_socket_connect_timeout_seconds: float = 2.0
+    redis_health_check_interval_seconds: int = 30  # 이보다 오래 쉰 커넥션은 사용 전 PING으로 확인
 
     # JWT 설정
     jwt_secret: str  # 환경 변수에서 필수로 설정해야 함
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60 * 24 * 7  # 7일
 
+    # 무상태 액세스 토큰 설정 (켜면 액세스 토큰을 키링의 비대칭 키로 서명, 검증에 Redis/DB 조회 없음)
+    jwt_stateless_access_tokens: bool = False
+    jwt_asymmetric_algorithm: str = "RS256"
+    jwt_stateless_access_minutes: int = 15  # 무상태 액세스 토큰 수명 (로그아웃/비활성화가 반영되기까지의 최대 지연)
+    jwt_keyring_path: str = "jwt_keyring.json"  # 개인 키가 담긴 키링 파일 (워커들이 공유, 저장소에 커밋하지 않음)
+    jwt_key_rotation_days: int = 30  # 서명 키 교체 주기
+    jwks_max_age_seconds: int = 600  # JWKS 응답 캐시 시간 (새 키는 이만큼 먼저 공개한 뒤 서명에 사용)
+
+    # 비밀번호 해싱 설정 (로그인/비밀번호 변경의 bcrypt를 이벤트 루프 밖 스레드 풀에서 실행)
+    password_hash_workers: Optional[int] = None  # 동시에 실행하는 해싱/검증 수 (비워 두면 CPU 수)
+    password_hash_queue_timeout_seconds: float = 2.0  # 실행 자리를 기다리는 최대 시간 (넘으면 503)
+
+    # 로그인 시도 제한 설정 (Redis GCRA, 사용자 조회/bcrypt 검증 전에 계정/IP별로 확인해 넘으면 429)
+    login_rate_limit_enabled: bool = True
+    login_email_rate_limit: int = 10  # 계정(이메일)별로 login_rate_period_seconds 동안 허용하는 시도 수
+    login_ip_rate_limit: int = 50  # 클라이언트 IP별로 login_rate_period_seconds 동안 허용하는 시도 수
+    login_rate_period_seconds: float = 60.0
+
+    # 토큰 폐기 필터 설정 (워커마다 Bloom 필터로 폐기 여부를 먼저 확인, 필터에 있을 때만 Redis 조회)
+    revocation_filter_enabled: bool = True
+    revocation_filter_capacity: int = 100000  # 필터 기본 크기 (스트림이 더 길면 다시 만들 때 키움)
+    revocation_filter_error_rate: float = 0.001  # 거짓 양성 비율 (거짓 양성은 Redis 조회 한 번)
+    revocation_filter_rebuild_seconds: float = 3600.0  # 만료되어 스트림에서 잘린 토큰을 빼기 위해 다시 만드는 주기
+
+    # 인증 설정
+    auth_session_check: bool = True  # 토큰의 세션/폐기 여부를 인증마다 확인 (Redis 한 번 왕복, 끄면 토큰 만료까지 유효)
+
+    # 인증 주체(principal) 캐시 설정
+    principal_cache_ttl_seconds: float = 30.0  # 프로세스 로컬 캐시 유지 시간 (무효화 메시지를 놓쳤을 때의 최대 지연, 0이면 비활성화)
+    principal_cache_max_entries: int = 10000  # 프로세스 로컬 캐시 최대 사용자 수 (넘으면 가장 오래 안 쓴 항목 제거)
+    principal_redis_ttl_seconds: int = 300  # Redis 공유 캐시 유지 시간 (로컬 캐시 유지 시간을 넘으면 그 값으로 제한)
+
     # AWS 설정
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
@@ -53,6 +98,12 @@ class Settings(BaseSettings):
     default_page_size: int = 50
     max_page_size: int = 100
 
+    # 일괄 작업 설정
+    max_bulk_photo_ids: int = 5000  # 앨범 사진 일괄 추가/제거 1회 요청당 최대 ID 수
+    export_batch_size: int = 1000  # 메타데이터 내보내기 시 서버 측 커서에서 한 번에 읽는 행 수
+    roster_max_rows: int = 2000  # 명단 가져오기 1회 요청당 최대 행 수
+    roster_hash_workers: Optional[int] = None  # 명단 비밀번호 해싱에 쓰는 공유 해싱 풀 자리 수 (비워 두면 풀 크기의 절반)
+
     # 얼굴 인식 설정
     face_similarity_threshold: float = 0.8
     face_confidence_threshold: float = 0.8
@@ -60,6 +111,7 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+        extra = "forbid"
 
 
 # 전역 설정 인스턴스
@@ -1,34 +1,30 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
-import os
-from typing import Generator
-
-# 환경 변수에서 데이터베이스 URL 가져오기
-DATABASE_URL = os.getenv(
-    "DATABASE_URL",
-    "sqlite:///./dandle_dev.db"
-)
+from sqlalchemy.orm import Session, ORMExecuteState, raiseload, sessionmaker
+import time
+from contextlib import contextmanager
+from typing import AsyncGenerator, Generator, Optional
+from app.core.metrics import metrics
+from app.core.pooling import DatabaseSettings, configure_sqlite, engine_options
+from app.core.replicas import Replica, ReplicaSet, instrument_engine
 
-# SQLAlchemy 엔진 생성
-if DATABASE_URL.startswith("sqlite"):
-    # SQLite용 설정
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        echo=False
-    )
-else:
-    # PostgreSQL용 설정
-    engine = create_engine(
-        DATABASE_URL,
-        poolclass=QueuePool,
-        pool_size=10,
-        max_overflow=20,
-        pool_pre_ping=True,
-        echo=False
-    )
+# 데이터베이스 설정 (환경 변수/.env, JWT_SECRET이 없는 Alembic 등에서도 읽을 수 있음)
+database_settings = DatabaseSettings()
+DATABASE_URL = database_settings.database_url
+
+
+def create_db_engine(url: str):
+    """동기 엔진 생성 (풀 크기/SQLite PRAGMA는 database_settings 기준)"""
+    engine = create_engine(url, echo=False, **engine_options(url, database_settings))
+    if url.startswith("sqlite"):
+        configure_sqlite(engine, database_settings)
+    return engine
+
+
+# SQLAlchemy 엔진 생성 (Celery 작업/스크립트/백그라운드 작업용)
+engine = create_db_engine(DATABASE_URL)
+instrument_engine(engine, "primary-sync")
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(
@@ -37,6 +33,124 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환 (SQLite -> aiosqlite, PostgreSQL -> asyncpg)"""
+    scheme, sep, rest = url.partition("://")
+    driver = scheme.split("+")[0]
+    if driver == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if driver in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+# 읽기 복제본 URL (쉼표로 구분, 비어 있으면 모든 쿼리가 primary 사용)
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in database_settings.database_replica_urls.split(",") if url.strip()
+]
+REPLICA_MAX_LAG_SECONDS = database_settings.replica_max_lag_seconds
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    """비동기 엔진 생성 (동기 엔진과 같은 풀/PRAGMA 설정)"""
+    url = to_async_url(url)
+    engine = create_async_engine(url, echo=False, **engine_options(url, database_settings, is_async=True))
+    if url.startswith("sqlite"):
+        configure_sqlite(engine.sync_engine, database_settings)
+    return engine
+
+
+# 비동기 엔진 (요청 처리 경로용)
+async_engine = create_async_db_engine(DATABASE_URL)
+instrument_engine(async_engine, "primary")
+
+replica_set = ReplicaSet(
+    [
+        Replica(f"replica-{index}", create_async_db_engine(url))
+        for index, url in enumerate(DATABASE_REPLICA_URLS)
+    ],
+    max_lag_seconds=REPLICA_MAX_LAG_SECONDS
+)
+for _replica in replica_set.replicas:
+    instrument_engine(_replica.engine, _replica.name)
+
+
+class AsyncBridgeSession(Session):
+    """AsyncSession 내부에서 사용하는 동기 세션
+
+    지연 로딩은 요청 처리 중 예고 없는 DB 왕복을 만들므로 금지하고,
+    관계는 저장소 쿼리에서 joinedload/selectinload로 명시적으로 로딩해야 한다.
+
+    read_only() 구간의 SELECT는 복제본으로 보내고, 쓰기(flush, DML)는 항상 primary를 사용한다.
+    쓰기가 있었던 세션은 복제본이 그 쓰기를 따라잡을 때까지 읽기도 primary를 사용한다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replicas: Optional[ReplicaSet] = self.info.get("replicas")
+        if (
+            replicas
+            and self.info.get("read_only")
+            and not self._flushing
+            and (clause is None or getattr(clause, "is_select", False))
+        ):
+            replica = replicas.choose(wrote_at=self.info.get("wrote_at"))
+            if replica is not None:
+                metrics.increment("db.routed", target=replica.name)
+                return replica.sync_engine
+        metrics.increment("db.routed", target="primary")
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(AsyncBridgeSession, "do_orm_execute")
+def _disable_lazy_loads(execute_state: ORMExecuteState):
+    """모든 ORM SELECT에 raiseload('*') 적용 (명시적으로 지정한 로딩 옵션은 유지)"""
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
+    elif not execute_state.is_select:
+        _mark_write(execute_state.session)
+
+
+@event.listens_for(AsyncBridgeSession, "after_flush")
+def _mark_write(session: Session, flush_context=None):
+    """쓰기 시각 기록 (이후 읽기는 복제 지연이 지날 때까지 primary 사용)"""
+    session.info["wrote_at"] = time.monotonic()
+
+
+@contextmanager
+def read_only(session: Session):
+    """이 구간의 SELECT는 복제본으로 보낼 수 있음을 표시"""
+    previous = session.info.get("read_only", False)
+    session.info["read_only"] = True
+    try:
+        yield session
+    finally:
+        session.info["read_only"] = previous
+
+
+def async_session_factory(bind: AsyncEngine, replicas: Optional[ReplicaSet] = None) -> async_sessionmaker:
+    """비동기 세션 팩토리 생성
+
+    커밋 후 속성 접근이 다시 DB를 조회하지 않도록 expire_on_commit=False
+    """
+    return async_sessionmaker(
+        bind=bind,
+        class_=AsyncSession,
+        sync_session_class=AsyncBridgeSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"replicas": replicas} if replicas else None
+    )
+
+
+AsyncSessionLocal = async_session_factory(async_engine, replica_set)
+
 # Base 클래스 (모든 ORM 모델의 기본 클래스)
 Base = declarative_base()
 
@@ -45,14 +159,47 @@ def get_db() -> Generator:
     """
     데이터베이스 세션 의존성 주입용 함수
     FastAPI의 Depends에서 사용
+
+    요청 단위 Unit of Work: 저장소는 flush만 수행하고,
+    요청이 정상 종료되면 한 번만 커밋, 예외 발생 시 롤백
     """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션 의존성 주입용 함수
+
+    라우터는 이 세션을 사용하고, 동기 get_db는 Celery 작업/스크립트용으로 유지.
+    get_db와 같은 요청 단위 Unit of Work (정상 종료 시 1회 커밋, 예외 시 롤백)
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    비동기 세션 팩토리 의존성 주입용 함수
+
+    StreamingResponse는 의존성 정리(get_async_db의 세션 종료) 이후에 본문을 보내므로,
+    응답 본문을 생성하는 동안 DB를 읽어야 하는 경우 이 팩토리로 세션을 직접 연다.
+    """
+    return AsyncSessionLocal
+
+
 def create_tables():
     """
     모든 테이블 생성
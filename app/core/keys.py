@@ -0,0 +1,206 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import JWTError, jwk
+from jose.backends.base import Key
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KeyEntry:
+    """키링의 서명 키 (activates_at부터 서명에 쓰고, 다음 키가 활성화되면 검증에만 씀)"""
+
+    kid: str
+    activates_at: float
+    private_key: Key
+    public_key: Key
+
+
+class KeyRing:
+    """액세스 토큰 서명용 비대칭 키링 (JSON 파일 하나를 워커들이 공유)
+
+    - 새 키는 JWKS 캐시 시간(publish_ahead)만큼 먼저 공개한 뒤 서명에 쓰므로,
+      JWKS를 캐시한 다른 서비스도 새 키로 서명된 토큰을 검증할 수 있다.
+    - 이전 키는 다음 키가 활성화된 뒤 overlap 동안 JWKS에 남겨, 이미 발급된 토큰이 만료될 때까지 검증된다.
+    - 파싱한 키 객체는 프로세스에 두고, 파일이 바뀌면(다른 워커가 교체) reload_seconds 안에 다시 읽는다.
+    """
+
+    def __init__(self, path: str, algorithm: str, publish_ahead: float, overlap: float,
+                 reload_seconds: float = 30.0):
+        self.path = path
+        self.algorithm = algorithm
+        self.publish_ahead = publish_ahead
+        self.overlap = overlap
+        self.reload_seconds = reload_seconds
+        self._keys: List[KeyEntry] = []
+        self._by_kid: Dict[str, KeyEntry] = {}
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def signing_key(self) -> KeyEntry:
+        """지금 서명에 쓸 키 (활성화된 키 중 가장 최근 키)"""
+        self._reload_if_changed()
+        now = time.time()
+        active = [entry for entry in self._keys if entry.activates_at <= now]
+        if not active:
+            raise RuntimeError(f"No active signing key in {self.path}")
+        return active[-1]
+
+    def verification_key(self, kid: str) -> Key:
+        """kid의 공개 키 (모르는 kid면 파일을 한 번 다시 읽고, 그래도 없으면 JWTError)"""
+        entry = self._by_kid.get(kid)
+        if entry is None:
+            self._reload_if_changed(min_interval=1.0)
+            entry = self._by_kid.get(kid)
+        if entry is None:
+            raise JWTError("Unknown signing key")
+        return entry.public_key
+
+    def jwks(self) -> dict:
+        """공개 키 문서 (RFC 7517 JWK Set, 아직 서명에 쓰지 않는 다음 키와 overlap 중인 이전 키 포함)"""
+        self._reload_if_changed()
+        return {
+            "keys": [
+                {**entry.public_key.to_dict(), "kid": entry.kid, "use": "sig"}
+                for entry in self._keys
+            ]
+        }
+
+    def rotate_if_due(self, rotation_seconds: float) -> bool:
+        """가장 최근 키가 rotation_seconds보다 오래되었으면 새 키 추가 (키가 없으면 바로 활성화되는 키 생성)
+
+        여러 워커가 동시에 호출해도 파일 잠금으로 한 번만 교체한다.
+
+        Returns:
+            새 키를 추가했는지 여부
+        """
+        with open(f"{self.path}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            records = self._read_records()
+            now = time.time()
+            if records and records[-1]["activates_at"] + rotation_seconds > now:
+                return False
+
+            activates_at = now + self.publish_ahead if records else now
+            records.append({
+                "kid": _new_kid(),
+                "activates_at": activates_at,
+                "private_key": _generate_private_key(self.algorithm),
+            })
+            self._write_records(self._prune(records, now))
+            metrics.increment("auth.keyring.rotations")
+
+        self._reload_if_changed(min_interval=0)
+        return True
+
+    def _prune(self, records: List[dict], now: float) -> List[dict]:
+        """다음 키가 활성화된 지 overlap이 지난 키 제거"""
+        kept = []
+        for record, successor in zip(records, records[1:] + [None]):
+            if successor is None or successor["activates_at"] + self.overlap > now:
+                kept.append(record)
+        return kept
+
+    def _reload_if_changed(self, min_interval: Optional[float] = None) -> None:
+        interval = self.reload_seconds if min_interval is None else min_interval
+        if self._keys and time.monotonic() - self._checked_at < interval:
+            return
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                return
+            if mtime == self._mtime:
+                return
+
+            keys = []
+            for record in self._read_records():
+                private_key = jwk.construct(record["private_key"], self.algorithm)
+                keys.append(KeyEntry(
+                    kid=record["kid"],
+                    activates_at=record["activates_at"],
+                    private_key=private_key,
+                    public_key=private_key.public_key(),
+                ))
+            self._keys = keys
+            self._by_kid = {entry.kid: entry for entry in keys}
+            self._mtime = mtime
+            logger.info("Loaded %d signing keys from %s", len(keys), self.path)
+
+    def _read_records(self) -> List[dict]:
+        try:
+            with open(self.path) as f:
+                return sorted(json.load(f)["keys"], key=lambda record: record["activates_at"])
+        except FileNotFoundError:
+            return []
+
+    def _write_records(self, records: List[dict]) -> None:
+        """임시 파일에 쓴 뒤 교체 (읽는 워커가 쓰다 만 파일을 보지 않도록, 소유자만 읽기 가능)"""
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"keys": records}, f)
+        os.replace(tmp_path, self.path)
+
+
+def _new_kid() -> str:
+    return os.urandom(8).hex()
+
+
+_EC_CURVES = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+
+
+def _generate_private_key(algorithm: str) -> str:
+    """알고리즘에 맞는 새 개인 키 PEM (ES*는 해당 곡선, 그 외 RS*는 RSA 2048)"""
+    if algorithm in _EC_CURVES:
+        private_key = ec.generate_private_key(_EC_CURVES[algorithm]())
+    else:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode()
+
+
+async def run_key_rotation(keyring: KeyRing, rotation_seconds: float, interval: float = 3600.0) -> None:
+    """interval마다 키 교체가 필요한지 확인 (lifespan 동안 실행, 키 생성은 스레드에서)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(keyring.rotate_if_due, rotation_seconds)
+        except OSError as e:
+            logger.warning("Signing key rotation failed: %s", e)
+
+
+_keyring: Optional[KeyRing] = None
+
+
+def get_keyring() -> KeyRing:
+    """프로세스 공유 키링 (처음 호출할 때 생성)
+
+    이전 키는 마지막으로 서명한 액세스 토큰이 만료되고, 그 뒤 캐시된 JWKS가 갱신될 때까지 남긴다.
+    """
+    global _keyring
+    if _keyring is None:
+        _keyring = KeyRing(
+            settings.jwt_keyring_path,
+            settings.jwt_asymmetric_algorithm,
+            publish_ahead=settings.jwks_max_age_seconds,
+            overlap=settings.jwt_stateless_access_minutes * 60 + settings.jwks_max_age_seconds
+        )
+    return _keyring
@@ -0,0 +1,119 @@
+import threading
+from collections import deque
+from typing import Callable, Dict, Optional
+
+
+def _key(name: str, labels: Dict[str, str]) -> str:
+    """메트릭 이름과 라벨을 하나의 키로 결합 (예: db.query.seconds{target=primary})"""
+    if not labels:
+        return name
+    label_str = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{label_str}}}"
+
+
+class Timing:
+    """지연 시간 요약 (횟수, 합계, 최댓값, 최근 샘플 기반 백분위수)"""
+
+    def __init__(self, window: int = 1024):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class Metrics:
+    """프로세스 내 메트릭 레지스트리
+
+    외부 의존성 없이 카운터, 게이지, 지연 시간을 모으고 /metrics에서 JSON으로 노출한다.
+    커넥션 풀 상태처럼 조회 시점에 계산해야 하는 값은 게이지 콜백으로 등록한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], Optional[float]]] = {}
+        self._timings: Dict[str, Timing] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """카운터 증가"""
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """게이지 값 설정"""
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def gauge_callback(self, name: str, callback: Callable[[], Optional[float]], **labels: str) -> None:
+        """조회 시점에 값을 계산하는 게이지 등록 (None을 반환하면 생략)"""
+        with self._lock:
+            self._gauge_callbacks[_key(name, labels)] = callback
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """지연 시간 기록"""
+        key = _key(name, labels)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = Timing()
+            timing.observe(seconds)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """카운터 현재 값"""
+        return self._counters.get(_key(name, labels), 0)
+
+    def timing(self, name: str, **labels: str) -> Optional[Timing]:
+        """지연 시간 요약 조회"""
+        return self._timings.get(_key(name, labels))
+
+    def snapshot(self) -> dict:
+        """모든 메트릭의 현재 값"""
+        with self._lock:
+            gauges = dict(self._gauges)
+            callbacks = dict(self._gauge_callbacks)
+            counters = dict(self._counters)
+            timings = {key: timing.summary() for key, timing in self._timings.items()}
+
+        for key, callback in callbacks.items():
+            value = callback()
+            if value is not None:
+                gauges[key] = value
+
+        return {"counters": counters, "gauges": gauges, "timings": timings}
+
+    def reset(self) -> None:
+        """모든 메트릭 초기화 (테스트용)"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._gauge_callbacks.clear()
+            self._timings.clear()
+
+
+# 전역 메트릭 레지스트리
+metrics = Metrics()
@@ -0,0 +1,178 @@
+import time
+from typing import Optional, Tuple
+from uuid import uuid4
+from pydantic_settings import BaseSettings
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.metrics import metrics
+
+# 프로세스당 primary 엔진 수 (동기 + 비동기), 풀 크기 계산에 사용
+ENGINES_PER_PROCESS = 2
+
+
+class DatabaseSettings(BaseSettings):
+    """데이터베이스 연결/풀 설정
+
+    JWT_SECRET 없이도 읽을 수 있어야 하므로(Alembic 등) Settings와 분리하고,
+    Settings가 상속해 settings.database_url 등으로도 접근할 수 있다.
+    """
+
+    database_url: str = "sqlite:///./dandle_dev.db"
+    database_replica_urls: str = ""  # 쉼표로 구분된 읽기 복제본 URL
+    replica_max_lag_seconds: float = 2.0  # 이보다 뒤처진 복제본은 사용하지 않음
+    replica_lag_check_interval_seconds: float = 5.0
+
+    # PostgreSQL 커넥션 풀 (크기를 비워 두면 최대 커넥션 수와 워커 수로 계산)
+    db_pool_size: Optional[int] = None
+    db_max_overflow: Optional[int] = None
+    db_max_connections: int = 100  # DB(또는 PgBouncer)가 허용하는 최대 커넥션 수
+    db_reserved_connections: int = 10  # 마이그레이션/관리 접속용으로 남겨 둘 커넥션 수
+    web_concurrency: int = 1  # 워커 프로세스 수 (uvicorn/gunicorn --workers)
+    db_pool_timeout_seconds: float = 10.0  # 커넥션을 기다리는 최대 시간
+    db_pool_recycle_seconds: int = 1800  # 이보다 오래된 커넥션은 재연결
+    db_pool_pre_ping: bool = True
+    db_pgbouncer: bool = False  # 트랜잭션 풀링 PgBouncer 경유 (서버 측 prepared statement 캐시 비활성화)
+
+    # PostgreSQL 테이블 파티셔닝 (photos/faces, 마이그레이션 시점에 적용)
+    db_partitioning: str = ""  # "range"면 created_at 월 단위 범위 파티션, 비워 두면 일반 테이블
+    db_partition_months_ahead: int = 3  # 미리 만들어 둘 미래 월 파티션 수
+    db_partition_retain_months: int = 0  # 이보다 오래된 월 파티션은 분리 (0이면 분리하지 않음)
+
+    # SQLite (개발/엣지 노드)
+    sqlite_wal: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_synchronous: str = "NORMAL"  # WAL에서는 NORMAL도 손상 없이 안전 (마지막 트랜잭션만 유실 가능)
+    sqlite_cache_size_kib: int = 20000
+    sqlite_mmap_size_mb: int = 128
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
+
+    def pool_limits(self) -> Tuple[int, int]:
+        """엔진 하나의 (pool_size, max_overflow)
+
+        명시하지 않으면 최대 커넥션 수에서 예비분을 빼고 워커 수 x 프로세스당 엔진 수로 나눈 값을
+        상시 풀과 overflow에 반씩 나눈다. 모든 워커가 overflow까지 써도 DB 한도를 넘지 않는다.
+        """
+        available = max(self.db_max_connections - self.db_reserved_connections, 1)
+        per_engine = max(available // (max(self.web_concurrency, 1) * ENGINES_PER_PROCESS), 2)
+        pool_size = self.db_pool_size if self.db_pool_size is not None else per_engine // 2
+        max_overflow = (
+            self.db_max_overflow if self.db_max_overflow is not None
+            else max(per_engine - pool_size, 0)
+        )
+        return pool_size, max_overflow
+
+
+class _CheckoutTimingMixin:
+    """풀에서 커넥션을 얻기까지 기다린 시간 기록"""
+
+    metrics_target = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe(
+                "db.pool.checkout_wait.seconds", time.perf_counter() - started, target=self.metrics_target
+            )
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, db_settings: DatabaseSettings, is_async: bool = False) -> dict:
+    """URL과 설정에 맞는 create_engine/create_async_engine 인자"""
+    if url.startswith("sqlite"):
+        options = {"connect_args": {
+            "check_same_thread": False,
+            "timeout": db_settings.sqlite_busy_timeout_ms / 1000,
+        }}
+        if not _is_sqlite_memory(url):
+            options["poolclass"] = InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool
+        return options
+
+    pool_size, max_overflow = db_settings.pool_limits()
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": db_settings.db_pool_timeout_seconds,
+        "pool_recycle": db_settings.db_pool_recycle_seconds,
+        "pool_pre_ping": db_settings.db_pool_pre_ping,
+    }
+    if db_settings.db_pgbouncer and is_async:
+        # 트랜잭션 풀링에서는 다음 트랜잭션이 다른 서버 커넥션을 쓸 수 있으므로
+        # asyncpg의 이름 있는 prepared statement 재사용을 끔
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return options
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    database = url.partition("://")[2].lstrip("/")
+    return database in ("", ":memory:") or "mode=memory" in url
+
+
+def configure_sqlite(engine: Engine, db_settings: DatabaseSettings) -> None:
+    """SQLite 커넥션마다 WAL 및 성능 관련 PRAGMA 적용
+
+    WAL은 읽기와 쓰기가 서로를 막지 않아 요청 처리 중 동시 읽기가 가능하고,
+    busy_timeout은 쓰기 잠금 경합 시 즉시 실패하는 대신 기다리게 한다.
+    """
+    memory = _is_sqlite_memory(str(engine.url))
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if db_settings.sqlite_wal and not memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(db_settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA synchronous={db_settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA cache_size=-{int(db_settings.sqlite_cache_size_kib)}")
+        cursor.execute(f"PRAGMA mmap_size={int(db_settings.sqlite_mmap_size_mb) * 1024 * 1024}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def instrument_pool(engine: Engine, target: str) -> None:
+    """커넥션 풀 메트릭 기록
+
+    - db.pool.checkout_wait.seconds: 커넥션을 얻기까지 기다린 시간 (Instrumented*Pool)
+    - db.pool.connection_age.seconds: 체크아웃된 커넥션이 연결된 지 지난 시간
+    - db.pool.overflow_checkouts: 상시 풀을 넘어 overflow 커넥션이 쓰이는 동안의 체크아웃 수
+    - db.pool.size/checkedout/overflow: 조회 시점의 풀 상태 (게이지)
+    """
+    pool = engine.pool
+    if isinstance(pool, _CheckoutTimingMixin):
+        pool.metrics_target = target
+
+    @event.listens_for(engine, "connect")
+    def _connected(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        connected_at = connection_record.info.get("connected_at")
+        if connected_at is not None:
+            metrics.observe("db.pool.connection_age.seconds", time.monotonic() - connected_at, target=target)
+        overflow = getattr(pool, "overflow", None)
+        if overflow is not None and overflow() > 0:
+            metrics.increment("db.pool.overflow_checkouts", target=target)
+
+    for name in ("size", "checkedout", "overflow"):
+        stat = getattr(pool, name, None)
+        if stat is not None:
+            metrics.gauge_callback(f"db.pool.{name}", stat, target=target)
@@ -0,0 +1,260 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from itertools import chain
+from typing import Iterable, Optional, Set
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+# 사용자 변경 시 무효화할 사용자 ID를 알리는 채널 (메시지: 쉼표로 구분한 ID)
+INVALIDATION_CHANNEL = "principal:invalidate"
+
+# 주체를 바꾸는 사용자 컬럼 (이 중 하나가 바뀌거나 사용자가 삭제되면 캐시 무효화)
+PRINCIPAL_FIELDS = ("is_active", "role", "token_version")
+
+# 세션에서 커밋을 기다리는 무효화 대상 사용자 ID (session.info 키)
+_PENDING_KEY = "principal_invalidations"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """인증/권한 검사에 필요한 사용자 정보만 담은 인증 주체
+
+    요청 의존성(get_current_user)이 ORM User 대신 돌려주며, 프로필 등 나머지 컬럼이
+    필요한 엔드포인트는 id로 사용자를 따로 조회한다.
+    """
+    id: int
+    is_active: bool
+    role: Optional[str]
+    token_version: int = 0
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "Principal":
+        return cls(**json.loads(data))
+
+
+class PrincipalCache:
+    """프로세스 로컬 TTL + LRU 주체 캐시 (스레드 안전)
+
+    ttl_seconds는 무효화 메시지를 놓쳤을 때(구독 재연결 등) 오래된 주체를 쓸 수 있는 최대 시간이다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # {사용자 ID: (만료 시각, 주체)}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def put(self, principal: Principal) -> None:
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict(self, user_ids: Iterable[int]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(settings.principal_cache_max_entries, settings.principal_cache_ttl_seconds)
+
+
+def principal_key(user_id: int) -> str:
+    """Redis 공유 캐시 키"""
+    return f"principal:{user_id}"
+
+
+async def get_cached_principal(redis_client: Redis, user_id: int) -> Optional[Principal]:
+    """로컬 캐시 -> Redis 순으로 주체 조회 (없거나 Redis 오류면 None, DB 조회는 호출자가 함)
+
+    - auth.principal{source=local|redis|db}: 주체를 찾은 곳 (db는 호출자가 기록)
+    """
+    principal = get_local_principal(user_id)
+    if principal is not None:
+        return principal
+
+    try:
+        data = await redis_client.get(principal_key(user_id))
+    except RedisError as e:
+        metrics.increment("auth.principal.redis_errors")
+        logger.debug("Principal cache read failed for user %s: %s", user_id, e)
+        return None
+    return principal_from_redis(data)
+
+
+def get_local_principal(user_id: int) -> Optional[Principal]:
+    """프로세스 로컬 캐시의 주체 (없으면 None)"""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        metrics.increment("auth.principal", source="local")
+    return principal
+
+
+def principal_from_redis(data: Optional[str]) -> Optional[Principal]:
+    """Redis 공유 캐시에서 읽은 값을 주체로 바꾸고 로컬 캐시에 저장 (값이 없으면 None)
+
+    파이프라인으로 다른 명령과 함께 GET principal_key(user_id)를 보낸 호출자도 쓴다.
+    """
+    if data is None:
+        return None
+    principal = Principal.from_json(data)
+    principal_cache.put(principal)
+    metrics.increment("auth.principal", source="redis")
+    return principal
+
+
+def principal_redis_ttl_ms() -> int:
+    """Redis 공유 캐시 유지 시간 (밀리초, 로컬 캐시 유지 시간을 넘지 않음)"""
+    return int(min(settings.principal_redis_ttl_seconds, settings.principal_cache_ttl_seconds) * 1000)
+
+
+async def cache_principal(redis_client: Redis, principal: Principal) -> None:
+    """DB에서 읽은 주체를 로컬 캐시와 Redis에 저장 (Redis 오류는 무시)
+
+    DB 조회와 저장 사이에 무효화(키 삭제)가 끼어들면 오래된 주체가 저장될 수 있으므로
+    Redis 유지 시간을 로컬 캐시 유지 시간(무효화를 놓쳤을 때의 최대 지연)으로 제한하고,
+    이미 있는 값(다른 요청이 더 최근에 저장한 주체)은 덮어쓰지 않는다.
+    """
+    principal_cache.put(principal)
+    ttl_ms = principal_redis_ttl_ms()
+    if ttl_ms <= 0:
+        return
+    try:
+        await redis_client.set(principal_key(principal.id), principal.to_json(), px=ttl_ms, nx=True)
+    except RedisError as e:
+        metrics.increment("auth.principal.redis_errors")
+        logger.debug("Principal cache write failed for user %s: %s", principal.id, e)
+
+
+_publish_tasks: Set[asyncio.Task] = set()
+
+
+def invalidate_principals(user_ids: Iterable[int]) -> None:
+    """사용자들의 캐시된 주체 무효화 (이 프로세스는 즉시, 다른 프로세스는 pub/sub으로)
+
+    커밋 훅에서 호출되므로 기다리지 않는다. 이벤트 루프 안(요청 처리 중인 AsyncSession 커밋)이면
+    공유 클라이언트로 발행하는 태스크를 만들고, 루프가 없는 스레드(Celery/스크립트)면 동기 클라이언트로 바로 발행한다.
+    """
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+    principal_cache.evict(user_ids)
+    metrics.increment("auth.principal.invalidations", len(user_ids))
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is None:
+        try:
+            _publish(get_sync_redis().pipeline(transaction=False), user_ids).execute()
+        except RedisError as e:
+            logger.warning("Failed to publish principal invalidation for users %s: %s", user_ids, e)
+        return
+
+    task = loop.create_task(_publish_async(get_redis(), user_ids))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+def _publish(pipeline, user_ids):
+    """공유 캐시 삭제 후 무효화 메시지 발행 (구독자는 삭제 이후에 메시지를 받음)"""
+    pipeline.delete(*(principal_key(user_id) for user_id in user_ids))
+    pipeline.publish(INVALIDATION_CHANNEL, ",".join(str(user_id) for user_id in user_ids))
+    return pipeline
+
+
+async def _publish_async(redis_client: Redis, user_ids) -> None:
+    try:
+        await _publish(redis_client.pipeline(transaction=False), user_ids).execute()
+    except RedisError as e:
+        logger.warning("Failed to publish principal invalidation for users %s: %s", user_ids, e)
+
+
+async def run_invalidation_listener(redis_client: Redis, retry_seconds: float = 5.0) -> None:
+    """다른 프로세스가 발행한 무효화 메시지를 받아 로컬 캐시에서 제거 (lifespan 동안 실행)
+
+    구독이 끊긴 동안의 메시지는 받을 수 없으므로 (재)구독할 때마다 로컬 캐시를 비운다.
+    """
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            principal_cache.clear()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    principal_cache.evict(int(user_id) for user_id in message["data"].split(","))
+        except asyncio.CancelledError:
+            raise
+        except (RedisError, OSError) as e:
+            logger.warning("Principal invalidation listener disconnected: %s", e)
+        finally:
+            await pubsub.aclose()
+        await asyncio.sleep(retry_seconds)
+
+
+def track_principal_changes(model) -> None:
+    """model(User)의 주체 컬럼이 바뀌거나 삭제된 채 커밋되면 해당 사용자의 캐시된 주체를 무효화
+
+    저장소의 update/delete와 역할 변경 등 ORM으로 사용자를 바꾸는 모든 경로에 적용된다.
+    flush에서 대상 ID를 모으고, 커밋이 끝난 뒤에만 무효화해서 롤백된 변경은 알리지 않는다.
+    """
+    @event.listens_for(Session, "after_flush")
+    def _collect(session, flush_context):
+        pending = None
+        for obj in chain(session.dirty, session.deleted):
+            if not isinstance(obj, model):
+                continue
+            state = inspect(obj)
+            if obj in session.deleted or any(state.attrs[field].history.has_changes() for field in PRINCIPAL_FIELDS):
+                if pending is None:
+                    pending = session.info.setdefault(_PENDING_KEY, set())
+                pending.add(obj.id)
+
+    @event.listens_for(Session, "after_commit")
+    def _invalidate(session):
+        user_ids = session.info.pop(_PENDING_KEY, None)
+        if user_ids:
+            invalidate_principals(user_ids)
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard(session):
+        session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,97 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import LuaScript
+
+logger = logging.getLogger(__name__)
+
+# GCRA (generic cell rate algorithm): 키마다 다음 요청의 이론적 도착 시각(TAT, ms)만 저장
+# KEYS: 제한 키들, ARGV: 키마다 (요청 간격 ms, 허용 구간 ms = 요청 간격 x limit)
+# 모든 키가 허용할 때만 TAT를 갱신하고 0, 하나라도 넘으면 갱신 없이 다시 시도할 수 있을 때까지 남은 ms를 반환
+# 시각은 Redis 서버 시계(TIME)를 써서 워커 간 시계 차이의 영향을 받지 않음
+GCRA = LuaScript("""
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local retry_after = 0
+local new_tats = {}
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[2 * i - 1])
+    local window = tonumber(ARGV[2 * i])
+    local tat = math.max(tonumber(redis.call('GET', key) or now), now)
+    new_tats[i] = tat + interval
+    retry_after = math.max(retry_after, new_tats[i] - window - now)
+end
+if retry_after > 0 then
+    return retry_after
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, new_tats[i], 'PX', new_tats[i] - now)
+end
+return 0
+""")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """period초 동안 limit번 (연달아 보내는 요청도 limit번까지 허용)"""
+
+    limit: int
+    period: float
+
+    def args(self) -> Tuple[int, int]:
+        """(요청 간격 ms, 허용 구간 ms) GCRA 인자
+
+        간격은 올림하므로 (제한보다 많이 허용하지 않음) 허용 구간은 기간이 아니라 간격 x limit이어야
+        연달아 보낸 limit번째 요청도 허용된다.
+        """
+        interval_ms = math.ceil(int(self.period * 1000) / self.limit)
+        return interval_ms, interval_ms * self.limit
+
+
+async def acquire(redis_client: Redis, limits: Sequence[Tuple[str, RateLimit]]) -> float:
+    """모든 키의 제한 안이면 요청을 기록하고 0, 넘으면 기록 없이 다시 시도할 수 있을 때까지 남은 초
+
+    한 번의 EVALSHA로 확인과 기록을 함께 하므로 동시 요청도 제한을 넘지 못한다.
+    """
+    args = []
+    for _, limit in limits:
+        args.extend(limit.args())
+    retry_after_ms = await GCRA(redis_client, keys=[key for key, _ in limits], args=args)
+    return int(retry_after_ms) / 1000
+
+
+class LoginThrottle:
+    """로그인 시도 제한 (계정(이메일)별, 클라이언트 IP별)
+
+    bcrypt 검증 전에 확인해 크리덴셜 스터핑이 워커 CPU를 모두 쓰지 못하게 한다.
+    Redis에 연결할 수 없으면 로그인을 막지 않는다 (nginx의 IP별 제한만 남음).
+    """
+
+    def __init__(self, redis_client: Redis):
+        self.redis_client = redis_client
+
+    async def retry_after(self, email: str, ip_address: Optional[str] = None) -> float:
+        """제한을 넘었으면 다시 시도할 수 있을 때까지 남은 초, 아니면 0 (시도를 기록함)"""
+        if not settings.login_rate_limit_enabled:
+            return 0.0
+
+        period = settings.login_rate_period_seconds
+        limits = [(f"login_rate:email:{email.strip().lower()}", RateLimit(settings.login_email_rate_limit, period))]
+        if ip_address:
+            limits.append((f"login_rate:ip:{ip_address}", RateLimit(settings.login_ip_rate_limit, period)))
+
+        try:
+            retry_after = await acquire(self.redis_client, limits)
+        except RedisError as e:
+            metrics.increment("auth.login_throttle.errors")
+            logger.warning("Login throttle unavailable, allowing attempt: %s", e)
+            return 0.0
+
+        if retry_after > 0:
+            metrics.increment("auth.login_throttle.rejected")
+        return retry_after
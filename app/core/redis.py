@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Optional, Sequence
+import redis as sync_redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError, NoScriptError, RedisError
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    """커넥션을 얻기까지 기다린 시간을 기록하는 Redis 커넥션 풀
+
+    max_connections를 모두 쓰고 있으면 ConnectionError 대신 timeout까지 기다린다.
+    연결(ensure_connection)은 대기 잠금 밖에서 하므로, redis-py 5.0.1처럼 연결 실패 시
+    잠금 안에서 release를 기다리다 timeout까지 멈추지 않고 바로 실패한다.
+    """
+
+    async def get_connection(self, command_name, *keys, **options):
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self._condition:
+                    await self._condition.wait_for(self.can_get_connection)
+                    try:
+                        connection = self._available_connections.pop()
+                    except IndexError:
+                        connection = self.make_connection()
+                    self._in_use_connections.add(connection)
+        except asyncio.TimeoutError as e:
+            raise ConnectionError("No connection available.") from e
+        finally:
+            metrics.observe("redis.pool.checkout_wait.seconds", time.perf_counter() - started)
+
+        try:
+            await self.ensure_connection(connection)
+        except BaseException:
+            await self.release(connection)
+            raise
+        return connection
+
+    def in_use(self) -> int:
+        return len(self._in_use_connections)
+
+    def idle(self) -> int:
+        return len(self._available_connections)
+
+
+def create_redis_pool(url: str, **overrides) -> InstrumentedBlockingConnectionPool:
+    """설정값으로 Redis 커넥션 풀 생성 (연결은 처음 사용할 때 맺음, overrides로 설정값 대신 지정)"""
+    options = {
+        "max_connections": settings.redis_max_connections,
+        "timeout": settings.redis_pool_timeout_seconds,
+        "socket_timeout": settings.redis_socket_timeout_seconds,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout_seconds,
+        "health_check_interval": settings.redis_health_check_interval_seconds,
+        "decode_responses": True,
+        **overrides,
+    }
+    return InstrumentedBlockingConnectionPool.from_url(url, **options)
+
+
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """
+    공유 Redis 클라이언트 의존성 주입용 함수
+
+    요청마다 redis.from_url로 풀을 만들면 닫히지 않은 풀과 커넥션이 계속 늘어나므로
+    모든 요청이 풀 하나를 빌려 쓴다. 풀은 lifespan(open_redis)에서 만들고,
+    lifespan 밖(작업/스크립트)에서 처음 호출하면 그 자리에서 만든다.
+
+    - redis.pool.checkout_wait.seconds: 커넥션을 얻기까지 기다린 시간
+    - redis.pool.in_use/idle: 조회 시점의 사용 중/유휴 커넥션 수 (게이지)
+    """
+    global _client
+    if _client is None:
+        pool = create_redis_pool(settings.redis_url)
+        metrics.gauge_callback("redis.pool.in_use", pool.in_use)
+        metrics.gauge_callback("redis.pool.idle", pool.idle)
+        _client = Redis(connection_pool=pool)
+    return _client
+
+
+_sync_client: Optional[sync_redis.Redis] = None
+
+
+def get_sync_redis() -> sync_redis.Redis:
+    """동기 Redis 클라이언트 (이벤트 루프가 없는 Celery 작업/스크립트/스레드용, 처음 호출할 때 생성)"""
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = sync_redis.Redis.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            socket_timeout=settings.redis_socket_timeout_seconds,
+            socket_connect_timeout=settings.redis_socket_connect_timeout_seconds,
+            decode_responses=True
+        )
+    return _sync_client
+
+
+async def open_redis() -> Redis:
+    """공유 Redis 풀 생성과 연결 확인 (lifespan 시작 시, 연결에 실패해도 시작은 계속)"""
+    client = get_redis()
+    try:
+        await client.ping()
+    except RedisError as e:
+        logger.warning("Redis is not reachable at %s: %s", settings.redis_url, e)
+    return client
+
+
+async def close_redis() -> None:
+    """공유 Redis 풀의 모든 커넥션 종료 (lifespan 종료 시)"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.connection_pool.disconnect()
+
+
+class LuaScript:
+    """서버 측 Lua 스크립트 (EVALSHA로 SHA만 보내 한 번의 왕복으로 실행)
+
+    스크립트는 lifespan 시작 시 load로 미리 올려 두고, Redis 재시작/장애 조치로
+    스크립트 캐시가 비어 NOSCRIPT가 나면 다시 올린 뒤 한 번 재시도한다.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.sha = hashlib.sha1(source.encode()).hexdigest()
+
+    async def load(self, client: Redis) -> None:
+        await client.script_load(self.source)
+
+    async def __call__(self, client: Redis, keys: Sequence[str], args: Sequence[Any]):
+        try:
+            return await client.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            await self.load(client)
+            return await client.evalsha(self.sha, len(keys), *keys, *args)
+
+
+async def load_scripts(client: Redis, *scripts: LuaScript) -> None:
+    """Lua 스크립트를 Redis 스크립트 캐시에 미리 올림 (lifespan 시작 시, 실패하면 첫 호출 때 올림)"""
+    try:
+        for script in scripts:
+            await script.load(client)
+    except RedisError as e:
+        logger.warning("Could not preload Redis scripts: %s", e)
+
+
+async def claim_job_run(client: Redis, job: str, period_seconds: float) -> bool:
+    """주기 작업을 이번 주기에 이 프로세스가 실행할지 (여러 워커 중 하나만 True)
+
+    SET job_lock:{job} NX PX로 주기 동안 잠그고 풀지 않으므로, 워커마다 작업 루프가 돌아도
+    period_seconds마다 한 워커만 실행한다. Redis에 연결할 수 없으면 실행하지 않는다 (다음 주기에 다시 시도).
+
+    - jobs.skipped{job}: 다른 워커가 실행 중이거나 Redis 오류로 건너뛴 수
+    """
+    try:
+        claimed = await client.set(f"job_lock:{job}", "1", nx=True, px=max(int(period_seconds * 1000), 1))
+    except RedisError as e:
+        logger.warning("Could not claim %s job run: %s", job, e)
+        claimed = False
+    if not claimed:
+        metrics.increment("jobs.skipped", job=job)
+    return bool(claimed)
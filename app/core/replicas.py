@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from itertools import count
+from typing import List, Optional, Union
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.metrics import metrics
+from app.core.pooling import instrument_pool
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL 스트리밍 복제 지연 (복제본에서 실행, 재생할 WAL이 없으면 0)
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+def instrument_engine(engine: Union[AsyncEngine, Engine], target: str) -> None:
+    """엔진별 쿼리 지연 시간과 커넥션 풀 상태를 메트릭으로 기록"""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _end(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        metrics.observe("db.query.seconds", time.perf_counter() - started, target=target)
+
+    instrument_pool(sync_engine, target)
+
+
+class Replica:
+    """읽기 복제본 엔진과 마지막으로 측정한 복제 지연"""
+
+    def __init__(self, name: str, engine: AsyncEngine, lag_seconds: Optional[float] = None):
+        self.name = name
+        self.engine = engine
+        # 아직 측정하지 않은 지연은 None (PostgreSQL이 아니면 측정하지 않고 0으로 간주)
+        self.lag_seconds = lag_seconds
+        if lag_seconds is None and engine.dialect.name != "postgresql":
+            self.lag_seconds = 0.0
+
+    @property
+    def sync_engine(self) -> Engine:
+        return self.engine.sync_engine
+
+    async def measure_lag(self) -> Optional[float]:
+        """복제본에서 현재 복제 지연(초) 측정, 실패하면 None (라우팅 대상에서 제외)"""
+        if self.engine.dialect.name != "postgresql":
+            return self.lag_seconds
+        try:
+            async with self.engine.connect() as conn:
+                self.lag_seconds = float((await conn.execute(LAG_QUERY)).scalar() or 0)
+        except Exception:
+            logger.warning("Replica %s lag check failed", self.name, exc_info=True)
+            self.lag_seconds = None
+        if self.lag_seconds is not None:
+            metrics.set_gauge("db.replica.lag_seconds", self.lag_seconds, target=self.name)
+        return self.lag_seconds
+
+
+class ReplicaSet:
+    """읽기 복제본 목록과 라우팅 정책
+
+    복제 지연이 max_lag_seconds 이하인 복제본만 순서대로 돌아가며 사용한다.
+    쓰기 직후의 세션은 복제본이 그 쓰기를 재생했다고 볼 수 있을 때까지
+    (쓰기 이후 경과 시간 > 복제 지연) primary를 사용한다.
+    """
+
+    def __init__(self, replicas: List[Replica], max_lag_seconds: float):
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self._next = count()
+        self._monitor: Optional[asyncio.Task] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self, wrote_at: Optional[float] = None) -> Optional[Replica]:
+        """읽기에 사용할 복제본 선택 (사용 가능한 복제본이 없으면 None -> primary)"""
+        since_write = None if wrote_at is None else time.monotonic() - wrote_at
+        candidates = [
+            replica for replica in self.replicas
+            if replica.lag_seconds is not None
+            and replica.lag_seconds <= self.max_lag_seconds
+            and (since_write is None or replica.lag_seconds < since_write)
+        ]
+        if not candidates:
+            return None
+        return candidates[next(self._next) % len(candidates)]
+
+    async def refresh_lag(self) -> None:
+        """모든 복제본의 복제 지연 갱신"""
+        await asyncio.gather(*(replica.measure_lag() for replica in self.replicas))
+
+    def start_monitor(self, interval_seconds: float) -> None:
+        """복제 지연을 주기적으로 측정하는 백그라운드 작업 시작"""
+        if not self.replicas or self._monitor is not None:
+            return
+
+        async def _run():
+            while True:
+                await self.refresh_lag()
+                await asyncio.sleep(interval_seconds)
+
+        self._monitor = asyncio.create_task(_run())
+
+    async def dispose(self) -> None:
+        """모니터 중지 및 복제본 커넥션 풀 정리"""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from typing import Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 폐기된 액세스 토큰 스트림 (필드: jti, 모든 워커가 읽어 로컬 필터에 반영)
+REVOCATION_STREAM = "revocations"
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (거짓 양성만 있고 거짓 음성은 없음, 삭제 불가)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationFilter:
+    """워커마다 두는 폐기 토큰 필터
+
+    토큰마다 EXISTS revoked:{jti}를 보내는 대신 필터에 없으면 폐기되지 않은 것으로 바로 판단하고,
+    필터에 있을 때(실제 폐기 또는 거짓 양성)만 Redis를 확인한다.
+    필터는 Redis 스트림으로 동기화한다. pub/sub과 달리 새 워커는 스트림 전체로 필터를 만들고
+    끊겼던 워커도 마지막으로 읽은 ID부터 이어 읽으므로 폐기를 놓치지 않는다.
+    스트림을 아직 읽지 못했거나 동기화가 끊기면 ready가 False가 되어 모든 확인이 Redis로 간다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ready = False
+        self.last_id = "0-0"
+        self._filter = BloomFilter(capacity, error_rate)
+
+    def add(self, jti: str) -> None:
+        self._filter.add(jti)
+
+    def might_be_revoked(self, jti: str) -> bool:
+        """False면 확실히 폐기되지 않음 (ready일 때만 의미 있음)"""
+        return jti in self._filter
+
+    def __len__(self) -> int:
+        return self._filter.count
+
+    async def rebuild(self, redis_client: Redis, batch_size: int = 1000) -> None:
+        """스트림 전체를 읽어 새 필터로 교체 (스트림 길이에 맞춰 크기를 키움)
+
+        Bloom 필터는 항목을 지울 수 없으므로 만료되어 스트림에서 잘린 토큰은 다시 만들 때 빠진다.
+        """
+        length = await redis_client.xlen(REVOCATION_STREAM)
+        bloom = BloomFilter(max(self.capacity, length * 2), self.error_rate)
+        last_id, start = "0-0", "-"
+        while True:
+            entries = await redis_client.xrange(REVOCATION_STREAM, min=start, count=batch_size)
+            for entry_id, fields in entries:
+                bloom.add(fields["jti"])
+                last_id = entry_id
+            if len(entries) < batch_size:
+                break
+            start = f"({last_id}"
+        self._filter, self.last_id, self.ready = bloom, last_id, True
+        metrics.increment("auth.revocation.rebuilds")
+
+    async def follow(self, redis_client: Redis, block_ms: int, batch_size: int = 1000) -> None:
+        """last_id 이후 스트림 항목을 필터에 추가 (새 항목이 없으면 block_ms 동안 대기)"""
+        response = await redis_client.xread({REVOCATION_STREAM: self.last_id}, count=batch_size, block=block_ms)
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                self._filter.add(fields["jti"])
+                self.last_id = entry_id
+
+
+async def run_revocation_sync(
+    revocations: RevocationFilter,
+    redis_client: Redis,
+    rebuild_seconds: float,
+    block_ms: int = 1000,
+    retry_seconds: float = 5.0
+) -> None:
+    """폐기 스트림을 따라 읽으며 로컬 필터 유지 (lifespan 동안 실행, rebuild_seconds마다 다시 만듦)
+
+    block_ms는 Redis 소켓 타임아웃보다 짧아야 한다.
+    """
+    while True:
+        try:
+            await revocations.rebuild(redis_client)
+            rebuilt_at = time.monotonic()
+            while time.monotonic() - rebuilt_at < rebuild_seconds:
+                await revocations.follow(redis_client, block_ms)
+        except asyncio.CancelledError:
+            revocations.ready = False
+            raise
+        except (RedisError, OSError) as e:
+            revocations.ready = False
+            logger.warning("Revocation stream sync failed, checking Redis per request: %s", e)
+            await asyncio.sleep(retry_seconds)
+
+
+_revocation_filter: Optional[RevocationFilter] = None
+
+
+def get_revocation_filter() -> RevocationFilter:
+    """프로세스 공유 폐기 필터 (처음 호출할 때 생성, 동기화 작업이 시작되기 전에는 ready가 아님)"""
+    global _revocation_filter
+    if _revocation_filter is None:
+        _revocation_filter = RevocationFilter(
+            settings.revocation_filter_capacity, settings.revocation_filter_error_rate
+        )
+        metrics.gauge_callback("auth.revocation.filter_entries", lambda: len(_revocation_filter))
+    return _revocation_filter
@@ -1,13 +1,39 @@
+import asyncio
+import logging
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, List, Optional, Tuple, TypeVar
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
-from app.core.database import get_db
-from app.infra.user_repository import UserRepository
+from app.core.database import get_async_db
+from app.core.keys import get_keyring
+from app.core.metrics import metrics
+from app.core.principal import (
+    Principal,
+    cache_principal,
+    get_cached_principal,
+    get_local_principal,
+    principal_from_redis,
+    principal_key,
+)
+from app.core.redis import get_redis
+from app.domain.auth import SessionData
+from app.infra.async_repository import AsyncUserRepository
+from app.infra.auth_repository import AuthRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 # 비밀번호 해싱 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -26,32 +52,173 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def hash_passwords(passwords: List[str], max_workers: Optional[int] = None) -> List[str]:
+    """비밀번호 일괄 해싱 (입력 순서 유지, 작업/스크립트용)
+
+    bcrypt는 해싱 중 GIL을 놓으므로 스레드 max_workers개로 병렬 실행한다 (None이면 CPU 수, 1이면 현재 스레드).
+    요청 처리 중에는 공유 풀을 쓰는 run_password_hashes를 사용한다.
+    """
+    if len(passwords) <= 1 or max_workers == 1:
+        return _hash_all(passwords)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(passwords))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash") as executor:
+        return list(executor.map(get_password_hash, passwords))
+
+
+def _hash_all(passwords: List[str]) -> List[str]:
+    return [get_password_hash(password) for password in passwords]
+
+
+class PasswordHashPool:
+    """요청 처리 중 비밀번호 해싱/검증을 실행하는 전용 스레드 풀
+
+    bcrypt 한 번은 수백 ms의 CPU 작업이라 async 핸들러에서 바로 호출하면 그동안 이벤트 루프의
+    다른 요청이 모두 멈춘다. bcrypt는 해싱 중 GIL을 놓으므로 스레드에서 실행하고,
+    동시 실행 수는 max_workers로 제한한다. 자리를 queue_timeout 안에 얻지 못하면 503으로 바로 실패해서
+    로그인 폭주가 대기열을 무한히 쌓지 않게 한다.
+
+    - auth.password_hash.seconds: 해싱/검증 실행 시간
+    - auth.password_hash.queue_wait.seconds: 실행 자리를 기다린 시간
+    - auth.password_hash.rejected: 대기 시간 초과로 거절한 수
+    - auth.password_hash.queue_depth/in_flight: 조회 시점의 대기/실행 중 작업 수 (게이지)
+    """
+
+    def __init__(self, max_workers: int, queue_timeout: float):
+        self.max_workers = max_workers
+        self.queue_timeout = queue_timeout
+        self.waiting = 0
+        self.running = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._slots = asyncio.Semaphore(max_workers)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """fn(*args)를 풀에서 실행
+
+        Raises:
+            HTTPException: queue_timeout 안에 실행 자리를 얻지 못한 경우 (503, Retry-After)
+        """
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await self._slots.acquire()
+        except TimeoutError:
+            metrics.increment("auth.password_hash.rejected")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-ins, please retry",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            self.waiting -= 1
+            metrics.observe("auth.password_hash.queue_wait.seconds", time.perf_counter() - started)
+
+        # 요청이 취소되어도 실행 중인 스레드가 끝날 때까지 자리를 반환하지 않음
+        self.running += 1
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        future.add_done_callback(lambda _: self._release(started))
+        return await asyncio.shield(future)
+
+    def _release(self, started: float) -> None:
+        metrics.observe("auth.password_hash.seconds", time.perf_counter() - started)
+        self.running -= 1
+        self._slots.release()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_password_pool: Optional[PasswordHashPool] = None
+
+
+def get_password_pool() -> PasswordHashPool:
+    """공유 비밀번호 해싱 풀 (처음 호출할 때 생성, lifespan 종료 시 close_password_pool로 정리)"""
+    global _password_pool
+    if _password_pool is None:
+        _password_pool = PasswordHashPool(
+            settings.password_hash_workers or os.cpu_count() or 1,
+            settings.password_hash_queue_timeout_seconds
+        )
+        metrics.gauge_callback("auth.password_hash.queue_depth", lambda: _password_pool and _password_pool.waiting)
+        metrics.gauge_callback("auth.password_hash.in_flight", lambda: _password_pool and _password_pool.running)
+    return _password_pool
+
+
+def close_password_pool() -> None:
+    """공유 비밀번호 해싱 풀 종료 (lifespan 종료 시)"""
+    global _password_pool
+    if _password_pool is not None:
+        pool, _password_pool = _password_pool, None
+        pool.shutdown()
+
+
+async def run_password_hash(fn: Callable[..., T], *args) -> T:
+    """verify_password/get_password_hash 등을 이벤트 루프 밖 공유 풀에서 실행"""
+    return await get_password_pool().run(fn, *args)
+
+
+async def run_password_hashes(passwords: List[str], slots: Optional[int] = None) -> List[str]:
+    """여러 비밀번호를 공유 해싱 풀에서 해싱 (입력 순서 유지)
+
+    비밀번호를 slots개(None이면 풀 크기의 절반)로 묶어 실행하므로, 큰 명단을 해싱하는 동안에도
+    로그인 검증에 쓸 풀 자리가 남는다.
+    """
+    if not passwords:
+        return []
+    pool = get_password_pool()
+    slots = min(slots or max(pool.max_workers // 2, 1), pool.max_workers, len(passwords))
+    size = -(-len(passwords) // slots)
+    chunks = await asyncio.gather(*(
+        pool.run(_hash_all, passwords[i:i + size]) for i in range(0, len(passwords), size)
+    ))
+    return [hashed for chunk in chunks for hashed in chunk]
+
+
+def new_token_id() -> str:
+    """토큰 jti/세션 ID용 짧은 임의 ID (URL-safe 16자)"""
+    return secrets.token_urlsafe(12)
+
+
+def access_token_expires_in() -> int:
+    """발급하는 액세스 토큰의 수명 (초)"""
+    if settings.jwt_stateless_access_tokens:
+        return settings.jwt_stateless_access_minutes * 60
+    return settings.jwt_expire_minutes * 60
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """JWT 액세스 토큰 생성"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
+    """JWT 액세스 토큰 생성 (data에 jti가 없으면 새로 붙임)
+
+    무상태 액세스 토큰을 켜면 키링의 현재 키로 서명하고 헤더에 kid를 붙인다.
+    """
+    to_encode = {"jti": new_token_id(), **data}
+    to_encode["exp"] = datetime.utcnow() + (expires_delta or timedelta(seconds=access_token_expires_in()))
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.jwt_secret,
-        algorithm=settings.jwt_algorithm
-    )
-    return encoded_jwt
+    if settings.jwt_stateless_access_tokens:
+        key = get_keyring().signing_key()
+        return jwt.encode(
+            to_encode,
+            key.private_key,
+            algorithm=settings.jwt_asymmetric_algorithm,
+            headers={"kid": key.kid}
+        )
+    return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
-def verify_token(token: str) -> dict:
-    """JWT 토큰 검증"""
+def decode_access_token(token: str) -> Tuple[dict, bool]:
+    """JWT 토큰 검증 후 (페이로드, 무상태 토큰 여부) 반환
+
+    헤더에 kid가 있으면 키링의 공개 키로 비대칭 알고리즘만 허용해 검증하고,
+    없으면 jwt_secret으로 검증한다. 파싱한 키는 키링이 프로세스에 캐시한다.
+    """
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm]
-        )
-        return payload
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]), False
+        key = get_keyring().verification_key(kid)
+        return jwt.decode(token, key, algorithms=[settings.jwt_asymmetric_algorithm]), True
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,54 +227,153 @@ def verify_token(token: str) -> dict:
         )
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    """현재 인증된 사용자 조회"""
-    try:
-        # 토큰에서 사용자 정보 추출
-        payload = verify_token(credentials.credentials)
-        user_id_raw = payload.get("sub")
-        if user_id_raw is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials"
-            )
+def verify_token(token: str) -> dict:
+    """JWT 토큰 검증"""
+    return decode_access_token(token)[0]
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    """인증 결과 (주체와, 세션을 확인한 경우 그 세션)"""
+
+    principal: Principal
+    payload: dict
+    session: Optional[SessionData] = None
+
+
+async def authenticate(
+    token: str,
+    db: AsyncSession,
+    redis_client: Redis,
+    check_session: Optional[bool] = None
+) -> AuthContext:
+    """액세스 토큰 인증 (모든 라우터의 인증 의존성이 사용하는 단일 경로)
+
+    1. JWT 검증. 무상태 토큰은 클레임만으로 주체를 만들고 끝낸다 (Redis/DB 조회 없음,
+       사용자 변경은 토큰 수명(jwt_stateless_access_minutes) 안에 반영).
+    2. 인증 주체(id, is_active, role, token_version)는 프로세스 로컬 캐시에서 찾는다.
+    3. 토큰에 sid/jti가 있고 세션 확인을 켰으면(check_session, 기본값 auth_session_check)
+       세션(HGET), 폐기 여부(EXISTS, 폐기 필터가 통과시키면 생략), 로컬 캐시에 없는 주체(GET)를
+       파이프라인 한 번으로 읽는다. 세션을 확인할 수 없으면(Redis 오류) 503.
+       sid가 없는 토큰이나 세션 확인을 끈 경우에는 주체만 Redis 공유 캐시에서 찾는다.
+    4. 주체가 Redis에도 없으면 DB에서 읽어 캐시한다. 사용자 변경은 커밋 시 pub/sub으로 무효화된다.
+    토큰의 ver 클레임(없으면 0)이 사용자의 token_version보다 작으면 거부한다.
+
+    - auth.latency.seconds{path=stateless|session|principal}: 인증에 걸린 시간
+    """
+    started = time.perf_counter()
+    payload, stateless = decode_access_token(token)
+    user_id = _token_user_id(payload)
 
-        # 사용자 ID 타입 검증 및 변환
+    if stateless:
+        principal = Principal(
+            id=user_id, is_active=True, role=payload.get("role", "user"), token_version=payload.get("ver", 0)
+        )
+        metrics.observe("auth.latency.seconds", time.perf_counter() - started, path="stateless")
+        return AuthContext(principal=principal, payload=payload)
+
+    if check_session is None:
+        check_session = settings.auth_session_check
+    session_id, jti = payload.get("sid"), payload.get("jti")
+
+    session = None
+    if check_session and session_id and jti:
+        path = "session"
+        principal = get_local_principal(user_id)
         try:
-            user_id = int(user_id_raw)
-        except (ValueError, TypeError):
+            check = await AuthRepository(redis_client).check_access_token(
+                user_id, session_id, jti, principal_key=None if principal else principal_key(user_id)
+            )
+        except RedisError as e:
+            metrics.increment("auth.redis_errors")
+            logger.warning("Session check failed for user %s: %s", user_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication temporarily unavailable",
+                headers={"Retry-After": "1"},
+            )
+        if check.revoked:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid user ID in token"
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
             )
-
-        # 데이터베이스에서 사용자 조회
-        user_repo = UserRepository(db)
-        user = user_repo.get_by_id(user_id)
-        if user is None:
+        if check.session is None or check.session.access_jti != jti:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found"
+                detail="Session not found or expired",
+                headers={"WWW-Authenticate": "Bearer"},
             )
+        session = check.session
+        principal = principal or principal_from_redis(check.principal)
+    else:
+        path = "principal"
+        principal = await get_cached_principal(redis_client, user_id)
 
-        if not user.is_active:
+    # 캐시에 없으면 데이터베이스에서 조회 후 캐시
+    if principal is None:
+        principal = await AsyncUserRepository(db).load_principal(user_id)
+        if principal is None:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User account is disabled"
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
             )
+        metrics.increment("auth.principal", source="db")
+        await cache_principal(redis_client, principal)
 
-        return user
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is disabled"
+        )
 
-    except JWTError:
+    if payload.get("ver", 0) < principal.token_version:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
+            detail="Token has been revoked",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    metrics.observe("auth.latency.seconds", time.perf_counter() - started, path=path)
+    return AuthContext(principal=principal, payload=payload, session=session)
+
+
+def _token_user_id(payload: dict) -> int:
+    """토큰의 sub 클레임 -> 사용자 ID"""
+    user_id_raw = payload.get("sub")
+    if user_id_raw is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+
+    # 사용자 ID 타입 검증 및 변환
+    try:
+        return int(user_id_raw)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid user ID in token"
+        )
+
+
+async def get_auth_context(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis)
+) -> AuthContext:
+    """인증 결과 전체가 필요한 라우터용 의존성 (확인한 세션 정보 포함)"""
+    return await authenticate(credentials.credentials, db, redis_client)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: Redis = Depends(get_redis)
+) -> Principal:
+    """현재 인증된 사용자의 인증 주체 조회 (authenticate 참고)"""
+    return (await authenticate(credentials.credentials, db, redis_client)).principal
+
 
 async def get_current_active_user(current_user = Depends(get_current_user)):
     """현재 활성 사용자 조회 (활성 상태 추가 검증)"""
@@ -119,17 +385,25 @@ async def get_current_active_user(current_user = Depends(get_current_user)):
     return current_user
 
 
-def create_refresh_token(user_id: int) -> str:
-    """리프레시 토큰 생성"""
-    data = {"sub": str(user_id), "type": "refresh"}
-    expires_delta = timedelta(days=30)  # 30일
-    return create_access_token(data, expires_delta)
+def create_refresh_token(
+    user_id: int,
+    token_version: int = 0,
+    session_id: Optional[str] = None,
+    jti: Optional[str] = None
+) -> str:
+    """리프레시 토큰 생성 (token_version은 ver, session_id는 sid 클레임)"""
+    data = {"sub": str(user_id), "type": "refresh", "ver": token_version, "jti": jti or new_token_id()}
+    if session_id is not None:
+        data["sid"] = session_id
+    data["exp"] = datetime.utcnow() + timedelta(days=30)  # 30일
+    # 리프레시 토큰은 인증 서비스만 검증하므로 무상태 모드에서도 jwt_secret으로 서명
+    return jwt.encode(data, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
 def verify_refresh_token(token: str) -> dict:
-    """리프레시 토큰 검증"""
-    payload = verify_token(token)
-    if payload.get("type") != "refresh":
+    """리프레시 토큰 검증 (jwt_secret으로 서명된 토큰만)"""
+    payload, stateless = decode_access_token(token)
+    if stateless or payload.get("type") != "refresh":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token type"
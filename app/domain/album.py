@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Table
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Table, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.domain.soft_delete import track_soft_delete
 
 # Many-to-Many 관계를 위한 연결 테이블
 album_photos = Table(
@@ -9,12 +10,15 @@ album_photos = Table(
     Base.metadata,
     Column('album_id', Integer, ForeignKey('albums.id'), primary_key=True),
     Column('photo_id', Integer, ForeignKey('photos.id'), primary_key=True),
-    Column('added_at', DateTime(timezone=True), server_default=func.now())
+    Column('added_at', DateTime(timezone=True), server_default=func.now()),
+    Index('ix_album_photos_album_added', 'album_id', 'added_at', 'photo_id'),
+    Index('ix_album_photos_photo', 'photo_id'),
 )
 
 
 class Album(Base):
     __tablename__ = "albums"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -39,26 +43,63 @@ class Album(Base):
     # 상태
     is_active = Column(Boolean, default=True)
 
+    # 비정규화 카운터 (활성 사진 수, 저장소가 같은 트랜잭션에서 갱신)
+    photo_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_albums_creator_active_updated", "created_by_id", "is_active", "updated_at", "id"),
+        Index("ix_albums_group_active_updated", "group_id", "is_active", "updated_at", "id"),
+        Index(
+            "ix_albums_public_updated", "updated_at", "id",
+            postgresql_where=(is_active == True) & (is_public == True),
+            sqlite_where=(is_active == True) & (is_public == True),
+        ),
+    )
 
     # Relationships
     photos = relationship("Photo", secondary=album_photos, back_populates="albums")
     cover_photo = relationship("Photo", foreign_keys=[cover_photo_id])
     shares = relationship("AlbumShare", back_populates="album")
 
+    @property
+    def cover_photo_url(self):
+        """커버 사진 URL (cover_photo 관계를 함께 로딩한 경우에만 사용)"""
+        return self.cover_photo.s3_url if self.cover_photo is not None else None
+
 
 class AlbumShare(Base):
     __tablename__ = "album_shares"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     album_id = Column(Integer, ForeignKey("albums.id"), nullable=False)
     shared_with_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     permission = Column(String, default="view")  # 'view', 'edit', 'admin'
     is_active = Column(Boolean, default=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)  # 공유 취소 시각 (보존 기간 정리 기준)
 
     shared_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_album_shares_album_user", "album_id", "shared_with_id"),
+        Index(
+            "ix_album_shares_shared_with_active", "shared_with_id",
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True),
+        ),
+        Index(
+            "ix_album_shares_inactive_deleted", "id", "deleted_at",
+            postgresql_where=(is_active == False),
+            sqlite_where=(is_active == False),
+        ),
+    )
+
     # Relationships
     album = relationship("Album", back_populates="shares")
-    shared_with = relationship("User", back_populates="shared_albums")
\ No newline at end of file
+    shared_with = relationship("User", back_populates="shared_albums")
+
+
+track_soft_delete(AlbumShare)
@@ -4,10 +4,11 @@ from datetime import datetime
 
 
 class SessionData(BaseModel):
-    """Redis 세션 데이터 모델"""
+    """Redis 세션 데이터 모델 (토큰 원문 대신 토큰의 jti만 보관)"""
     user_id: int
-    access_token: str
-    refresh_token: str
+    session_id: str
+    access_jti: str
+    refresh_jti: str
     created_at: datetime
     expires_at: datetime
     ip_address: Optional[str] = None
@@ -25,7 +26,8 @@ class TokenPayload(BaseModel):
     exp: datetime
     iat: datetime
     type: Optional[str] = "access"
-    jti: Optional[str] = None  # JWT ID for token tracking
+    jti: Optional[str] = None  # JWT ID (세션/폐기 목록이 토큰 대신 이 값을 키로 사용)
+    sid: Optional[str] = None  # 세션 ID
 
 
 class AuthCredentials(BaseModel):
@@ -56,11 +58,3 @@ class UserSession(BaseModel):
     is_active: bool = True
     device_info: Optional[dict] = None
 
-
-class TokenBlacklist(BaseModel):
-    """토큰 블랙리스트 모델"""
-    token: str
-    user_id: int
-    blacklisted_at: datetime
-    reason: str = "logout"
-    expires_at: datetime
\ No newline at end of file
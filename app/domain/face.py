@@ -1,11 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.domain.soft_delete import track_soft_delete
 
 
 class Face(Base):
     __tablename__ = "faces"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -36,12 +38,36 @@ class Face(Base):
     external_image_id = Column(String, nullable=True)  # AWS Collection 내 이미지 ID
 
     is_active = Column(Boolean, default=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)  # 소프트 삭제 시각 (보존 기간 정리 기준)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_faces_photo_confidence", "photo_id", "confidence"),
+        Index(
+            "ix_faces_identified_user_created", "identified_user_id", "created_at",
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True),
+        ),
+        Index(
+            "ix_faces_unidentified_created", "created_at", "id",
+            postgresql_where=(is_active == True) & identified_user_id.is_(None),
+            sqlite_where=(is_active == True) & identified_user_id.is_(None),
+        ),
+        Index(
+            "ix_faces_inactive_deleted", "id", "deleted_at",
+            postgresql_where=(is_active == False),
+            sqlite_where=(is_active == False),
+        ),
+    )
+
+
+track_soft_delete(Face)
 
 
 class FaceCollection(Base):
     __tablename__ = "face_collections"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     collection_id = Column(String, unique=True, nullable=False)  # AWS Rekognition Collection ID
@@ -57,11 +83,16 @@ class FaceCollection(Base):
 
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_face_collections_owner", "owner_type", "owner_id"),
+    )
 
 
 class FaceMatch(Base):
     __tablename__ = "face_matches"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -81,9 +112,28 @@ class FaceMatch(Base):
     confirmed_at = Column(DateTime(timezone=True), nullable=True)
 
     is_active = Column(Boolean, default=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)  # 소프트 삭제 시각 (보존 기간 정리 기준)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_face_matches_face1", "face1_id", "similarity"),
+        Index("ix_face_matches_face2", "face2_id", "similarity"),
+        Index(
+            "ix_face_matches_unconfirmed", "similarity", "id",
+            postgresql_where=(is_active == True) & (is_confirmed == False),
+            sqlite_where=(is_active == True) & (is_confirmed == False),
+        ),
+        Index(
+            "ix_face_matches_inactive_deleted", "id", "deleted_at",
+            postgresql_where=(is_active == False),
+            sqlite_where=(is_active == False),
+        ),
+    )
+
     # Relationships
     face1 = relationship("Face", foreign_keys=[face1_id])
     face2 = relationship("Face", foreign_keys=[face2_id])
-    confirmed_by = relationship("User")
\ No newline at end of file
+    confirmed_by = relationship("User")
+
+
+track_soft_delete(FaceMatch)
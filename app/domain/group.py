@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -6,6 +6,7 @@ from app.core.database import Base
 
 class Group(Base):
     __tablename__ = "groups"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -22,8 +23,11 @@ class Group(Base):
     is_public = Column(Boolean, default=False)  # 공개/비공개
     max_members = Column(Integer, default=100)  # 최대 멤버 수
 
+    # 비정규화 카운터 (활성 멤버 수, 저장소가 같은 트랜잭션에서 갱신)
+    member_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
 
     # Relationships
     memberships = relationship("GroupMembership", back_populates="group")
@@ -33,6 +37,7 @@ class Group(Base):
 
 class GroupMembership(Base):
     __tablename__ = "group_memberships"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
@@ -43,6 +48,15 @@ class GroupMembership(Base):
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
     left_at = Column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        Index("ix_group_memberships_group_user", "group_id", "user_id"),
+        Index(
+            "ix_group_memberships_user_active", "user_id",
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True),
+        ),
+    )
+
     # Relationships
     group = relationship("Group", back_populates="memberships")
     user = relationship("User", back_populates="group_memberships")
\ No newline at end of file
@@ -1,11 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.domain.soft_delete import track_soft_delete
 
 
 class Photo(Base):
     __tablename__ = "photos"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, nullable=False)
@@ -41,21 +43,50 @@ class Photo(Base):
     # 상태
     is_processed = Column(Boolean, default=False)  # 얼굴 인식 처리 완료 여부
     is_active = Column(Boolean, default=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)  # 소프트 삭제 시각 (보존 기간 정리 기준)
+
+    # 비정규화 카운터 (활성 얼굴 수, 저장소가 같은 트랜잭션에서 갱신)
+    face_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     # 해시 (중복 방지용)
     file_hash = Column(String, nullable=True, index=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
 
     # Additional relationships
     tags = relationship("PhotoTag", back_populates="photo")
     faces = relationship("Face", back_populates="photo")
     albums = relationship("Album", secondary="album_photos", back_populates="photos")
 
+    # 저장소 조회 패턴에 맞춘 인덱스 (키셋 정렬 키와 ID 타이브레이커 포함)
+    __table_args__ = (
+        Index("ix_photos_group_active_created", "group_id", "is_active", "created_at", "id"),
+        Index("ix_photos_uploader_active_created", "uploaded_by_id", "is_active", "created_at", "id"),
+        Index(
+            "ix_photos_unprocessed_created", "created_at",
+            postgresql_where=(is_active == True) & (is_processed == False),
+            sqlite_where=(is_active == True) & (is_processed == False),
+        ),
+        Index(
+            "ix_photos_active_taken_at", "group_id", "taken_at",
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True),
+        ),
+        Index(
+            "ix_photos_inactive_deleted", "id", "deleted_at",
+            postgresql_where=(is_active == False),
+            sqlite_where=(is_active == False),
+        ),
+    )
+
+
+track_soft_delete(Photo)
+
 
 class PhotoTag(Base):
     __tablename__ = "photo_tags"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     photo_id = Column(Integer, ForeignKey("photos.id"), nullable=False)
@@ -64,4 +95,8 @@ class PhotoTag(Base):
 
     photo = relationship("Photo", back_populates="tags")
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_photo_tags_photo_confidence", "photo_id", "confidence"),
+    )
\ No newline at end of file
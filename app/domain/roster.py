@@ -0,0 +1,29 @@
+from pydantic import BaseModel, EmailStr, Field
+from typing import List, Literal, Optional
+
+
+class RosterEntry(BaseModel):
+    """명단 가져오기 한 행 (CSV 열 또는 JSON 객체 키)"""
+    email: EmailStr
+    username: str = Field(min_length=1)
+    password: str = Field(min_length=1)  # 이미 가입한 사용자(같은 이메일)면 무시
+    full_name: Optional[str] = None
+    role: Literal["member", "admin"] = "member"
+
+    class Config:
+        str_strip_whitespace = True
+
+
+class RosterRowError(BaseModel):
+    """가져오지 못한 행 (row는 데이터 행 번호, 1부터)"""
+    row: int
+    email: Optional[str] = None
+    message: str
+
+
+class RosterImportResult(BaseModel):
+    """명단 가져오기 결과"""
+    created: int  # 새로 만든 사용자 수
+    added: int  # 새로 그룹에 추가(또는 재가입)된 멤버 수
+    skipped: int  # 이미 그룹의 활성 멤버였던 행 수
+    errors: List[RosterRowError] = []
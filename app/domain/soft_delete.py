@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+from sqlalchemy import event
+
+
+def track_soft_delete(model) -> None:
+    """is_active가 False가 된 시각을 deleted_at에 기록 (다시 활성화하면 해제)
+
+    보존 기간이 지난 소프트 삭제 행을 정리하는 RetentionService의 기준 시각이다.
+    저장소의 delete/update가 ORM 속성으로 is_active를 바꾸므로 모든 소프트 삭제 경로에 적용된다.
+    """
+    @event.listens_for(model.is_active, "set")
+    def _set_deleted_at(target, value, oldvalue, initiator):
+        if value is False and oldvalue is not False:
+            target.deleted_at = datetime.now(timezone.utc)
+        elif value:
+            target.deleted_at = None
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, event
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm.base import NEVER_SET, NO_VALUE
 from sqlalchemy.sql import func
 from datetime import datetime
 from app.core.database import Base
@@ -7,6 +8,7 @@ from app.core.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -18,12 +20,18 @@ class User(Base):
     profile_image_url = Column(String, nullable=True)
     role = Column(String, default="user")  # 'admin', 'user'
 
+    # 토큰 버전 (토큰의 ver 클레임이 이보다 작으면 거부, 비밀번호가 바뀌면 증가)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 비정규화 카운터 (이 사용자로 식별된 활성 얼굴 수, 저장소가 같은 트랜잭션에서 갱신)
+    face_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     # OAuth fields
     apple_id = Column(String, unique=True, nullable=True)
     google_id = Column(String, unique=True, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
 
     # Relationships
     group_memberships = relationship("GroupMembership", back_populates="user")
@@ -31,4 +39,10 @@ class User(Base):
     uploaded_photos = relationship("Photo", back_populates="uploaded_by")
     created_albums = relationship("Album", back_populates="created_by")
     shared_albums = relationship("AlbumShare", back_populates="shared_with")
-    face_identifications = relationship("Face", back_populates="identified_user", foreign_keys="Face.identified_user_id")
\ No newline at end of file
+    face_identifications = relationship("Face", back_populates="identified_user", foreign_keys="Face.identified_user_id")
+
+@event.listens_for(User.hashed_password, "set")
+def _bump_token_version(target, value, oldvalue, initiator):
+    """비밀번호가 바뀌면 token_version을 올려 이전에 발급된 토큰을 모두 거부"""
+    if oldvalue not in (None, NO_VALUE, NEVER_SET) and value != oldvalue:
+        target.token_version = (target.token_version or 0) + 1
@@ -1,7 +1,26 @@
-from typing import Optional, List
+from typing import Iterator, Optional, List, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, case, func, literal, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from app.domain.album import Album, AlbumShare, album_photos
+from app.infra.counters import adjust_counter
+from app.infra.loading import LoadingProfile, apply_profile
+from app.infra.pagination import keyset_condition
+from app.infra.read_models import AlbumCard
+
+# 일괄 작업 한 문장당 최대 ID 수 (드라이버 바인드 파라미터 한도 이내)
+BULK_CHUNK_SIZE = 1000
+
+# 앨범 권한 순위 (여러 경로로 접근 가능하면 가장 높은 권한이 유효 권한)
+PERMISSION_RANKS = {"view": 1, "edit": 2, "admin": 3, "owner": 4}
+PERMISSION_NAMES = {rank: name for name, rank in PERMISSION_RANKS.items()}
+
+
+def _chunks(ids: List[int]) -> Iterator[List[int]]:
+    """중복을 제거한 ID 목록을 BULK_CHUNK_SIZE 단위로 분할"""
+    unique_ids = list(dict.fromkeys(ids))
+    for start in range(0, len(unique_ids), BULK_CHUNK_SIZE):
+        yield unique_ids[start:start + BULK_CHUNK_SIZE]
 
 
 class AlbumRepository:
@@ -12,17 +31,15 @@ class AlbumRepository:
         """새로운 앨범 생성"""
         album = Album(**album_data)
         self.db.add(album)
-        self.db.commit()
-        self.db.refresh(album)
+        self.db.flush()
         return album
 
     def get_by_id(self, album_id: int) -> Optional[Album]:
-        """ID로 앨범 조회"""
-        return (
-            self.db.query(Album)
-            .filter(and_(Album.id == album_id, Album.is_active == True))
-            .first()
-        )
+        """ID로 앨범 조회 (identity map에 있으면 추가 조회 없음)"""
+        album = self.db.get(Album, album_id)
+        if album is None or not album.is_active:
+            return None
+        return album
 
     def get_albums(
         self,
@@ -30,10 +47,39 @@ class AlbumRepository:
         group_id: Optional[int] = None,
         album_type: Optional[str] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
     ) -> List[Album]:
-        """앨범 목록 조회"""
-        query = self.db.query(Album).filter(Album.is_active == True)
+        """앨범 목록 조회 (cursor가 있으면 키셋 페이지네이션, skip은 무시)"""
+        query = apply_profile(self.db.query(Album), profile)
+        query = self._filter_albums(query, created_by_id, group_id, album_type)
+        return self._page(query, skip, limit, cursor)
+
+    def get_album_cards(
+        self,
+        created_by_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        album_type: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> List[AlbumCard]:
+        """앨범 목록을 읽기 모델로 조회 (get_albums와 같은 조건/순서, 커버 사진 URL은 외부 조인)"""
+        from app.domain.photo import Photo
+
+        query = self.db.query(*AlbumCard.columns).outerjoin(Photo, Album.cover_photo_id == Photo.id)
+        query = self._filter_albums(query, created_by_id, group_id, album_type)
+        return AlbumCard.from_rows(self._page(query, skip, limit, cursor))
+
+    def _filter_albums(
+        self,
+        query,
+        created_by_id: Optional[int],
+        group_id: Optional[int],
+        album_type: Optional[str]
+    ):
+        query = query.filter(Album.is_active == True)
 
         if created_by_id is not None:
             query = query.filter(Album.created_by_id == created_by_id)
@@ -44,14 +90,52 @@ class AlbumRepository:
         if album_type is not None:
             query = query.filter(Album.album_type == album_type)
 
-        return (
-            query
-            .order_by(Album.updated_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return query
+
+    def get_user_albums(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[Tuple[Album, str]]:
+        """사용자가 볼 수 있는 앨범과 유효 권한 목록 조회 (최근 수정순, 키셋 페이지네이션)
+
+        만든 앨범(owner), 공유받은 앨범(공유 권한), 가입한 그룹의 앨범(view)을 UNION ALL로 모은 뒤
+        앨범별로 가장 높은 권한을 골라 한 쿼리로 정렬/페이지네이션한다.
+        """
+        from app.domain.group import GroupMembership
+
+        share_rank = case(
+            {name: rank for name, rank in PERMISSION_RANKS.items() if name != "owner"},
+            value=AlbumShare.permission,
+            else_=PERMISSION_RANKS["view"]
+        )
+        grants = union_all(
+            select(Album.id.label("album_id"), literal(PERMISSION_RANKS["owner"]).label("rank"))
+            .where(Album.created_by_id == user_id),
+            select(AlbumShare.album_id, share_rank)
+            .where(and_(AlbumShare.shared_with_id == user_id, AlbumShare.is_active == True)),
+            select(Album.id, literal(PERMISSION_RANKS["view"]))
+            .join(GroupMembership, GroupMembership.group_id == Album.group_id)
+            .where(and_(GroupMembership.user_id == user_id, GroupMembership.is_active == True)),
+        ).subquery()
+        effective = (
+            select(grants.c.album_id, func.max(grants.c.rank).label("rank"))
+            .group_by(grants.c.album_id)
+            .subquery()
         )
 
+        query = (
+            apply_profile(self.db.query(Album, effective.c.rank), profile)
+            .join(effective, effective.c.album_id == Album.id)
+            .filter(Album.is_active == True)
+        )
+        return [
+            (album, PERMISSION_NAMES[rank])
+            for album, rank in self._page(query, 0, limit, cursor)
+        ]
+
     def update(self, album_id: int, update_data: dict) -> Optional[Album]:
         """앨범 정보 수정"""
         album = self.get_by_id(album_id)
@@ -62,8 +146,7 @@ class AlbumRepository:
             if hasattr(album, key):
                 setattr(album, key, value)
 
-        self.db.commit()
-        self.db.refresh(album)
+        self.db.flush()
         return album
 
     def delete(self, album_id: int) -> bool:
@@ -73,7 +156,7 @@ class AlbumRepository:
             return False
 
         album.is_active = False
-        self.db.commit()
+        self.db.flush()
         return True
 
     def add_photo_to_album(self, album_id: int, photo_id: int) -> bool:
@@ -85,11 +168,112 @@ class AlbumRepository:
         # Many-to-Many 관계 테이블에 직접 삽입
         stmt = album_photos.insert().values(album_id=album_id, photo_id=photo_id)
         self.db.execute(stmt)
-        self.db.commit()
+        self.db.flush()
+        adjust_counter(self.db, Album, "photo_count", [album_id], self._active_photo_count([photo_id]))
         return True
 
+    def add_photos_to_album(
+        self,
+        album_id: int,
+        photo_ids: List[int],
+        visible_to_user_id: Optional[int] = None
+    ) -> int:
+        """앨범에 여러 사진을 한 번에 추가하고 실제로 추가된 수 반환
+
+        청크마다 INSERT ... SELECT ... ON CONFLICT DO NOTHING 한 문장으로 처리한다
+        (ON CONFLICT가 없는 DB는 INSERT ... SELECT ... WHERE NOT EXISTS).
+        이미 앨범에 있는 사진, 존재하지 않거나 삭제된 사진, (visible_to_user_id 지정 시)
+        사용자가 올리지 않았고 속한 그룹의 사진도 아닌 사진은 건너뛴다.
+        """
+        from app.domain.group import GroupMembership
+        from app.domain.photo import Photo
+
+        # 아직 flush되지 않은 사진도 SELECT 대상에 포함
+        self.db.flush()
+
+        added = 0
+        for chunk in _chunks(photo_ids):
+            candidates = select(literal(album_id), Photo.id).where(
+                and_(Photo.id.in_(chunk), Photo.is_active == True)
+            )
+            if visible_to_user_id is not None:
+                member_groups = select(GroupMembership.group_id).where(
+                    and_(
+                        GroupMembership.user_id == visible_to_user_id,
+                        GroupMembership.is_active == True
+                    )
+                )
+                candidates = candidates.where(
+                    or_(
+                        Photo.uploaded_by_id == visible_to_user_id,
+                        Photo.group_id.in_(member_groups)
+                    )
+                )
+
+            added += self.db.execute(self._insert_ignoring_conflicts(album_id, candidates)).rowcount
+
+        # 삽입 대상은 활성 사진만이므로 추가된 수만큼 photo_count 증가
+        adjust_counter(self.db, Album, "photo_count", [album_id], added)
+        return added
+
+    def remove_photos_from_album(self, album_id: int, photo_ids: List[int]) -> int:
+        """앨범에서 여러 사진을 한 번에 제거하고 실제로 제거된 수 반환"""
+        removed = 0
+        for chunk in _chunks(photo_ids):
+            # 삭제 전에 앨범에서 빠질 활성 사진 수만큼 photo_count 감소
+            adjust_counter(
+                self.db, Album, "photo_count", [album_id],
+                -self._active_photo_count(chunk, album_id=album_id)
+            )
+            stmt = album_photos.delete().where(
+                and_(
+                    album_photos.c.album_id == album_id,
+                    album_photos.c.photo_id.in_(chunk)
+                )
+            )
+            removed += self.db.execute(stmt).rowcount
+        return removed
+
+    def _active_photo_count(self, photo_ids: List[int], album_id: Optional[int] = None):
+        """photo_ids 중 활성 사진 수를 세는 스칼라 서브쿼리 (album_id를 주면 그 앨범에 있는 사진만)"""
+        from app.domain.photo import Photo
+
+        query = select(func.count(Photo.id)).where(
+            and_(Photo.id.in_(photo_ids), Photo.is_active == True)
+        )
+        if album_id is not None:
+            query = query.where(
+                Photo.id.in_(
+                    select(album_photos.c.photo_id).where(album_photos.c.album_id == album_id)
+                )
+            )
+        return query.scalar_subquery()
+
+    def _insert_ignoring_conflicts(self, album_id: int, candidates):
+        """candidates의 (album_id, photo_id) 중 앨범에 없는 것만 넣는 INSERT ... SELECT
+
+        PostgreSQL/SQLite는 ON CONFLICT DO NOTHING을, 그 외 DB는 WHERE NOT EXISTS를 쓴다
+        (동시에 같은 사진을 추가하면 후자는 기본 키 충돌로 실패할 수 있음).
+        """
+        columns = ["album_id", "photo_id"]
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(album_photos).from_select(columns, candidates).on_conflict_do_nothing()
+        if dialect == "sqlite":
+            return sqlite.insert(album_photos).from_select(columns, candidates).on_conflict_do_nothing()
+
+        photo_id = candidates.selected_columns[1]
+        existing = select(album_photos.c.photo_id).where(
+            and_(album_photos.c.album_id == album_id, album_photos.c.photo_id == photo_id)
+        )
+        return album_photos.insert().from_select(columns, candidates.where(~existing.exists()))
+
     def remove_photo_from_album(self, album_id: int, photo_id: int) -> bool:
         """앨범에서 사진 제거"""
+        adjust_counter(
+            self.db, Album, "photo_count", [album_id],
+            -self._active_photo_count([photo_id], album_id=album_id)
+        )
         stmt = album_photos.delete().where(
             and_(
                 album_photos.c.album_id == album_id,
@@ -97,7 +281,7 @@ class AlbumRepository:
             )
         )
         result = self.db.execute(stmt)
-        self.db.commit()
+        self.db.flush()
         return result.rowcount > 0
 
     def is_photo_in_album(self, album_id: int, photo_id: int) -> bool:
@@ -114,12 +298,19 @@ class AlbumRepository:
         )
         return result is not None
 
-    def get_album_photos(self, album_id: int, skip: int = 0, limit: int = 50):
-        """앨범의 사진 목록 조회"""
+    def get_album_photos(
+        self,
+        album_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
+    ):
+        """앨범의 사진 목록 조회 (추가된 순서 역순, 커서는 photo_id 기준)"""
         from app.domain.photo import Photo
 
-        return (
-            self.db.query(Photo)
+        query = (
+            apply_profile(self.db.query(Photo), profile)
             .join(album_photos)
             .filter(
                 and_(
@@ -127,34 +318,33 @@ class AlbumRepository:
                     Photo.is_active == True
                 )
             )
-            .order_by(album_photos.c.added_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .order_by(album_photos.c.added_at.desc(), album_photos.c.photo_id.desc())
         )
 
-    def get_album_photo_count(self, album_id: int) -> int:
-        """앨범의 사진 개수 조회"""
-        from app.domain.photo import Photo
-
-        return (
-            self.db.query(func.count(Photo.id))
-            .join(album_photos)
-            .filter(
-                and_(
-                    album_photos.c.album_id == album_id,
-                    Photo.is_active == True
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(
+                    album_photos.c.added_at,
+                    album_photos.c.photo_id,
+                    cursor,
+                    album_id=album_id
                 )
             )
-            .scalar()
-        )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
+    def get_album_photo_count(self, album_id: int) -> int:
+        """앨범의 사진 개수 조회 (photo_count 카운터)"""
+        count = self.db.query(Album.photo_count).filter(Album.id == album_id).scalar()
+        return count or 0
 
     def create_album_share(self, share_data: dict) -> AlbumShare:
         """앨범 공유 생성"""
         share = AlbumShare(**share_data)
         self.db.add(share)
-        self.db.commit()
-        self.db.refresh(share)
+        self.db.flush()
         return share
 
     def get_album_share(self, album_id: int, shared_with_id: int) -> Optional[AlbumShare]:
@@ -208,22 +398,37 @@ class AlbumRepository:
             if hasattr(share, key):
                 setattr(share, key, value)
 
-        self.db.commit()
-        self.db.refresh(share)
+        self.db.flush()
         return share
 
-    def get_public_albums(self, skip: int = 0, limit: int = 50) -> List[Album]:
+    def get_public_albums(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[Album]:
         """공개 앨범 목록 조회"""
-        return (
-            self.db.query(Album)
+        query = (
+            apply_profile(self.db.query(Album), profile)
             .filter(
                 and_(
                     Album.is_active == True,
                     Album.is_public == True
                 )
             )
-            .order_by(Album.updated_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
\ No newline at end of file
+        )
+        return self._page(query, skip, limit, cursor)
+
+    def _page(self, query, skip: int, limit: int, cursor: Optional[str]) -> List[Album]:
+        """앨범 목록 정렬(updated_at, id 역순) 및 페이지네이션 적용"""
+        query = query.order_by(Album.updated_at.desc(), Album.id.desc())
+
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(Album.__table__.c.updated_at, Album.__table__.c.id, cursor)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
\ No newline at end of file
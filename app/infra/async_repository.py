@@ -0,0 +1,76 @@
+from typing import Any, Callable, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.database import read_only
+from app.infra.album_repository import AlbumRepository
+from app.infra.face_repository import FaceRepository
+from app.infra.group_repository import GroupRepository
+from app.infra.photo_repository import PhotoRepository
+from app.infra.user_repository import UserRepository
+
+
+T = TypeVar("T")
+
+# 복제본으로 보낼 수 있는 읽기 전용 메서드 접두사
+READ_METHOD_PREFIXES = ("get_", "search_", "is_", "count_")
+
+
+async def run_read_only(db: AsyncSession, fn: Callable[[Session], T]) -> T:
+    """읽기 전용 작업을 복제본 라우팅이 허용된 상태로 실행"""
+    def _run(session: Session) -> T:
+        with read_only(session):
+            return fn(session)
+
+    return await db.run_sync(_run)
+
+
+class AsyncRepository:
+    """동기 저장소의 비동기 버전
+
+    메서드 호출을 AsyncSession.run_sync로 실행한다. 쿼리는 비동기 드라이버(asyncpg/aiosqlite)
+    위에서 greenlet으로 실행되므로 DB 왕복 동안 이벤트 루프를 막지 않고,
+    쿼리 정의는 동기 저장소 한 곳에만 유지된다.
+    읽기 전용 메서드(get_*, search_*, is_*, count_*)는 복제본으로 보낼 수 있다.
+    """
+
+    repository_class: Callable[[Session], Any]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def __getattr__(self, name: str):
+        method = getattr(self.repository_class, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            if name.startswith(READ_METHOD_PREFIXES):
+                return await run_read_only(
+                    self.db, lambda session: self._invoke(session, method, args, kwargs)
+                )
+            return await self.db.run_sync(self._invoke, method, args, kwargs)
+
+        return call
+
+    def _invoke(self, session: Session, method, args, kwargs):
+        return method(self.repository_class(session), *args, **kwargs)
+
+
+class AsyncUserRepository(AsyncRepository):
+    repository_class = UserRepository
+
+
+class AsyncGroupRepository(AsyncRepository):
+    repository_class = GroupRepository
+
+
+class AsyncPhotoRepository(AsyncRepository):
+    repository_class = PhotoRepository
+
+
+class AsyncAlbumRepository(AsyncRepository):
+    repository_class = AlbumRepository
+
+
+class AsyncFaceRepository(AsyncRepository):
+    repository_class = FaceRepository
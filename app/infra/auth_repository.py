@@ -1,84 +1,108 @@
-import redis.asyncio as redis
 import json
-import uuid
-from datetime import datetime, timedelta
-from typing import Optional, List
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, NamedTuple, Optional
+from redis.asyncio import Redis
 from app.core.config import settings
-from app.domain.auth import SessionData, TokenBlacklist, UserSession
+from app.core.metrics import metrics
+from app.core.redis import LuaScript
+from app.core.revocation import REVOCATION_STREAM, RevocationFilter, get_revocation_filter
+from app.domain.auth import SessionData
+
+# 토큰 갱신 시 세션 회전 (한 번의 왕복으로 원자적으로 실행)
+# KEYS: 세션 해시, 세션 만료 색인
+# ARGV: 세션 ID, 기존 리프레시 jti, 새 액세스 jti, 새 리프레시 jti, 현재 epoch 초, 새 만료 epoch 초,
+#       세션 해시 TTL 초, 만료 색인 멤버
+# 저장된 리프레시 jti가 같고 만료되지 않았을 때만 jti를 교체하고 {이전 액세스 jti, 그 만료 epoch 초}를 반환, 아니면 nil
+# (이전 액세스 토큰의 폐기 키는 jti로 정해지므로 KEYS로 미리 넘길 수 없어 호출자가 이어서 기록)
+ROTATE_SESSION = LuaScript("""
+local raw = redis.call('HGET', KEYS[1], ARGV[1])
+if not raw then
+    return false
+end
+local session = cjson.decode(raw)
+local now = tonumber(ARGV[5])
+if session.r ~= ARGV[2] or session.e <= now then
+    return false
+end
+local old_access_jti = session.a
+local old_expires_at = session.e
+session.a = ARGV[3]
+session.r = ARGV[4]
+session.e = tonumber(ARGV[6])
+redis.call('HSET', KEYS[1], ARGV[1], cjson.encode(session))
+redis.call('EXPIRE', KEYS[1], ARGV[7])
+redis.call('ZADD', KEYS[2], ARGV[6], ARGV[8])
+return {old_access_jti, old_expires_at}
+""")
+
+# 세션 만료 색인 (정리 작업이 키 공간을 SCAN하지 않고 만료된 세션만 범위로 꺼냄)
+SESSION_EXPIRY_KEY = "session_expiry"
+
+
+class AccessCheck(NamedTuple):
+    """AuthRepository.check_access_token 결과"""
+
+    revoked: bool
+    session: Optional[SessionData]
+    principal: Optional[str]
 
 
 class AuthRepository:
-    """인증 관련 Redis 저장소"""
+    """인증 관련 Redis 저장소 (애플리케이션 공유 풀의 클라이언트를 받아 사용)
 
-    def __init__(self):
-        self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+    키에는 토큰 원문 대신 짧은 ID만 쓴다.
+    - sessions:{user_id}: 사용자의 세션 해시 (필드: 세션 ID, 값: jti/시각/접속 정보를 담은 짧은 JSON)
+    - session_expiry: 세션 만료 색인 (멤버: {user_id}:{세션 ID}, 점수: 만료 epoch 초)
+    - revoked:{jti}: 폐기된 액세스 토큰 (토큰이 만료될 때까지 유지)
 
-    async def store_session(self, user_id: int, access_token: str, refresh_token: str,
+    토큰의 sid/jti 클레임으로 세션을 바로 찾으므로 토큰 -> 세션 역색인 키는 두지 않는다.
+    토큰 폐기는 revoked 키와 함께 폐기 스트림에도 기록하고,
+    폐기 여부는 워커 로컬 필터(RevocationFilter)에 있을 때만 Redis로 확인한다.
+    토큰 갱신(세션 회전)은 ROTATE_SESSION 스크립트로 원자적으로 처리하고, 이전 액세스 토큰 폐기는 이어지는 파이프라인으로 기록한다.
+    """
+
+    def __init__(self, redis_client: Redis, revocations: Optional[RevocationFilter] = None):
+        self.redis_client = redis_client
+        self.revocations = revocations if revocations is not None else get_revocation_filter()
+
+    async def store_session(self, user_id: int, session_id: str, access_jti: str, refresh_jti: str,
                            ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> str:
         """Redis에 사용자 세션 저장
 
         Args:
             user_id: 사용자 ID
-            access_token: 액세스 토큰
-            refresh_token: 리프레시 토큰
+            session_id: 세션 ID (토큰의 sid 클레임)
+            access_jti: 액세스 토큰 jti
+            refresh_jti: 리프레시 토큰 jti
             ip_address: 클라이언트 IP 주소
             user_agent: 클라이언트 User-Agent
 
         Returns:
             세션 ID
         """
-        session_id = str(uuid.uuid4())
-        expires_at = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
-
-        session_data = SessionData(
+        created_at = datetime.utcnow()
+        session = SessionData(
             user_id=user_id,
-            access_token=access_token,
-            refresh_token=refresh_token,
-            created_at=datetime.utcnow(),
-            expires_at=expires_at,
+            session_id=session_id,
+            access_jti=access_jti,
+            refresh_jti=refresh_jti,
+            created_at=created_at,
+            expires_at=created_at + timedelta(minutes=settings.jwt_expire_minutes),
             ip_address=ip_address,
             user_agent=user_agent
         )
 
-        # 사용자별 세션 키
-        session_key = f"session:user:{user_id}:{session_id}"
-        user_sessions_key = f"user_sessions:{user_id}"
-
-        # Redis 파이프라인으로 원자적 저장
+        # 세션 해시의 만료는 가장 최근 세션 기준 (이전 세션은 expires_at으로 걸러내고 정리 작업이 삭제)
         pipe = self.redis_client.pipeline()
-
-        # 세션 데이터 저장
-        pipe.setex(
-            session_key,
-            timedelta(minutes=settings.jwt_expire_minutes),
-            session_data.model_dump_json()
-        )
-
-        # 사용자의 활성 세션 목록에 추가
-        pipe.sadd(user_sessions_key, session_id)
-        pipe.expire(user_sessions_key, timedelta(minutes=settings.jwt_expire_minutes))
-
-        # 액세스 토큰 매핑 저장 (빠른 검증용)
-        token_key = f"token:{access_token}"
-        pipe.setex(
-            token_key,
-            timedelta(minutes=settings.jwt_expire_minutes),
-            json.dumps({"user_id": user_id, "session_id": session_id})
-        )
-
-        # 리프레시 토큰 매핑 저장 (빠른 세션 업데이트용)
-        refresh_token_key = f"refresh_token:{refresh_token}"
-        pipe.setex(
-            refresh_token_key,
-            timedelta(days=30),  # 리프레시 토큰 만료 시간과 동일
-            json.dumps({"user_id": user_id, "session_id": session_id})
-        )
-
+        pipe.hset(_sessions_key(user_id), session_id, _encode_session(session))
+        pipe.expire(_sessions_key(user_id), timedelta(minutes=settings.jwt_expire_minutes))
+        pipe.zadd(SESSION_EXPIRY_KEY, {_expiry_member(user_id, session_id): _epoch(session.expires_at)})
         await pipe.execute()
         return session_id
 
     async def get_session(self, user_id: int, session_id: str) -> Optional[SessionData]:
-        """사용자 세션 조회
+        """사용자 세션 조회 (만료된 세션은 None)
 
         Args:
             user_id: 사용자 ID
@@ -87,260 +111,172 @@ class AuthRepository:
         Returns:
             세션 데이터 또는 None
         """
-        session_key = f"session:user:{user_id}:{session_id}"
-        session_data = await self.redis_client.get(session_key)
-
-        if session_data:
-            return SessionData.model_validate_json(session_data)
-        return None
+        raw = await self.redis_client.hget(_sessions_key(user_id), session_id)
+        if raw is None:
+            return None
+        session = _decode_session(user_id, session_id, raw)
+        return session if session.expires_at > datetime.utcnow() else None
 
-    async def get_session_by_token(self, access_token: str) -> Optional[SessionData]:
-        """액세스 토큰으로 세션 조회
-
-        Args:
-            access_token: 액세스 토큰
-
-        Returns:
-            세션 데이터 또는 None
-        """
-        token_key = f"token:{access_token}"
-        token_data = await self.redis_client.get(token_key)
-
-        if token_data:
-            token_info = json.loads(token_data)
-            return await self.get_session(token_info["user_id"], token_info["session_id"])
-        return None
-
-    async def invalidate_session(self, user_id: int, access_token: str) -> None:
-        """세션 무효화 (로그아웃)
+    async def invalidate_session(self, user_id: int, session_id: str) -> None:
+        """세션 무효화 (로그아웃, 세션의 액세스 토큰도 폐기)
 
         Args:
             user_id: 사용자 ID
-            access_token: 액세스 토큰
+            session_id: 세션 ID
         """
-        # 토큰으로 세션 정보 찾기
-        token_key = f"token:{access_token}"
-        token_data = await self.redis_client.get(token_key)
+        session = await self.get_session(user_id, session_id)
 
-        if token_data:
-            token_info = json.loads(token_data)
-            session_id = token_info["session_id"]
-
-            # 세션 데이터 조회하여 리프레시 토큰 추출
-            session = await self.get_session(user_id, session_id)
-
-            # Redis 파이프라인으로 원자적 삭제
-            pipe = self.redis_client.pipeline()
-
-            # 세션 데이터 삭제
-            session_key = f"session:user:{user_id}:{session_id}"
-            pipe.delete(session_key)
-
-            # 토큰 매핑 삭제
-            pipe.delete(token_key)
-
-            # 리프레시 토큰 매핑 삭제 (세션이 존재하는 경우)
-            if session:
-                refresh_token_key = f"refresh_token:{session.refresh_token}"
-                pipe.delete(refresh_token_key)
-
-            # 사용자 세션 목록에서 제거
-            user_sessions_key = f"user_sessions:{user_id}"
-            pipe.srem(user_sessions_key, session_id)
-
-            # 토큰 블랙리스트에 추가 (파이프라인 내에서 원자적 처리)
-            blacklist_key = f"blacklist:{access_token}"
-            blacklist_data = TokenBlacklist(
-                token=access_token,
-                user_id=user_id,
-                blacklisted_at=datetime.utcnow(),
-                reason="logout",
-                expires_at=datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
-            )
-            pipe.setex(
-                blacklist_key,
-                timedelta(minutes=settings.jwt_expire_minutes),
-                blacklist_data.model_dump_json()
-            )
+        pipe = self.redis_client.pipeline()
+        pipe.hdel(_sessions_key(user_id), session_id)
+        pipe.zrem(SESSION_EXPIRY_KEY, _expiry_member(user_id, session_id))
+        if session:
+            self._revoke(pipe, session.access_jti, session.expires_at, "logout")
+        await pipe.execute()
 
-            await pipe.execute()
+        if session:
+            self.revocations.add(session.access_jti)
 
-    async def _invalidate_session_with_refresh_token(self, user_id: int, access_token: str, refresh_token: str) -> None:
-        """세션 무효화 (리프레시 토큰 매핑 포함)
+    async def invalidate_all_sessions(self, user_id: int) -> None:
+        """사용자의 모든 세션 무효화 (각 세션의 액세스 토큰도 폐기)
 
         Args:
             user_id: 사용자 ID
-            access_token: 액세스 토큰
-            refresh_token: 리프레시 토큰
         """
-        # 토큰으로 세션 정보 찾기
-        token_key = f"token:{access_token}"
-        token_data = await self.redis_client.get(token_key)
-
-        if token_data:
-            token_info = json.loads(token_data)
-            session_id = token_info["session_id"]
+        sessions = await self._get_all_sessions(user_id)
 
-            # Redis 파이프라인으로 원자적 삭제
-            pipe = self.redis_client.pipeline()
-
-            # 세션 데이터 삭제
-            session_key = f"session:user:{user_id}:{session_id}"
-            pipe.delete(session_key)
-
-            # 토큰 매핑 삭제
-            pipe.delete(token_key)
-
-            # 리프레시 토큰 매핑 삭제
-            refresh_token_key = f"refresh_token:{refresh_token}"
-            pipe.delete(refresh_token_key)
-
-            # 사용자 세션 목록에서 제거
-            user_sessions_key = f"user_sessions:{user_id}"
-            pipe.srem(user_sessions_key, session_id)
-
-            # 토큰 블랙리스트에 추가 (파이프라인 내에서 원자적 처리)
-            blacklist_key = f"blacklist:{access_token}"
-            blacklist_data = TokenBlacklist(
-                token=access_token,
-                user_id=user_id,
-                blacklisted_at=datetime.utcnow(),
-                reason="logout",
-                expires_at=datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
-            )
-            pipe.setex(
-                blacklist_key,
-                timedelta(minutes=settings.jwt_expire_minutes),
-                blacklist_data.model_dump_json()
-            )
+        pipe = self.redis_client.pipeline()
+        pipe.delete(_sessions_key(user_id))
+        if sessions:
+            pipe.zrem(SESSION_EXPIRY_KEY, *(_expiry_member(user_id, session.session_id) for session in sessions))
+        for session in sessions:
+            self._revoke(pipe, session.access_jti, session.expires_at, "logout_all")
+        await pipe.execute()
 
-            await pipe.execute()
+        for session in sessions:
+            self.revocations.add(session.access_jti)
 
-    async def invalidate_all_sessions(self, user_id: int) -> None:
-        """사용자의 모든 세션 무효화
+    async def update_session(self, user_id: int, session_id: str, old_refresh_jti: str,
+                           access_jti: str, refresh_jti: str) -> Optional[str]:
+        """세션 업데이트 (토큰 갱신, 세션 ID는 유지하고 jti만 교체)
 
         Args:
             user_id: 사용자 ID
+            session_id: 세션 ID (리프레시 토큰의 sid 클레임)
+            old_refresh_jti: 기존 리프레시 토큰 jti (세션에 저장된 값과 같아야 함)
+            access_jti: 새 액세스 토큰 jti
+            refresh_jti: 새 리프레시 토큰 jti
+
+        Returns:
+            세션 ID 또는 None (세션이 없거나 이미 교체된 리프레시 토큰인 경우)
         """
-        user_sessions_key = f"user_sessions:{user_id}"
-        session_ids = await self.redis_client.smembers(user_sessions_key)
+        # 확인/교체는 스크립트 하나로 (동시 갱신 중 하나만 성공), 이긴 요청만 이전 액세스 토큰을 폐기
+        now = datetime.utcnow()
+        rotated = await ROTATE_SESSION(
+            self.redis_client,
+            keys=[_sessions_key(user_id), SESSION_EXPIRY_KEY],
+            args=[
+                session_id,
+                old_refresh_jti,
+                access_jti,
+                refresh_jti,
+                _epoch(now),
+                _epoch(now + timedelta(minutes=settings.jwt_expire_minutes)),
+                settings.jwt_expire_minutes * 60,
+                _expiry_member(user_id, session_id),
+            ]
+        )
+        if rotated is None:
+            return None
 
-        if session_ids:
-            # 먼저 모든 세션 데이터를 조회하여 토큰 정보 수집
-            pipe = self.redis_client.pipeline()
+        old_access_jti, old_expires_at = rotated
+        pipe = self.redis_client.pipeline()
+        self._revoke(pipe, old_access_jti, datetime.utcfromtimestamp(int(old_expires_at)), "refresh")
+        await pipe.execute()
 
-            # 모든 세션 데이터를 한 번에 조회
-            for session_id in session_ids:
-                session_key = f"session:user:{user_id}:{session_id}"
-                pipe.get(session_key)
+        self.revocations.add(old_access_jti)
+        return session_id
 
-            session_data_list = await pipe.execute()
+    async def is_token_blacklisted(self, jti: str) -> bool:
+        """토큰 폐기 여부 확인
 
-            # 새로운 파이프라인으로 모든 관련 데이터 삭제
-            pipe = self.redis_client.pipeline()
+        Args:
+            jti: 액세스 토큰 jti
 
-            # 세션 데이터와 관련 토큰 매핑 삭제
-            for i, session_data in enumerate(session_data_list):
-                if session_data:
-                    try:
-                        session_info = json.loads(session_data)
-                        access_token = session_info.get("access_token")
-                        refresh_token = session_info.get("refresh_token")
-
-                        # 토큰 매핑 삭제
-                        if access_token:
-                            pipe.delete(f"token:{access_token}")
-                        if refresh_token:
-                            pipe.delete(f"refresh_token:{refresh_token}")
-                    except (json.JSONDecodeError, KeyError):
-                        # 잘못된 세션 데이터는 무시하고 계속 진행
-                        pass
-
-                # 세션 데이터 삭제
-                session_id = list(session_ids)[i]
-                session_key = f"session:user:{user_id}:{session_id}"
-                pipe.delete(session_key)
-
-            # 사용자 세션 목록 삭제
-            pipe.delete(user_sessions_key)
+        Returns:
+            폐기 여부
+        """
+        if not self._needs_revocation_lookup(jti):
+            return False
+        return await self.redis_client.exists(_revoked_key(jti)) > 0
 
-            await pipe.execute()
+    async def check_access_token(self, user_id: int, session_id: str, jti: str,
+                                 principal_key: Optional[str] = None) -> AccessCheck:
+        """액세스 토큰 확인에 필요한 Redis 조회를 파이프라인 한 번으로
 
-    async def update_session(self, user_id: int, old_refresh_token: str,
-                           access_token: str, refresh_token: str) -> Optional[str]:
-        """세션 업데이트 (토큰 갱신)
+        세션(HGET)과 폐기 여부(EXISTS, 폐기 필터가 폐기되지 않았다고 확인하면 생략),
+        principal_key가 있으면 캐시된 인증 주체(GET)까지 함께 읽는다.
 
         Args:
             user_id: 사용자 ID
-            old_refresh_token: 기존 리프레시 토큰
-            access_token: 새 액세스 토큰
-            refresh_token: 새 리프레시 토큰
+            session_id: 토큰의 sid 클레임
+            jti: 토큰의 jti 클레임
+            principal_key: 함께 읽을 인증 주체 캐시 키 (로컬 캐시에 없을 때)
 
         Returns:
-            새 세션 ID 또는 None
+            폐기 여부, 세션(없거나 만료되었으면 None), 캐시된 주체 값
         """
-        # 기존 세션 찾기 (리프레시 토큰 매핑으로 O(1) 조회)
-        refresh_token_key = f"refresh_token:{old_refresh_token}"
-        refresh_token_data = await self.redis_client.get(refresh_token_key)
-
-        if refresh_token_data:
-            token_info = json.loads(refresh_token_data)
-            session_id = token_info["session_id"]
-
-            # 기존 세션 데이터 조회
-            session = await self.get_session(user_id, session_id)
-            if session:
-                # 기존 세션 삭제 (리프레시 토큰 매핑도 삭제됨)
-                await self._invalidate_session_with_refresh_token(user_id, session.access_token, old_refresh_token)
-
-                # 새 세션 생성
-                return await self.store_session(
-                    user_id=user_id,
-                    access_token=access_token,
-                    refresh_token=refresh_token,
-                    ip_address=session.ip_address,
-                    user_agent=session.user_agent
-                )
-
-        return None
-
-    async def is_token_blacklisted(self, access_token: str) -> bool:
-        """토큰 블랙리스트 확인
+        check_revoked = self._needs_revocation_lookup(jti)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hget(_sessions_key(user_id), session_id)
+        if check_revoked:
+            pipe.exists(_revoked_key(jti))
+        if principal_key is not None:
+            pipe.get(principal_key)
+
+        results = iter(await pipe.execute())
+        raw_session = next(results)
+        revoked = bool(next(results)) if check_revoked else False
+        principal = next(results) if principal_key is not None else None
+
+        session = None
+        if raw_session is not None:
+            session = _decode_session(user_id, session_id, raw_session)
+            if session.expires_at <= datetime.utcnow():
+                session = None
+        return AccessCheck(revoked=revoked, session=session, principal=principal)
+
+    def _needs_revocation_lookup(self, jti: str) -> bool:
+        """폐기 필터로 판단할 수 없어 Redis를 확인해야 하는지 (auth.revocation.checks에 기록)"""
+        if self.revocations.ready and not self.revocations.might_be_revoked(jti):
+            metrics.increment("auth.revocation.checks", source="filter")
+            return False
+        metrics.increment("auth.revocation.checks", source="redis")
+        return True
+
+    async def add_to_blacklist(self, jti: str, expires_at: datetime, reason: str = "logout") -> None:
+        """토큰 폐기
 
         Args:
-            access_token: 액세스 토큰
-
-        Returns:
-            블랙리스트 여부
+            jti: 액세스 토큰 jti
+            expires_at: 토큰 만료 시각 (이후에는 폐기 기록이 필요 없음)
+            reason: 폐기 이유
         """
-        blacklist_key = f"blacklist:{access_token}"
-        return await self.redis_client.exists(blacklist_key) > 0
+        pipe = self.redis_client.pipeline()
+        self._revoke(pipe, jti, expires_at, reason)
+        await pipe.execute()
+        self.revocations.add(jti)
 
-    async def add_to_blacklist(self, access_token: str, user_id: int, reason: str = "logout") -> None:
-        """토큰을 블랙리스트에 추가
+    def _revoke(self, pipe, jti: str, expires_at: datetime, reason: str) -> None:
+        """폐기 키 저장과 폐기 스트림 기록을 파이프라인에 추가
 
-        Args:
-            access_token: 액세스 토큰
-            user_id: 사용자 ID
-            reason: 블랙리스트 추가 이유
+        폐기 키는 토큰이 만료될 때까지만 두고, 토큰이 만료되어 의미가 없어진 스트림 항목은 MINID로 잘라낸다.
         """
-        blacklist_key = f"blacklist:{access_token}"
-        blacklist_data = TokenBlacklist(
-            token=access_token,
-            user_id=user_id,
-            blacklisted_at=datetime.utcnow(),
-            reason=reason,
-            expires_at=datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
-        )
-
-        await self.redis_client.setex(
-            blacklist_key,
-            timedelta(minutes=settings.jwt_expire_minutes),
-            blacklist_data.model_dump_json()
-        )
+        ttl = max(int((expires_at - datetime.utcnow()).total_seconds()), 1)
+        pipe.setex(_revoked_key(jti), ttl, reason)
+        pipe.xadd(REVOCATION_STREAM, {"jti": jti}, minid=_revocation_min_id(), approximate=True)
 
     async def get_user_sessions(self, user_id: int) -> List[SessionData]:
-        """사용자의 모든 활성 세션 조회
+        """사용자의 모든 활성 세션 조회 (HGETALL 한 번, 만료된 세션은 이때 해시에서 지움)
 
         Args:
             user_id: 사용자 ID
@@ -348,40 +284,106 @@ class AuthRepository:
         Returns:
             활성 세션 목록
         """
-        user_sessions_key = f"user_sessions:{user_id}"
-        session_ids = await self.redis_client.smembers(user_sessions_key)
+        now = datetime.utcnow()
+        active, expired = [], []
+        for session in await self._get_all_sessions(user_id):
+            (active if session.expires_at > now else expired).append(session)
 
-        sessions = []
-        for session_id in session_ids:
-            session = await self.get_session(user_id, session_id)
-            if session:
-                sessions.append(session)
+        if expired:
+            pipe = self.redis_client.pipeline()
+            pipe.hdel(_sessions_key(user_id), *(session.session_id for session in expired))
+            pipe.zrem(SESSION_EXPIRY_KEY, *(_expiry_member(user_id, session.session_id) for session in expired))
+            await pipe.execute()
+        return active
 
-        return sessions
+    async def cleanup_expired_sessions(self, batch_size: int = 500) -> int:
+        """만료된 세션 정리 (만료 색인에서 batch_size개씩 꺼내 파이프라인으로 삭제)
 
-    async def cleanup_expired_sessions(self) -> int:
-        """만료된 세션 정리
+        Args:
+            batch_size: 한 번에 정리할 세션 수
 
         Returns:
             정리된 세션 수
         """
-        # 이 메서드는 주기적으로 실행하여 만료된 세션을 정리
-        # Redis TTL을 사용하므로 자동으로 만료되지만, 명시적 정리도 가능
-        current_time = datetime.utcnow()
+        # 세션 해시 자체는 TTL로 만료되지만, 해시 안의 오래된 세션은 여기서 지움
+        # 만료된 세션은 갱신되지 않으므로 조회와 삭제 사이에 점수가 바뀌지 않음
+        now = _epoch(datetime.utcnow())
         cleaned_count = 0
 
-        # 패턴 매칭으로 모든 세션 키 찾기
-        pattern = "session:user:*"
-        async for key in self.redis_client.scan_iter(match=pattern):
-            session_data = await self.redis_client.get(key)
-            if session_data:
-                session = SessionData.model_validate_json(session_data)
-                if session.expires_at < current_time:
-                    await self.redis_client.delete(key)
-                    cleaned_count += 1
+        while True:
+            members = await self.redis_client.zrangebyscore(
+                SESSION_EXPIRY_KEY, "-inf", now, start=0, num=batch_size
+            )
+            if not members:
+                break
+
+            pipe = self.redis_client.pipeline()
+            for member in members:
+                user_id, session_id = member.split(":", 1)
+                pipe.hdel(_sessions_key(int(user_id)), session_id)
+            pipe.zrem(SESSION_EXPIRY_KEY, *members)
+            await pipe.execute()
+
+            cleaned_count += len(members)
+            if len(members) < batch_size:
+                break
 
         return cleaned_count
 
     async def close(self) -> None:
-        """Redis 연결 종료"""
-        await self.redis_client.close()
\ No newline at end of file
+        """저장소 정리 (공유 Redis 풀은 애플리케이션 종료 시 close_redis가 닫음)"""
+
+    async def _get_all_sessions(self, user_id: int) -> List[SessionData]:
+        sessions: Dict[str, str] = await self.redis_client.hgetall(_sessions_key(user_id))
+        return [_decode_session(user_id, session_id, raw) for session_id, raw in sessions.items()]
+
+
+def _revocation_min_id() -> str:
+    """폐기 스트림에 남길 가장 오래된 항목 ID (이보다 오래된 토큰은 이미 만료됨)"""
+    return str(int((time.time() - settings.jwt_expire_minutes * 60) * 1000))
+
+
+def _expiry_member(user_id: int, session_id: str) -> str:
+    return f"{user_id}:{session_id}"
+
+
+def _sessions_key(user_id: int) -> str:
+    return f"sessions:{user_id}"
+
+
+def _revoked_key(jti: str) -> str:
+    return f"revoked:{jti}"
+
+
+def _encode_session(session: SessionData) -> str:
+    """세션 해시 값 (짧은 키의 JSON, 시각은 epoch 초, 없는 접속 정보는 생략)"""
+    data = {
+        "a": session.access_jti,
+        "r": session.refresh_jti,
+        "c": _epoch(session.created_at),
+        "e": _epoch(session.expires_at),
+    }
+    if session.ip_address:
+        data["ip"] = session.ip_address
+    if session.user_agent:
+        data["ua"] = session.user_agent
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _epoch(value: datetime) -> int:
+    """UTC 기준 naive datetime -> epoch 초"""
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _decode_session(user_id: int, session_id: str, raw: str) -> SessionData:
+    data = json.loads(raw)
+    return SessionData(
+        user_id=user_id,
+        session_id=session_id,
+        access_jti=data["a"],
+        refresh_jti=data["r"],
+        created_at=datetime.utcfromtimestamp(data["c"]),
+        expires_at=datetime.utcfromtimestamp(data["e"]),
+        ip_address=data.get("ip"),
+        user_agent=data.get("ua")
+    )
@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, Optional, Union
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import ColumnElement, Select
+from app.domain.album import Album, album_photos
+from app.domain.face import Face
+from app.domain.group import Group, GroupMembership
+from app.domain.photo import Photo
+from app.domain.user import User
+
+# 카운터 이름 -> (모델, 컬럼, 실제 값을 계산하는 상관 서브쿼리)
+COUNTERS = {
+    "albums.photo_count": (
+        Album, "photo_count",
+        select(func.count(album_photos.c.photo_id))
+        .join(Photo, Photo.id == album_photos.c.photo_id)
+        .where(and_(album_photos.c.album_id == Album.id, Photo.is_active == True))
+    ),
+    "groups.member_count": (
+        Group, "member_count",
+        select(func.count(GroupMembership.id))
+        .where(and_(GroupMembership.group_id == Group.id, GroupMembership.is_active == True))
+    ),
+    "photos.face_count": (
+        Photo, "face_count",
+        select(func.count(Face.id))
+        .where(and_(Face.photo_id == Photo.id, Face.is_active == True))
+    ),
+    "users.face_count": (
+        User, "face_count",
+        select(func.count(Face.id))
+        .where(and_(Face.identified_user_id == User.id, Face.is_active == True))
+    ),
+}
+
+
+def adjust_counter(
+    db: Session,
+    model,
+    column: str,
+    ids: Union[Iterable[int], Select],
+    delta: Union[int, ColumnElement],
+    guard: Optional[ColumnElement] = None
+) -> Dict[int, int]:
+    """비정규화 카운터 컬럼을 원자적으로 증감하고 갱신된 {id: 값} 반환
+
+    UPDATE ... SET col = col + delta 한 문장으로 처리하므로 동시 요청이 있어도
+    값을 읽고 다시 쓰는 사이에 증감이 유실되지 않고, 호출한 쓰기와 같은 트랜잭션에서 반영된다.
+    ids에는 ID 목록 또는 ID를 고르는 SELECT를, delta에는 정수 또는 스칼라 서브쿼리를 줄 수 있다.
+    guard 조건을 만족하지 않는 행은 갱신하지 않으며 결과에도 포함되지 않는다.
+    카운터 변경은 행 수정이 아니므로 updated_at은 그대로 둔다.
+    """
+    if not isinstance(ids, Select):
+        ids = list(ids)
+        if not ids:
+            return {}
+        if isinstance(delta, int) and delta == 0:
+            return {}
+
+    table = model.__table__
+    counter = table.c[column]
+    values = {column: counter + delta}
+    if "updated_at" in table.c:
+        values["updated_at"] = table.c.updated_at
+
+    stmt = update(table).where(table.c.id.in_(ids)).values(values)
+    if guard is not None:
+        stmt = stmt.where(guard)
+
+    rows = db.execute(stmt.returning(table.c.id, counter)).all()
+
+    # 세션에 로딩된 객체에도 새 값을 반영 (만료시키면 다음 접근에서 다시 조회하게 됨)
+    updated = {}
+    for row_id, value in rows:
+        updated[row_id] = value
+        obj = db.identity_map.get(db.identity_key(model, row_id))
+        if obj is not None:
+            set_committed_value(obj, column, value)
+    return updated
+
+
+def max_counter_row_id(db: Session, name: str) -> int:
+    """카운터 테이블의 최대 ID (행이 없으면 0)"""
+    model, _, _ = COUNTERS[name]
+    return db.execute(select(func.max(model.__table__.c.id))).scalar() or 0
+
+
+def repair_counter(db: Session, name: str, min_id: int, max_id: int) -> int:
+    """min_id < id <= max_id 범위에서 실제 값과 다른 카운터를 다시 계산하고 수정된 행 수 반환
+
+    UPDATE ... SET col = (COUNT 서브쿼리) WHERE col <> (COUNT 서브쿼리) 한 문장으로 처리하므로
+    어긋난 행만 잠그고 갱신한다.
+    """
+    model, column, count_query = COUNTERS[name]
+    table = model.__table__
+    actual = count_query.correlate(table).scalar_subquery()
+
+    stmt = (
+        update(table)
+        .where(table.c.id > min_id, table.c.id <= max_id, table.c[column] != actual)
+        .values({column: actual, "updated_at": table.c.updated_at})
+    )
+    return db.execute(stmt).rowcount
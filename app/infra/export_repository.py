@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+from sqlalchemy import Row, Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import read_only
+from app.domain.album import Album
+from app.domain.face import Face
+from app.domain.photo import Photo
+
+# 내보내기 종류별 컬럼 (ORM 객체 대신 컬럼 행으로 읽어 identity map에 쌓이지 않게 함)
+EXPORT_COLUMNS: Dict[str, Sequence] = {
+    "photos": (
+        Photo.id, Photo.filename, Photo.original_filename, Photo.file_size,
+        Photo.width, Photo.height, Photo.format, Photo.taken_at,
+        Photo.camera_make, Photo.camera_model, Photo.gps_latitude, Photo.gps_longitude,
+        Photo.s3_url, Photo.uploaded_by_id, Photo.group_id, Photo.face_count, Photo.created_at,
+    ),
+    "faces": (
+        Face.id, Face.photo_id, Face.confidence, Face.bounding_box, Face.age_range,
+        Face.gender, Face.identified_user_id, Face.identified_at, Face.created_at,
+    ),
+    "albums": (
+        Album.id, Album.name, Album.description, Album.album_type, Album.is_public,
+        Album.cover_photo_id, Album.created_by_id, Album.group_id, Album.photo_count, Album.created_at,
+    ),
+}
+
+
+class ExportRepository:
+    """사진/얼굴/앨범 메타데이터 스트리밍 조회
+
+    결과 전체를 메모리에 올리지 않도록 서버 측 커서(stream_results)로 실행하고
+    yield_per 크기만큼씩 읽는다. 메모리 사용량은 결과 크기와 관계없이 배치 하나 분량이다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def statement(
+        self,
+        kind: str,
+        group_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        taken_from: Optional[datetime] = None,
+        taken_to: Optional[datetime] = None
+    ) -> Select:
+        """내보내기 쿼리 (group_id가 있으면 그룹, 없으면 user_id 사용자의 데이터, id 순)"""
+        query = select(*EXPORT_COLUMNS[kind])
+
+        if kind == "albums":
+            owner = Album.group_id == group_id if group_id is not None else Album.created_by_id == user_id
+            return query.where(and_(Album.is_active == True, owner)).order_by(Album.id)
+
+        owner = Photo.group_id == group_id if group_id is not None else Photo.uploaded_by_id == user_id
+        conditions = [Photo.is_active == True, owner]
+        if taken_from is not None:
+            conditions.append(Photo.taken_at >= taken_from)
+        if taken_to is not None:
+            conditions.append(Photo.taken_at <= taken_to)
+
+        if kind == "faces":
+            return (
+                query.join(Photo, Face.photo_id == Photo.id)
+                .where(and_(Face.is_active == True, *conditions))
+                .order_by(Face.id)
+            )
+        return query.where(and_(*conditions)).order_by(Photo.id)
+
+    async def stream(self, kind: str, batch_size: int = 1000, **scope) -> AsyncIterator[List[Row]]:
+        """내보내기 행을 batch_size개씩 전달 (읽기 전용이므로 복제본 라우팅 허용)"""
+        statement = self.statement(kind, **scope).execution_options(yield_per=batch_size)
+        with read_only(self.db.sync_session):
+            result = await self.db.stream(statement)
+        async for partition in result.partitions():
+            yield partition
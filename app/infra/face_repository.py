@@ -1,7 +1,14 @@
-from typing import Optional, List
+from collections import Counter
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from app.domain.face import Face, FaceCollection, FaceMatch
+from app.domain.photo import Photo
+from app.domain.user import User
+from app.infra.counters import adjust_counter
+from app.infra.loading import LoadingProfile, apply_profile
+from app.infra.pagination import keyset_condition
+from app.infra.read_models import FaceCard
 
 
 class FaceRepository:
@@ -12,8 +19,8 @@ class FaceRepository:
         """새로운 얼굴 생성"""
         face = Face(**face_data)
         self.db.add(face)
-        self.db.commit()
-        self.db.refresh(face)
+        self.db.flush()
+        self._count_faces(((face.photo_id, face.identified_user_id, face.is_active), 1))
         return face
 
     def get_face_by_id(self, face_id: int) -> Optional[Face]:
@@ -55,28 +62,55 @@ class FaceRepository:
             .all()
         )
 
-    def get_unidentified_faces(self, skip: int = 0, limit: int = 50) -> List[Face]:
-        """미식별 얼굴 목록 조회"""
-        return (
-            self.db.query(Face)
+    def get_unidentified_faces(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[Face]:
+        """미식별 얼굴 목록 조회 (cursor가 있으면 키셋 페이지네이션, skip은 무시)"""
+        query = apply_profile(self.db.query(Face), profile)
+        return self._unidentified_page(query, skip, limit, cursor).all()
+
+    def get_unidentified_face_cards(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> List[FaceCard]:
+        """미식별 얼굴 목록을 읽기 모델로 조회 (ORM 객체를 만들지 않음)"""
+        query = self.db.query(*FaceCard.columns)
+        return FaceCard.from_rows(self._unidentified_page(query, skip, limit, cursor).all())
+
+    def _unidentified_page(self, query, skip: int, limit: int, cursor: Optional[str]):
+        query = (
+            query
             .filter(
                 and_(
                     Face.identified_user_id.is_(None),
                     Face.is_active == True
                 )
             )
-            .order_by(Face.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .order_by(Face.created_at.desc(), Face.id.desc())
         )
 
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(Face.__table__.c.created_at, Face.__table__.c.id, cursor)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit)
+
     def update_face(self, face_id: int, update_data: dict) -> Optional[Face]:
         """얼굴 정보 수정"""
         face = self.get_face_by_id(face_id)
         if not face:
             return None
 
+        before = (face.photo_id, face.identified_user_id, face.is_active)
         for key, value in update_data.items():
             if hasattr(face, key):
                 if value == "NOW()":
@@ -84,8 +118,12 @@ class FaceRepository:
                 else:
                     setattr(face, key, value)
 
-        self.db.commit()
-        self.db.refresh(face)
+        self.db.flush()
+
+        # 식별 사용자/사진/활성 상태가 바뀌면 이전 카운터에서 빼고 새 카운터에 더함
+        after = (face.photo_id, face.identified_user_id, face.is_active)
+        if after != before:
+            self._count_faces((before, -1), (after, 1))
         return face
 
     def delete_face(self, face_id: int) -> bool:
@@ -95,15 +133,33 @@ class FaceRepository:
             return False
 
         face.is_active = False
-        self.db.commit()
+        self.db.flush()
+        self._count_faces(((face.photo_id, face.identified_user_id, True), -1))
         return True
 
+    def _count_faces(self, *changes: Tuple[tuple, int]) -> None:
+        """얼굴 상태 (photo_id, identified_user_id, is_active) 변화를 face_count 카운터에 반영
+
+        변경 전 상태는 -1, 변경 후 상태는 +1로 주면 사진/사용자별로 합산해
+        실제로 값이 바뀌는 카운터만 갱신한다.
+        """
+        photo_deltas, user_deltas = Counter(), Counter()
+        for (photo_id, user_id, is_active), delta in changes:
+            if is_active is False:
+                continue
+            photo_deltas[photo_id] += delta
+            if user_id is not None:
+                user_deltas[user_id] += delta
+
+        for model, deltas in ((Photo, photo_deltas), (User, user_deltas)):
+            for row_id, delta in deltas.items():
+                adjust_counter(self.db, model, "face_count", [row_id], delta)
+
     def create_collection(self, collection_data: dict) -> FaceCollection:
         """얼굴 컬렉션 생성"""
         collection = FaceCollection(**collection_data)
         self.db.add(collection)
-        self.db.commit()
-        self.db.refresh(collection)
+        self.db.flush()
         return collection
 
     def get_collection_by_id(self, collection_id: int) -> Optional[FaceCollection]:
@@ -146,8 +202,7 @@ class FaceRepository:
         """얼굴 매칭 생성"""
         match = FaceMatch(**match_data)
         self.db.add(match)
-        self.db.commit()
-        self.db.refresh(match)
+        self.db.flush()
         return match
 
     def get_face_matches(self, face_id: int, threshold: float = 0.8) -> List[FaceMatch]:
@@ -189,13 +244,17 @@ class FaceRepository:
                 else:
                     setattr(match, key, value)
 
-        self.db.commit()
-        self.db.refresh(match)
+        self.db.flush()
         return match
 
-    def get_unconfirmed_matches(self, skip: int = 0, limit: int = 50) -> List[FaceMatch]:
-        """미확인 얼굴 매칭 목록 조회"""
-        return (
+    def get_unconfirmed_matches(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> List[FaceMatch]:
+        """미확인 얼굴 매칭 목록 조회 (유사도 역순)"""
+        query = (
             self.db.query(FaceMatch)
             .filter(
                 and_(
@@ -203,12 +262,18 @@ class FaceRepository:
                     FaceMatch.is_active == True
                 )
             )
-            .order_by(FaceMatch.similarity.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .order_by(FaceMatch.similarity.desc(), FaceMatch.id.desc())
         )
 
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(FaceMatch.__table__.c.similarity, FaceMatch.__table__.c.id, cursor)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
     def get_faces_by_similarity(
         self,
         target_face_id: int,
@@ -250,27 +315,11 @@ class FaceRepository:
         )
 
     def get_face_count_by_user(self, user_id: int) -> int:
-        """사용자별 얼굴 개수 조회"""
-        return (
-            self.db.query(func.count(Face.id))
-            .filter(
-                and_(
-                    Face.identified_user_id == user_id,
-                    Face.is_active == True
-                )
-            )
-            .scalar()
-        )
+        """사용자별 얼굴 개수 조회 (users.face_count 카운터)"""
+        count = self.db.query(User.face_count).filter(User.id == user_id).scalar()
+        return count or 0
 
     def get_face_count_by_photo(self, photo_id: int) -> int:
-        """사진별 얼굴 개수 조회"""
-        return (
-            self.db.query(func.count(Face.id))
-            .filter(
-                and_(
-                    Face.photo_id == photo_id,
-                    Face.is_active == True
-                )
-            )
-            .scalar()
-        )
\ No newline at end of file
+        """사진별 얼굴 개수 조회 (photos.face_count 카운터)"""
+        count = self.db.query(Photo.face_count).filter(Photo.id == photo_id).scalar()
+        return count or 0
\ No newline at end of file
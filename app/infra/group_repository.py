@@ -1,7 +1,10 @@
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, insert, select, update
 from app.domain.group import Group, GroupMembership
+from app.infra.counters import adjust_counter
+from app.infra.loading import LoadingProfile, apply_profile
+from app.infra.pagination import keyset_condition
 
 
 class GroupRepository:
@@ -12,13 +15,12 @@ class GroupRepository:
         """새로운 그룹 생성"""
         group = Group(**group_data)
         self.db.add(group)
-        self.db.commit()
-        self.db.refresh(group)
+        self.db.flush()
         return group
 
     def get_by_id(self, group_id: int) -> Optional[Group]:
         """ID로 그룹 조회"""
-        return self.db.query(Group).filter(Group.id == group_id).first()
+        return self.db.get(Group, group_id)
 
     def get_by_invite_code(self, invite_code: str) -> Optional[Group]:
         """초대 코드로 그룹 조회"""
@@ -39,8 +41,7 @@ class GroupRepository:
             if hasattr(group, key):
                 setattr(group, key, value)
 
-        self.db.commit()
-        self.db.refresh(group)
+        self.db.flush()
         return group
 
     def delete(self, group_id: int) -> bool:
@@ -50,17 +51,79 @@ class GroupRepository:
             return False
 
         group.is_active = False
-        self.db.commit()
+        self.db.flush()
         return True
 
-    def create_membership(self, membership_data: dict) -> Optional[GroupMembership]:
-        """그룹 멤버십 생성"""
+    def create_membership(
+        self,
+        membership_data: dict,
+        within_limit: bool = False
+    ) -> Optional[GroupMembership]:
+        """그룹 멤버십 생성
+
+        활성 멤버십이면 그룹의 member_count를 같은 트랜잭션에서 1 증가시킨다.
+        within_limit이면 member_count < max_members일 때만 증가시키고(조건부 UPDATE 한 문장),
+        정원이 찼으면 멤버십을 만들지 않고 None을 반환한다.
+        """
         membership = GroupMembership(**membership_data)
+        if membership.is_active is not False:
+            guard = Group.member_count < Group.max_members if within_limit else None
+            if not adjust_counter(self.db, Group, "member_count", [membership.group_id], 1, guard=guard):
+                return None
+
         self.db.add(membership)
-        self.db.commit()
-        self.db.refresh(membership)
+        self.db.flush()
         return membership
 
+    def add_members(
+        self,
+        group_id: int,
+        members: Dict[int, str],
+        inactive_user_ids: Iterable[int] = ()
+    ) -> bool:
+        """여러 사용자를 한 번에 그룹 멤버로 추가 ({사용자 ID: 역할})
+
+        member_count를 정원 안에서만 한 문장으로 늘리고, 새 멤버십은 executemany로 넣는다.
+        inactive_user_ids의 사용자는 기존(탈퇴한) 멤버십을 다시 활성화한다.
+        정원을 넘으면 아무것도 추가하지 않고 False를 반환한다.
+        """
+        if not members:
+            return True
+        guard = Group.member_count + len(members) <= Group.max_members
+        if not adjust_counter(self.db, Group, "member_count", [group_id], len(members), guard=guard):
+            return False
+
+        inactive = set(inactive_user_ids)
+        if inactive:
+            table = GroupMembership.__table__
+            self.db.execute(
+                update(table)
+                .where(and_(table.c.group_id == group_id, table.c.user_id == bindparam("member_id")))
+                .values(is_active=True, role=bindparam("member_role"), left_at=None),
+                [{"member_id": user_id, "member_role": members[user_id]} for user_id in inactive]
+            )
+        new_members = [
+            {"group_id": group_id, "user_id": user_id, "role": role, "is_active": True}
+            for user_id, role in members.items() if user_id not in inactive
+        ]
+        if new_members:
+            self.db.execute(insert(GroupMembership), new_members)
+        return True
+
+    def get_membership_states(self, group_id: int, user_ids: Iterable[int]) -> Dict[int, bool]:
+        """사용자별 그룹 멤버십 활성 여부 ({사용자 ID: is_active}, 멤버십이 없으면 제외)"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        rows = self.db.execute(
+            select(GroupMembership.user_id, GroupMembership.is_active)
+            .where(and_(GroupMembership.group_id == group_id, GroupMembership.user_id.in_(user_ids)))
+        )
+        states: Dict[int, bool] = {}
+        for user_id, is_active in rows:
+            states[user_id] = states.get(user_id, False) or bool(is_active)
+        return states
+
     def get_membership(self, group_id: int, user_id: int) -> Optional[GroupMembership]:
         """특정 사용자의 그룹 멤버십 조회"""
         return (
@@ -74,10 +137,14 @@ class GroupRepository:
             .first()
         )
 
-    def get_active_memberships(self, group_id: int) -> List[GroupMembership]:
+    def get_active_memberships(
+        self,
+        group_id: int,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[GroupMembership]:
         """그룹의 활성 멤버십 목록 조회"""
         return (
-            self.db.query(GroupMembership)
+            apply_profile(self.db.query(GroupMembership), profile)
             .filter(
                 and_(
                     GroupMembership.group_id == group_id,
@@ -88,17 +155,9 @@ class GroupRepository:
         )
 
     def get_active_member_count(self, group_id: int) -> int:
-        """그룹의 활성 멤버 수 조회"""
-        return (
-            self.db.query(GroupMembership)
-            .filter(
-                and_(
-                    GroupMembership.group_id == group_id,
-                    GroupMembership.is_active == True
-                )
-            )
-            .count()
-        )
+        """그룹의 활성 멤버 수 조회 (member_count 카운터)"""
+        group = self.get_by_id(group_id)
+        return group.member_count if group else 0
 
     def deactivate_membership(self, group_id: int, user_id: int) -> bool:
         """멤버십 비활성화 (그룹 탈퇴)"""
@@ -107,13 +166,14 @@ class GroupRepository:
             return False
 
         membership.is_active = False
-        self.db.commit()
+        self.db.flush()
+        adjust_counter(self.db, Group, "member_count", [group_id], -1)
         return True
 
-    def get_user_groups(self, user_id: int) -> List[Group]:
+    def get_user_groups(self, user_id: int, profile: Optional[LoadingProfile] = None) -> List[Group]:
         """사용자가 가입한 활성 그룹 목록 조회"""
         return (
-            self.db.query(Group)
+            apply_profile(self.db.query(Group), profile)
             .join(GroupMembership)
             .filter(
                 and_(
@@ -125,12 +185,24 @@ class GroupRepository:
             .all()
         )
 
-    def get_all_active(self, skip: int = 0, limit: int = 100) -> List[Group]:
-        """활성 그룹 목록 조회"""
-        return (
+    def get_all_active(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Group]:
+        """활성 그룹 목록 조회 (ID 순, cursor가 있으면 키셋 페이지네이션)"""
+        query = (
             self.db.query(Group)
             .filter(Group.is_active == True)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
\ No newline at end of file
+            .order_by(Group.id.asc())
+        )
+
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(Group.__table__.c.id, Group.__table__.c.id, cursor, descending=False)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
\ No newline at end of file
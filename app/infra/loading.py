@@ -0,0 +1,58 @@
+from typing import Optional
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from app.domain.album import Album
+from app.domain.group import GroupMembership
+from app.domain.photo import Photo
+
+
+class LoadingProfile:
+    """조회 용도별 관계 로딩 방식
+
+    응답에 필요한 관계만 selectinload/joinedload로 미리 읽고, 나머지 관계는 raiseload로 막아
+    목록 응답에서 행마다 지연 로딩 쿼리가 나가는(N+1) 대신 즉시 예외가 나도록 한다.
+    """
+
+    def __init__(self, name: str, *options):
+        self.name = name
+        self.options = options + (raiseload("*"),)
+
+    def apply(self, query):
+        """Query/Select에 로딩 옵션 적용"""
+        return query.options(*self.options)
+
+    def __repr__(self) -> str:
+        return f"LoadingProfile({self.name!r})"
+
+
+def apply_profile(query, profile: Optional[LoadingProfile]):
+    """프로필이 있으면 적용 (없으면 모델의 기본 지연 로딩 유지)"""
+    return profile.apply(query) if profile is not None else query
+
+
+# 사진 목록 카드: 컬럼과 카운터(face_count)만 사용
+PHOTO_CARD = LoadingProfile("photo_card")
+
+# 사진 상세: 태그와 얼굴 목록 포함
+PHOTO_DETAIL = LoadingProfile(
+    "photo_detail",
+    selectinload(Photo.tags),
+    selectinload(Photo.faces),
+)
+
+# 앨범 목록: 커버 사진 포함 (사진 수는 photo_count 카운터)
+ALBUM_WITH_COVER = LoadingProfile(
+    "album_with_cover",
+    joinedload(Album.cover_photo),
+)
+
+# 그룹 목록: 멤버 수는 member_count 카운터이므로 관계를 읽지 않음
+GROUP_WITH_MEMBER_COUNT = LoadingProfile("group_with_member_count")
+
+# 그룹 멤버 목록: 멤버십별 사용자 포함
+MEMBERSHIP_WITH_USER = LoadingProfile(
+    "membership_with_user",
+    joinedload(GroupMembership.user),
+)
+
+# 얼굴 목록 카드: 컬럼만 사용
+FACE_CARD = LoadingProfile("face_card")
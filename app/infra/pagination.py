@@ -0,0 +1,103 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from sqlalchemy import Column, and_, func, select, tuple_
+
+
+# 날짜 커서의 행을 다시 읽을 때 정렬 값으로 거는 범위 (시간대/직렬화 차이를 덮을 만큼 넓게)
+ANCHOR_WINDOW = timedelta(days=1)
+
+
+class InvalidCursorError(ValueError):
+    """잘못된 페이지네이션 커서"""
+
+
+def encode_cursor(sort_value: Any, last_id: int) -> str:
+    """(정렬 값, ID)를 불투명한 커서 문자열로 인코딩"""
+    if isinstance(sort_value, datetime):
+        value = {"dt": sort_value.isoformat()}
+    else:
+        value = sort_value
+    payload = json.dumps([value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """커서 문자열을 (정렬 값, ID)로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+        if not isinstance(last_id, int):
+            raise TypeError("cursor id must be an integer")
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    return value, last_id
+
+
+def keyset_condition(
+    sort_column: Column,
+    id_column: Column,
+    cursor: str,
+    descending: bool = True,
+    **anchor_key: Any
+):
+    """커서가 가리키는 행 다음부터 조회하는 키셋 조건 생성
+
+    (정렬 컬럼, ID) 튜플 비교로 OFFSET 없이 인덱스 범위 스캔만으로 다음 페이지를 찾는다.
+    비교 기준 정렬 값은 커서 행에서 DB에 저장된 값을 직접 읽고 (드라이버별 날짜 직렬화
+    차이로 같은 시각이 다르게 비교되는 문제 방지), 행이 사라진 경우 커서에 담긴 값을 사용한다.
+
+    Args:
+        sort_column: 정렬 컬럼 (Core Column)
+        id_column: 고유 타이브레이커 컬럼 (Core Column, 같은 테이블)
+        cursor: encode_cursor로 만든 커서
+        descending: 내림차순 여부
+        anchor_key: 커서 행을 찾기 위한 추가 키 (예: album_id)
+    """
+    last_value, last_id = decode_cursor(cursor)
+
+    if sort_column is id_column:
+        return id_column < last_id if descending else id_column > last_id
+
+    anchor_table = sort_column.table.alias()
+    conditions = [
+        anchor_table.c[id_column.name] == last_id,
+        *(anchor_table.c[key] == value for key, value in anchor_key.items())
+    ]
+    plan_bounds = []
+    if isinstance(last_value, datetime):
+        # 정렬 컬럼이 파티션 키이면 커서 행을 찾을 때도 커서 값 근처 파티션만 읽음 (ID만으로는 모든 파티션을 확인)
+        low, high = last_value - ANCHOR_WINDOW, last_value + ANCHOR_WINDOW
+        conditions.append(anchor_table.c[sort_column.name].between(low, high))
+        # 기준 값은 항상 이 범위 안이므로 결과는 같고, 상수 조건이라 계획 시점에 커서 이후 파티션을 제외
+        plan_bounds.append(sort_column <= high if descending else sort_column >= low)
+    anchor = select(anchor_table.c[sort_column.name]).where(and_(*conditions)).scalar_subquery()
+    last_sort = func.coalesce(anchor, last_value)
+
+    # 정렬 컬럼 단독 범위 조건을 함께 걸어 두면 (결과는 같음) 정렬 컬럼이 파티션 키일 때
+    # PostgreSQL이 실행 시점에 커서 이후 파티션만 스캔한다 (튜플 비교만으로는 가지치기 불가).
+    # 상수 범위는 뒤에 두어 SQLite가 커서 값 범위로 인덱스를 탐색하게 한다.
+    if descending:
+        return and_(
+            sort_column <= last_sort, tuple_(sort_column, id_column) < tuple_(last_sort, last_id), *plan_bounds
+        )
+    return and_(sort_column >= last_sort, tuple_(sort_column, id_column) > tuple_(last_sort, last_id), *plan_bounds)
+
+
+def next_cursor(
+    items: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], Tuple[Any, int]]
+) -> Optional[str]:
+    """마지막 항목으로 다음 페이지 커서 생성 (마지막 페이지면 None)"""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(*key(items[-1]))
+
+
+def paginate(items: List[Any], limit: int, key: Callable[[Any], Tuple[Any, int]]) -> dict:
+    """목록 응답용 페이지 딕셔너리"""
+    return {"items": items, "next_cursor": next_cursor(items, limit, key)}
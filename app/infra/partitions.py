@@ -0,0 +1,204 @@
+import re
+from datetime import date
+from typing import Dict, List, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+# created_at 월 단위 범위 파티셔닝 대상 (PostgreSQL 전용, DB_PARTITIONING=range일 때 마이그레이션이 변환)
+PARTITIONED_TABLES = ("photos", "faces")
+
+# 파티션 테이블을 참조하는 외래 키 (참조 테이블, 컬럼, 파티션 테이블)
+# 파티션 테이블의 고유 키는 파티션 키(created_at)를 포함해야 하므로 id만으로는 참조할 수 없어
+# 변환 시 제거하고, 참조 무결성은 저장소(소프트 삭제)와 RetentionService의 삭제 순서가 보장한다.
+REFERENCING_FOREIGN_KEYS = [
+    ("faces", "photo_id", "photos"),
+    ("photo_tags", "photo_id", "photos"),
+    ("album_photos", "photo_id", "photos"),
+    ("albums", "cover_photo_id", "photos"),
+    ("face_matches", "face1_id", "faces"),
+    ("face_matches", "face2_id", "faces"),
+]
+
+# 같은 이유로 파티션 테이블에서는 일반 인덱스로 바꾸는 고유 인덱스 (되돌릴 때 복원)
+UNIQUE_INDEXES = {"ix_faces_face_id"}
+
+MONTH_PARTITION = re.compile(r"^(?P<table>\w+)_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """월 파티션 이름 (예: photos_p2026_10)"""
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """테이블이 파티션 테이블인지 확인"""
+    return bool(conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = :table AND c.relnamespace = current_schema()::regnamespace)"
+    ), {"table": table}).scalar())
+
+
+def month_partitions(conn: Connection, table: str) -> List[Tuple[str, date]]:
+    """붙어 있는 월 파티션 (이름, 시작 월) 목록 (시작 월 순, 기본 파티션 제외)"""
+    names = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :table AND p.relnamespace = current_schema()::regnamespace"
+    ), {"table": table}).scalars()
+
+    partitions = []
+    for name in names:
+        match = MONTH_PARTITION.match(name)
+        if match and match["table"] == table:
+            partitions.append((name, date(int(match["year"]), int(match["month"]), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_month_partitions(conn: Connection, table: str, first: date, last: date) -> List[str]:
+    """first ~ last 월 파티션 생성 (이미 있으면 건너뛰고 새로 만든 이름 반환)"""
+    existing = {name for name, _ in month_partitions(conn, table)}
+    created = []
+    month = month_start(first)
+    while month <= month_start(last):
+        name = partition_name(table, month)
+        if name not in existing:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(conn: Connection, table: str, before: date, concurrently: bool = False) -> List[str]:
+    """before 월 이전 파티션을 분리 (분리된 테이블은 그대로 남아 덤프/보관 후 삭제할 수 있음)
+
+    concurrently=True면 부모 테이블을 잠그지 않고 분리한다 (PostgreSQL 14+, 트랜잭션 밖 AUTOCOMMIT 연결 필요,
+    기본 파티션이 있는 테이블에는 쓸 수 없음).
+    """
+    detached = []
+    for name, month in month_partitions(conn, table):
+        if add_months(month, 1) <= month_start(before):
+            suffix = " CONCURRENTLY" if concurrently else ""
+            conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}{suffix}"))
+            detached.append(name)
+    return detached
+
+
+def drop_referencing_foreign_keys(conn: Connection) -> None:
+    """파티션 테이블을 참조하는 외래 키 제거"""
+    inspector = inspect(conn)
+    for table, column, referred in REFERENCING_FOREIGN_KEYS:
+        for fk in inspector.get_foreign_keys(table):
+            if fk["referred_table"] == referred and fk["constrained_columns"] == [column]:
+                conn.execute(text(f'ALTER TABLE {table} DROP CONSTRAINT "{fk["name"]}"'))
+
+
+def restore_referencing_foreign_keys(conn: Connection) -> None:
+    """drop_referencing_foreign_keys로 제거한 외래 키 복원"""
+    for table, column, referred in REFERENCING_FOREIGN_KEYS:
+        conn.execute(text(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {referred} (id)"
+        ))
+
+
+def partition_table(conn: Connection, table: str, months_ahead: int = 3) -> None:
+    """기존 테이블을 created_at 월 범위 파티션 테이블로 변환 (데이터 복사, 인덱스/외래 키 재생성)
+
+    기본 키는 (id, created_at)이 되고, 가장 오래된 행의 월부터 months_ahead 개월 뒤까지의 파티션과
+    범위를 벗어난 행을 받는 기본 파티션을 만든다. drop_referencing_foreign_keys 이후에 호출해야 한다.
+    """
+    index_defs, foreign_keys = _capture(conn, table)
+    index_defs = [
+        indexdef.replace("CREATE UNIQUE INDEX", "CREATE INDEX", 1) for indexdef in index_defs
+    ]
+    legacy = f"{table}_unpartitioned"
+
+    conn.execute(text(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL"))
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    conn.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT {table}_pkey"))
+    conn.execute(text(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE) "
+        f"PARTITION BY RANGE (created_at)"
+    ))
+    conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL"))
+    conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)"))
+
+    oldest = conn.execute(text(f"SELECT min(created_at)::date FROM {legacy}")).scalar()
+    this_month = month_start(date.today())
+    create_month_partitions(conn, table, min(oldest or this_month, this_month), add_months(this_month, months_ahead))
+    conn.execute(text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"))
+
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {legacy}"))
+    _move_sequence(conn, legacy, table)
+    conn.execute(text(f"DROP TABLE {legacy}"))
+    _restore(conn, table, index_defs, foreign_keys)
+
+
+def unpartition_table(conn: Connection, table: str) -> None:
+    """partition_table의 역변환 (붙어 있는 파티션의 데이터만 일반 테이블로 복사, 분리된 파티션은 그대로 남음)"""
+    index_defs, foreign_keys = _capture(conn, table)
+    index_defs = [
+        indexdef.replace("CREATE INDEX", "CREATE UNIQUE INDEX", 1)
+        if indexdef.split()[2] in UNIQUE_INDEXES else indexdef
+        for indexdef in index_defs
+    ]
+    partitioned = f"{table}_partitioned"
+
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {partitioned}"))
+    conn.execute(text(f"ALTER TABLE {partitioned} DROP CONSTRAINT {table}_pkey"))
+    conn.execute(text(
+        f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE)"
+    ))
+    conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN created_at DROP NOT NULL"))
+    conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)"))
+
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {partitioned}"))
+    _move_sequence(conn, partitioned, table)
+    conn.execute(text(f"DROP TABLE {partitioned} CASCADE"))
+    _restore(conn, table, index_defs, foreign_keys)
+
+
+def _capture(conn: Connection, table: str) -> Tuple[List[str], List[Dict]]:
+    """기본 키 외 인덱스 정의와, 파티션 테이블이 아닌 테이블을 참조하는 외래 키"""
+    index_defs = list(conn.execute(text(
+        "SELECT indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = :table AND indexname <> :pkey"
+    ), {"table": table, "pkey": f"{table}_pkey"}).scalars())
+    foreign_keys = [
+        fk for fk in inspect(conn).get_foreign_keys(table)
+        if fk["referred_table"] not in PARTITIONED_TABLES
+    ]
+    return index_defs, foreign_keys
+
+
+def _restore(conn: Connection, table: str, index_defs: List[str], foreign_keys: List[Dict]) -> None:
+    """_capture로 저장한 인덱스/외래 키를 새 테이블에 다시 생성 (파티션 테이블이면 모든 파티션에 전파)"""
+    for indexdef in index_defs:
+        conn.execute(text(indexdef))
+    for fk in foreign_keys:
+        conn.execute(text(
+            f'ALTER TABLE {table} ADD CONSTRAINT "{fk["name"]}" '
+            f'FOREIGN KEY ({", ".join(fk["constrained_columns"])}) '
+            f'REFERENCES {fk["referred_table"]} ({", ".join(fk["referred_columns"])})'
+        ))
+
+
+def _move_sequence(conn: Connection, source: str, table: str) -> None:
+    """id 시퀀스 소유권을 새 테이블로 이전 (원래 테이블을 삭제해도 시퀀스가 남도록)"""
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence(:source, 'id')"), {"source": source}).scalar()
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
@@ -1,7 +1,13 @@
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
+from sqlalchemy import select
+from app.domain.album import Album, album_photos
 from app.domain.photo import Photo, PhotoTag
+from app.infra.counters import adjust_counter
+from app.infra.loading import LoadingProfile, apply_profile
+from app.infra.pagination import keyset_condition
+from app.infra.read_models import PhotoCard
 
 
 class PhotoRepository:
@@ -12,17 +18,13 @@ class PhotoRepository:
         """새로운 사진 생성"""
         photo = Photo(**photo_data)
         self.db.add(photo)
-        self.db.commit()
-        self.db.refresh(photo)
+        self.db.flush()
         return photo
 
-    def get_by_id(self, photo_id: int) -> Optional[Photo]:
+    def get_by_id(self, photo_id: int, profile: Optional[LoadingProfile] = None) -> Optional[Photo]:
         """ID로 사진 조회"""
-        return (
-            self.db.query(Photo)
-            .filter(and_(Photo.id == photo_id, Photo.is_active == True))
-            .first()
-        )
+        query = self.db.query(Photo).filter(and_(Photo.id == photo_id, Photo.is_active == True))
+        return apply_profile(query, profile).first()
 
     def get_by_hash(self, file_hash: str) -> Optional[Photo]:
         """파일 해시로 사진 조회"""
@@ -37,10 +39,38 @@ class PhotoRepository:
         group_id: Optional[int] = None,
         uploaded_by_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
     ) -> List[Photo]:
-        """사진 목록 조회"""
-        query = self.db.query(Photo).filter(Photo.is_active == True)
+        """사진 목록 조회 (cursor가 있으면 키셋 페이지네이션, skip은 무시)"""
+        query = apply_profile(self.db.query(Photo), profile)
+        return self._photos_page(query, group_id, uploaded_by_id, skip, limit, cursor).all()
+
+    def get_photo_cards(
+        self,
+        group_id: Optional[int] = None,
+        uploaded_by_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> List[PhotoCard]:
+        """사진 목록을 읽기 모델로 조회 (get_photos와 같은 조건/순서, ORM 객체를 만들지 않음)"""
+        query = self.db.query(*PhotoCard.columns)
+        return PhotoCard.from_rows(
+            self._photos_page(query, group_id, uploaded_by_id, skip, limit, cursor).all()
+        )
+
+    def _photos_page(
+        self,
+        query,
+        group_id: Optional[int],
+        uploaded_by_id: Optional[int],
+        skip: int,
+        limit: int,
+        cursor: Optional[str]
+    ):
+        query = query.filter(Photo.is_active == True)
 
         if group_id is not None:
             query = query.filter(Photo.group_id == group_id)
@@ -48,13 +78,16 @@ class PhotoRepository:
         if uploaded_by_id is not None:
             query = query.filter(Photo.uploaded_by_id == uploaded_by_id)
 
-        return (
-            query
-            .order_by(Photo.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = query.order_by(Photo.created_at.desc(), Photo.id.desc())
+
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(Photo.__table__.c.created_at, Photo.__table__.c.id, cursor)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit)
 
     def get_unprocessed_photos(self, limit: int = 10) -> List[Photo]:
         """처리되지 않은 사진 목록 조회"""
@@ -81,8 +114,9 @@ class PhotoRepository:
             if hasattr(photo, key):
                 setattr(photo, key, value)
 
-        self.db.commit()
-        self.db.refresh(photo)
+        self.db.flush()
+        if photo.is_active is False:
+            self._uncount_from_albums(photo_id)
         return photo
 
     def delete(self, photo_id: int) -> bool:
@@ -92,15 +126,20 @@ class PhotoRepository:
             return False
 
         photo.is_active = False
-        self.db.commit()
+        self.db.flush()
+        self._uncount_from_albums(photo_id)
         return True
 
+    def _uncount_from_albums(self, photo_id: int) -> None:
+        """비활성화된 사진이 들어 있는 앨범들의 photo_count를 1씩 감소"""
+        album_ids = select(album_photos.c.album_id).where(album_photos.c.photo_id == photo_id)
+        adjust_counter(self.db, Album, "photo_count", album_ids, -1)
+
     def create_tag(self, tag_data: dict) -> PhotoTag:
         """사진 태그 생성"""
         tag = PhotoTag(**tag_data)
         self.db.add(tag)
-        self.db.commit()
-        self.db.refresh(tag)
+        self.db.flush()
         return tag
 
     def get_photo_tags(self, photo_id: int) -> List[PhotoTag]:
@@ -119,7 +158,7 @@ class PhotoRepository:
             return False
 
         self.db.delete(tag)
-        self.db.commit()
+        self.db.flush()
         return True
 
     def search_photos_by_tag(self, tag_name: str, limit: int = 50) -> List[Photo]:
@@ -145,6 +184,24 @@ class PhotoRepository:
         group_id: Optional[int] = None
     ) -> List[Photo]:
         """날짜 범위로 사진 조회"""
+        return self._date_range_query(start_date, end_date, group_id).all()
+
+    def iter_photos_by_date_range(
+        self,
+        start_date,
+        end_date,
+        group_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Photo]:
+        """날짜 범위로 사진 순회 (서버 측 커서로 batch_size개씩 읽음, 작업/스크립트용)
+
+        결과 전체를 리스트로 만들지 않으므로 범위가 넓어도 메모리 사용량이 일정하다.
+        AsyncRepository로는 호출할 수 없다 (API는 ExportRepository 사용).
+        """
+        query = self._date_range_query(start_date, end_date, group_id)
+        return query.execution_options(stream_results=True).yield_per(batch_size)
+
+    def _date_range_query(self, start_date, end_date, group_id: Optional[int]):
         query = (
             self.db.query(Photo)
             .filter(
@@ -159,4 +216,4 @@ class PhotoRepository:
         if group_id is not None:
             query = query.filter(Photo.group_id == group_id)
 
-        return query.order_by(Photo.taken_at.desc()).all()
\ No newline at end of file
+        return query.order_by(Photo.taken_at.desc())
@@ -0,0 +1,99 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple
+from pydantic_core import to_json
+from app.domain.album import Album
+from app.domain.face import Face
+from app.domain.photo import Photo
+from app.infra.pagination import paginate
+
+
+class ReadModel:
+    """목록 응답용 읽기 모델 (컬럼 단위 SELECT 결과를 담는 __slots__ 데이터클래스)
+
+    ORM 객체 생성과 identity map 추적, 응답 모델의 from_attributes 재검증을 거치지 않는다.
+    columns의 순서는 데이터클래스 필드 순서와 같아야 한다.
+    """
+
+    __slots__ = ()
+
+    columns: ClassVar[Tuple[Any, ...]]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> List["ReadModel"]:
+        return [cls(*row) for row in rows]
+
+
+@dataclass(slots=True)
+class PhotoCard(ReadModel):
+    """PhotoResponse와 같은 필드"""
+
+    id: int
+    filename: str
+    original_filename: str
+    file_path: str
+    file_size: int
+    width: Optional[int]
+    height: Optional[int]
+    format: Optional[str]
+    s3_url: str
+    uploaded_by_id: int
+    group_id: Optional[int]
+    is_processed: bool
+    is_active: bool
+    face_count: int
+    taken_at: Optional[datetime]
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class AlbumCard(ReadModel):
+    """AlbumResponse와 같은 필드 (cover_photo_url은 커버 사진 외부 조인)"""
+
+    id: int
+    name: str
+    description: Optional[str]
+    album_type: str
+    auto_criteria: Optional[str]
+    is_public: bool
+    cover_photo_id: Optional[int]
+    cover_photo_url: Optional[str]
+    created_by_id: int
+    group_id: Optional[int]
+    is_active: bool
+    photo_count: int
+    created_at: datetime
+    updated_at: Optional[datetime]  # 커서 키
+
+
+@dataclass(slots=True)
+class FaceCard(ReadModel):
+    """FaceResponse와 같은 필드"""
+
+    id: int
+    face_id: str
+    confidence: float
+    bounding_box: Dict[str, float]
+    landmarks: Optional[Dict[str, Any]]
+    age_range: Optional[Dict[str, int]]
+    gender: Optional[str]
+    emotions: Optional[List[Dict[str, Any]]]
+    photo_id: int
+    identified_user_id: Optional[int]
+    identified_by_id: Optional[int]
+    identified_at: Optional[datetime]
+    is_active: bool
+    created_at: datetime
+
+
+PhotoCard.columns = tuple(getattr(Photo, field.name) for field in fields(PhotoCard))
+AlbumCard.columns = tuple(
+    Photo.s3_url.label("cover_photo_url") if field.name == "cover_photo_url" else getattr(Album, field.name)
+    for field in fields(AlbumCard)
+)
+FaceCard.columns = tuple(getattr(Face, field.name) for field in fields(FaceCard))
+
+
+def dump_page(items: List[ReadModel], limit: int, key: Callable[[Any], Tuple[Any, int]]) -> bytes:
+    """목록 응답 JSON ({"items", "next_cursor"})을 응답 모델 검증 없이 바로 직렬화"""
+    return to_json(paginate(items, limit, key))
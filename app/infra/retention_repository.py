@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.orm import Session
+from app.domain.album import Album, AlbumShare, album_photos
+from app.domain.face import Face, FaceMatch
+from app.domain.photo import Photo, PhotoTag
+from app.domain.user import User
+from app.infra.counters import adjust_counter
+
+# 보관(archive) 콜백: (테이블 이름, 삭제 직전 행 목록)
+Archiver = Callable[[str, List[dict]], None]
+
+
+class RetentionRepository:
+    """소프트 삭제된 행의 영구 삭제
+
+    저장소의 delete는 is_active만 끄므로 삭제된 행이 계속 남아 인덱스를 키운다.
+    보존 기간이 지난 행을 ID 키셋 배치로 골라 의존 순서대로(매칭 -> 얼굴 -> 태그/앨범 연결 -> 사진) 지운다.
+    archive가 있으면 각 테이블 행을 지우기 직전에 같은 트랜잭션에서 넘긴다.
+    """
+
+    def __init__(self, db: Session, archive: Optional[Archiver] = None):
+        self.db = db
+        self.archive = archive
+
+    def expired_ids(self, model, cutoff: datetime, after_id: int, limit: int) -> List[int]:
+        """cutoff 이전에 소프트 삭제된 행 ID (after_id 다음부터 limit개, ID 순)"""
+        return list(self.db.execute(
+            select(model.id)
+            .where(and_(
+                model.is_active == False,
+                model.deleted_at < cutoff,
+                model.id > after_id
+            ))
+            .order_by(model.id)
+            .limit(limit)
+        ).scalars())
+
+    def delete_face_matches(self, match_ids: List[int]) -> int:
+        """얼굴 매칭 삭제"""
+        return self._delete(FaceMatch.__table__, FaceMatch.id.in_(match_ids))
+
+    def delete_faces(self, face_ids: List[int]) -> Dict[str, int]:
+        """소프트 삭제된 얼굴과 그 얼굴을 참조하는 매칭 삭제 (이미 카운터에서 제외된 얼굴)"""
+        return {
+            "face_matches": self._delete(
+                FaceMatch.__table__,
+                or_(FaceMatch.face1_id.in_(face_ids), FaceMatch.face2_id.in_(face_ids))
+            ),
+            "faces": self._delete(Face.__table__, Face.id.in_(face_ids)),
+        }
+
+    def photo_objects(self, photo_ids: List[int]) -> List[Tuple[int, str, str]]:
+        """사진들의 저장소 객체 (사진 ID, bucket, key) 목록"""
+        return [
+            (photo_id, bucket, key) for photo_id, bucket, key in self.db.execute(
+                select(Photo.id, Photo.s3_bucket, Photo.s3_key).where(Photo.id.in_(photo_ids))
+            )
+        ]
+
+    def delete_photos(self, photo_ids: List[int]) -> Dict[str, int]:
+        """사진과 그 사진에 딸린 매칭/얼굴/태그/앨범 연결 삭제 (테이블별 삭제 행 수 반환)"""
+        face_ids = select(Face.id).where(Face.photo_id.in_(photo_ids))
+
+        deleted = {"face_matches": self._delete(
+            FaceMatch.__table__,
+            or_(FaceMatch.face1_id.in_(face_ids), FaceMatch.face2_id.in_(face_ids))
+        )}
+        # 사진이 비활성이어도 얼굴은 활성일 수 있으므로 사용자 카운터에서 제외
+        self._uncount_active_faces(Face.photo_id.in_(photo_ids))
+        deleted["faces"] = self._delete(Face.__table__, Face.photo_id.in_(photo_ids))
+        deleted["photo_tags"] = self._delete(PhotoTag.__table__, PhotoTag.photo_id.in_(photo_ids))
+        # 소프트 삭제 시 photo_count에서 이미 제외되었으므로 카운터는 그대로
+        deleted["album_photos"] = self._delete(album_photos, album_photos.c.photo_id.in_(photo_ids))
+        self.db.execute(
+            update(Album)
+            .where(Album.cover_photo_id.in_(photo_ids))
+            .values(cover_photo_id=None, updated_at=Album.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        deleted["photos"] = self._delete(Photo.__table__, Photo.id.in_(photo_ids))
+        return deleted
+
+    def delete_album_shares(self, share_ids: List[int]) -> int:
+        """앨범 공유 삭제"""
+        return self._delete(AlbumShare.__table__, AlbumShare.id.in_(share_ids))
+
+    def _uncount_active_faces(self, condition) -> None:
+        """지울 얼굴 중 활성이고 식별된 얼굴 수만큼 사용자별 users.face_count 감소 (UPDATE 한 문장)"""
+        active = and_(condition, Face.is_active == True)
+        user_ids = select(Face.identified_user_id).where(and_(active, Face.identified_user_id.isnot(None)))
+        removed = (
+            select(func.count(Face.id))
+            .where(and_(active, Face.identified_user_id == User.id))
+            .scalar_subquery()
+        )
+        adjust_counter(self.db, User, "face_count", user_ids, -removed)
+
+    def _delete(self, table, condition) -> int:
+        """조건에 맞는 행 삭제 (archive가 있으면 먼저 넘김)"""
+        if self.archive is not None:
+            rows = [dict(row) for row in self.db.execute(select(table).where(condition)).mappings()]
+            if not rows:
+                return 0
+            self.archive(table.name, rows)
+        return self.db.execute(
+            delete(table).where(condition).execution_options(synchronize_session=False)
+        ).rowcount
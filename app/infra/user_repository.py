@@ -1,6 +1,10 @@
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
+from sqlalchemy import insert, or_, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from app.core.principal import Principal, track_principal_changes
 from app.domain.user import User
+from app.infra.pagination import keyset_condition
 
 
 class UserRepository:
@@ -11,13 +15,46 @@ class UserRepository:
         """새로운 사용자 생성"""
         user = User(**user_data)
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
+    def bulk_create(self, users_data: List[dict]) -> Dict[str, int]:
+        """사용자 일괄 생성 (executemany INSERT ... RETURNING, ORM 객체를 만들지 않음)
+
+        Returns:
+            {이메일: 새 사용자 ID}
+        """
+        if not users_data:
+            return {}
+        rows = self.db.execute(insert(User).returning(User.id, User.email), users_data)
+        return {email: user_id for user_id, email in rows}
+
+    def get_identities(self, emails: Iterable[str], usernames: Iterable[str]) -> List[Row]:
+        """이메일 또는 사용자명이 겹치는 사용자의 (id, email, username, is_active) 조회 (한 문장)"""
+        emails, usernames = list(emails), list(usernames)
+        if not emails and not usernames:
+            return []
+        return list(self.db.execute(
+            select(User.id, User.email, User.username, User.is_active)
+            .where(or_(User.email.in_(emails), User.username.in_(usernames)))
+        ))
+
     def get_by_id(self, user_id: int) -> Optional[User]:
         """ID로 사용자 조회"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
+
+    def load_principal(self, user_id: int) -> Optional[Principal]:
+        """인증 주체 컬럼만 조회 (캐시 미스 시 사용)
+
+        get_ 접두사가 아니므로 복제본으로 보내지 않는다. 무효화 직후 복제 지연 때문에
+        바뀌기 전 주체를 다시 캐시하지 않도록 항상 primary에서 읽는다.
+        """
+        row = self.db.execute(
+            select(User.id, User.is_active, User.role, User.token_version).where(User.id == user_id)
+        ).first()
+        if row is None:
+            return None
+        return Principal(id=row.id, is_active=bool(row.is_active), role=row.role, token_version=row.token_version or 0)
 
     def get_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
@@ -45,8 +82,7 @@ class UserRepository:
             if hasattr(user, key):
                 setattr(user, key, value)
 
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def delete(self, user_id: int) -> bool:
@@ -56,15 +92,31 @@ class UserRepository:
             return False
 
         user.is_active = False
-        self.db.commit()
+        self.db.flush()
         return True
 
-    def get_all_active(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """활성 사용자 목록 조회"""
-        return (
+    def get_all_active(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[User]:
+        """활성 사용자 목록 조회 (ID 순, cursor가 있으면 키셋 페이지네이션)"""
+        query = (
             self.db.query(User)
             .filter(User.is_active.is_(True))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
\ No newline at end of file
+            .order_by(User.id.asc())
+        )
+
+        if cursor is not None:
+            query = query.filter(
+                keyset_condition(User.__table__.c.id, User.__table__.c.id, cursor, descending=False)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
+
+# 사용자 변경(update/delete, 역할 변경 등)이 커밋되면 캐시된 인증 주체 무효화
+track_principal_changes(User)
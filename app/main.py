@@ -1,8 +1,21 @@
+import asyncio
+import boto3
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.database import create_tables
+from app.core.database import SessionLocal, async_engine, create_tables, engine, replica_set
+from app.core.keys import get_keyring, run_key_rotation
+from app.core.metrics import metrics
+from app.core.principal import run_invalidation_listener
+from app.core.rate_limit import GCRA
+from app.core.redis import close_redis, load_scripts, open_redis
+from app.core.revocation import get_revocation_filter, run_revocation_sync
+from app.core.security import close_password_pool, require_admin
+from app.infra.auth_repository import ROTATE_SESSION
+from app.services.counter_service import run_reconcile_job
+from app.services.partition_service import run_partition_job
+from app.services.retention_service import run_retention_job
 
 # API 라우터 import
 from app.api.auth_router import router as auth_router
@@ -11,6 +24,7 @@ from app.api.group_router import router as group_router
 from app.api.photo_router import router as photo_router
 from app.api.album_router import router as album_router
 from app.api.face_router import router as face_router
+from app.api.export_router import router as export_router
 
 
 @asynccontextmanager
@@ -18,8 +32,69 @@ async def lifespan(app: FastAPI):
     """애플리케이션 라이프사이클 관리"""
     # 시작 시 실행
     create_tables()
+    redis_client = await open_redis()
+    await load_scripts(redis_client, ROTATE_SESSION, GCRA)
+    principal_listener = None
+    if settings.principal_cache_ttl_seconds > 0:
+        principal_listener = asyncio.create_task(run_invalidation_listener(redis_client))
+    revocation_sync = None
+    if settings.revocation_filter_enabled:
+        revocation_sync = asyncio.create_task(
+            run_revocation_sync(get_revocation_filter(), redis_client, settings.revocation_filter_rebuild_seconds)
+        )
+    key_rotation = None
+    if settings.jwt_stateless_access_tokens:
+        # 첫 시작이면 서명 키를 만들고, 이후 주기적으로 교체 (키 생성은 스레드에서)
+        rotation_seconds = settings.jwt_key_rotation_days * 86400
+        await asyncio.to_thread(get_keyring().rotate_if_due, rotation_seconds)
+        key_rotation = asyncio.create_task(run_key_rotation(get_keyring(), rotation_seconds))
+    replica_set.start_monitor(settings.replica_lag_check_interval_seconds)
+    reconcile_job = None
+    if settings.counter_reconcile_interval_seconds > 0:
+        reconcile_job = asyncio.create_task(
+            run_reconcile_job(SessionLocal, settings.counter_reconcile_interval_seconds, redis_client)
+        )
+    retention_job = None
+    if settings.retention_interval_seconds > 0:
+        retention_job = asyncio.create_task(
+            run_retention_job(
+                SessionLocal,
+                settings.retention_interval_seconds,
+                settings.retention_days,
+                settings.retention_batch_size,
+                s3_client=boto3.client("s3", region_name=settings.aws_region),
+                redis_client=redis_client
+            )
+        )
+    partition_job = None
+    if (
+        settings.partition_maintenance_interval_seconds > 0
+        and settings.db_partitioning
+        and engine.dialect.name == "postgresql"
+    ):
+        partition_job = asyncio.create_task(
+            run_partition_job(
+                engine,
+                settings.partition_maintenance_interval_seconds,
+                settings.db_partition_months_ahead,
+                settings.db_partition_retain_months,
+                redis_client
+            )
+        )
     yield
-    # 종료 시 실행 (필요한 경우 정리 작업)
+    # 종료 시 실행: 카운터 복구/보존 기간 정리/파티션 유지 작업, 주체 무효화 구독/폐기 스트림 동기화/서명 키 교체와 복제 지연 모니터 중지, 비동기 커넥션/Redis/비밀번호 해싱 풀 정리
+    # (작업이 끝난 뒤에 엔진/Redis 풀을 닫도록 취소한 작업을 기다림)
+    jobs = [
+        job for job in (reconcile_job, retention_job, partition_job, principal_listener, revocation_sync, key_rotation)
+        if job is not None
+    ]
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
+    await replica_set.dispose()
+    await async_engine.dispose()
+    await close_redis()
+    close_password_pool()
 
 
 app = FastAPI(
@@ -46,6 +121,7 @@ app.include_router(group_router, prefix="/api/v1")
 app.include_router(photo_router, prefix="/api/v1")
 app.include_router(album_router, prefix="/api/v1")
 app.include_router(face_router, prefix="/api/v1")
+app.include_router(export_router, prefix="/api/v1")
 
 
 
@@ -61,6 +137,21 @@ async def root():
     }
 
 
+@app.get("/metrics", dependencies=[Depends(require_admin)])
+async def get_metrics():
+    """프로세스 메트릭 (DB 라우팅, 커넥션 풀, 쿼리 지연 시간, 관리자 전용)"""
+    return metrics.snapshot()
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks(response: Response):
+    """액세스 토큰 검증용 공개 키 (무상태 액세스 토큰을 켠 경우만)"""
+    if not settings.jwt_stateless_access_tokens:
+        raise HTTPException(status_code=404, detail="Not Found")
+    response.headers["Cache-Control"] = f"public, max-age={settings.jwks_max_age_seconds}"
+    return get_keyring().jwks()
+
+
 @app.get("/health")
 async def health_check():
     """헬스체크 엔드포인트"""
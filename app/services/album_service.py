@@ -1,7 +1,9 @@
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from app.domain.album import Album, AlbumShare
 from app.infra.album_repository import AlbumRepository
+from app.infra.loading import LoadingProfile
+from app.infra.read_models import AlbumCard
 
 
 class AlbumService:
@@ -59,7 +61,9 @@ class AlbumService:
         group_id: Optional[int] = None,
         album_type: Optional[str] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
     ) -> List[Album]:
         """앨범 목록 조회"""
         return self.repository.get_albums(
@@ -67,19 +71,37 @@ class AlbumService:
             group_id=group_id,
             album_type=album_type,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            profile=profile
         )
 
-    def get_user_albums(self, user_id: int) -> List[Album]:
-        """사용자의 모든 앨범 조회 (생성한 앨범 + 공유받은 앨범)"""
-        created_albums = self.repository.get_albums(created_by_id=user_id)
-        shared_albums = self.repository.get_shared_albums(user_id)
-
-        # 중복 제거
-        all_albums = created_albums + [share.album for share in shared_albums]
-        unique_albums = {album.id: album for album in all_albums}
+    def get_album_cards(
+        self,
+        created_by_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        album_type: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> List[AlbumCard]:
+        """앨범 목록 조회 (목록 응답용 읽기 모델)"""
+        return self.repository.get_album_cards(
+            created_by_id=created_by_id,
+            group_id=group_id,
+            album_type=album_type,
+            limit=limit,
+            cursor=cursor
+        )
 
-        return list(unique_albums.values())
+    def get_user_albums(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[Tuple[Album, str]]:
+        """사용자의 앨범과 유효 권한 조회 (생성한 앨범 + 공유받은 앨범 + 가입한 그룹의 앨범)"""
+        return self.repository.get_user_albums(user_id, limit=limit, cursor=cursor, profile=profile)
 
     def update_album(self, album_id: int, update_data: dict) -> Optional[Album]:
         """앨범 정보 수정"""
@@ -89,25 +111,63 @@ class AlbumService:
         """앨범 삭제 (소프트 삭제)"""
         return self.repository.delete(album_id)
 
-    def add_photos_to_album(self, album_id: int, photo_ids: List[int]) -> bool:
-        """앨범에 사진들 추가"""
+    def can_edit_album(self, album: Album, user_id: int) -> bool:
+        """앨범 편집 권한 확인 (생성자 또는 edit/admin 권한으로 공유받은 사용자)"""
+        if album.created_by_id == user_id:
+            return True
+        share = self.repository.get_album_share(album.id, user_id)
+        return share is not None and share.permission in ("edit", "admin")
+
+    def add_photos_to_album(
+        self,
+        album_id: int,
+        photo_ids: List[int],
+        user_id: Optional[int] = None
+    ) -> Optional[Dict[str, int]]:
+        """앨범에 사진들 일괄 추가 (앨범이 없으면 None)
+
+        user_id를 지정하면 그 사용자가 볼 수 있는 사진만 추가한다.
+        """
         album = self.repository.get_by_id(album_id)
         if not album:
-            return False
+            return None
+
+        requested = len(set(photo_ids))
+        added = self.repository.add_photos_to_album(
+            album_id, photo_ids, visible_to_user_id=user_id
+        )
+        return {"added": added, "skipped": requested - added}
+
+    def remove_photos_from_album(
+        self,
+        album_id: int,
+        photo_ids: List[int]
+    ) -> Optional[Dict[str, int]]:
+        """앨범에서 사진들 일괄 제거 (앨범이 없으면 None, 커버 사진이 제거되면 커버 해제)"""
+        album = self.repository.get_by_id(album_id)
+        if not album:
+            return None
 
-        for photo_id in photo_ids:
-            if not self.repository.is_photo_in_album(album_id, photo_id):
-                self.repository.add_photo_to_album(album_id, photo_id)
+        requested = set(photo_ids)
+        removed = self.repository.remove_photos_from_album(album_id, photo_ids)
+        if removed and album.cover_photo_id in requested:
+            self.repository.update(album_id, {"cover_photo_id": None})
 
-        return True
+        return {"removed": removed, "skipped": len(requested) - removed}
 
     def remove_photo_from_album(self, album_id: int, photo_id: int) -> bool:
         """앨범에서 사진 제거"""
         return self.repository.remove_photo_from_album(album_id, photo_id)
 
-    def get_album_photos(self, album_id: int, skip: int = 0, limit: int = 50):
+    def get_album_photos(
+        self,
+        album_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ):
         """앨범의 사진 목록 조회"""
-        return self.repository.get_album_photos(album_id, skip, limit)
+        return self.repository.get_album_photos(album_id, skip, limit, cursor)
 
     def set_cover_photo(self, album_id: int, photo_id: int) -> bool:
         """앨범 커버 사진 설정"""
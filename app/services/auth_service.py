@@ -1,28 +1,35 @@
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+import math
+from typing import Optional, Dict, Any, Tuple
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from datetime import datetime, timedelta
 
-from app.domain.user import User
-from app.domain.auth import AuthResponse, SessionData
-from app.infra.user_repository import UserRepository
+from app.infra.async_repository import AsyncUserRepository
 from app.infra.auth_repository import AuthRepository
 from app.core.security import (
+    AuthContext,
     verify_password,
+    run_password_hash,
+    access_token_expires_in,
     create_access_token,
     create_refresh_token,
+    new_token_id,
+    decode_access_token,
     verify_token,
     verify_refresh_token
 )
-from app.core.config import settings
+from app.core.rate_limit import LoginThrottle
+from app.core.redis import get_redis
 
 
 class AuthService:
     """인증 서비스"""
 
-    def __init__(self, db: Session):
-        self.user_repository = UserRepository(db)
-        self.auth_repository = AuthRepository()
+    def __init__(self, db: AsyncSession, redis_client: Optional[Redis] = None):
+        self.user_repository = AsyncUserRepository(db)
+        redis_client = redis_client if redis_client is not None else get_redis()
+        self.auth_repository = AuthRepository(redis_client)
+        self.login_throttle = LoginThrottle(redis_client)
 
     async def login(self, email: str, password: str,
                    ip_address: Optional[str] = None,
@@ -39,18 +46,27 @@ class AuthService:
             인증 토큰과 사용자 정보
 
         Raises:
-            HTTPException: 인증 실패 시
+            HTTPException: 인증 실패 시, 시도 제한을 넘은 경우 (429, Retry-After)
         """
+        # 시도 제한 확인 (사용자 조회와 bcrypt 검증 전에)
+        retry_after = await self.login_throttle.retry_after(email, ip_address)
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts",
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+
         # 사용자 확인
-        user = self.user_repository.get_by_email(email)
+        user = await self.user_repository.get_by_email(email)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
             )
 
-        # 비밀번호 검증
-        if not verify_password(password, user.hashed_password):
+        # 비밀번호 검증 (bcrypt는 이벤트 루프 밖 해싱 풀에서 실행)
+        if not await run_password_hash(verify_password, password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -63,15 +79,20 @@ class AuthService:
                 detail="User account is disabled"
             )
 
-        # JWT 토큰 생성
-        access_token = create_access_token(data={"sub": str(user.id)})
-        refresh_token = create_refresh_token(user.id)
+        # JWT 토큰 생성 (토큰에 세션 ID와 jti를 담고, Redis 세션에는 jti만 저장)
+        session_id = new_token_id()
+        access_jti, refresh_jti = new_token_id(), new_token_id()
+        access_token = create_access_token(
+            data=_access_claims(user, session_id, access_jti)
+        )
+        refresh_token = create_refresh_token(user.id, user.token_version, session_id, refresh_jti)
 
         # Redis에 세션 저장
         session_id = await self.auth_repository.store_session(
             user_id=user.id,
-            access_token=access_token,
-            refresh_token=refresh_token,
+            session_id=session_id,
+            access_jti=access_jti,
+            refresh_jti=refresh_jti,
             ip_address=ip_address,
             user_agent=user_agent
         )
@@ -80,7 +101,7 @@ class AuthService:
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_type": "bearer",
-            "expires_in": settings.jwt_expire_minutes * 60,
+            "expires_in": access_token_expires_in(),
             "user_id": user.id,
             "session_id": session_id
         }
@@ -94,25 +115,24 @@ class AuthService:
         Raises:
             HTTPException: 토큰이 유효하지 않을 시
         """
-        # 토큰 블랙리스트 확인
-        if await self.auth_repository.is_token_blacklisted(access_token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token is already invalidated"
-            )
-
         # 토큰 검증
         try:
-            payload = verify_token(access_token)
-            user_id = int(payload.get("sub"))
+            user_id, session_id, jti = _session_claims(verify_token(access_token))
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token"
             )
 
+        # 토큰 폐기 여부 확인
+        if await self.auth_repository.is_token_blacklisted(jti):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token is already invalidated"
+            )
+
         # Redis에서 세션 제거
-        await self.auth_repository.invalidate_session(user_id, access_token)
+        await self.auth_repository.invalidate_session(user_id, session_id)
 
     async def logout_all_sessions(self, user_id: int) -> None:
         """사용자의 모든 세션 로그아웃
@@ -137,7 +157,7 @@ class AuthService:
         # 리프레시 토큰 검증
         try:
             payload = verify_refresh_token(refresh_token)
-            user_id = int(payload.get("sub"))
+            user_id, session_id, old_refresh_jti = _session_claims(payload)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -145,23 +165,34 @@ class AuthService:
             )
 
         # 사용자 확인
-        user = self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(user_id)
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found or inactive"
             )
 
-        # 새 토큰 생성
-        new_access_token = create_access_token(data={"sub": str(user.id)})
-        new_refresh_token = create_refresh_token(user.id)
+        # 비밀번호 변경 등으로 토큰 버전이 올라간 뒤의 이전 리프레시 토큰 거부
+        if payload.get("ver", 0) < user.token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token"
+            )
 
-        # Redis 세션 업데이트
+        # 새 토큰 생성 (같은 세션 ID 유지)
+        access_jti, refresh_jti = new_token_id(), new_token_id()
+        new_access_token = create_access_token(
+            data=_access_claims(user, session_id, access_jti)
+        )
+        new_refresh_token = create_refresh_token(user.id, user.token_version, session_id, refresh_jti)
+
+        # Redis 세션 업데이트 (세션에 저장된 리프레시 jti와 같을 때만)
         session_id = await self.auth_repository.update_session(
             user_id=user.id,
-            old_refresh_token=refresh_token,
-            access_token=new_access_token,
-            refresh_token=new_refresh_token
+            session_id=session_id,
+            old_refresh_jti=old_refresh_jti,
+            access_jti=access_jti,
+            refresh_jti=refresh_jti
         )
 
         if not session_id:
@@ -174,56 +205,33 @@ class AuthService:
             "access_token": new_access_token,
             "refresh_token": new_refresh_token,
             "token_type": "bearer",
-            "expires_in": settings.jwt_expire_minutes * 60,
+            "expires_in": access_token_expires_in(),
             "user_id": user.id,
             "session_id": session_id
         }
 
-    async def get_current_user(self, access_token: str) -> Dict[str, Any]:
-        """현재 인증된 사용자 정보 조회
+    async def get_profile(self, context: AuthContext) -> Dict[str, Any]:
+        """현재 인증된 사용자 프로필 조회
+
+        토큰/세션 확인은 인증 의존성(authenticate)이 이미 했으므로 프로필 컬럼만 DB에서 읽는다.
 
         Args:
-            access_token: 액세스 토큰
+            context: 인증 결과 (get_auth_context)
 
         Returns:
-            사용자 정보
+            사용자 정보 (세션을 확인하지 않은 토큰이면 session_info는 None)
 
         Raises:
-            HTTPException: 토큰이 유효하지 않을 시
+            HTTPException: 사용자가 없거나 비활성일 시
         """
-        # 토큰 블랙리스트 확인
-        if await self.auth_repository.is_token_blacklisted(access_token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token is invalidated"
-            )
-
-        # 토큰 검증
-        try:
-            payload = verify_token(access_token)
-            user_id = int(payload.get("sub"))
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token"
-            )
-
-        # 세션 확인
-        session = await self.auth_repository.get_session_by_token(access_token)
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Session not found or expired"
-            )
-
-        # 사용자 정보 조회
-        user = self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(context.principal.id)
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found or inactive"
             )
 
+        session = context.session
         return {
             "id": user.id,
             "email": user.email,
@@ -235,11 +243,12 @@ class AuthService:
             "profile_image_url": user.profile_image_url,
             "created_at": user.created_at,
             "session_info": {
+                "session_id": session.session_id,
                 "created_at": session.created_at,
                 "expires_at": session.expires_at,
                 "ip_address": session.ip_address,
                 "user_agent": session.user_agent
-            }
+            } if session else None
         }
 
     async def validate_token(self, access_token: str) -> bool:
@@ -252,21 +261,23 @@ class AuthService:
             토큰 유효성 여부
         """
         try:
-            # 블랙리스트 확인
-            if await self.auth_repository.is_token_blacklisted(access_token):
+            # 토큰 검증 (무상태 토큰은 서명/만료만 확인하고 Redis/DB를 조회하지 않음)
+            payload, stateless = decode_access_token(access_token)
+            if stateless:
+                return True
+            user_id, session_id, jti = _session_claims(payload)
+
+            # 폐기 여부 확인
+            if await self.auth_repository.is_token_blacklisted(jti):
                 return False
 
-            # 토큰 검증
-            payload = verify_token(access_token)
-            user_id = int(payload.get("sub"))
-
             # 세션 확인
-            session = await self.auth_repository.get_session_by_token(access_token)
-            if not session:
+            session = await self.auth_repository.get_session(user_id, session_id)
+            if not session or session.access_jti != jti:
                 return False
 
             # 사용자 활성 상태 확인
-            user = self.user_repository.get_by_id(user_id)
+            user = await self.user_repository.get_by_id(user_id)
             return user is not None and user.is_active
 
         except Exception:
@@ -284,6 +295,7 @@ class AuthService:
         sessions = await self.auth_repository.get_user_sessions(user_id)
         return [
             {
+                "session_id": session.session_id,
                 "created_at": session.created_at,
                 "expires_at": session.expires_at,
                 "ip_address": session.ip_address,
@@ -293,14 +305,14 @@ class AuthService:
             for session in sessions
         ]
 
-    async def revoke_session(self, user_id: int, access_token: str) -> None:
+    async def revoke_session(self, user_id: int, session_id: str) -> None:
         """특정 세션 취소
 
         Args:
             user_id: 사용자 ID
-            access_token: 취소할 세션의 액세스 토큰
+            session_id: 취소할 세션 ID
         """
-        await self.auth_repository.invalidate_session(user_id, access_token)
+        await self.auth_repository.invalidate_session(user_id, session_id)
 
     async def change_password(self, user_id: int, current_password: str, new_password: str) -> None:
         """비밀번호 변경 (모든 세션 무효화)
@@ -314,7 +326,7 @@ class AuthService:
             HTTPException: 현재 비밀번호가 틀릴 시
         """
         # 사용자 확인
-        user = self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -322,7 +334,7 @@ class AuthService:
             )
 
         # 현재 비밀번호 확인
-        if not verify_password(current_password, user.hashed_password):
+        if not await run_password_hash(verify_password, current_password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect current password"
@@ -330,8 +342,8 @@ class AuthService:
 
         # 비밀번호 업데이트
         from app.core.security import get_password_hash
-        hashed_new_password = get_password_hash(new_password)
-        self.user_repository.update(user_id, {"hashed_password": hashed_new_password})
+        hashed_new_password = await run_password_hash(get_password_hash, new_password)
+        await self.user_repository.update(user_id, {"hashed_password": hashed_new_password})
 
         # 모든 세션 무효화 (보안상 이유)
         await self.logout_all_sessions(user_id)
@@ -346,4 +358,14 @@ class AuthService:
 
     async def close(self) -> None:
         """서비스 종료 시 리소스 정리"""
-        await self.auth_repository.close()
\ No newline at end of file
+        await self.auth_repository.close()
+
+
+def _session_claims(payload: dict) -> Tuple[int, str, str]:
+    """토큰 페이로드의 (사용자 ID, 세션 ID, jti) (없으면 KeyError/ValueError)"""
+    return int(payload["sub"]), payload["sid"], payload["jti"]
+
+
+def _access_claims(user, session_id: str, jti: str) -> dict:
+    """액세스 토큰 클레임 (role은 무상태 토큰 검증 시 주체를 만드는 데 씀)"""
+    return {"sub": str(user.id), "ver": user.token_version, "role": user.role, "sid": session_id, "jti": jti}
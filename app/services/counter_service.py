@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import Callable, Dict, Optional
+from redis.asyncio import Redis
+from sqlalchemy.orm import Session
+from app.core.metrics import metrics
+from app.core.redis import claim_job_run
+from app.infra.counters import COUNTERS, max_counter_row_id, repair_counter
+
+logger = logging.getLogger(__name__)
+
+
+class CounterService:
+    """비정규화 카운터 정합성 복구
+
+    카운터는 쓰기와 같은 트랜잭션에서 원자적으로 갱신되지만, 저장소를 거치지 않은 수정
+    (수동 SQL, 이전 버전 코드 등)으로 어긋날 수 있으므로 주기적으로 실제 COUNT와 비교해 복구한다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def reconcile(self, batch_size: int = 10000) -> Dict[str, int]:
+        """모든 카운터를 ID 구간별로 다시 계산하고 카운터별 수정된 행 수 반환
+
+        구간마다 커밋해 긴 트랜잭션이나 테이블 전체 잠금 없이 처리한다.
+        """
+        repaired = {}
+        for name in COUNTERS:
+            max_id = max_counter_row_id(self.db, name)
+            repaired[name] = 0
+            for min_id in range(0, max_id, batch_size):
+                repaired[name] += repair_counter(self.db, name, min_id, min_id + batch_size)
+                self.db.commit()
+
+            if repaired[name]:
+                logger.warning("Repaired %d drifted rows of %s", repaired[name], name)
+                metrics.increment("counters.repaired", repaired[name], counter=name)
+        return repaired
+
+
+async def run_reconcile_job(
+    session_factory: Callable[[], Session],
+    interval_seconds: float,
+    redis_client: Optional[Redis] = None
+) -> None:
+    """interval_seconds마다 카운터 정합성 복구 (이벤트 루프를 막지 않도록 스레드에서 실행)
+
+    redis_client를 주면 워커가 여럿이어도 주기마다 한 워커만 실행한다 (claim_job_run).
+    """
+    def _reconcile():
+        with session_factory() as db:
+            CounterService(db).reconcile()
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if redis_client is not None and not await claim_job_run(redis_client, "counter_reconcile", interval_seconds):
+            continue
+        try:
+            await asyncio.to_thread(_reconcile)
+        except Exception:
+            logger.exception("Counter reconciliation failed")
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, List, Sequence
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.export_repository import EXPORT_COLUMNS, ExportRepository
+
+# 형식별 Content-Type
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _csv_value(value):
+    """CSV 셀 값 (JSON 컬럼은 JSON 문자열, 날짜는 ISO 8601)"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class ExportService:
+    def __init__(self, db: AsyncSession):
+        self.repository = ExportRepository(db)
+
+    @staticmethod
+    def columns(kind: str) -> List[str]:
+        """내보내기 컬럼 이름"""
+        return [column.key for column in EXPORT_COLUMNS[kind]]
+
+    async def export(
+        self,
+        kind: str,
+        export_format: str = "ndjson",
+        batch_size: int = 1000,
+        **scope
+    ) -> AsyncIterator[str]:
+        """메타데이터를 NDJSON 또는 CSV 텍스트 조각으로 스트리밍
+
+        CSV 헤더는 쿼리 전에 바로 내보내고, 이후 배치마다 한 조각씩 생성한다.
+        """
+        names = self.columns(kind)
+        if export_format == "csv":
+            yield self._csv_chunk([names])
+
+        async for rows in self.repository.stream(kind, batch_size=batch_size, **scope):
+            if export_format == "csv":
+                yield self._csv_chunk([[_csv_value(value) for value in row] for row in rows])
+            else:
+                yield self._ndjson_chunk(names, rows)
+
+    @staticmethod
+    def _ndjson_chunk(names: Sequence[str], rows: Sequence[Row]) -> str:
+        return "".join(
+            json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_json_default) + "\n"
+            for row in rows
+        )
+
+    @staticmethod
+    def _csv_chunk(rows) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue()
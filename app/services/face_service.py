@@ -3,6 +3,8 @@ import boto3
 from sqlalchemy.orm import Session
 from app.domain.face import Face, FaceCollection, FaceMatch
 from app.infra.face_repository import FaceRepository
+from app.infra.loading import LoadingProfile
+from app.infra.read_models import FaceCard
 
 
 class FaceService:
@@ -119,10 +121,6 @@ class FaceService:
 
     def identify_face(self, face_id: int, user_id: int, identified_by_id: int) -> bool:
         """얼굴에 사용자 태깅"""
-        face = self.repository.get_face_by_id(face_id)
-        if not face:
-            return False
-
         update_data = {
             "identified_user_id": user_id,
             "identified_by_id": identified_by_id,
@@ -143,9 +141,19 @@ class FaceService:
         """유사한 얼굴 검색"""
         return self.repository.get_face_matches(face_id, threshold)
 
-    def get_unidentified_faces(self, skip: int = 0, limit: int = 50) -> List[Face]:
+    def get_unidentified_faces(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[Face]:
         """미식별 얼굴 목록 조회"""
-        return self.repository.get_unidentified_faces(skip, limit)
+        return self.repository.get_unidentified_faces(skip, limit, cursor, profile=profile)
+
+    def get_unidentified_face_cards(self, limit: int = 50, cursor: Optional[str] = None) -> List[FaceCard]:
+        """미식별 얼굴 목록 조회 (목록 응답용 읽기 모델)"""
+        return self.repository.get_unidentified_face_cards(limit=limit, cursor=cursor)
 
     def confirm_face_match(self, match_id: int, confirmed_by_id: int) -> bool:
         """얼굴 매칭 결과 확인"""
@@ -4,6 +4,7 @@ import string
 from sqlalchemy.orm import Session
 from app.domain.group import Group, GroupMembership
 from app.infra.group_repository import GroupRepository
+from app.infra.loading import LoadingProfile
 
 
 class GroupService:
@@ -40,8 +41,13 @@ class GroupService:
 
         group = self.repository.create(group_data)
 
-        # 생성자를 관리자로 자동 가입
-        self.add_member(group.id, created_by_id, role="admin")
+        # 생성자를 관리자로 자동 가입 (새 그룹이므로 중복/정원 검사 불필요)
+        self.repository.create_membership({
+            "group_id": group.id,
+            "user_id": created_by_id,
+            "role": "admin",
+            "is_active": True
+        })
 
         return group
 
@@ -69,12 +75,7 @@ class GroupService:
         if existing_membership and existing_membership.is_active:
             return False
 
-        # 최대 멤버 수 확인
-        current_member_count = self.repository.get_active_member_count(group_id)
-        if current_member_count >= group.max_members:
-            return False
-
-        # 멤버십 생성
+        # 멤버십 생성 (최대 멤버 수 확인과 member_count 증가는 한 문장으로 처리)
         membership_data = {
             "group_id": group_id,
             "user_id": user_id,
@@ -82,19 +83,33 @@ class GroupService:
             "is_active": True
         }
 
-        return self.repository.create_membership(membership_data) is not None
+        return self.repository.create_membership(membership_data, within_limit=True) is not None
 
     def remove_member(self, group_id: int, user_id: int) -> bool:
         """그룹에서 멤버 제거"""
         return self.repository.deactivate_membership(group_id, user_id)
 
-    def get_group_members(self, group_id: int) -> List[GroupMembership]:
+    def is_member(self, group_id: int, user_id: int) -> bool:
+        """사용자가 그룹의 활성 멤버인지 확인"""
+        membership = self.repository.get_membership(group_id, user_id)
+        return membership is not None and membership.is_active
+
+    def is_admin(self, group_id: int, user_id: int) -> bool:
+        """사용자가 그룹의 활성 관리자인지 확인"""
+        membership = self.repository.get_membership(group_id, user_id)
+        return membership is not None and membership.is_active and membership.role == "admin"
+
+    def get_group_members(
+        self,
+        group_id: int,
+        profile: Optional[LoadingProfile] = None
+    ) -> List[GroupMembership]:
         """그룹 멤버 목록 조회"""
-        return self.repository.get_active_memberships(group_id)
+        return self.repository.get_active_memberships(group_id, profile=profile)
 
-    def get_user_groups(self, user_id: int) -> List[Group]:
+    def get_user_groups(self, user_id: int, profile: Optional[LoadingProfile] = None) -> List[Group]:
         """사용자가 가입한 그룹 목록 조회"""
-        return self.repository.get_user_groups(user_id)
+        return self.repository.get_user_groups(user_id, profile=profile)
 
     def _generate_invite_code(self, length: int = 8) -> str:
         """초대 코드 생성"""
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.core.metrics import metrics
+from app.core.redis import claim_job_run
+from app.infra.partitions import (
+    PARTITIONED_TABLES,
+    add_months,
+    create_month_partitions,
+    detach_partitions_before,
+    is_partitioned,
+    month_start,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionService:
+    """photos/faces 월 파티션 유지
+
+    미래 월 파티션을 미리 만들어 새 행이 기본 파티션으로 떨어지지 않게 하고, 보관 기간이 지난
+    월 파티션은 분리한다. 분리된 파티션은 독립 테이블로 남으므로 pg_dump 등으로 보관한 뒤 삭제한다.
+    """
+
+    # 파티션 생성/분리는 부모 테이블 잠금이 필요하므로 오래 기다리지 않고 다음 주기에 다시 시도
+    LOCK_TIMEOUT = "5s"
+    # 여러 워커가 동시에 유지 작업을 실행해도 테이블마다 한 트랜잭션씩 차례로 확인/변경 (pg_advisory_xact_lock 키)
+    ADVISORY_LOCK_KEY = 0x70617274  # "part"
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def maintain(self, months_ahead: int = 3, retain_months: int = 0) -> Dict[str, Dict[str, List[str]]]:
+        """테이블별로 생성/분리한 파티션 이름 반환 (파티션 테이블이 아니면 건너뜀)"""
+        this_month = month_start(date.today())
+        result = {}
+        for table in PARTITIONED_TABLES:
+            with self.engine.begin() as conn:
+                conn.execute(text(f"SET LOCAL lock_timeout = '{self.LOCK_TIMEOUT}'"))
+                # 먼저 잠근 워커가 커밋한 뒤에 파티션 목록을 읽으므로 같은 파티션을 두 번 만들거나 분리하지 않음
+                conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": self.ADVISORY_LOCK_KEY})
+                if not is_partitioned(conn, table):
+                    continue
+                created = create_month_partitions(conn, table, this_month, add_months(this_month, months_ahead))
+                detached = []
+                if retain_months > 0:
+                    detached = detach_partitions_before(conn, table, add_months(this_month, -retain_months))
+
+            metrics.increment("partitions.created", len(created), table=table)
+            metrics.increment("partitions.detached", len(detached), table=table)
+            if created or detached:
+                logger.info("Partitions %s: created %s, detached %s", table, created, detached)
+            result[table] = {"created": created, "detached": detached}
+        return result
+
+
+async def run_partition_job(
+    engine: Engine,
+    interval_seconds: float,
+    months_ahead: int,
+    retain_months: int,
+    redis_client: Optional[Redis] = None
+) -> None:
+    """시작 직후와 이후 interval_seconds마다 파티션 유지 (이벤트 루프를 막지 않도록 스레드에서 실행)
+
+    redis_client를 주면 워커가 여럿이어도 주기마다 한 워커만 실행한다 (claim_job_run).
+    동시에 실행되더라도 maintain이 advisory lock으로 차례로 처리한다.
+    """
+    service = PartitionService(engine)
+    while True:
+        if redis_client is not None and not await claim_job_run(redis_client, "partition_maintenance", interval_seconds):
+            await asyncio.sleep(interval_seconds)
+            continue
+        try:
+            await asyncio.to_thread(service.maintain, months_ahead, retain_months)
+        except Exception:
+            logger.exception("Partition maintenance failed")
+        await asyncio.sleep(interval_seconds)
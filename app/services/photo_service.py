@@ -6,7 +6,9 @@ from PIL import Image
 from PIL.ExifTags import TAGS
 from sqlalchemy.orm import Session
 from app.domain.photo import Photo, PhotoTag
+from app.infra.loading import LoadingProfile
 from app.infra.photo_repository import PhotoRepository
+from app.infra.read_models import PhotoCard
 
 
 class PhotoService:
@@ -74,23 +76,42 @@ class PhotoService:
 
         return photo
 
-    def get_photo_by_id(self, photo_id: int) -> Optional[Photo]:
+    def get_photo_by_id(self, photo_id: int, profile: Optional[LoadingProfile] = None) -> Optional[Photo]:
         """ID로 사진 조회"""
-        return self.repository.get_by_id(photo_id)
+        return self.repository.get_by_id(photo_id, profile=profile)
 
     def get_photos(
         self,
         group_id: Optional[int] = None,
         uploaded_by_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        profile: Optional[LoadingProfile] = None
     ) -> List[Photo]:
         """사진 목록 조회"""
         return self.repository.get_photos(
             group_id=group_id,
             uploaded_by_id=uploaded_by_id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            profile=profile
+        )
+
+    def get_photo_cards(
+        self,
+        group_id: Optional[int] = None,
+        uploaded_by_id: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> List[PhotoCard]:
+        """사진 목록 조회 (목록 응답용 읽기 모델)"""
+        return self.repository.get_photo_cards(
+            group_id=group_id,
+            uploaded_by_id=uploaded_by_id,
+            limit=limit,
+            cursor=cursor
         )
 
     def update_photo(self, photo_id: int, update_data: dict) -> Optional[Photo]:
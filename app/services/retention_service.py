@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from redis.asyncio import Redis
+from sqlalchemy.orm import Session
+from app.core.metrics import metrics
+from app.core.redis import claim_job_run
+from app.domain.album import AlbumShare
+from app.domain.face import Face, FaceMatch
+from app.domain.photo import Photo
+from app.infra.retention_repository import Archiver, RetentionRepository
+
+logger = logging.getLogger(__name__)
+
+# 정리 순서 (참조하는 쪽부터): 매칭 -> 얼굴 -> 사진(태그/앨범 연결 포함) -> 앨범 공유
+RETENTION_TABLES = (
+    ("face_matches", FaceMatch),
+    ("faces", Face),
+    ("photos", Photo),
+    ("album_shares", AlbumShare),
+)
+
+# 결과에 포함되는 테이블 (사진 정리 시 함께 지워지는 태그/앨범 연결 포함)
+PURGED_TABLES = ("face_matches", "faces", "photo_tags", "album_photos", "photos", "album_shares")
+
+# S3 DeleteObjects 요청 하나에 담을 수 있는 최대 키 수
+S3_DELETE_LIMIT = 1000
+
+
+class RetentionService:
+    """보존 기간이 지난 소프트 삭제 행 정리
+
+    작은 ID 키셋 배치마다 커밋해 트랜잭션과 잠금을 짧게 유지하고, 사진 배치는 저장소 객체를
+    먼저 지운 뒤 객체가 지워진 사진 행만 지운다. 삭제에 실패한 객체의 사진 행은 소프트 삭제 상태로 남아
+    다음 실행에서 다시 시도하므로 DB 행 없이 남는 객체가 생기지 않는다
+    (반대로 객체만 지워진 행은 이미 소프트 삭제되어 조회되지 않고 다음 실행에서 지워진다).
+    배치가 실패하면 롤백하고 기록한 뒤 다음 배치로 넘어가, 지울 수 없는 행이 정리 전체를 막지 않는다.
+    """
+
+    def __init__(self, db: Session, s3_client=None, archive: Optional[Archiver] = None):
+        self.db = db
+        self.repository = RetentionRepository(db, archive=archive)
+        self.s3_client = s3_client  # AWS S3 클라이언트 (없으면 저장소 객체는 지우지 않음)
+
+    def purge(self, max_age_days: float, batch_size: int = 500) -> Dict[str, int]:
+        """max_age_days보다 오래전에 소프트 삭제된 행을 영구 삭제하고 테이블별 삭제 행 수 반환"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        totals = Counter(dict.fromkeys(PURGED_TABLES, 0))
+        started = time.perf_counter()
+
+        for name, model in RETENTION_TABLES:
+            after_id = 0
+            while True:
+                ids = self.repository.expired_ids(model, cutoff, after_id, batch_size)
+                if not ids:
+                    break
+
+                batch_started = time.perf_counter()
+                after_id = ids[-1]
+                try:
+                    deleted = self._purge_batch(name, ids)
+                    self.db.commit()
+                except Exception:
+                    self.db.rollback()
+                    metrics.increment("retention.failed_batches", table=name)
+                    logger.exception("Retention %s: skipped batch of ids %d..%d", name, ids[0], after_id)
+                    continue
+                metrics.observe("retention.batch.seconds", time.perf_counter() - batch_started, table=name)
+                for table, count in deleted.items():
+                    metrics.increment("retention.deleted", count, table=table)
+                totals.update(deleted)
+                logger.info("Retention %s: purged through id %d (%d rows so far)", name, after_id, totals[name])
+
+        elapsed = time.perf_counter() - started
+        rows = sum(totals.values())
+        rate = rows / elapsed if elapsed > 0 else 0.0
+        metrics.set_gauge("retention.rows_per_second", rate)
+        logger.info("Retention purged %d rows in %.1fs (%.0f rows/s): %s", rows, elapsed, rate, dict(totals))
+        return dict(totals)
+
+    def _purge_batch(self, name: str, ids: List[int]) -> Dict[str, int]:
+        if name == "face_matches":
+            return {"face_matches": self.repository.delete_face_matches(ids)}
+        if name == "faces":
+            return self.repository.delete_faces(ids)
+        if name == "photos":
+            objects = self.repository.photo_objects(ids)
+            failed = self._delete_objects([(bucket, key) for _, bucket, key in objects])
+            # 객체가 남은 사진은 지우지 않고 다음 실행에서 다시 시도
+            kept = {photo_id for photo_id, bucket, key in objects if (bucket, key) in failed}
+            remaining = [photo_id for photo_id in ids if photo_id not in kept]
+            return self.repository.delete_photos(remaining) if remaining else {}
+        return {"album_shares": self.repository.delete_album_shares(ids)}
+
+    def _delete_objects(self, objects: List[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """저장소 객체를 버킷별로 묶어 삭제하고 삭제하지 못한 (bucket, key) 반환 (요청당 S3 한도 1,000개)"""
+        failed: Set[Tuple[str, str]] = set()
+        if self.s3_client is None:
+            return failed
+        for bucket, group in groupby(sorted(objects), key=lambda obj: obj[0]):
+            keys = [key for _, key in group]
+            for start in range(0, len(keys), S3_DELETE_LIMIT):
+                response = self.s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={
+                        "Objects": [{"Key": key} for key in keys[start:start + S3_DELETE_LIMIT]],
+                        "Quiet": True
+                    }
+                )
+                for error in response.get("Errors", []):
+                    failed.add((bucket, error["Key"]))
+                    logger.warning(
+                        "Retention: failed to delete s3://%s/%s (%s: %s)",
+                        bucket, error["Key"], error.get("Code"), error.get("Message")
+                    )
+        if failed:
+            metrics.increment("retention.storage_errors", len(failed))
+        return failed
+
+
+async def run_retention_job(
+    session_factory: Callable[[], Session],
+    interval_seconds: float,
+    max_age_days: float,
+    batch_size: int,
+    s3_client=None,
+    redis_client: Optional[Redis] = None
+) -> None:
+    """interval_seconds마다 보존 기간 정리 (이벤트 루프를 막지 않도록 스레드에서 실행)
+
+    redis_client를 주면 워커가 여럿이어도 주기마다 한 워커만 실행한다 (claim_job_run).
+    """
+    def _purge():
+        with session_factory() as db:
+            RetentionService(db, s3_client=s3_client).purge(max_age_days, batch_size)
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if redis_client is not None and not await claim_job_run(redis_client, "retention", interval_seconds):
+            continue
+        try:
+            await asyncio.to_thread(_purge)
+        except Exception:
+            logger.exception("Retention purge failed")
@@ -0,0 +1,182 @@
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from app.core.security import hash_passwords
+from app.domain.roster import RosterEntry, RosterImportResult, RosterRowError
+from app.infra.group_repository import GroupRepository
+from app.infra.user_repository import UserRepository
+
+
+class RosterFormatError(ValueError):
+    """명단 파일 자체를 읽을 수 없음 (형식 오류, 행 수 초과)"""
+
+
+def parse_roster(content: bytes, format: str, max_rows: int) -> List[dict]:
+    """CSV(헤더 행 필수) 또는 JSON(객체 배열) 명단을 행 목록으로 변환 (빈 값은 생략)"""
+    try:
+        text = content.decode("utf-8-sig")
+        if format == "json":
+            rows = json.loads(text)
+            if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                raise RosterFormatError("JSON roster must be an array of objects")
+        else:
+            rows = list(csv.DictReader(io.StringIO(text)))
+    except (UnicodeDecodeError, json.JSONDecodeError, csv.Error) as e:
+        raise RosterFormatError(f"Invalid {format} roster: {e}") from e
+
+    if len(rows) > max_rows:
+        raise RosterFormatError(f"Roster has {len(rows)} rows (max {max_rows})")
+    return [
+        {key: value for key, value in row.items() if key is not None and value not in (None, "")}
+        for row in rows
+    ]
+
+
+@dataclass
+class RosterPlan:
+    """검증을 마친 가져오기 계획 (prepare 결과, 비밀번호 해싱 후 apply에 넘김)"""
+    group_id: int
+    new_users: List[Tuple[int, RosterEntry]] = field(default_factory=list)  # (행 번호, 항목)
+    members: Dict[int, str] = field(default_factory=dict)  # 기존 사용자 {ID: 역할}
+    inactive_user_ids: Set[int] = field(default_factory=set)
+    skipped: int = 0
+    errors: List[RosterRowError] = field(default_factory=list)
+
+    @property
+    def passwords(self) -> List[str]:
+        return [entry.password for _, entry in self.new_users]
+
+
+class RosterService:
+    """학급 등 그룹 명단 일괄 가져오기
+
+    사용자마다 create_user/add_member를 부르면 행마다 중복 조회 2번, bcrypt 해싱, 멤버십 조회/추가가
+    반복된다. 여기서는 이메일/사용자명 중복과 기존 멤버십을 IN 조회 한두 번으로 확인하고,
+    비밀번호는 스레드에서 병렬 해싱하며 (bcrypt는 GIL을 놓음), 사용자와 멤버십은 executemany로 한 번에 넣는다.
+    문제가 있는 행은 건너뛰고 행 번호와 사유를 결과에 담는다.
+    """
+
+    def __init__(self, db: Session):
+        self.users = UserRepository(db)
+        self.groups = GroupRepository(db)
+
+    def import_roster(
+        self,
+        group_id: int,
+        rows: List[dict],
+        max_workers: Optional[int] = None
+    ) -> Optional[RosterImportResult]:
+        """명단 가져오기 (그룹이 없으면 None, 작업/스크립트용)
+
+        API는 해싱하는 동안 이벤트 루프와 DB 커넥션을 붙잡지 않도록 prepare/run_password_hashes/apply를 나눠 호출한다.
+        """
+        plan = self.prepare(group_id, rows)
+        if plan is None:
+            return None
+        return self.apply(plan, hash_passwords(plan.passwords, max_workers))
+
+    def prepare(self, group_id: int, rows: List[dict]) -> Optional[RosterPlan]:
+        """행 검증과 중복/멤버십/정원 확인 (쓰기 없음, 그룹이 없으면 None)"""
+        group = self.groups.get_by_id(group_id)
+        if not group or not group.is_active:
+            return None
+
+        plan = RosterPlan(group_id=group_id)
+        entries = self._validate(rows, plan.errors)
+
+        existing = self.users.get_identities(
+            {entry.email for _, entry in entries},
+            {entry.username for _, entry in entries}
+        )
+        by_email = {user.email: user for user in existing}
+        taken_usernames = {user.username for user in existing}
+        states = self.groups.get_membership_states(
+            group_id, [by_email[entry.email].id for _, entry in entries if entry.email in by_email]
+        )
+
+        available = max((group.max_members or 0) - group.member_count, 0)
+        for row, entry in entries:
+            user = by_email.get(entry.email)
+            if user is not None and not user.is_active:
+                plan.errors.append(RosterRowError(row=row, email=entry.email, message="User account is disabled"))
+                continue
+            if user is not None and states.get(user.id):
+                plan.skipped += 1
+                continue
+            if user is None and entry.username in taken_usernames:
+                plan.errors.append(RosterRowError(row=row, email=entry.email, message="Username already taken"))
+                continue
+            if available == 0:
+                plan.errors.append(RosterRowError(row=row, email=entry.email, message="Group is full"))
+                continue
+
+            available -= 1
+            if user is None:
+                plan.new_users.append((row, entry))
+            else:
+                plan.members[user.id] = entry.role
+                if user.id in states:
+                    plan.inactive_user_ids.add(user.id)
+
+        plan.errors.sort(key=lambda error: error.row)
+        return plan
+
+    def apply(self, plan: RosterPlan, hashed_passwords: List[str]) -> RosterImportResult:
+        """prepare 결과대로 사용자와 멤버십 일괄 생성 (hashed_passwords는 plan.passwords 순서)
+
+        Raises:
+            ValueError: prepare 이후 다른 가입으로 정원이 찬 경우 (아무것도 추가하지 않음)
+        """
+        created = self.users.bulk_create([
+            {
+                "email": entry.email,
+                "username": entry.username,
+                "full_name": entry.full_name,
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "is_verified": False
+            }
+            for (_, entry), hashed_password in zip(plan.new_users, hashed_passwords)
+        ])
+        members = dict(plan.members)
+        members.update((created[entry.email], entry.role) for _, entry in plan.new_users)
+
+        if not self.groups.add_members(plan.group_id, members, plan.inactive_user_ids):
+            raise ValueError("Group is full")
+
+        return RosterImportResult(
+            created=len(created),
+            added=len(members),
+            skipped=plan.skipped,
+            errors=plan.errors
+        )
+
+    def _validate(self, rows: List[dict], errors: List[RosterRowError]) -> List[Tuple[int, RosterEntry]]:
+        """행별 형식 검증과 파일 안 이메일/사용자명 중복 확인 (먼저 나온 행만 유지)"""
+        entries = []
+        seen_emails, seen_usernames = set(), set()
+        for row, data in enumerate(rows, start=1):
+            try:
+                entry = RosterEntry.model_validate(data)
+            except ValidationError as e:
+                message = "; ".join(
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+                )
+                email = data.get("email") if isinstance(data.get("email"), str) else None
+                errors.append(RosterRowError(row=row, email=email, message=message))
+                continue
+
+            if entry.email in seen_emails:
+                errors.append(RosterRowError(row=row, email=entry.email, message="Duplicate email in roster"))
+                continue
+            if entry.username in seen_usernames:
+                errors.append(RosterRowError(row=row, email=entry.email, message="Duplicate username in roster"))
+                continue
+            seen_emails.add(entry.email)
+            seen_usernames.add(entry.username)
+            entries.append((row, entry))
+        return entries
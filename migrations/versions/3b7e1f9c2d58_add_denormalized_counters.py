@@ -0,0 +1,54 @@
+"""add_denormalized_counters
+
+Revision ID: 3b7e1f9c2d58
+Revises: 8d3f6a2c9e14
+Create Date: 2026-10-19 16:05:12.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e1f9c2d58'
+down_revision: Union[str, None] = '8d3f6a2c9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 카운터 컬럼, 현재 값을 계산하는 상관 서브쿼리)
+COUNTERS = [
+    (
+        'albums', 'photo_count',
+        "SELECT COUNT(*) FROM album_photos JOIN photos ON photos.id = album_photos.photo_id "
+        "WHERE album_photos.album_id = albums.id AND photos.is_active = true"
+    ),
+    (
+        'groups', 'member_count',
+        "SELECT COUNT(*) FROM group_memberships "
+        "WHERE group_memberships.group_id = groups.id AND group_memberships.is_active = true"
+    ),
+    (
+        'photos', 'face_count',
+        "SELECT COUNT(*) FROM faces WHERE faces.photo_id = photos.id AND faces.is_active = true"
+    ),
+    (
+        'users', 'face_count',
+        "SELECT COUNT(*) FROM faces WHERE faces.identified_user_id = users.id AND faces.is_active = true"
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, column, _ in COUNTERS:
+        op.add_column(table, sa.Column(column, sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 데이터로 카운터 백필 (updated_at은 건드리지 않음)
+    for table, column, count_query in COUNTERS:
+        op.execute(sa.text(f"UPDATE {table} SET {column} = ({count_query})"))
+
+
+def downgrade() -> None:
+    for table, column, _ in reversed(COUNTERS):
+        op.drop_column(table, column)
@@ -0,0 +1,33 @@
+"""backfill_updated_at
+
+Revision ID: 5c2e9d41b7a3
+Revises: 1a848a636234
+Create Date: 2026-10-19 10:12:40.113502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e9d41b7a3'
+down_revision: Union[str, None] = '1a848a636234'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# updated_at은 이제 생성 시에도 채워지며 키셋 페이지네이션의 정렬 키로 사용됨
+TABLES = ['users', 'groups', 'photos', 'albums', 'faces', 'face_collections']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            sa.text(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL")
+        )
+
+
+def downgrade() -> None:
+    # 데이터 백필은 되돌리지 않음
+    pass
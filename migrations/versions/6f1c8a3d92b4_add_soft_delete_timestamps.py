@@ -0,0 +1,52 @@
+"""add_soft_delete_timestamps
+
+Revision ID: 6f1c8a3d92b4
+Revises: 3b7e1f9c2d58
+Create Date: 2026-10-19 18:22:40.193514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f1c8a3d92b4'
+down_revision: Union[str, None] = '3b7e1f9c2d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 기존 소프트 삭제 행의 deleted_at으로 쓸 컬럼)
+TABLES = [
+    ('photos', 'updated_at'),
+    ('faces', 'updated_at'),
+    ('face_matches', 'created_at'),
+    ('album_shares', 'shared_at'),
+]
+
+
+def upgrade() -> None:
+    for table, _ in TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+
+    # 이미 소프트 삭제된 행은 마지막 수정 시각을 삭제 시각으로 간주
+    for table, fallback in TABLES:
+        op.execute(sa.text(
+            f"UPDATE {table} SET deleted_at = COALESCE({fallback}, CURRENT_TIMESTAMP) "
+            f"WHERE is_active = false"
+        ))
+
+    # 보존 기간 정리 작업의 키셋 배치 조회용 (소프트 삭제된 행만 포함)
+    for table, _ in TABLES:
+        op.create_index(
+            f'ix_{table}_inactive_deleted', table, ['id', 'deleted_at'],
+            postgresql_where=sa.text('is_active = false'),
+            sqlite_where=sa.text('is_active = 0'),
+        )
+
+
+def downgrade() -> None:
+    for table, _ in reversed(TABLES):
+        op.drop_index(f'ix_{table}_inactive_deleted', table_name=table)
+        op.drop_column(table, 'deleted_at')
@@ -0,0 +1,74 @@
+"""add_query_indexes
+
+Revision ID: 8d3f6a2c9e14
+Revises: 5c2e9d41b7a3
+Create Date: 2026-10-19 11:02:18.504127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f6a2c9e14'
+down_revision: Union[str, None] = '5c2e9d41b7a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _where(condition: str) -> dict:
+    """부분 인덱스 조건
+
+    SQLite는 쿼리의 WHERE 절과 글자 그대로 같은 조건일 때만 부분 인덱스를 사용하므로
+    ORM이 내보내는 형태(is_active = 1)에 맞춰 불리언 리터럴을 바꾼다.
+    """
+    sqlite_condition = condition.replace('= true', '= 1').replace('= false', '= 0')
+    return {
+        'postgresql_where': sa.text(condition),
+        'sqlite_where': sa.text(sqlite_condition),
+    }
+
+
+ACTIVE = 'is_active = true'
+
+# (인덱스명, 테이블, 컬럼, 부분 인덱스 조건)
+INDEXES = [
+    # 사진: 그룹/업로더별 목록 (created_at, id 키셋), 미처리 사진 큐, 촬영일 범위
+    ('ix_photos_group_active_created', 'photos', ['group_id', 'is_active', 'created_at', 'id'], None),
+    ('ix_photos_uploader_active_created', 'photos', ['uploaded_by_id', 'is_active', 'created_at', 'id'], None),
+    ('ix_photos_unprocessed_created', 'photos', ['created_at'], f'{ACTIVE} AND is_processed = false'),
+    ('ix_photos_active_taken_at', 'photos', ['group_id', 'taken_at'], ACTIVE),
+    ('ix_photo_tags_photo_confidence', 'photo_tags', ['photo_id', 'confidence'], None),
+    # 얼굴: 사진별, 식별된 사용자별, 미식별 목록
+    ('ix_faces_photo_confidence', 'faces', ['photo_id', 'confidence'], None),
+    ('ix_faces_identified_user_created', 'faces', ['identified_user_id', 'created_at'], ACTIVE),
+    ('ix_faces_unidentified_created', 'faces', ['created_at', 'id'], f'{ACTIVE} AND identified_user_id IS NULL'),
+    ('ix_face_matches_face1', 'face_matches', ['face1_id', 'similarity'], None),
+    ('ix_face_matches_face2', 'face_matches', ['face2_id', 'similarity'], None),
+    ('ix_face_matches_unconfirmed', 'face_matches', ['similarity', 'id'], f'{ACTIVE} AND is_confirmed = false'),
+    ('ix_face_collections_owner', 'face_collections', ['owner_type', 'owner_id'], None),
+    # 그룹 멤버십: 멤버 확인, 사용자의 그룹 목록
+    ('ix_group_memberships_group_user', 'group_memberships', ['group_id', 'user_id'], None),
+    ('ix_group_memberships_user_active', 'group_memberships', ['user_id'], ACTIVE),
+    # 앨범: 소유자/그룹/공개 목록 (updated_at, id 키셋), 앨범 사진, 공유
+    ('ix_albums_creator_active_updated', 'albums', ['created_by_id', 'is_active', 'updated_at', 'id'], None),
+    ('ix_albums_group_active_updated', 'albums', ['group_id', 'is_active', 'updated_at', 'id'], None),
+    ('ix_albums_public_updated', 'albums', ['updated_at', 'id'], f'{ACTIVE} AND is_public = true'),
+    ('ix_album_photos_album_added', 'album_photos', ['album_id', 'added_at', 'photo_id'], None),
+    ('ix_album_photos_photo', 'album_photos', ['photo_id'], None),
+    ('ix_album_shares_album_user', 'album_shares', ['album_id', 'shared_with_id'], None),
+    ('ix_album_shares_shared_with_active', 'album_shares', ['shared_with_id'], ACTIVE),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, condition in INDEXES:
+        kwargs = _where(condition) if condition else {}
+        op.create_index(name, table, columns, unique=False, **kwargs)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,51 @@
+"""partition_photos_and_faces
+
+Revision ID: a4d2e7c91f36
+Revises: 6f1c8a3d92b4
+Create Date: 2026-10-19 21:04:12.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.core.pooling import DatabaseSettings
+from app.infra.partitions import (
+    PARTITIONED_TABLES,
+    drop_referencing_foreign_keys,
+    is_partitioned,
+    partition_table,
+    restore_referencing_foreign_keys,
+    unpartition_table,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d2e7c91f36'
+down_revision: Union[str, None] = '6f1c8a3d92b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # DB_PARTITIONING=range인 PostgreSQL에서만 변환 (그 외에는 일반 테이블 유지)
+    conn = op.get_bind()
+    db_settings = DatabaseSettings()
+    if conn.dialect.name != 'postgresql' or db_settings.db_partitioning != 'range':
+        return
+    if is_partitioned(conn, 'photos'):
+        return
+
+    drop_referencing_foreign_keys(conn)
+    for table in PARTITIONED_TABLES:
+        partition_table(conn, table, db_settings.db_partition_months_ahead)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql' or not is_partitioned(conn, 'photos'):
+        return
+
+    for table in PARTITIONED_TABLES:
+        unpartition_table(conn, table)
+    restore_referencing_foreign_keys(conn)
@@ -0,0 +1,26 @@
+"""add_user_token_version
+
+Revision ID: c81f5e3a7d20
+Revises: a4d2e7c91f36
+Create Date: 2026-10-19 18:42:07.315904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f5e3a7d20'
+down_revision: Union[str, None] = 'a4d2e7c91f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,231 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.photo import Photo
+
+
+def _add_photos(db_session, user_id: int, count: int, group_id=None):
+    for i in range(count):
+        db_session.add(Photo(
+            filename=f"p{i}.jpg",
+            original_filename=f"p{i}.jpg",
+            file_path=f"/p/{i}",
+            file_size=1,
+            s3_bucket="bucket",
+            s3_key=f"p/{i}",
+            s3_url=f"https://bucket/p/{i}",
+            uploaded_by_id=user_id,
+            group_id=group_id
+        ))
+    db_session.commit()
+
+
+def test_photo_list_returns_next_cursor(client: TestClient, db_session, created_user, auth_headers):
+    """사진 목록은 next_cursor로 끝까지 순회"""
+    _add_photos(db_session, created_user.id, 5)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/photos/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_photo_list_invalid_cursor(client: TestClient, auth_headers):
+    """잘못된 커서는 400"""
+    response = client.get("/api/v1/photos/", params={"cursor": "nope"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_photo_list_requires_group_membership(client: TestClient, auth_headers):
+    """멤버가 아닌 그룹의 사진 목록은 403"""
+    response = client.get("/api/v1/photos/", params={"group_id": 999}, headers=auth_headers)
+    assert response.status_code == 403
+
+
+def test_album_list_empty(client: TestClient, auth_headers):
+    """앨범이 없으면 빈 목록과 next_cursor None"""
+    response = client.get("/api/v1/albums/", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+def test_unidentified_faces_admin_only(client: TestClient, auth_headers):
+    """미식별 얼굴 목록은 관리자 전용"""
+    response = client.get("/api/v1/faces/unidentified", headers=auth_headers)
+    assert response.status_code == 403
+
+
+def _album(db_session, user_id: int) -> int:
+    from app.infra.album_repository import AlbumRepository
+
+    album = AlbumRepository(db_session).create(
+        {"name": "Trip", "album_type": "personal", "created_by_id": user_id}
+    )
+    db_session.commit()
+    return album.id
+
+
+def test_bulk_add_and_remove_album_photos(client: TestClient, db_session, created_user, auth_headers):
+    """앨범 사진 일괄 추가/제거는 추가/건너뜀 수를 반환"""
+    _add_photos(db_session, created_user.id, 4)
+    photo_ids = [p.id for p in db_session.query(Photo).all()]
+    album_id = _album(db_session, created_user.id)
+
+    response = client.post(
+        f"/api/v1/albums/{album_id}/photos",
+        json={"photo_ids": photo_ids + [photo_ids[0], 999999]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {"added": 4, "skipped": 1}
+
+    response = client.request(
+        "DELETE",
+        f"/api/v1/albums/{album_id}/photos",
+        json={"photo_ids": photo_ids[:3]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {"removed": 3, "skipped": 0}
+
+
+def test_bulk_add_album_photos_requires_edit_permission(client: TestClient, db_session, auth_headers):
+    """편집 권한이 없는 앨범은 403, 없는 앨범은 404"""
+    from app.domain.user import User
+
+    other = User(email="owner@example.com", username="owner", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    album_id = _album(db_session, other.id)
+
+    response = client.post(f"/api/v1/albums/{album_id}/photos", json={"photo_ids": [1]}, headers=auth_headers)
+    assert response.status_code == 403
+
+    response = client.post("/api/v1/albums/999999/photos", json={"photo_ids": [1]}, headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_bulk_add_album_photos_limits_ids(client: TestClient, auth_headers):
+    """빈 목록과 최대 개수를 넘는 요청은 422"""
+    from app.core.config import settings
+
+    too_many = list(range(settings.max_bulk_photo_ids + 1))
+    for photo_ids in ([], too_many):
+        response = client.post("/api/v1/albums/1/photos", json={"photo_ids": photo_ids}, headers=auth_headers)
+        assert response.status_code == 422
+
+
+def test_my_albums_include_shared_with_permission(client: TestClient, db_session, created_user, auth_headers):
+    """내 앨범 목록은 공유받은 앨범과 유효 권한을 함께 반환"""
+    from app.domain.album import AlbumShare
+    from app.domain.user import User
+
+    other = User(email="sharer@example.com", username="sharer", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    owned_id = _album(db_session, created_user.id)
+    shared_id = _album(db_session, other.id)
+    db_session.add(AlbumShare(album_id=shared_id, shared_with_id=created_user.id, permission="edit"))
+    db_session.commit()
+
+    response = client.get("/api/v1/albums/mine", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {item["id"]: item["permission"] for item in data["items"]} == {
+        owned_id: "owner",
+        shared_id: "edit",
+    }
+    assert data["next_cursor"] is None
+
+
+def test_photo_detail_includes_tags_and_faces(client: TestClient, db_session, created_user, auth_headers):
+    """사진 상세는 태그와 얼굴을 포함하고, 다른 사용자의 사진은 403, 없는 사진은 404"""
+    from app.domain.face import Face
+    from app.domain.photo import PhotoTag
+    from app.domain.user import User
+
+    _add_photos(db_session, created_user.id, 1)
+    photo_id = db_session.query(Photo.id).scalar()
+    db_session.add_all([
+        PhotoTag(photo_id=photo_id, tag_name="beach"),
+        Face(face_id="detail-face", confidence=0.9, photo_id=photo_id,
+             bounding_box={"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2}),
+    ])
+    other = User(email="stranger@example.com", username="stranger", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    _add_photos(db_session, other.id, 1)
+    other_photo_id = db_session.query(Photo.id).filter(Photo.uploaded_by_id == other.id).scalar()
+
+    response = client.get(f"/api/v1/photos/{photo_id}", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [tag["tag_name"] for tag in data["tags"]] == ["beach"]
+    assert len(data["faces"]) == 1
+
+    assert client.get(f"/api/v1/photos/{other_photo_id}", headers=auth_headers).status_code == 403
+    assert client.get("/api/v1/photos/999999", headers=auth_headers).status_code == 404
+
+
+@pytest.mark.query_budget(2)
+def test_album_list_loads_covers_without_n_plus_one(client: TestClient, db_session, created_user, auth_headers):
+    """앨범 목록은 앨범 수와 관계없이 인증 + 목록 조회 2회 (커버 사진 포함)"""
+    from app.infra.album_repository import AlbumRepository
+
+    _add_photos(db_session, created_user.id, 5)
+    repo = AlbumRepository(db_session)
+    for i, photo_id in enumerate(db_session.query(Photo.id).all()):
+        repo.create({"name": f"A{i}", "album_type": "personal", "created_by_id": created_user.id,
+                     "cover_photo_id": photo_id[0]})
+    db_session.commit()
+
+    for path in ("/api/v1/albums/", "/api/v1/albums/mine"):
+        response = client.get(path, headers=auth_headers)
+        assert response.status_code == 200
+        assert all(item["cover_photo_url"].startswith("https://bucket/") for item in response.json()["items"])
+
+
+@pytest.mark.query_budget(1)
+def test_query_budget_fails_request(client: TestClient, auth_headers):
+    """요청이 쿼리 예산을 넘으면 테스트 실패"""
+    with pytest.raises(pytest.fail.Exception, match="budget 1"):
+        client.get("/api/v1/albums/", headers=auth_headers)
+
+
+def test_export_streams_ndjson(client: TestClient, db_session, created_user, auth_headers):
+    """본인 사진 메타데이터를 NDJSON으로 스트리밍"""
+    _add_photos(db_session, created_user.id, 3)
+
+    with client.stream("GET", "/api/v1/exports/photos", headers=auth_headers) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = list(response.iter_lines())
+
+    assert [json.loads(line)["filename"] for line in lines] == ["p0.jpg", "p1.jpg", "p2.jpg"]
+
+
+def test_export_csv_attachment(client: TestClient, auth_headers):
+    """CSV는 첨부 파일로 내려받고, 결과가 없어도 헤더 포함"""
+    response = client.get("/api/v1/exports/albums", params={"format": "csv"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="albums.csv"'
+    assert response.text.startswith("id,name,")
+
+
+def test_export_requires_group_membership(client: TestClient, auth_headers):
+    """멤버가 아닌 그룹의 내보내기는 403"""
+    response = client.get("/api/v1/exports/faces", params={"group_id": 999}, headers=auth_headers)
+    assert response.status_code == 403
@@ -0,0 +1,55 @@
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+
+from app.core.database import get_async_db
+from app.core.redis import get_redis
+from app.main import app
+
+# deploy/production-docker-compose.yml의 nginx 고정 주소 (앱의 FORWARDED_ALLOW_IPS)
+NGINX_ADDR = "172.28.0.10"
+
+
+@pytest.fixture
+def served_app(override_get_async_db, script_redis):
+    """uvicorn이 배포 설정(--proxy-headers, FORWARDED_ALLOW_IPS)으로 감싼 앱과 시도 제한 스크립트 호출 기록"""
+    redis = script_redis(result=0)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_redis] = lambda: redis
+    config = uvicorn.Config(app, proxy_headers=True, forwarded_allow_ips=NGINX_ADDR, log_config=None)
+    config.load()
+    yield config.loaded_app, redis
+    app.dependency_overrides.clear()
+
+
+def _login_from(asgi_app, peer: str, forwarded_for: str) -> int:
+    client = TestClient(asgi_app, client=(peer, 40000))
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "nobody@example.com", "password": "wrong-password"},
+        headers={"X-Forwarded-For": forwarded_for},
+    )
+    return response.status_code
+
+
+def _ip_keys(redis):
+    return [key for call in redis.calls if call[0] == "EVALSHA" for key in call[2] if key.startswith("login_rate:ip:")]
+
+
+def test_clients_behind_proxy_get_separate_ip_buckets(served_app):
+    """nginx를 거친 두 클라이언트는 nginx 주소가 아니라 각자의 IP 버킷으로 제한"""
+    asgi_app, redis = served_app
+
+    assert _login_from(asgi_app, NGINX_ADDR, "198.51.100.1") == 401
+    assert _login_from(asgi_app, NGINX_ADDR, "198.51.100.2") == 401
+
+    assert _ip_keys(redis) == ["login_rate:ip:198.51.100.1", "login_rate:ip:198.51.100.2"]
+
+
+def test_forwarded_for_from_untrusted_peer_is_ignored(served_app):
+    """프록시를 거치지 않은 요청의 X-Forwarded-For로는 다른 IP 버킷을 쓸 수 없음"""
+    asgi_app, redis = served_app
+
+    assert _login_from(asgi_app, "203.0.113.9", "198.51.100.1") == 401
+
+    assert _ip_keys(redis) == ["login_rate:ip:203.0.113.9"]
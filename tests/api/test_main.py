@@ -62,23 +62,23 @@ def test_group_endpoints_exist(client: TestClient):
 
 def test_photo_endpoints_exist(client: TestClient):
     """사진 API 엔드포인트 존재 확인"""
-    # 사진 목록 조회 엔드포인트 (구현되지 않았으므로 501 에러 예상)
+    # 사진 목록 조회 엔드포인트 (인증 필요)
     response = client.get("/api/v1/photos/")
-    assert response.status_code == 501  # Not Implemented
+    assert response.status_code == 403  # Not authenticated
 
 
 def test_album_endpoints_exist(client: TestClient):
     """앨범 API 엔드포인트 존재 확인"""
-    # 앨범 목록 조회 엔드포인트 (구현되지 않았으므로 501 에러 예상)
+    # 앨범 목록 조회 엔드포인트 (인증 필요)
     response = client.get("/api/v1/albums/")
-    assert response.status_code == 501  # Not Implemented
+    assert response.status_code == 403  # Not authenticated
 
 
 def test_face_endpoints_exist(client: TestClient):
     """얼굴 인식 API 엔드포인트 존재 확인"""
-    # 미식별 얼굴 목록 조회 엔드포인트 (구현되지 않았으므로 501 에러 예상)
+    # 미식별 얼굴 목록 조회 엔드포인트 (인증 필요)
     response = client.get("/api/v1/faces/unidentified")
-    assert response.status_code == 501  # Not Implemented
+    assert response.status_code == 403  # Not authenticated
 
 
 def test_cors_headers(client: TestClient):
@@ -0,0 +1,78 @@
+import json
+from fastapi.testclient import TestClient
+
+from app.services.group_service import GroupService
+from app.services.user_service import UserService
+
+
+def _group(db_session, admin_id: int) -> int:
+    group = GroupService(db_session).create_group(name="3-1", created_by_id=admin_id, group_type="class")
+    db_session.commit()
+    return group.id
+
+
+def test_import_roster_csv(client: TestClient, db_session, created_user, auth_headers):
+    """CSV 명단은 행 수와 상관없이 일정한 쿼리 수로 가져오고 행별 오류를 반환"""
+    group_id = _group(db_session, created_user.id)
+    lines = ["email,username,password"] + [f"s{i}@example.com,s{i},pw{i}" for i in range(20)] + ["bad,x,pw"]
+
+    response = client.post(
+        f"/api/v1/groups/{group_id}/roster",
+        files={"file": ("roster.csv", "\n".join(lines), "text/csv")},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["added"], data["skipped"]) == (20, 20, 0)
+    assert [error["row"] for error in data["errors"]] == [21]
+
+
+def test_import_roster_json_requires_group_admin(client: TestClient, db_session, auth_headers):
+    """그룹 관리자가 아니면 403"""
+    other = UserService(db_session).create_user(email="other@example.com", username="other", password="pw")
+    group_id = _group(db_session, other.id)
+    roster = json.dumps([{"email": "s@example.com", "username": "s", "password": "pw"}])
+
+    response = client.post(
+        f"/api/v1/groups/{group_id}/roster",
+        files={"file": ("roster.json", roster, "application/json")},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 403
+
+
+def test_import_roster_malformed_file(client: TestClient, db_session, created_user, auth_headers):
+    """읽을 수 없는 파일은 400"""
+    group_id = _group(db_session, created_user.id)
+
+    response = client.post(
+        f"/api/v1/groups/{group_id}/roster",
+        files={"file": ("roster.json", "{", "application/json")},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
+def test_import_roster_conflicts_with_concurrent_signup(client: TestClient, db_session, created_user, auth_headers,
+                                                        monkeypatch):
+    """해싱하는 동안(읽기 트랜잭션을 끝낸 뒤) 명단의 이메일로 가입하면 500 대신 409"""
+    group_id = _group(db_session, created_user.id)
+    roster = json.dumps([{"email": "s@example.com", "username": "s", "password": "pw"}])
+
+    async def hash_after_signup(passwords, slots=None):
+        UserService(db_session).create_user(email="s@example.com", username="s2", password="pw")
+        db_session.commit()
+        return ["hashed"] * len(passwords)
+
+    monkeypatch.setattr("app.api.group_router.run_password_hashes", hash_after_signup)
+    response = client.post(
+        f"/api/v1/groups/{group_id}/roster",
+        files={"file": ("roster.json", roster, "application/json")},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 409
+    assert "registered concurrently" in response.json()["detail"]
@@ -0,0 +1,38 @@
+import statistics
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+
+
+@pytest.fixture(scope="module")
+def bench_engine(tmp_path_factory):
+    """벤치마크 전용 SQLite 엔진 (테스트 DB와 분리)"""
+    path = tmp_path_factory.mktemp("bench") / "bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def bench_session(bench_engine):
+    """벤치마크용 세션"""
+    session = sessionmaker(bind=bench_engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """fn 실행 시간의 중앙값 (초)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
@@ -0,0 +1,72 @@
+import asyncio
+import statistics
+import time
+import httpx
+import pytest
+
+from app.core.security import PasswordHashPool, get_password_hash, verify_password
+from app.main import app
+
+LOGINS = 8
+PASSWORD = "password123"
+
+
+def _p99(samples) -> float:
+    return statistics.quantiles(samples, n=100)[98]
+
+
+async def _health_latencies_during(storm, interval: float = 0.005) -> list:
+    """로그인 폭주(storm) 동안 관련 없는 엔드포인트(/health)의 응답 시간 (초)
+
+    interval마다 보내기로 한 시각부터 재므로 루프가 막혀 요청을 보내지 못한 시간도 포함된다.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        latencies = []
+        done = asyncio.Event()
+
+        async def probe():
+            scheduled = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+                assert (await client.get("/health")).status_code == 200
+                latencies.append(time.perf_counter() - scheduled)
+                scheduled += interval
+
+        prober = asyncio.create_task(probe())
+        await asyncio.sleep(0.02)
+        await storm()
+        done.set()
+        await prober
+        return latencies
+
+
+@pytest.mark.slow
+def test_login_storm_does_not_stall_other_requests():
+    """로그인 폭주 중 /health p99: 이벤트 루프에서 바로 bcrypt 검증 vs 해싱 풀"""
+    hashed = get_password_hash(PASSWORD)
+
+    async def inline_storm():
+        async def login():
+            await asyncio.sleep(0)
+            assert verify_password(PASSWORD, hashed)
+        await asyncio.gather(*(login() for _ in range(LOGINS)))
+
+    pool = PasswordHashPool(max_workers=2, queue_timeout=30)
+
+    async def pooled_storm():
+        results = await asyncio.gather(*(pool.run(verify_password, PASSWORD, hashed) for _ in range(LOGINS)))
+        assert all(results)
+
+    try:
+        inline = asyncio.run(_health_latencies_during(inline_storm))
+        pooled = asyncio.run(_health_latencies_during(pooled_storm))
+    finally:
+        pool.shutdown()
+
+    print(
+        f"\n/health during {LOGINS} logins: inline p99 {_p99(inline) * 1000:.1f}ms, "
+        f"pooled p99 {_p99(pooled) * 1000:.1f}ms"
+    )
+
+    assert _p99(pooled) < _p99(inline)
@@ -0,0 +1,79 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+
+from app.domain.user import User
+from app.domain.group import Group
+from app.domain.photo import Photo
+from app.infra.pagination import next_cursor
+from app.infra.photo_repository import PhotoRepository
+from tests.benchmarks.conftest import timed
+
+PHOTO_COUNT = 50_000
+PAGE_SIZE = 50
+DEEP_PAGE = 1_000
+
+
+@pytest.fixture(scope="module")
+def seeded(bench_engine):
+    """사진 5만 장이 있는 그룹"""
+    with bench_engine.begin() as conn:
+        user_id = conn.execute(
+            insert(User).values(email="bench@example.com", username="bench", hashed_password="x")
+        ).inserted_primary_key[0]
+        group_id = conn.execute(
+            insert(Group).values(name="G", group_type="class", invite_code="BENCH001", created_by_id=user_id)
+        ).inserted_primary_key[0]
+        base = datetime(2025, 1, 1)
+        conn.execute(insert(Photo), [
+            {
+                "filename": f"{i}.jpg",
+                "original_filename": f"{i}.jpg",
+                "file_path": f"/{i}",
+                "file_size": 1,
+                "s3_bucket": "b",
+                "s3_key": str(i),
+                "s3_url": f"https://b/{i}",
+                "uploaded_by_id": user_id,
+                "group_id": group_id,
+                "is_active": True,
+                # 초 단위 동률이 많도록 10장씩 같은 시각
+                "created_at": base + timedelta(seconds=i // 10),
+            }
+            for i in range(PHOTO_COUNT)
+        ])
+    return group_id
+
+
+@pytest.mark.slow
+def test_deep_page_costs_same_as_first_page(bench_session, seeded):
+    """1,000번째 페이지 조회 비용이 첫 페이지와 같은 수준 (OFFSET은 선형 증가)"""
+    repo = PhotoRepository(bench_session)
+    key = lambda photo: (photo.created_at, photo.id)
+
+    first_page = repo.get_photos(group_id=seeded, limit=PAGE_SIZE)
+    cursor = next_cursor(first_page, PAGE_SIZE, key)
+    # 1,000번째 페이지 직전 커서 (마지막으로 본 행)
+    before_deep = repo.get_photos(
+        group_id=seeded, skip=(DEEP_PAGE - 1) * PAGE_SIZE - 1, limit=1
+    )
+    deep_cursor = next_cursor(before_deep, 1, key)
+
+    keyset_first = timed(lambda: repo.get_photos(group_id=seeded, limit=PAGE_SIZE))
+    keyset_deep = timed(lambda: repo.get_photos(group_id=seeded, limit=PAGE_SIZE, cursor=deep_cursor))
+    offset_deep = timed(lambda: repo.get_photos(
+        group_id=seeded, skip=(DEEP_PAGE - 1) * PAGE_SIZE, limit=PAGE_SIZE
+    ))
+
+    print(
+        f"\nkeyset page 1: {keyset_first * 1000:.2f}ms, "
+        f"keyset page {DEEP_PAGE}: {keyset_deep * 1000:.2f}ms, "
+        f"offset page {DEEP_PAGE}: {offset_deep * 1000:.2f}ms"
+    )
+
+    deep_page = repo.get_photos(group_id=seeded, limit=PAGE_SIZE, cursor=deep_cursor)
+    offset_page = repo.get_photos(group_id=seeded, skip=(DEEP_PAGE - 1) * PAGE_SIZE, limit=PAGE_SIZE)
+    assert [p.id for p in deep_page] == [p.id for p in offset_page]
+    assert cursor is not None
+    assert keyset_deep < keyset_first * 3
+    assert keyset_deep < offset_deep
@@ -0,0 +1,103 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+import pytest
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.domain.group import Group
+from app.domain.photo import Photo
+from app.domain.user import User
+from app.infra.pagination import encode_cursor
+from app.infra.partitions import PARTITIONED_TABLES, drop_referencing_foreign_keys, partition_table
+from app.infra.photo_repository import PhotoRepository
+from tests.benchmarks.conftest import timed
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+MONTH_COUNT = 24
+PHOTOS_PER_MONTH = 5_000
+NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def pg_bench():
+    """2년치 사진을 채운 PostgreSQL 엔진과 그룹 ID (빈 스키마에서 시작)"""
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(POSTGRES_URL)
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE"))
+        conn.execute(text("CREATE SCHEMA public"))
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        user_id = conn.execute(
+            insert(User).values(email="bench@example.com", username="bench", hashed_password="x")
+        ).inserted_primary_key[0]
+        group_id = conn.execute(
+            insert(Group).values(name="bench", group_type="event", invite_code="bench", created_by_id=user_id)
+        ).inserted_primary_key[0]
+        for month in range(MONTH_COUNT):
+            conn.execute(insert(Photo), [
+                {
+                    "filename": f"{month}-{i}.jpg",
+                    "original_filename": f"{month}-{i}.jpg",
+                    "file_path": f"/{month}/{i}",
+                    "file_size": 1,
+                    "s3_bucket": "b",
+                    "s3_key": f"{month}/{i}",
+                    "s3_url": f"https://b/{month}/{i}",
+                    "uploaded_by_id": user_id,
+                    "group_id": group_id,
+                    "is_active": True,
+                    "created_at": NOW - timedelta(days=30 * month, minutes=i),
+                }
+                for i in range(PHOTOS_PER_MONTH)
+            ])
+    yield engine, group_id
+    engine.dispose()
+
+
+def _measure(engine, group_id: int, cursor: str) -> Tuple[float, float]:
+    """(첫 페이지, 오래된 구간 키셋 페이지) 조회 시간 (초)"""
+    with Session(engine) as db:
+        db.execute(text("ANALYZE photos"))
+        repository = PhotoRepository(db)
+
+        def first_page():
+            repository.get_photos(group_id=group_id, limit=50)
+            db.expunge_all()
+
+        def cursor_page():
+            repository.get_photos(group_id=group_id, limit=50, cursor=cursor)
+            db.expunge_all()
+
+        return timed(first_page, repeat=20), timed(cursor_page, repeat=20)
+
+
+@pytest.mark.slow
+def test_partition_pruned_lists_against_baseline(pg_bench):
+    """created_at 범위 파티셔닝 후 키셋 페이지는 커서 이전 파티션만 계획/실행해 기준(일반 테이블)보다 느려지지 않음
+
+    첫 페이지는 범위 조건이 없어 모든 파티션을 계획하므로 파티션 수만큼 계획 시간이 늘어난다 (출력만).
+    """
+    engine, group_id = pg_bench
+    cursor = encode_cursor(NOW - timedelta(days=30 * (MONTH_COUNT - 2)), 0)
+
+    baseline_first, baseline = _measure(engine, group_id, cursor)
+    with engine.begin() as conn:
+        drop_referencing_foreign_keys(conn)
+        for table in PARTITIONED_TABLES:
+            partition_table(conn, table)
+    partitioned_first, partitioned = _measure(engine, group_id, cursor)
+
+    print(
+        f"\nfirst page - unpartitioned: {baseline_first * 1000:.1f}ms, "
+        f"partitioned: {partitioned_first * 1000:.1f}ms"
+        f"\ncursor page - unpartitioned: {baseline * 1000:.1f}ms, partitioned: {partitioned * 1000:.1f}ms "
+        f"({baseline / partitioned:.2f}x)"
+    )
+
+    assert partitioned <= baseline * 1.5
@@ -0,0 +1,77 @@
+import tracemalloc
+import pytest
+from sqlalchemy import insert
+
+from app.api.photo_router import PhotoListResponse
+from app.domain.photo import Photo
+from app.domain.user import User
+from app.infra.pagination import paginate
+from app.infra.photo_repository import PhotoRepository
+from app.infra.read_models import dump_page
+from tests.benchmarks.conftest import timed
+
+PHOTO_COUNT = 10_000
+KEY = lambda photo: (photo.created_at, photo.id)
+
+
+@pytest.fixture(scope="module")
+def seeded(bench_engine):
+    """사진 1만 장을 업로드한 사용자"""
+    with bench_engine.begin() as conn:
+        user_id = conn.execute(
+            insert(User).values(email="rows@example.com", username="rows", hashed_password="x")
+        ).inserted_primary_key[0]
+        conn.execute(insert(Photo), [
+            {
+                "filename": f"{i}.jpg",
+                "original_filename": f"{i}.jpg",
+                "file_path": f"/{i}",
+                "file_size": 1,
+                "s3_bucket": "b",
+                "s3_key": str(i),
+                "s3_url": f"https://b/{i}",
+                "uploaded_by_id": user_id,
+                "is_active": True,
+            }
+            for i in range(PHOTO_COUNT)
+        ])
+    return user_id
+
+
+def _peak_allocation(fn) -> int:
+    """fn 실행 중 최대 할당 바이트"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.slow
+def test_read_model_path_outperforms_orm_path(bench_session, seeded):
+    """목록 응답 JSON 생성: 읽기 모델 경로가 ORM + 응답 모델 경로보다 빠르고 메모리를 덜 씀"""
+    repo = PhotoRepository(bench_session)
+
+    def orm_path():
+        photos = repo.get_photos(uploaded_by_id=seeded, limit=PHOTO_COUNT)
+        body = PhotoListResponse.model_validate(paginate(photos, PHOTO_COUNT, KEY)).model_dump_json()
+        bench_session.expunge_all()
+        return body
+
+    def read_model_path():
+        return dump_page(repo.get_photo_cards(uploaded_by_id=seeded, limit=PHOTO_COUNT), PHOTO_COUNT, KEY)
+
+    assert len(read_model_path()) > 0 and len(orm_path()) > 0
+    orm_seconds = timed(orm_path, repeat=3)
+    read_model_seconds = timed(read_model_path, repeat=3)
+    orm_peak = _peak_allocation(orm_path)
+    read_model_peak = _peak_allocation(read_model_path)
+
+    print(
+        f"\nORM path: {PHOTO_COUNT / orm_seconds:,.0f} rows/s, peak {orm_peak / 1024 / 1024:.1f}MiB; "
+        f"read model path: {PHOTO_COUNT / read_model_seconds:,.0f} rows/s, peak {read_model_peak / 1024 / 1024:.1f}MiB"
+    )
+
+    assert read_model_seconds < orm_seconds
+    assert read_model_peak < orm_peak
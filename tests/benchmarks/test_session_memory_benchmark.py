@@ -0,0 +1,123 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from jose import jwt
+
+from app.core.config import settings
+from app.core.revocation import RevocationFilter
+from app.core.security import create_access_token, create_refresh_token, new_token_id
+from app.infra.auth_repository import AuthRepository
+
+SESSIONS = 1000
+USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148"
+# 최상위 키 하나에 드는 Redis 내부 오버헤드 추정치 (dictEntry, robj, 키 SDS 헤더, 만료 사전 항목)
+KEY_OVERHEAD = 72
+
+
+class RecordingPipeline:
+    """쓰기 명령을 받은 그대로 dict에 기록하는 파이프라인 (값의 바이트 수 계산용)"""
+
+    def __init__(self, store: dict):
+        self.store = store
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+
+    def hset(self, key, field, value):
+        self.store.setdefault(key, {})[field] = value
+
+    def zadd(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, ttl):
+        pass
+
+    async def execute(self):
+        pass
+
+
+class RecordingRedis:
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self):
+        return RecordingPipeline(self.store)
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, dict):
+        return sum(_nbytes(k) + _nbytes(v) for k, v in value.items())
+    if isinstance(value, set):
+        return sum(_nbytes(member) for member in value)
+    return len(str(value).encode())
+
+
+def _bytes_per_session(store: dict) -> float:
+    total = sum(_nbytes(key) + _nbytes(value) + KEY_OVERHEAD for key, value in store.items())
+    return total / SESSIONS
+
+
+def _legacy_sessions(store: dict) -> None:
+    """이전 스키마로 세션 저장 (토큰 원문을 키 이름과 세션 JSON에 그대로 씀, 로그아웃 시 blacklist:{token} 추가)"""
+    pipe = RecordingPipeline(store)
+    for user_id in range(1, SESSIONS + 1):
+        now = datetime.utcnow()
+        access_token = jwt.encode(
+            {"sub": str(user_id), "ver": 0, "exp": now + timedelta(minutes=settings.jwt_expire_minutes)},
+            settings.jwt_secret, algorithm=settings.jwt_algorithm
+        )
+        refresh_token = jwt.encode(
+            {"sub": str(user_id), "type": "refresh", "ver": 0, "exp": now + timedelta(days=30)},
+            settings.jwt_secret, algorithm=settings.jwt_algorithm
+        )
+        session_id = str(uuid.uuid4())
+        session = {
+            "user_id": user_id,
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "created_at": now.isoformat(),
+            "expires_at": (now + timedelta(minutes=settings.jwt_expire_minutes)).isoformat(),
+            "ip_address": "203.0.113.7",
+            "user_agent": USER_AGENT,
+        }
+        token_index = json.dumps({"user_id": user_id, "session_id": session_id})
+        pipe.setex(f"session:user:{user_id}:{session_id}", 0, json.dumps(session))
+        pipe.sadd(f"user_sessions:{user_id}", session_id)
+        pipe.setex(f"token:{access_token}", 0, token_index)
+        pipe.setex(f"refresh_token:{refresh_token}", 0, token_index)
+
+
+async def _compact_sessions(redis: RecordingRedis) -> None:
+    repository = AuthRepository(redis, RevocationFilter(capacity=10, error_rate=0.01))
+    for user_id in range(1, SESSIONS + 1):
+        session_id, access_jti, refresh_jti = new_token_id(), new_token_id(), new_token_id()
+        # 토큰은 클라이언트에만 전달되고 Redis에는 들어가지 않음
+        create_access_token({"sub": str(user_id), "ver": 0, "sid": session_id, "jti": access_jti})
+        create_refresh_token(user_id, 0, session_id, refresh_jti)
+        await repository.store_session(
+            user_id, session_id, access_jti, refresh_jti, ip_address="203.0.113.7", user_agent=USER_AGENT
+        )
+
+
+@pytest.mark.slow
+def test_compact_session_schema_uses_less_memory():
+    """세션당 Redis 바이트 수 (키 이름 + 값 + 키 오버헤드 추정): 토큰 원문 키 vs 사용자별 해시"""
+    legacy = {}
+    _legacy_sessions(legacy)
+    compact = RecordingRedis()
+    asyncio.run(_compact_sessions(compact))
+
+    legacy_bytes, compact_bytes = _bytes_per_session(legacy), _bytes_per_session(compact.store)
+    print(
+        f"\nbytes/session over {SESSIONS} sessions: legacy {legacy_bytes:.0f}B in "
+        f"{len(legacy) / SESSIONS:.0f} keys, compact {compact_bytes:.0f}B in 1 key + expiry index entry"
+    )
+
+    assert len(compact.store) == SESSIONS + 1  # 사용자당 해시 하나 + 만료 색인
+    assert not any("." in key for key in compact.store)  # 키 이름에 토큰 원문 없음
+    assert compact_bytes * 3 < legacy_bytes
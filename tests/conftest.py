@@ -1,13 +1,19 @@
+import hashlib
 import pytest
 import tempfile
 import os
+from contextlib import asynccontextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.main import app
-from app.core.database import get_db, Base
+from app.core.database import get_db, get_async_db, get_async_session_factory, async_session_factory, Base
+from app.core.principal import principal_cache
 from app.domain.user import User
 from app.domain.group import Group, GroupMembership
 from app.domain.photo import Photo, PhotoTag
@@ -56,6 +62,8 @@ def db_session(TestingSessionLocal, tables):
     try:
         yield db
     finally:
+        # 커밋되지 않은 작업 단위 정리 후 데이터 삭제
+        db.rollback()
         # Clear all data from tables to ensure test isolation
         for table in reversed(Base.metadata.sorted_tables):
             db.execute(table.delete())
@@ -63,6 +71,126 @@ def db_session(TestingSessionLocal, tables):
         db.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """테스트마다 테이블을 비우고 사용자 ID를 다시 쓰므로 이전 테스트에서 캐시된 인증 주체 제거"""
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 기록 (왕복 횟수 검증용)"""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def on_commit(self, conn):
+        self.commits += 1
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+        self.commits = 0
+
+
+@pytest.fixture
+def query_counter(engine):
+    """테스트 중 실행되는 SQL 문 수를 세는 픽스처"""
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    event.listen(engine, "commit", counter.on_commit)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter)
+    event.remove(engine, "commit", counter.on_commit)
+
+
+class ScriptPipeline:
+    """ScriptRedis의 파이프라인 (실행하면 쌓인 명령 이름을 한 번의 호출로 기록)"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args))
+
+    async def execute(self):
+        self.redis.calls.append(("PIPELINE", self.commands))
+        return [None] * len(self.commands)
+
+
+class ScriptRedis:
+    """EVALSHA/SCRIPT LOAD 호출을 기록하고 정해진 값을 돌려주는 Redis (Lua 스크립트 테스트용)
+
+    loaded=False면 스크립트 캐시가 비어 있는 것처럼 첫 EVALSHA가 NOSCRIPT로 실패한다.
+    calls: ("EVALSHA", sha, keys, args), ("SCRIPT LOAD", sha) 또는 ("PIPELINE", [(명령, 인자), ...])
+    """
+
+    def __init__(self, result=None, error=None, loaded=True):
+        self.result = result
+        self.error = error
+        self.loaded = loaded
+        self.calls = []
+
+    async def script_load(self, source):
+        sha = hashlib.sha1(source.encode()).hexdigest()
+        self.calls.append(("SCRIPT LOAD", sha))
+        self.loaded = True
+        return sha
+
+    async def evalsha(self, sha, numkeys, *keys_and_args):
+        self.calls.append(("EVALSHA", sha, keys_and_args[:numkeys], keys_and_args[numkeys:]))
+        if self.error:
+            raise self.error
+        if not self.loaded:
+            raise NoScriptError("NOSCRIPT No matching script.")
+        return self.result
+
+    def pipeline(self, transaction=True):
+        return ScriptPipeline(self)
+
+
+@pytest.fixture
+def script_redis():
+    """ScriptRedis 생성 함수"""
+    return ScriptRedis
+
+
+# 실제 Redis가 필요한 테스트 (예: docker compose up -d redis 후 TEST_REDIS_URL=redis://localhost:6379/15)
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+
+@pytest.fixture
+def real_redis():
+    """테스트 DB를 비운 실제 Redis 클라이언트를 여는 함수 (TEST_REDIS_URL이 없으면 건너뜀)
+
+    클라이언트 커넥션은 이벤트 루프에 묶이므로 테스트의 이벤트 루프 안에서 연다:
+    async with real_redis() as client: ...
+    """
+    if not TEST_REDIS_URL:
+        pytest.skip("TEST_REDIS_URL is not set")
+
+    @asynccontextmanager
+    async def open_client():
+        client = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+        await client.flushdb()
+        try:
+            yield client
+        finally:
+            await client.flushdb()
+            await client.connection_pool.disconnect()
+
+    return open_client
+
+
 @pytest.fixture
 def override_get_db(db_session):
     """테스트용 데이터베이스 세션 오버라이드"""
@@ -74,11 +202,80 @@ def override_get_db(db_session):
     return _override_get_db
 
 
+@pytest.fixture(scope="session")
+def async_engine(temp_db):
+    """같은 테스트 DB 파일을 바라보는 비동기 엔진
+
+    TestClient는 클라이언트마다 이벤트 루프를 새로 만들므로 커넥션을 풀에 보관하지 않음
+    """
+    return create_async_engine(f"sqlite+aiosqlite:///{temp_db}", poolclass=NullPool)
+
+
+@pytest.fixture(scope="session")
+def AsyncTestingSessionLocal(async_engine, tables):
+    """비동기 세션 팩토리"""
+    return async_session_factory(async_engine)
+
+
 @pytest.fixture
-def client(override_get_db):
-    """테스트 클라이언트 픽스처"""
+def override_get_async_db(AsyncTestingSessionLocal):
+    """테스트용 비동기 데이터베이스 세션 오버라이드 (요청마다 커밋)"""
+    async def _override_get_async_db():
+        async with AsyncTestingSessionLocal() as db:
+            try:
+                yield db
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+    return _override_get_async_db
+
+
+# 요청 하나가 실행할 수 있는 SQL 문 수 (N+1 감지, @pytest.mark.query_budget(n)으로 테스트별 조정)
+DEFAULT_QUERY_BUDGET = 10
+
+
+def pytest_configure(config):
+    # pytest.ini의 [tool:pytest] 섹션은 읽히지 않으므로 마커는 여기서 등록
+    config.addinivalue_line("markers", "query_budget(n): 요청 하나에서 허용하는 최대 SQL 문 수")
+
+
+class QueryBudgetClient(TestClient):
+    """요청마다 실행된 SQL 문 수를 세고 예산을 넘으면 테스트를 실패시키는 테스트 클라이언트"""
+
+    def __init__(self, app, engines, query_budget: int):
+        super().__init__(app)
+        self.engines = engines
+        self.query_budget = query_budget
+
+    def request(self, method, url, *args, **kwargs):
+        counter = QueryCounter()
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", counter)
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        finally:
+            for engine in self.engines:
+                event.remove(engine, "before_cursor_execute", counter)
+
+        if counter.count > self.query_budget:
+            pytest.fail(
+                f"{method} {url} issued {counter.count} queries (budget {self.query_budget}):\n"
+                + "\n".join(counter.statements)
+            )
+        return response
+
+
+@pytest.fixture
+def client(request, engine, async_engine, AsyncTestingSessionLocal, override_get_db, override_get_async_db):
+    """테스트 클라이언트 픽스처 (요청당 쿼리 수 예산 적용)"""
+    marker = request.node.get_closest_marker("query_budget")
+    query_budget = marker.args[0] if marker else DEFAULT_QUERY_BUDGET
+
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as c:
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: AsyncTestingSessionLocal
+    with QueryBudgetClient(app, [engine, async_engine.sync_engine], query_budget) as c:
         yield c
     app.dependency_overrides.clear()
 
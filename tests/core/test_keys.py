@@ -0,0 +1,150 @@
+import asyncio
+import base64
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwk, jwt
+
+from app.core.config import settings
+from app.core.keys import KeyRing
+from app.core.principal import Principal
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    get_current_user,
+    verify_refresh_token,
+    verify_token,
+)
+
+
+def _keyring(tmp_path, **kwargs) -> KeyRing:
+    options = {"publish_ahead": 600, "overlap": 1500, **kwargs}
+    return KeyRing(str(tmp_path / "keyring.json"), "RS256", **options)
+
+
+class TestKeyRing:
+    """서명 키링 테스트"""
+
+    def test_first_key_is_active_and_published(self, tmp_path):
+        keyring = _keyring(tmp_path)
+
+        assert keyring.rotate_if_due(3600) is True
+        assert keyring.rotate_if_due(3600) is False  # 아직 교체 주기가 아님
+
+        (key,) = keyring.jwks()["keys"]
+        assert key["kid"] == keyring.signing_key().kid
+        assert (key["kty"], key["alg"], key["use"]) == ("RSA", "RS256", "sig")
+        assert "d" not in key  # 개인 키 성분은 공개하지 않음
+
+    def test_rotation_publishes_ahead_and_keeps_overlap(self, tmp_path):
+        keyring = _keyring(tmp_path)
+        with patch("app.core.keys.time.time", return_value=0.0):
+            keyring.rotate_if_due(3600)
+            first = keyring.signing_key().kid
+
+        with patch("app.core.keys.time.time", return_value=3600.0):
+            keyring.rotate_if_due(3600)
+            second = keyring.jwks()["keys"][-1]["kid"]
+            assert keyring.signing_key().kid == first  # 새 키는 공개만 하고 아직 서명에 쓰지 않음
+
+        with patch("app.core.keys.time.time", return_value=4200.0):
+            assert keyring.signing_key().kid == second
+            assert [key["kid"] for key in keyring.jwks()["keys"]] == [first, second]
+
+        with patch("app.core.keys.time.time", return_value=7800.0):
+            keyring.rotate_if_due(3600)
+            kids = [key["kid"] for key in keyring.jwks()["keys"]]
+            assert first not in kids and kids[0] == second  # overlap이 지난 이전 키 제거
+
+    def test_other_worker_picks_up_rotated_key(self, tmp_path):
+        worker_a, worker_b = _keyring(tmp_path, publish_ahead=0), _keyring(tmp_path, publish_ahead=0)
+        worker_a.rotate_if_due(3600)
+        worker_b.signing_key()
+
+        with patch("app.core.keys.time.time", return_value=datetime.utcnow().timestamp() + 7200):
+            worker_a.rotate_if_due(3600)
+            rotated = worker_a.signing_key().kid
+
+        with patch("app.core.keys.time.monotonic", return_value=worker_b._checked_at + 1):
+            assert worker_b.verification_key(rotated) is not None  # 모르는 kid면 파일을 다시 읽음
+
+
+@pytest.fixture
+def stateless(tmp_path, monkeypatch):
+    """무상태 액세스 토큰 모드와 임시 키링"""
+    keyring = _keyring(tmp_path)
+    keyring.rotate_if_due(3600)
+    monkeypatch.setattr(settings, "jwt_stateless_access_tokens", True)
+    monkeypatch.setattr("app.core.security.get_keyring", lambda: keyring)
+    return keyring
+
+
+class TestStatelessAccessTokens:
+    """비대칭 키로 서명한 무상태 액세스 토큰 테스트"""
+
+    def test_access_token_is_short_lived_and_verifiable_with_jwks(self, stateless):
+        token = create_access_token({"sub": "1", "ver": 0, "role": "admin"})
+
+        assert jwt.get_unverified_header(token)["kid"] == stateless.signing_key().kid
+        payload = jwt.decode(token, stateless.jwks(), algorithms=["RS256"])  # 다른 서비스는 JWKS만으로 검증
+        lifetime = payload["exp"] - datetime.utcnow().timestamp()
+        assert settings.jwt_stateless_access_minutes * 60 - 5 < lifetime <= settings.jwt_stateless_access_minutes * 60
+
+    def test_authentication_needs_no_redis_or_db(self, stateless):
+        credentials = Mock(spec=HTTPAuthorizationCredentials)
+        credentials.credentials = create_access_token({"sub": "1", "ver": 2, "role": "admin"})
+        db, redis_client = Mock(), Mock()  # 호출하면 await에서 실패
+
+        with patch("app.core.keys.jwk.construct", wraps=jwk.construct) as construct:
+            principals = [asyncio.run(get_current_user(credentials, db, redis_client)) for _ in range(20)]
+
+        assert principals[0] == Principal(id=1, is_active=True, role="admin", token_version=2)
+        assert construct.call_count == 0  # 파싱한 공개 키를 재사용
+        assert not db.mock_calls and not redis_client.mock_calls
+
+    def test_refresh_tokens_stay_symmetric(self, stateless):
+        refresh_token = create_refresh_token(1, session_id="sid-1")
+        assert "kid" not in jwt.get_unverified_header(refresh_token)
+        assert verify_refresh_token(refresh_token)["sid"] == "sid-1"
+
+        forged = create_access_token({"sub": "1", "type": "refresh"})  # 키링으로 서명된 토큰은 리프레시로 쓸 수 없음
+        with pytest.raises(HTTPException):
+            verify_refresh_token(forged)
+
+    def test_rejects_secret_signed_token_with_kid(self, stateless):
+        kid = stateless.signing_key().kid
+        token = jwt.encode({"sub": "1", "role": "admin"}, settings.jwt_secret, algorithm="HS256", headers={"kid": kid})
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token(token)
+        assert exc_info.value.status_code == 401
+
+    def test_unknown_kid_is_rejected(self, stateless):
+        token = _with_kid(create_access_token({"sub": "1"}), "unknown")
+
+        with pytest.raises(HTTPException):
+            verify_token(token)
+
+
+def _with_kid(token: str, kid: str) -> str:
+    """서명은 그대로 두고 헤더의 kid만 바꾼 토큰"""
+    header, rest = token.split(".", 1)
+    decoded = json.loads(base64.urlsafe_b64decode(header + "=" * (-len(header) % 4)))
+    encoded = base64.urlsafe_b64encode(json.dumps({**decoded, "kid": kid}).encode()).rstrip(b"=").decode()
+    return f"{encoded}.{rest}"
+
+
+def test_jwks_endpoint(client, stateless, monkeypatch):
+    monkeypatch.setattr("app.main.get_keyring", lambda: stateless)
+    response = client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == f"public, max-age={settings.jwks_max_age_seconds}"
+    assert [key["kid"] for key in response.json()["keys"]] == [stateless.signing_key().kid]
+
+    monkeypatch.setattr(settings, "jwt_stateless_access_tokens", False)
+    assert client.get("/.well-known/jwks.json").status_code == 404
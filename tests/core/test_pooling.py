@@ -0,0 +1,116 @@
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import metrics
+from app.core.pooling import (
+    DatabaseSettings,
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    configure_sqlite,
+    engine_options,
+    instrument_pool,
+)
+
+POSTGRES_URL = "postgresql+asyncpg://user:pw@db/dandle"
+
+
+def _settings(**overrides) -> DatabaseSettings:
+    return DatabaseSettings(_env_file=None, **overrides)
+
+
+class TestPoolLimits:
+    """배포 프로필별 풀 크기 계산 테스트"""
+
+    def test_derived_from_connection_budget(self):
+        """(최대 - 예비) 커넥션을 워커 x 엔진 수로 나눠 상시 풀과 overflow에 배분"""
+        assert _settings().pool_limits() == (22, 23)
+        assert _settings(web_concurrency=4).pool_limits() == (5, 6)
+
+    def test_never_exceeds_server_limit(self):
+        """모든 워커가 overflow까지 사용해도 예비분을 제외한 한도 이내"""
+        db_settings = _settings(db_max_connections=50, db_reserved_connections=5, web_concurrency=3)
+        pool_size, max_overflow = db_settings.pool_limits()
+
+        assert (pool_size + max_overflow) * 3 * 2 <= 45
+
+    def test_explicit_overrides(self):
+        """명시한 값이 계산 값보다 우선"""
+        assert _settings(db_pool_size=3, db_max_overflow=0).pool_limits() == (3, 0)
+
+
+class TestEngineOptions:
+    """URL/설정별 엔진 인자 테스트"""
+
+    def test_postgres_pool(self):
+        """PostgreSQL은 계측 풀과 타임아웃/재활용 설정 사용"""
+        options = engine_options(POSTGRES_URL, _settings(web_concurrency=2), is_async=True)
+
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert (options["pool_size"], options["max_overflow"]) == (11, 11)
+        assert options["pool_recycle"] == 1800
+        assert "connect_args" not in options
+
+    def test_pgbouncer_disables_prepared_statement_cache(self):
+        """PgBouncer 경유 시 asyncpg prepared statement 캐시를 끄고 이름을 매번 새로 생성"""
+        connect_args = engine_options(POSTGRES_URL, _settings(db_pgbouncer=True), is_async=True)["connect_args"]
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+    def test_sqlite(self):
+        """파일 SQLite는 계측 풀, 메모리 SQLite는 기본 풀 사용"""
+        file_options = engine_options("sqlite:///./x.db", _settings())
+        memory_options = engine_options("sqlite+aiosqlite://", _settings(), is_async=True)
+
+        assert file_options["poolclass"] is InstrumentedQueuePool
+        assert file_options["connect_args"]["timeout"] == 5.0
+        assert "poolclass" not in memory_options
+
+
+class TestSqlitePragmas:
+    """SQLite PRAGMA 적용 테스트"""
+
+    def test_wal_and_busy_timeout(self, tmp_path):
+        """커넥션마다 WAL 모드와 busy_timeout 적용"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+        configure_sqlite(engine, _settings(sqlite_busy_timeout_ms=1234))
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        engine.dispose()
+
+    def test_wal_can_be_disabled(self, tmp_path):
+        """sqlite_wal=False면 기본 저널 모드 유지"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'journal.db'}")
+        configure_sqlite(engine, _settings(sqlite_wal=False))
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        engine.dispose()
+
+
+class TestPoolMetrics:
+    """커넥션 풀 메트릭 테스트"""
+
+    def test_checkout_metrics(self, tmp_path):
+        """체크아웃 대기 시간, 커넥션 나이, overflow 사용, 풀 상태 게이지 기록"""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+        )
+        instrument_pool(engine, "pool-test")
+        overflow_before = metrics.counter("db.pool.overflow_checkouts", target="pool-test")
+
+        with engine.connect():
+            with engine.connect():
+                assert metrics.snapshot()["gauges"]["db.pool.checkedout{target=pool-test}"] == 2
+
+        assert metrics.timing("db.pool.checkout_wait.seconds", target="pool-test").count == 2
+        assert metrics.timing("db.pool.connection_age.seconds", target="pool-test").count == 2
+        assert metrics.counter("db.pool.overflow_checkouts", target="pool-test") == overflow_before + 1
+        engine.dispose()
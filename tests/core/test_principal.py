@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.principal import (
+    Principal,
+    PrincipalCache,
+    cache_principal,
+    principal_cache,
+    principal_key,
+)
+from app.infra.user_repository import UserRepository
+
+
+class TestPrincipalCache:
+    """프로세스 로컬 주체 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+        for user_id in (1, 2):
+            cache.put(Principal(id=user_id, is_active=True, role="user"))
+        cache.get(1)  # 1을 최근 사용으로
+        cache.put(Principal(id=3, is_active=True, role="user"))
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None and cache.get(3) is not None
+
+    def test_ttl_expiry(self):
+        cache = PrincipalCache(max_entries=10, ttl_seconds=5)
+        with patch("app.core.principal.time.monotonic", return_value=100.0):
+            cache.put(Principal(id=1, is_active=True, role="user"))
+        with patch("app.core.principal.time.monotonic", return_value=104.0):
+            assert cache.get(1) is not None
+        with patch("app.core.principal.time.monotonic", return_value=105.0):
+            assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_json_round_trip(self):
+        principal = Principal(id=7, is_active=False, role="admin", token_version=3)
+        assert Principal.from_json(principal.to_json()) == principal
+
+
+def test_cache_write_never_outlives_local_ttl(real_redis):
+    """DB 조회와 겹친 무효화 뒤 늦게 저장된 주체는 로컬 캐시 유지 시간 안에 사라지고, 최신 값을 덮어쓰지 않음"""
+    async def scenario():
+        async with real_redis() as client:
+            fresh = Principal(id=1, is_active=False, role="user", token_version=1)
+            stale = Principal(id=1, is_active=True, role="admin", token_version=0)
+
+            await cache_principal(client, fresh)
+            await cache_principal(client, stale)  # 무효화 전에 읽은 요청이 늦게 저장
+
+            assert Principal.from_json(await client.get(principal_key(1))) == fresh
+            assert 0 < await client.pttl(principal_key(1)) <= settings.principal_cache_ttl_seconds * 1000
+
+    asyncio.run(scenario())
+    principal_cache.clear()
+
+
+class TestPrincipalInvalidation:
+    """사용자 변경 커밋 시 캐시 무효화 테스트"""
+
+    def test_update_and_delete_invalidate_after_commit(self, db_session: Session, created_user):
+        repository = UserRepository(db_session)
+        principal_cache.put(repository.load_principal(created_user.id))
+
+        repository.update(created_user.id, {"full_name": "Renamed"})
+        db_session.commit()
+        assert principal_cache.get(created_user.id) is not None  # 주체 컬럼이 아니면 유지
+
+        repository.update(created_user.id, {"role": "admin"})
+        assert principal_cache.get(created_user.id) is not None  # 커밋 전에는 유지
+        db_session.commit()
+        assert principal_cache.get(created_user.id) is None
+
+        principal_cache.put(repository.load_principal(created_user.id))
+        repository.delete(created_user.id)
+        db_session.commit()
+        assert principal_cache.get(created_user.id) is None
+        assert repository.load_principal(created_user.id) == Principal(
+            id=created_user.id, is_active=False, role="admin", token_version=0
+        )
+
+    def test_rollback_keeps_cache(self, db_session: Session, created_user):
+        repository = UserRepository(db_session)
+        principal_cache.put(repository.load_principal(created_user.id))
+
+        repository.update(created_user.id, {"is_active": False})
+        db_session.rollback()
+        db_session.commit()
+
+        assert principal_cache.get(created_user.id) is not None
+
+    def test_password_change_bumps_token_version(self, db_session: Session, created_user):
+        repository = UserRepository(db_session)
+        repository.update(created_user.id, {"hashed_password": "new-hash"})
+        db_session.commit()
+
+        assert repository.load_principal(created_user.id).token_version == 1
+
+
+def test_authenticated_requests_skip_db_once_cached(client, db_session: Session, created_user, auth_headers):
+    """캐시된 뒤 인증은 DB를 조회하지 않고, 사용자 변경은 다음 요청에 바로 반영"""
+    assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+    client.query_budget = 1  # 프로필 조회 한 번만 허용 (인증 주체 조회 없음)
+    for _ in range(3):
+        assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+    UserRepository(db_session).delete(created_user.id)
+    db_session.commit()
+    client.query_budget = 2
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 403
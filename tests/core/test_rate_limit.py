@@ -0,0 +1,60 @@
+import asyncio
+
+from redis.exceptions import ConnectionError
+
+from app.core.config import settings
+from app.core.rate_limit import GCRA, LoginThrottle, RateLimit, acquire
+
+
+def test_rate_limit_args():
+    assert RateLimit(limit=10, period=60).args() == (6000, 60000)
+    assert RateLimit(limit=7, period=1).args() == (143, 1001)  # 간격은 올림 (제한보다 많이 허용하지 않음)
+
+
+class TestLoginThrottle:
+    """로그인 시도 제한 테스트"""
+
+    def test_checks_email_and_ip_in_one_script_call(self, monkeypatch, script_redis):
+        monkeypatch.setattr(settings, "login_email_rate_limit", 5)
+        monkeypatch.setattr(settings, "login_ip_rate_limit", 20)
+        monkeypatch.setattr(settings, "login_rate_period_seconds", 60.0)
+        redis = script_redis(result=0)
+
+        assert asyncio.run(LoginThrottle(redis).retry_after(" User@Example.com ", "203.0.113.7")) == 0
+
+        ((_, sha, keys, args),) = redis.calls
+        assert sha == GCRA.sha
+        assert keys == ("login_rate:email:user@example.com", "login_rate:ip:203.0.113.7")
+        assert args == (12000, 60000, 3000, 60000)
+
+    def test_returns_seconds_until_retry(self, script_redis):
+        redis = script_redis(result=2500)
+
+        assert asyncio.run(LoginThrottle(redis).retry_after("user@example.com")) == 2.5
+        assert len(redis.calls[0][2]) == 1  # IP를 모르면 계정 키만
+
+    def test_allows_login_when_redis_is_down(self, script_redis):
+        redis = script_redis(error=ConnectionError("refused"))
+
+        assert asyncio.run(LoginThrottle(redis).retry_after("user@example.com", "203.0.113.7")) == 0
+
+
+def test_gcra_limits_bursts_and_recovers(real_redis):
+    """limit번까지 연달아 허용, 넘은 시도는 기록하지 않고 Retry-After 뒤에 다시 허용"""
+    async def scenario():
+        async with real_redis() as client:
+            limits = [
+                ("login_rate:email:a", RateLimit(limit=3, period=1)),
+                ("login_rate:ip:1", RateLimit(limit=5, period=1)),
+            ]
+
+            assert [await acquire(client, limits) for _ in range(3)] == [0, 0, 0]
+            retry_after = await acquire(client, limits)
+            assert 0 < retry_after <= 0.334
+            assert await acquire(client, [("login_rate:email:b", RateLimit(limit=3, period=1))]) == 0
+
+            await asyncio.sleep(retry_after)
+            assert await acquire(client, limits) == 0
+            assert await acquire(client, limits) > 0
+
+    asyncio.run(scenario())
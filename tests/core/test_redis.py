@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from redis.asyncio import Redis
+from redis.asyncio.connection import Connection
+from redis.exceptions import ConnectionError
+
+from app.core import redis as redis_module
+from app.core.metrics import metrics
+from app.core.redis import claim_job_run, close_redis, create_redis_pool, get_redis
+from app.core.security import create_access_token
+
+
+class FakeConnection(Connection):
+    """서버 없이 GET/SET/EXISTS/HGET/PING/SUBSCRIBE/XRANGE/XREAD에 응답하는 커넥션 (만들어진 수를 셈, 파이프라인 지원)"""
+
+    created = 0
+    store = {}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        FakeConnection.created += 1
+        self._commands = []
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self, nowait: bool = False):
+        pass
+
+    async def can_read_destructive(self):
+        return False
+
+    async def send_command(self, *args, **kwargs):
+        self._commands.append(args)
+        await asyncio.sleep(0.001)  # 명령 왕복 동안 다른 요청이 커넥션을 기다리게 함
+
+    async def send_packed_command(self, command, check_health=True):
+        """파이프라인이 보낸 RESP 배열들을 명령으로 풀어 둠"""
+        lines = b"".join(command).split(b"\r\n")
+        while lines and lines[0]:
+            count, lines = int(lines[0][1:]), lines[1:]
+            self._commands.append(tuple(arg.decode() for arg in lines[1:2 * count:2]))
+            lines = lines[2 * count:]
+        await asyncio.sleep(0.001)
+
+    async def read_response(self, **kwargs):
+        name, *args = self._commands.pop(0)
+        if name == "SET":
+            if "NX" in args and args[0] in self.store:
+                return None
+            self.store[args[0]] = args[1]
+            return b"OK"
+        if name == "GET":
+            return self.store.get(args[0])
+        if name == "HGET":
+            return None
+        if name == "EXISTS":
+            return sum(key in self.store for key in args)
+        if name == "XLEN":
+            return 0
+        if name == "XRANGE":
+            return []
+        if name == "SUBSCRIBE":
+            self._commands.append(("LISTEN",))
+            return [b"subscribe", args[0].encode(), 1]
+        if name in ("LISTEN", "XREAD"):
+            await asyncio.Event().wait()  # 발행되는 메시지 없음
+        return b"PONG"
+
+
+@pytest.fixture
+def fake_pool():
+    FakeConnection.created = 0
+    FakeConnection.store = {}
+    pool = create_redis_pool("redis://localhost:6379/0", max_connections=4, connection_class=FakeConnection)
+    yield pool
+    asyncio.run(pool.disconnect())
+
+
+def test_pool_connection_count_constant_under_load(fake_pool):
+    """동시 요청이 계속 들어와도 커넥션 수는 max_connections에서 더 늘지 않고, 나머지는 대기 후 재사용"""
+    client = Redis(connection_pool=fake_pool)
+    before = metrics.timing("redis.pool.checkout_wait.seconds")
+    before_count = before.count if before else 0
+
+    async def load():
+        counts = []
+        for round_ in range(5):
+            await asyncio.gather(*(client.set(f"k{round_}:{i}", i) for i in range(200)))
+            counts.append(FakeConnection.created)
+        return counts
+
+    counts = asyncio.run(load())
+
+    assert counts == [4] * 5
+    assert fake_pool.in_use() == 0 and fake_pool.idle() == 4
+    assert metrics.timing("redis.pool.checkout_wait.seconds").count >= before_count + 1000
+
+
+def test_requests_share_one_pool(fake_pool, monkeypatch, request):
+    """인증 요청마다 새 풀을 만들지 않고 공유 클라이언트의 커넥션 하나를 재사용 (주체 무효화 구독, 폐기 스트림 읽기용 1개씩 별도)"""
+    monkeypatch.setattr(redis_module, "_client", Redis(connection_pool=fake_pool))
+    client = request.getfixturevalue("client")  # lifespan 시작 (open_redis가 위 클라이언트를 사용)
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': '1', 'sid': 'session-1'})}"}  # 세션 조회까지 진행
+    for _ in range(50):
+        response = client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 401
+
+    assert FakeConnection.created == 3
+
+
+def test_get_redis_outside_lifespan_creates_pool_once():
+    asyncio.run(close_redis())
+    try:
+        client = get_redis()
+        assert client is get_redis()
+        assert client.connection_pool.max_connections == redis_module.settings.redis_max_connections
+    finally:
+        asyncio.run(close_redis())
+
+
+def test_only_one_worker_claims_each_job_run(fake_pool):
+    """워커마다 작업 루프가 돌아도 주기마다 한 워커만 실행"""
+    workers = [Redis(connection_pool=fake_pool) for _ in range(4)]
+    before = metrics.counter("jobs.skipped", job="retention")
+
+    async def claim_all():
+        return await asyncio.gather(*(claim_job_run(worker, "retention", 60) for worker in workers))
+
+    assert sorted(asyncio.run(claim_all())) == [False, False, False, True]
+    assert metrics.counter("jobs.skipped", job="retention") == before + 3
+
+
+def test_job_run_is_skipped_when_redis_is_down():
+    class DownRedis:
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("refused")
+
+    assert asyncio.run(claim_job_run(DownRedis(), "retention", 60)) is False
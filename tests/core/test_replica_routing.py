@@ -0,0 +1,133 @@
+import time
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, async_session_factory
+from app.core.metrics import metrics
+from app.core.replicas import Replica, ReplicaSet
+from app.domain.user import User
+from app.infra.async_repository import AsyncUserRepository
+
+
+def _replica(name: str, lag_seconds):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=NullPool)
+    return Replica(name, engine, lag_seconds=lag_seconds)
+
+
+class TestReplicaSet:
+    """복제본 선택 정책 테스트"""
+
+    def test_round_robin(self):
+        """지연이 허용 범위인 복제본을 번갈아 선택"""
+        replicas = ReplicaSet([_replica("r0", 0.0), _replica("r1", 0.1)], max_lag_seconds=1.0)
+
+        assert [replicas.choose().name for _ in range(4)] == ["r0", "r1", "r0", "r1"]
+
+    def test_skips_lagging_and_unmeasured(self):
+        """지연이 크거나 측정되지 않은 복제본은 제외"""
+        lagging = _replica("lagging", 5.0)
+        unknown = _replica("unknown", 0.0)
+        unknown.lag_seconds = None
+        replicas = ReplicaSet([lagging, unknown], max_lag_seconds=1.0)
+
+        assert replicas.choose() is None
+
+    def test_sticks_to_primary_after_write(self):
+        """쓰기 직후에는 복제 지연이 지날 때까지 복제본을 선택하지 않음"""
+        replicas = ReplicaSet([_replica("r0", 0.5)], max_lag_seconds=1.0)
+
+        assert replicas.choose(wrote_at=time.monotonic()) is None
+        assert replicas.choose(wrote_at=time.monotonic() - 1.0).name == "r0"
+
+    def test_empty_set_is_falsy(self):
+        """복제본이 없으면 라우팅하지 않음"""
+        assert not ReplicaSet([], max_lag_seconds=1.0)
+
+
+class TestRoutingSession:
+    """AsyncSession 읽기/쓰기 라우팅 테스트"""
+
+    @pytest.fixture
+    def replica_path(self, tmp_path):
+        """primary와 다른 데이터를 가진 복제본 DB (라우팅 대상 구분용)"""
+        path = tmp_path / "replica.db"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(insert(User), [
+                {"id": 1, "email": "r@example.com", "username": "from-replica", "hashed_password": "x"}
+            ])
+        engine.dispose()
+        return path
+
+    @pytest.fixture
+    def primary_user(self, db_session: Session):
+        user = User(id=1, email="p@example.com", username="from-primary", hashed_password="x")
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    def _factory(self, temp_db, replica_path, lag_seconds: float = 0.0):
+        primary = create_async_engine(f"sqlite+aiosqlite:///{temp_db}", poolclass=NullPool)
+        replica = Replica(
+            "replica-test",
+            create_async_engine(f"sqlite+aiosqlite:///{replica_path}", poolclass=NullPool),
+            lag_seconds=lag_seconds
+        )
+        return async_session_factory(primary, ReplicaSet([replica], max_lag_seconds=1.0))
+
+    @pytest.mark.asyncio
+    async def test_reads_go_to_replica(self, temp_db, replica_path, primary_user):
+        """읽기 전용 저장소 메서드는 복제본에서 조회"""
+        before = metrics.counter("db.routed", target="replica-test")
+        async with self._factory(temp_db, replica_path)() as db:
+            user = await AsyncUserRepository(db).get_by_id(1)
+
+        assert user.username == "from-replica"
+        assert metrics.counter("db.routed", target="replica-test") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_writes_go_to_primary(self, temp_db, replica_path, primary_user):
+        """쓰기 메서드는 조회와 flush 모두 primary 사용"""
+        async with self._factory(temp_db, replica_path)() as db:
+            user = await AsyncUserRepository(db).update(1, {"full_name": "Primary"})
+            await db.commit()
+
+        assert user.username == "from-primary"
+
+    @pytest.mark.asyncio
+    async def test_session_sticks_to_primary_after_write(self, temp_db, replica_path, primary_user):
+        """쓰기가 있었던 세션은 복제 지연 동안 읽기도 primary 사용"""
+        async with self._factory(temp_db, replica_path, lag_seconds=0.5)() as db:
+            repo = AsyncUserRepository(db)
+            await repo.create({"email": "new@example.com", "username": "new", "hashed_password": "x"})
+            found = await repo.get_by_username("new")
+
+        assert found is not None
+
+    @pytest.mark.asyncio
+    async def test_no_replicas_uses_primary(self, temp_db, AsyncTestingSessionLocal, primary_user):
+        """복제본이 없으면 읽기도 primary"""
+        async with AsyncTestingSessionLocal() as db:
+            user = await AsyncUserRepository(db).get_by_id(1)
+
+        assert user.username == "from-primary"
+
+
+def test_metrics_endpoint(client, db_session, created_user, auth_headers):
+    """/metrics는 관리자에게만 카운터/게이지/지연 시간 스냅샷 반환"""
+    metrics.observe("test.seconds", 0.25, target="x")
+    assert client.get("/metrics").status_code in (401, 403)
+    assert client.get("/metrics", headers=auth_headers).status_code == 403
+
+    created_user.role = "admin"
+    db_session.commit()
+    response = client.get("/metrics", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"counters", "gauges", "timings"}
+    assert data["timings"]["test.seconds{target=x}"]["count"] >= 1
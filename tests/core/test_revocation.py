@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.core.revocation import REVOCATION_STREAM, BloomFilter, RevocationFilter
+from app.infra.auth_repository import AuthRepository
+
+
+def _stream_id(entry_id: str):
+    return tuple(int(part) for part in entry_id.split("-"))
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append(lambda: self.redis.keys.__setitem__(key, value))
+
+    def xadd(self, name, fields, **kwargs):
+        self.ops.append(lambda: self.redis.xadd(fields))
+
+    async def execute(self):
+        for op in self.ops:
+            op()
+
+
+class FakeStreamRedis:
+    """폐기 필터/저장소가 쓰는 명령만 흉내 내는 Redis (EXISTS 호출 수를 셈)"""
+
+    def __init__(self):
+        self.keys = {}
+        self.stream = []
+        self.exists_calls = 0
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def xadd(self, fields):
+        self.stream.append((f"{len(self.stream) + 1}-0", dict(fields)))
+
+    async def exists(self, key):
+        self.exists_calls += 1
+        return int(key in self.keys)
+
+    async def xlen(self, name):
+        return len(self.stream)
+
+    async def xrange(self, name, min="-", count=None):
+        entries = self.stream
+        if min.startswith("("):
+            entries = [e for e in entries if _stream_id(e[0]) > _stream_id(min[1:])]
+        return entries[:count]
+
+    async def xread(self, streams, count=None, block=None):
+        last_id = streams[REVOCATION_STREAM]
+        entries = [e for e in self.stream if _stream_id(e[0]) > _stream_id(last_id)][:count]
+        return [[REVOCATION_STREAM, entries]] if entries else []
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    members = [f"token-{i}" for i in range(1000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300  # 기대값 약 100 (1%)
+
+
+def test_filter_skips_redis_for_tokens_not_revoked():
+    """필터가 준비되면 폐기되지 않은 토큰은 EXISTS 없이 통과, 폐기된 토큰만 Redis로 확인"""
+    async def scenario():
+        redis = FakeStreamRedis()
+        worker_a = AuthRepository(redis, RevocationFilter(capacity=100, error_rate=0.001))
+        worker_b = AuthRepository(redis, RevocationFilter(capacity=100, error_rate=0.001))
+
+        # 동기화 전에는 모든 확인이 Redis로 감
+        assert await worker_b.is_token_blacklisted("token-1") is False
+        assert redis.exists_calls == 1
+
+        await worker_b.revocations.rebuild(redis, batch_size=2)
+        expires_at = datetime.utcnow() + timedelta(minutes=5)
+        await worker_a.add_to_blacklist("token-1", expires_at)
+        assert worker_a.revocations.might_be_revoked("token-1")  # 자기 워커는 즉시 반영
+        assert redis.stream[0][1] == {"jti": "token-1"}
+
+        await worker_b.revocations.follow(redis, block_ms=0)
+        redis.exists_calls = 0
+        results = [await worker_b.is_token_blacklisted(f"token-{i}") for i in range(2, 50)]
+        assert not any(results) and redis.exists_calls <= 1  # 거짓 양성 정도만 Redis 확인
+        assert await worker_b.is_token_blacklisted("token-1") is True
+
+        # 새 워커는 스트림 전체로 필터를 만듦
+        for i in range(2, 6):
+            await worker_a.add_to_blacklist(f"token-{i}", expires_at)
+        worker_c = RevocationFilter(capacity=100, error_rate=0.001)
+        await worker_c.rebuild(redis, batch_size=2)
+        assert len(worker_c) == 5 and worker_c.last_id == "5-0"
+
+    asyncio.run(scenario())
@@ -1,27 +1,72 @@
+import asyncio
+import threading
+import time
 import pytest
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 from unittest.mock import Mock, AsyncMock, patch
 from jose import jwt
+from redis.exceptions import ConnectionError
 
 from app.core.security import (
     verify_password,
     get_password_hash,
     create_access_token,
     verify_token,
+    authenticate,
     get_current_user,
     get_current_active_user,
     create_refresh_token,
     verify_refresh_token,
     PermissionChecker,
+    PasswordHashPool,
+    run_password_hashes,
     require_admin,
     require_user
 )
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.principal import Principal, principal_cache, principal_redis_ttl_ms
 from app.domain.user import User
 
 
+def _redis_miss():
+    """캐시가 비어 있는 Redis 클라이언트 mock"""
+    redis_client = AsyncMock()
+    redis_client.get.return_value = None
+    return redis_client
+
+
+class PipelineRedis:
+    """파이프라인 명령만 받는 Redis (execute마다 왕복 한 번, 보낸 명령을 기록)"""
+
+    def __init__(self, session=None, revoked=False, principal=None, error=None):
+        self.values = {"hget": session, "exists": int(revoked), "get": principal}
+        self.error = error
+        self.round_trips = []
+
+    def pipeline(self, transaction=True):
+        redis, commands = self, []
+
+        class Pipeline:
+            def __getattr__(self, name):
+                return lambda *args: commands.append((name, *args))
+
+            async def execute(self):
+                if redis.error:
+                    raise redis.error
+                redis.round_trips.append(commands)
+                return [redis.values[command[0]] for command in commands]
+
+        return Pipeline()
+
+
+def _session_json(access_jti="access-1") -> str:
+    expires_at = int(time.time()) + 3600
+    return f'{{"a": "{access_jti}", "r": "refresh-1", "c": {expires_at - 3600}, "e": {expires_at}}}'
+
+
 class TestPasswordFunctions:
     """비밀번호 관련 함수 테스트"""
 
@@ -164,19 +209,51 @@ class TestUserAuthentication:
         mock_credentials.credentials = create_access_token({"sub": "1"})
 
         mock_db = Mock()
-        mock_user_repo = Mock()
-        mock_user = Mock(spec=User)
-        mock_user.id = 1
-        mock_user.is_active = True
+        mock_user_repo = AsyncMock()
+        principal = Principal(id=1, is_active=True, role="user")
+        mock_user_repo.load_principal.return_value = principal
+        redis_client = _redis_miss()
+
+        # AsyncUserRepository를 mock으로 패치
+        with patch('app.core.security.AsyncUserRepository', return_value=mock_user_repo):
+            user = await get_current_user(mock_credentials, mock_db, redis_client)
+            # 두 번째 요청은 로컬 캐시에서 찾으므로 DB/Redis를 조회하지 않음
+            assert await get_current_user(mock_credentials, mock_db, redis_client) == principal
+
+        assert user == principal
+        mock_user_repo.load_principal.assert_awaited_once_with(1)
+        redis_client.get.assert_awaited_once()
+        redis_client.set.assert_awaited_once_with(
+            "principal:1", principal.to_json(), px=principal_redis_ttl_ms(), nx=True
+        )
+
+    async def test_get_current_user_from_redis(self):
+        """로컬 캐시에 없으면 Redis 공유 캐시의 주체 사용"""
+        mock_credentials = Mock(spec=HTTPAuthorizationCredentials)
+        mock_credentials.credentials = create_access_token({"sub": "1"})
+        redis_client = AsyncMock()
+        redis_client.get.return_value = Principal(id=1, is_active=True, role="admin").to_json()
+        mock_user_repo = AsyncMock()
+
+        with patch('app.core.security.AsyncUserRepository', return_value=mock_user_repo):
+            user = await get_current_user(mock_credentials, Mock(), redis_client)
 
-        mock_user_repo.get_by_id.return_value = mock_user
+        assert user.role == "admin"
+        mock_user_repo.load_principal.assert_not_awaited()
 
-        # UserRepository를 mock으로 패치
-        with patch('app.core.security.UserRepository', return_value=mock_user_repo):
-            user = await get_current_user(mock_credentials, mock_db)
+    async def test_get_current_user_revoked_token_version(self):
+        """ver 클레임이 사용자의 token_version보다 작은 토큰은 거부"""
+        mock_credentials = Mock(spec=HTTPAuthorizationCredentials)
+        mock_credentials.credentials = create_access_token({"sub": "1", "ver": 1})
+        mock_user_repo = AsyncMock()
+        mock_user_repo.load_principal.return_value = Principal(id=1, is_active=True, role="user", token_version=2)
 
-        assert user == mock_user
-        mock_user_repo.get_by_id.assert_called_once_with(1)
+        with patch('app.core.security.AsyncUserRepository', return_value=mock_user_repo):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(mock_credentials, Mock(), _redis_miss())
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "Token has been revoked" in str(exc_info.value.detail)
 
     async def test_get_current_user_invalid_token(self):
         """무효한 토큰으로 현재 사용자 조회"""
@@ -207,12 +284,12 @@ class TestUserAuthentication:
         mock_credentials.credentials = create_access_token({"sub": "999"})
 
         mock_db = Mock()
-        mock_user_repo = Mock()
-        mock_user_repo.get_by_id.return_value = None  # 사용자 없음
+        mock_user_repo = AsyncMock()
+        mock_user_repo.load_principal.return_value = None  # 사용자 없음
 
-        with patch('app.core.security.UserRepository', return_value=mock_user_repo):
+        with patch('app.core.security.AsyncUserRepository', return_value=mock_user_repo):
             with pytest.raises(HTTPException) as exc_info:
-                await get_current_user(mock_credentials, mock_db)
+                await get_current_user(mock_credentials, mock_db, _redis_miss())
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert "User not found" in str(exc_info.value.detail)
@@ -223,16 +300,12 @@ class TestUserAuthentication:
         mock_credentials.credentials = create_access_token({"sub": "1"})
 
         mock_db = Mock()
-        mock_user_repo = Mock()
-        mock_user = Mock(spec=User)
-        mock_user.id = 1
-        mock_user.is_active = False  # 비활성 사용자
+        mock_user_repo = AsyncMock()
+        mock_user_repo.load_principal.return_value = Principal(id=1, is_active=False, role="user")  # 비활성 사용자
 
-        mock_user_repo.get_by_id.return_value = mock_user
-
-        with patch('app.core.security.UserRepository', return_value=mock_user_repo):
+        with patch('app.core.security.AsyncUserRepository', return_value=mock_user_repo):
             with pytest.raises(HTTPException) as exc_info:
-                await get_current_user(mock_credentials, mock_db)
+                await get_current_user(mock_credentials, mock_db, _redis_miss())
 
         assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
         assert "User account is disabled" in str(exc_info.value.detail)
@@ -291,4 +364,141 @@ class TestPermissionChecker:
     def test_require_user_instance(self):
         """require_user 인스턴스 테스트"""
         assert isinstance(require_user, PermissionChecker)
-        assert require_user.required_permission == "user"
\ No newline at end of file
+        assert require_user.required_permission == "user"
+
+
+@pytest.mark.asyncio
+class TestPasswordHashPool:
+    """비밀번호 해싱 풀 테스트"""
+
+    async def test_runs_off_event_loop(self):
+        """해싱은 풀 스레드에서 실행되고, 그동안 이벤트 루프는 다른 작업을 처리"""
+        pool = PasswordHashPool(max_workers=1, queue_timeout=1.0)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        try:
+            hashed = await pool.run(get_password_hash, "password")
+        finally:
+            task.cancel()
+            pool.shutdown()
+
+        assert verify_password("password", hashed)
+        assert ticks > 5
+
+    async def test_bulk_hashing_leaves_slots_for_logins(self, monkeypatch):
+        """명단 해싱은 풀 자리 일부만 쓰고 입력 순서를 유지"""
+        pool = PasswordHashPool(max_workers=4, queue_timeout=1.0)
+        monkeypatch.setattr("app.core.security.get_password_pool", lambda: pool)
+        peak = 0
+
+        def hash_all(passwords):
+            nonlocal peak
+            peak = max(peak, pool.running)
+            return [f"hashed-{password}" for password in passwords]
+
+        monkeypatch.setattr("app.core.security._hash_all", hash_all)
+        try:
+            hashed = await run_password_hashes([str(i) for i in range(7)])
+        finally:
+            pool.shutdown()
+
+        assert hashed == [f"hashed-{i}" for i in range(7)]
+        assert peak <= 2
+
+    async def test_rejects_when_queue_wait_exceeds_timeout(self):
+        """자리가 모두 차 있으면 queue_timeout 후 503으로 실패하고, 자리는 실행이 끝나야 반환"""
+        pool = PasswordHashPool(max_workers=1, queue_timeout=0.05)
+        release = threading.Event()
+        try:
+            running = asyncio.create_task(pool.run(release.wait, 5))
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(HTTPException) as exc_info:
+                await pool.run(verify_password, "password", "hash")
+            assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+            assert exc_info.value.headers == {"Retry-After": "1"}
+
+            running.cancel()  # 요청이 취소되어도 스레드가 끝나기 전에는 자리 유지
+            await asyncio.sleep(0.01)
+            assert pool.running == 1
+            release.set()
+            assert await pool.run(lambda: "done") == "done"
+            assert (pool.running, pool.waiting) == (0, 0)
+        finally:
+            release.set()
+            pool.shutdown()
+
+
+@pytest.mark.asyncio
+class TestSessionCheck:
+    """세션/폐기/주체 확인을 파이프라인 한 번으로 하는 인증 테스트"""
+
+    TOKEN_CLAIMS = {"sub": "1", "sid": "sid-1", "jti": "access-1"}
+
+    async def test_checks_session_revocation_and_principal_in_one_round_trip(self):
+        redis_client = PipelineRedis(
+            session=_session_json(), principal=Principal(id=1, is_active=True, role="admin").to_json()
+        )
+        before = metrics.timing("auth.latency.seconds", path="session")
+        before = before.count if before else 0
+
+        context = await authenticate(create_access_token(self.TOKEN_CLAIMS), Mock(), redis_client)
+
+        assert context.principal.role == "admin"
+        assert context.session.session_id == "sid-1"
+        assert redis_client.round_trips == [[
+            ("hget", "sessions:1", "sid-1"), ("exists", "revoked:access-1"), ("get", "principal:1")
+        ]]
+        assert metrics.timing("auth.latency.seconds", path="session").count == before + 1
+
+    async def test_locally_cached_principal_is_not_fetched(self):
+        principal_cache.put(Principal(id=1, is_active=True, role="user"))
+        redis_client = PipelineRedis(session=_session_json())
+
+        await authenticate(create_access_token(self.TOKEN_CLAIMS), Mock(), redis_client)
+
+        assert [command[0] for command in redis_client.round_trips[0]] == ["hget", "exists"]
+
+    async def test_rejects_revoked_token(self):
+        redis_client = PipelineRedis(session=_session_json(), revoked=True)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate(create_access_token(self.TOKEN_CLAIMS), Mock(), redis_client)
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.detail == "Token has been revoked"
+
+    @pytest.mark.parametrize("session", [None, _session_json(access_jti="access-2")])
+    async def test_rejects_missing_or_rotated_session(self, session):
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate(create_access_token(self.TOKEN_CLAIMS), Mock(), PipelineRedis(session=session))
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.detail == "Session not found or expired"
+
+    async def test_fails_closed_when_redis_is_down(self):
+        """세션을 확인할 수 없으면 로그아웃한 토큰을 통과시키지 않고 503"""
+        redis_client = PipelineRedis(error=ConnectionError("refused"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate(create_access_token(self.TOKEN_CLAIMS), Mock(), redis_client)
+
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+    async def test_session_check_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "auth_session_check", False)
+        redis_client = _redis_miss()
+        redis_client.get.return_value = Principal(id=1, is_active=True, role="user").to_json()
+
+        context = await authenticate(create_access_token(self.TOKEN_CLAIMS), Mock(), redis_client)
+
+        assert context.session is None
+        redis_client.get.assert_awaited_once_with("principal:1")
@@ -1,8 +1,10 @@
 import pytest
+from unittest.mock import patch
+from sqlalchemy import literal, select
 from sqlalchemy.orm import Session
 from app.infra.album_repository import AlbumRepository
 from app.domain.user import User
-from app.domain.group import Group
+from app.domain.group import Group, GroupMembership
 from app.domain.photo import Photo
 
 
@@ -679,4 +681,193 @@ class TestAlbumRepository:
 
         assert len(albums_page1) == 2
         assert len(albums_page2) == 2
-        assert albums_page1[0] != albums_page2[0]
\ No newline at end of file
+        assert albums_page1[0] != albums_page2[0]
+
+class TestAlbumBulkPhotos:
+    """앨범 사진 일괄 추가/제거 테스트"""
+
+    @pytest.fixture
+    def owner(self, db_session: Session):
+        user = User(email="bulk@example.com", username="bulk", hashed_password="x")
+        db_session.add(user)
+        db_session.flush()
+        return user
+
+    @pytest.fixture
+    def album(self, db_session: Session, owner):
+        return AlbumRepository(db_session).create(
+            {"name": "Trip", "album_type": "personal", "created_by_id": owner.id}
+        )
+
+    def _photos(self, db_session: Session, user_id: int, count: int, **kwargs):
+        photos = [
+            Photo(
+                filename=f"b{i}.jpg",
+                original_filename=f"b{i}.jpg",
+                file_path=f"/b/{i}",
+                file_size=1,
+                s3_bucket="bucket",
+                s3_key=f"b/{i}",
+                s3_url=f"https://bucket/b/{i}",
+                uploaded_by_id=user_id,
+                **kwargs
+            )
+            for i in range(count)
+        ]
+        db_session.add_all(photos)
+        db_session.flush()
+        return [photo.id for photo in photos]
+
+    def test_add_many_in_one_statement(self, db_session: Session, album, owner, query_counter):
+        """여러 사진을 INSERT 한 문장으로 추가하고 photo_count는 UPDATE 한 번으로 갱신"""
+        ids = self._photos(db_session, owner.id, 50)
+        query_counter.reset()
+
+        added = AlbumRepository(db_session).add_photos_to_album(album.id, ids + ids[:5])
+
+        assert added == 50
+        assert [s.split()[0] for s in query_counter.statements] == ["INSERT", "UPDATE"]
+        assert album.photo_count == 50
+        assert AlbumRepository(db_session).get_album_photo_count(album.id) == 50
+
+    def test_skips_existing_missing_and_inactive(self, db_session: Session, album, owner):
+        """이미 있는 사진, 없는 사진, 삭제된 사진은 건너뜀"""
+        repo = AlbumRepository(db_session)
+        ids = self._photos(db_session, owner.id, 3)
+        inactive = self._photos(db_session, owner.id, 1, is_active=False)
+        repo.add_photos_to_album(album.id, ids[:1])
+
+        added = repo.add_photos_to_album(album.id, ids + inactive + [999999])
+
+        assert added == 2
+
+    def test_portable_fallback_skips_existing(self, db_session: Session, album, owner, monkeypatch):
+        """ON CONFLICT가 없는 DB에서는 WHERE NOT EXISTS로 이미 있는 사진을 건너뜀"""
+        repo = AlbumRepository(db_session)
+        ids = self._photos(db_session, owner.id, 3)
+        repo.add_photos_to_album(album.id, ids[:1])
+        monkeypatch.setattr(db_session.get_bind().dialect, "name", "mysql")
+
+        stmt = repo._insert_ignoring_conflicts(album.id, select(literal(album.id), Photo.id).where(Photo.id.in_(ids)))
+        assert "ON CONFLICT" not in str(stmt) and "NOT (EXISTS" in str(stmt)
+        added = repo.add_photos_to_album(album.id, ids)
+
+        assert added == 2
+        assert repo.get_album_photo_count(album.id) == 3
+
+    def test_visibility_filter(self, db_session: Session, album, owner):
+        """visible_to_user_id가 있으면 본인 사진과 속한 그룹 사진만 추가"""
+        other = User(email="other@example.com", username="other", hashed_password="x")
+        db_session.add(other)
+        db_session.flush()
+        group = Group(name="G", group_type="class", invite_code="BULK0001", created_by_id=other.id)
+        db_session.add(group)
+        db_session.flush()
+        db_session.add(GroupMembership(group_id=group.id, user_id=owner.id, role="member"))
+        own = self._photos(db_session, owner.id, 1)
+        shared = self._photos(db_session, other.id, 1, group_id=group.id)
+        private = self._photos(db_session, other.id, 1)
+
+        added = AlbumRepository(db_session).add_photos_to_album(
+            album.id, own + shared + private, visible_to_user_id=owner.id
+        )
+
+        assert added == 2
+        assert not AlbumRepository(db_session).is_photo_in_album(album.id, private[0])
+
+    def test_chunks_large_requests(self, db_session: Session, album, owner, query_counter):
+        """ID가 많으면 청크 단위로 나눠 실행"""
+        ids = self._photos(db_session, owner.id, 7)
+        query_counter.reset()
+
+        with patch("app.infra.album_repository.BULK_CHUNK_SIZE", 3):
+            added = AlbumRepository(db_session).add_photos_to_album(album.id, ids)
+
+        assert added == 7
+        assert query_counter.count == 4
+
+    def test_remove_many(self, db_session: Session, album, owner, query_counter):
+        """여러 사진을 DELETE 한 문장으로 제거 (삭제 전에 photo_count 감소)"""
+        repo = AlbumRepository(db_session)
+        ids = self._photos(db_session, owner.id, 5)
+        repo.add_photos_to_album(album.id, ids)
+        query_counter.reset()
+
+        removed = repo.remove_photos_from_album(album.id, ids[:3] + [999999])
+
+        assert removed == 3
+        assert [s.split()[0] for s in query_counter.statements] == ["UPDATE", "DELETE"]
+        assert repo.get_album_photo_count(album.id) == 2
+
+
+class TestUserAlbums:
+    """내 앨범 (만든/공유받은/그룹 앨범) 단일 쿼리 조회 테스트"""
+
+    @pytest.fixture
+    def users(self, db_session: Session):
+        users = [User(email=f"mine{i}@example.com", username=f"mine{i}", hashed_password="x") for i in range(2)]
+        db_session.add_all(users)
+        db_session.flush()
+        return users
+
+    def _album(self, repo: AlbumRepository, name: str, owner_id: int, **kwargs):
+        return repo.create({"name": name, "album_type": "personal", "created_by_id": owner_id, **kwargs})
+
+    def test_combines_sources_with_effective_permission(
+        self, db_session: Session, users, query_counter
+    ):
+        """출처별 앨범을 중복 없이 모으고 가장 높은 권한을 유효 권한으로 반환"""
+        from app.domain.album import AlbumShare
+
+        me, other = users
+        repo = AlbumRepository(db_session)
+        group = Group(name="G", group_type="class", invite_code="MINE0001", created_by_id=other.id)
+        db_session.add(group)
+        db_session.flush()
+        db_session.add(GroupMembership(group_id=group.id, user_id=me.id, role="member"))
+
+        owned = self._album(repo, "owned", me.id)
+        shared = self._album(repo, "shared", other.id)
+        group_album = self._album(repo, "group", other.id, group_id=group.id)
+        both = self._album(repo, "both", other.id, group_id=group.id)
+        revoked = self._album(repo, "revoked", other.id)
+        deleted = self._album(repo, "deleted", me.id, is_active=False)
+        self._album(repo, "unrelated", other.id)
+        db_session.add_all([
+            AlbumShare(album_id=shared.id, shared_with_id=me.id, permission="view"),
+            AlbumShare(album_id=both.id, shared_with_id=me.id, permission="edit"),
+            AlbumShare(album_id=revoked.id, shared_with_id=me.id, is_active=False),
+            AlbumShare(album_id=owned.id, shared_with_id=me.id, permission="admin"),
+        ])
+        db_session.flush()
+        query_counter.reset()
+
+        rows = repo.get_user_albums(me.id)
+
+        assert query_counter.count == 1
+        assert {album.id: permission for album, permission in rows} == {
+            owned.id: "owner",
+            shared.id: "view",
+            group_album.id: "view",
+            both.id: "edit",
+        }
+        assert deleted.id not in {album.id for album, _ in rows}
+
+    def test_keyset_pagination(self, db_session: Session, users):
+        """최근 수정순으로 커서를 따라 끝까지 순회"""
+        from app.infra.pagination import next_cursor
+
+        repo = AlbumRepository(db_session)
+        for i in range(5):
+            self._album(repo, f"A{i}", users[0].id)
+        db_session.flush()
+
+        seen, cursor = [], None
+        while True:
+            rows = repo.get_user_albums(users[0].id, limit=2, cursor=cursor)
+            seen.extend(album.id for album, _ in rows)
+            cursor = next_cursor(rows, 2, key=lambda row: (row[0].updated_at, row[0].id))
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 5
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.core.database import to_async_url
+from app.domain.user import User
+from app.domain.group import Group, GroupMembership
+from app.domain.album import AlbumShare
+from app.infra.album_repository import AlbumRepository
+from app.infra.async_repository import (
+    AsyncAlbumRepository,
+    AsyncGroupRepository,
+    AsyncUserRepository,
+)
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("sqlite:///./dandle_dev.db", "sqlite+aiosqlite:///./dandle_dev.db"),
+    ("postgresql://u:p@db:5432/dandle", "postgresql+asyncpg://u:p@db:5432/dandle"),
+    ("postgresql+psycopg2://u:p@db/dandle", "postgresql+asyncpg://u:p@db/dandle"),
+    ("postgresql+asyncpg://u:p@db/dandle", "postgresql+asyncpg://u:p@db/dandle"),
+])
+def test_to_async_url(url, expected):
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환"""
+    assert to_async_url(url) == expected
+
+
+class TestAsyncRepository:
+    """AsyncSession 기반 저장소 테스트"""
+
+    @pytest.fixture
+    def seeded(self, db_session: Session):
+        """커밋된 사용자/그룹/앨범 공유"""
+        user = User(email="async@example.com", username="async", hashed_password="x")
+        db_session.add(user)
+        db_session.flush()
+        group = Group(name="G", group_type="class", invite_code="ASYNC001", created_by_id=user.id)
+        db_session.add(group)
+        db_session.flush()
+        db_session.add(GroupMembership(group_id=group.id, user_id=user.id, role="admin"))
+        album = AlbumRepository(db_session).create(
+            {"name": "A", "album_type": "personal", "created_by_id": user.id}
+        )
+        db_session.add(AlbumShare(album_id=album.id, shared_with_id=user.id))
+        db_session.commit()
+        return {"user_id": user.id, "group_id": group.id, "album_id": album.id}
+
+    @pytest.mark.asyncio
+    async def test_queries_run_on_async_session(self, AsyncTestingSessionLocal, seeded):
+        """동기 저장소와 같은 쿼리를 await로 실행"""
+        async with AsyncTestingSessionLocal() as db:
+            repo = AsyncUserRepository(db)
+            user = await repo.get_by_id(seeded["user_id"])
+            same = await repo.get_by_email("async@example.com")
+
+        assert user is same
+        assert user.username == "async"
+
+    @pytest.mark.asyncio
+    async def test_writes_flush_and_commit(self, AsyncTestingSessionLocal, seeded):
+        """쓰기는 flush만 하고 커밋 후 속성 접근은 추가 조회 없음"""
+        async with AsyncTestingSessionLocal() as db:
+            user = await AsyncUserRepository(db).update(seeded["user_id"], {"full_name": "Async"})
+            await db.commit()
+
+        assert user.full_name == "Async"
+
+    @pytest.mark.asyncio
+    async def test_lazy_loads_are_disabled(self, AsyncTestingSessionLocal, seeded):
+        """명시적으로 로딩하지 않은 관계 접근은 예외"""
+        async with AsyncTestingSessionLocal() as db:
+            membership = await AsyncGroupRepository(db).get_membership(
+                seeded["group_id"], seeded["user_id"]
+            )
+            with pytest.raises(InvalidRequestError):
+                await db.run_sync(lambda session: membership.group)
+
+    @pytest.mark.asyncio
+    async def test_explicit_loads_are_kept(self, AsyncTestingSessionLocal, seeded):
+        """joinedload로 지정한 관계는 그대로 로딩"""
+        async with AsyncTestingSessionLocal() as db:
+            shares = await AsyncAlbumRepository(db).get_shared_albums(seeded["user_id"])
+
+        assert [share.album.name for share in shares] == ["A"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions(self, AsyncTestingSessionLocal, seeded):
+        """세션별 조회를 한 이벤트 루프에서 동시에 실행"""
+        async def load(user_id: int):
+            async with AsyncTestingSessionLocal() as db:
+                return await AsyncUserRepository(db).get_by_id(user_id)
+
+        users = await asyncio.gather(*(load(seeded["user_id"]) for _ in range(5)))
+
+        assert {user.id for user in users} == {seeded["user_id"]}
+
+    def test_unknown_method(self, AsyncTestingSessionLocal):
+        """저장소에 없는 메서드는 AttributeError"""
+        with pytest.raises(AttributeError):
+            AsyncUserRepository(AsyncTestingSessionLocal()).missing
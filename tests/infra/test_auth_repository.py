@@ -0,0 +1,180 @@
+import asyncio
+import time
+from datetime import timezone
+
+from app.core.config import settings
+from app.core.redis import load_scripts
+from app.core.revocation import REVOCATION_STREAM, RevocationFilter
+from app.infra.auth_repository import ROTATE_SESSION, SESSION_EXPIRY_KEY, AuthRepository
+
+
+class HashPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for name, args, kwargs in self.ops:
+            await getattr(self.redis, name)(*args, _pipelined=True, **kwargs)
+
+
+class HashRedis:
+    """세션 해시/만료 색인에 쓰는 명령만 흉내 내는 Redis (왕복 수를 셈)"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zset = {}
+        self.round_trips = 0
+
+    def _call(self, pipelined):
+        if not pipelined:
+            self.round_trips += 1
+
+    def pipeline(self):
+        return HashPipeline(self)
+
+    async def hset(self, key, field, value, _pipelined=False):
+        self._call(_pipelined)
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hdel(self, key, *fields, _pipelined=False):
+        self._call(_pipelined)
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    async def hgetall(self, key, _pipelined=False):
+        self._call(_pipelined)
+        return dict(self.hashes.get(key, {}))
+
+    async def expire(self, key, ttl, _pipelined=False):
+        self._call(_pipelined)
+
+    async def zadd(self, key, mapping, _pipelined=False):
+        self._call(_pipelined)
+        self.zset.update(mapping)
+
+    async def zrem(self, key, *members, _pipelined=False):
+        self._call(_pipelined)
+        for member in members:
+            self.zset.pop(member, None)
+
+    async def zrangebyscore(self, key, min, max, start=None, num=None, _pipelined=False):
+        self._call(_pipelined)
+        members = sorted((score, member) for member, score in self.zset.items() if score <= max)
+        return [member for _, member in members][start:start + num]
+
+
+def _repository(redis) -> AuthRepository:
+    return AuthRepository(redis, RevocationFilter(capacity=100, error_rate=0.001))
+
+
+class TestUpdateSession:
+    """토큰 갱신 시 세션 회전 테스트"""
+
+    def test_rotation_touches_only_declared_keys(self, script_redis):
+        """스크립트는 KEYS로 넘긴 키만 쓰고, 이전 액세스 토큰 폐기는 이어지는 파이프라인 하나로 기록"""
+        async def scenario():
+            expires_at = int(time.time()) + 600
+            redis = script_redis(result=["old-access-jti", expires_at], loaded=False)
+            await load_scripts(redis, ROTATE_SESSION)
+            redis.calls.clear()
+            repository = _repository(redis)
+
+            session_id = await repository.update_session(1, "sid-1", "refresh-1", "access-2", "refresh-2")
+
+            assert session_id == "sid-1"
+            (_, _, keys, _), (_, commands) = redis.calls
+            assert keys == ("sessions:1", SESSION_EXPIRY_KEY)
+            (_, (key, ttl, reason)), (stream, _) = commands
+            assert (key, reason, stream) == ("revoked:old-access-jti", "refresh", "xadd")
+            assert 590 <= ttl <= 600  # 이전 액세스 토큰이 만료될 때까지만
+            assert repository.revocations.might_be_revoked("old-access-jti")
+
+        asyncio.run(scenario())
+
+    def test_reloads_script_after_cache_flush(self, script_redis):
+        async def scenario():
+            redis = script_redis(result=None, loaded=False)  # 리프레시 jti가 맞지 않음
+            session_id = await _repository(redis).update_session(1, "sid-1", "stale", "access-2", "refresh-2")
+
+            assert session_id is None
+            assert [call[0] for call in redis.calls] == ["EVALSHA", "SCRIPT LOAD", "EVALSHA"]
+
+        asyncio.run(scenario())
+
+
+class TestSessionExpiry:
+    """세션 만료 색인 테스트"""
+
+    async def _store(self, repository, monkeypatch, expired: dict, active: dict):
+        """expired/active: {user_id: 세션 수}"""
+        for minutes, counts in ((-1, expired), (settings.jwt_expire_minutes, active)):
+            monkeypatch.setattr(settings, "jwt_expire_minutes", minutes)
+            for user_id, count in counts.items():
+                for i in range(count):
+                    await repository.store_session(user_id, f"sid-{minutes}-{i}", "a", "r")
+
+    def test_cleanup_removes_expired_sessions_in_batches(self, monkeypatch):
+        async def scenario():
+            redis = HashRedis()
+            repository = _repository(redis)
+            await self._store(repository, monkeypatch, expired={1: 3, 2: 2}, active={1: 1, 3: 1})
+            redis.round_trips = 0
+
+            assert await repository.cleanup_expired_sessions(batch_size=2) == 5
+
+            assert redis.round_trips == 6  # 배치마다 범위 조회 + 삭제 파이프라인 (키 공간 SCAN 없음)
+            assert sorted(redis.zset) == ["1:sid-30-0", "3:sid-30-0"]
+            assert {key: list(fields) for key, fields in redis.hashes.items()} == {
+                "sessions:1": ["sid-30-0"], "sessions:2": [], "sessions:3": ["sid-30-0"]
+            }
+
+        monkeypatch.setattr(settings, "jwt_expire_minutes", 30)
+        asyncio.run(scenario())
+
+    def test_get_user_sessions_prunes_expired_lazily(self, monkeypatch):
+        async def scenario():
+            redis = HashRedis()
+            repository = _repository(redis)
+            await self._store(repository, monkeypatch, expired={1: 2}, active={1: 2})
+            redis.round_trips = 0
+
+            sessions = await repository.get_user_sessions(1)
+
+            assert sorted(session.session_id for session in sessions) == ["sid-30-0", "sid-30-1"]
+            assert redis.round_trips == 2  # HGETALL 한 번 + 정리 파이프라인
+            assert sorted(redis.hashes["sessions:1"]) == ["sid-30-0", "sid-30-1"]
+            assert sorted(redis.zset) == ["1:sid-30-0", "1:sid-30-1"]
+
+        monkeypatch.setattr(settings, "jwt_expire_minutes", 30)
+        asyncio.run(scenario())
+
+
+def test_only_one_concurrent_refresh_wins(real_redis):
+    """같은 리프레시 토큰으로 동시에 갱신하면 하나만 성공하고, 이전 액세스 토큰은 폐기됨"""
+    async def scenario():
+        async with real_redis() as redis_client:
+            repository = _repository(redis_client)
+            await repository.store_session(1, "sid-1", "access-1", "refresh-1", user_agent="Mozilla/5.0 (X11)")
+
+            results = await asyncio.gather(*(
+                repository.update_session(1, "sid-1", "refresh-1", f"access-{i}", f"refresh-{i}")
+                for i in range(2, 22)
+            ))
+
+            assert results.count("sid-1") == 1 and results.count(None) == 19
+            winner = results.index("sid-1") + 2
+            session = await repository.get_session(1, "sid-1")
+            assert (session.access_jti, session.refresh_jti) == (f"access-{winner}", f"refresh-{winner}")
+            assert session.user_agent == "Mozilla/5.0 (X11)"
+            assert await redis_client.zscore(SESSION_EXPIRY_KEY, "1:sid-1") == int(
+                session.expires_at.replace(tzinfo=timezone.utc).timestamp()
+            )
+            assert await repository.is_token_blacklisted("access-1")
+            assert [fields for _, fields in await redis_client.xrange(REVOCATION_STREAM)] == [{"jti": "access-1"}]
+
+    asyncio.run(scenario())
@@ -0,0 +1,179 @@
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.metrics import metrics
+from app.domain.album import Album
+from app.domain.group import Group
+from app.domain.photo import Photo
+from app.domain.user import User
+from app.infra.album_repository import AlbumRepository
+from app.infra.counters import adjust_counter
+from app.infra.face_repository import FaceRepository
+from app.infra.group_repository import GroupRepository
+from app.infra.photo_repository import PhotoRepository
+from app.services.counter_service import CounterService
+from app.services.group_service import GroupService
+
+
+@pytest.fixture
+def owner(db_session: Session):
+    user = User(email="counter@example.com", username="counter", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+@pytest.fixture
+def photo(db_session: Session, owner):
+    return _photo(db_session, owner.id, "p0")
+
+
+def _photo(db_session: Session, user_id: int, name: str) -> Photo:
+    photo = Photo(
+        filename=f"{name}.jpg",
+        original_filename=f"{name}.jpg",
+        file_path=f"/c/{name}",
+        file_size=1,
+        s3_bucket="bucket",
+        s3_key=f"c/{name}",
+        s3_url=f"https://bucket/c/{name}",
+        uploaded_by_id=user_id
+    )
+    db_session.add(photo)
+    db_session.flush()
+    return photo
+
+
+def _face(repo: FaceRepository, photo_id: int, face_id: str, **kwargs):
+    return repo.create_face({
+        "face_id": face_id,
+        "confidence": 0.9,
+        "bounding_box": {"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2},
+        "photo_id": photo_id,
+        **kwargs
+    })
+
+
+class TestAdjustCounter:
+    """원자적 카운터 증감 테스트"""
+
+    def test_updates_loaded_objects_without_touching_updated_at(self, db_session: Session, photo):
+        """세션의 객체에도 새 값을 반영하고 updated_at은 유지"""
+        db_session.commit()
+        updated_at = photo.updated_at
+
+        result = adjust_counter(db_session, Photo, "face_count", [photo.id], 2)
+
+        assert result == {photo.id: 2}
+        assert photo.face_count == 2
+        db_session.expire(photo)
+        assert photo.updated_at == updated_at
+
+    def test_guard_skips_rows(self, db_session: Session, photo):
+        """guard를 만족하지 않으면 갱신하지 않음"""
+        result = adjust_counter(db_session, Photo, "face_count", [photo.id], 1, guard=Photo.face_count > 0)
+
+        assert result == {}
+        assert photo.face_count == 0
+
+
+class TestMaintainedCounters:
+    """쓰기와 같은 트랜잭션에서 유지되는 카운터 테스트"""
+
+    def test_face_counts(self, db_session: Session, owner, photo):
+        """얼굴 생성/식별/재식별/삭제에 따라 사진과 사용자 카운터 갱신"""
+        other = User(email="other@example.com", username="other", hashed_password="x")
+        db_session.add(other)
+        db_session.flush()
+        repo = FaceRepository(db_session)
+
+        face = _face(repo, photo.id, "f1")
+        _face(repo, photo.id, "f2", identified_user_id=owner.id)
+        assert (photo.face_count, owner.face_count) == (2, 1)
+
+        repo.update_face(face.id, {"identified_user_id": owner.id})
+        assert (photo.face_count, owner.face_count) == (2, 2)
+
+        repo.update_face(face.id, {"identified_user_id": other.id})
+        assert (owner.face_count, other.face_count) == (1, 1)
+
+        repo.delete_face(face.id)
+        assert (photo.face_count, other.face_count) == (1, 0)
+        assert repo.get_face_count_by_photo(photo.id) == 1
+        assert repo.get_face_count_by_user(owner.id) == 1
+
+    def test_member_count_and_limit(self, db_session: Session, owner):
+        """멤버 가입/탈퇴에 따라 member_count 갱신, 정원이 차면 가입 거부"""
+        service = GroupService(db_session)
+        group = service.create_group("Group", owner.id, "class", max_members=2)
+        users = [User(email=f"m{i}@example.com", username=f"m{i}", hashed_password="x") for i in range(2)]
+        db_session.add_all(users)
+        db_session.flush()
+
+        assert service.add_member(group.id, users[0].id) is True
+        assert service.add_member(group.id, users[1].id) is False
+        assert group.member_count == 2
+
+        assert service.remove_member(group.id, users[0].id) is True
+        assert group.member_count == 1
+        assert service.add_member(group.id, users[1].id) is True
+        assert GroupRepository(db_session).get_active_member_count(group.id) == 2
+
+    def test_photo_delete_updates_albums(self, db_session: Session, owner, photo):
+        """사진을 삭제하면 그 사진이 있는 앨범의 photo_count 감소"""
+        repo = AlbumRepository(db_session)
+        albums = [
+            repo.create({"name": f"A{i}", "album_type": "personal", "created_by_id": owner.id})
+            for i in range(2)
+        ]
+        for album in albums:
+            repo.add_photo_to_album(album.id, photo.id)
+        assert [album.photo_count for album in albums] == [1, 1]
+
+        PhotoRepository(db_session).delete(photo.id)
+
+        assert [album.photo_count for album in albums] == [0, 0]
+
+    def test_single_remove_ignores_missing(self, db_session: Session, owner, photo):
+        """앨범에 없는 사진을 제거해도 photo_count는 그대로"""
+        repo = AlbumRepository(db_session)
+        album = repo.create({"name": "A", "album_type": "personal", "created_by_id": owner.id})
+        repo.add_photo_to_album(album.id, photo.id)
+
+        assert repo.remove_photo_from_album(album.id, 999999) is False
+        assert repo.remove_photo_from_album(album.id, photo.id) is True
+        assert album.photo_count == 0
+
+
+class TestCounterService:
+    """카운터 정합성 복구 테스트"""
+
+    def test_reconcile_repairs_drift(self, db_session: Session, owner, photo):
+        """저장소를 거치지 않고 어긋난 카운터만 실제 값으로 복구"""
+        album = AlbumRepository(db_session).create(
+            {"name": "A", "album_type": "personal", "created_by_id": owner.id}
+        )
+        AlbumRepository(db_session).add_photo_to_album(album.id, photo.id)
+        _face(FaceRepository(db_session), photo.id, "f1", identified_user_id=owner.id)
+        group = GroupService(db_session).create_group("Group", owner.id, "class")
+        db_session.commit()
+
+        db_session.execute(update(Album).values(photo_count=7))
+        db_session.execute(update(Group).values(member_count=0))
+        db_session.execute(update(User).values(face_count=3))
+        db_session.commit()
+        before = metrics.counter("counters.repaired", counter="albums.photo_count")
+
+        repaired = CounterService(db_session).reconcile(batch_size=1)
+
+        assert repaired == {
+            "albums.photo_count": 1,
+            "groups.member_count": 1,
+            "photos.face_count": 0,
+            "users.face_count": 1,
+        }
+        db_session.expire_all()
+        assert (album.photo_count, group.member_count, owner.face_count) == (1, 1, 1)
+        assert metrics.counter("counters.repaired", counter="albums.photo_count") == before + 1
+        assert CounterService(db_session).reconcile() == dict.fromkeys(repaired, 0)
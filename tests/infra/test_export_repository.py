@@ -0,0 +1,140 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.domain.face import Face
+from app.domain.group import Group
+from app.domain.photo import Photo
+from app.domain.user import User
+from app.infra.album_repository import AlbumRepository
+from app.infra.export_repository import ExportRepository
+from app.infra.photo_repository import PhotoRepository
+from app.services.export_service import ExportService
+
+
+@pytest.fixture
+def seeded(db_session: Session):
+    """사용자 사진 5장(각 얼굴 1개, 2023년 1~5월 촬영) + 그룹 사진 1장 + 앨범 1개 (커밋됨)"""
+    user = User(email="export@example.com", username="export", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    group = Group(name="G", group_type="class", invite_code="EXPORT01", created_by_id=user.id)
+    db_session.add(group)
+    db_session.flush()
+
+    photos = [
+        Photo(
+            filename=f"e{i}.jpg",
+            original_filename=f"e{i}.jpg",
+            file_path=f"/e/{i}",
+            file_size=1,
+            s3_bucket="bucket",
+            s3_key=f"e/{i}",
+            s3_url=f"https://bucket/e/{i}",
+            uploaded_by_id=user.id,
+            group_id=group.id if i == 5 else None,
+            taken_at=datetime(2023, i + 1, 1, tzinfo=timezone.utc)
+        )
+        for i in range(6)
+    ]
+    db_session.add_all(photos)
+    db_session.flush()
+    db_session.add_all(
+        Face(
+            face_id=f"export-{photo.id}",
+            confidence=0.9,
+            bounding_box={"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2},
+            photo_id=photo.id
+        )
+        for photo in photos[:5]
+    )
+    AlbumRepository(db_session).create({"name": "A", "album_type": "personal", "created_by_id": user.id})
+    db_session.commit()
+    return {"user_id": user.id, "group_id": group.id, "photo_ids": [photo.id for photo in photos]}
+
+
+async def _collect(AsyncTestingSessionLocal, *args, **kwargs) -> str:
+    async with AsyncTestingSessionLocal() as db:
+        return "".join([chunk async for chunk in ExportService(db).export(*args, **kwargs)])
+
+
+class TestExportRepository:
+    """서버 측 커서 스트리밍 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_in_batches_with_one_query(self, AsyncTestingSessionLocal, async_engine, seeded):
+        """yield_per 크기만큼씩 나눠 받지만 쿼리는 한 번만 실행"""
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            async with AsyncTestingSessionLocal() as db:
+                batches = [
+                    [row.id for row in batch]
+                    async for batch in ExportRepository(db).stream("photos", batch_size=2, user_id=seeded["user_id"])
+                ]
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+
+        assert batches == [seeded["photo_ids"][0:2], seeded["photo_ids"][2:4], seeded["photo_ids"][4:6]]
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_group_scope_and_date_range(self, AsyncTestingSessionLocal, seeded):
+        """그룹 범위와 촬영 시각 범위 필터"""
+        group_photos = await _collect(AsyncTestingSessionLocal, "photos", group_id=seeded["group_id"])
+        faces = await _collect(
+            AsyncTestingSessionLocal, "faces", user_id=seeded["user_id"],
+            taken_from=datetime(2023, 2, 1, tzinfo=timezone.utc),
+            taken_to=datetime(2023, 3, 1, tzinfo=timezone.utc)
+        )
+
+        assert [json.loads(line)["id"] for line in group_photos.splitlines()] == [seeded["photo_ids"][5]]
+        assert [json.loads(line)["photo_id"] for line in faces.splitlines()] == seeded["photo_ids"][1:3]
+
+
+class TestExportService:
+    """NDJSON/CSV 인코딩 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, AsyncTestingSessionLocal, seeded):
+        """한 줄에 한 객체, JSON 컬럼은 객체 그대로"""
+        body = await _collect(AsyncTestingSessionLocal, "faces", "ndjson", user_id=seeded["user_id"])
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert len(rows) == 5
+        assert rows[0]["bounding_box"] == {"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2}
+        assert set(rows[0]) == set(ExportService.columns("faces"))
+
+    @pytest.mark.asyncio
+    async def test_csv(self, AsyncTestingSessionLocal, seeded):
+        """헤더 + 행, 날짜는 ISO 8601"""
+        body = await _collect(AsyncTestingSessionLocal, "albums", "csv", batch_size=1, user_id=seeded["user_id"])
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert [row["name"] for row in rows] == ["A"]
+        assert rows[0]["photo_count"] == "0"
+        datetime.fromisoformat(rows[0]["created_at"])
+
+    @pytest.mark.asyncio
+    async def test_csv_header_without_rows(self, AsyncTestingSessionLocal, seeded):
+        """결과가 없어도 헤더는 내보냄"""
+        body = await _collect(AsyncTestingSessionLocal, "photos", "csv", group_id=999)
+
+        assert body == ",".join(ExportService.columns("photos")) + "\n"
+
+
+def test_iter_photos_by_date_range(db_session: Session, seeded):
+    """동기 순회는 리스트 조회와 같은 결과를 배치 단위로 전달"""
+    repo = PhotoRepository(db_session)
+    start, end = datetime(2023, 1, 1, tzinfo=timezone.utc), datetime(2023, 12, 31, tzinfo=timezone.utc)
+
+    streamed = [photo.id for photo in repo.iter_photos_by_date_range(start, end, batch_size=2)]
+
+    assert streamed == [photo.id for photo in repo.get_photos_by_date_range(start, end)]
+    assert len(streamed) == 6
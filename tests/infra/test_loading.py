@@ -0,0 +1,117 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.domain.face import Face
+from app.domain.group import Group, GroupMembership
+from app.domain.photo import Photo, PhotoTag
+from app.domain.user import User
+from app.infra.album_repository import AlbumRepository
+from app.infra.group_repository import GroupRepository
+from app.infra.loading import (
+    ALBUM_WITH_COVER,
+    MEMBERSHIP_WITH_USER,
+    PHOTO_CARD,
+    PHOTO_DETAIL,
+)
+from app.infra.photo_repository import PhotoRepository
+
+
+@pytest.fixture
+def owner(db_session: Session):
+    user = User(email="loading@example.com", username="loading", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+@pytest.fixture
+def photos(db_session: Session, owner):
+    """태그 2개, 얼굴 1개씩 가진 사진 5장 (identity map을 비워 관계가 로딩되지 않은 상태)"""
+    photos = [
+        Photo(
+            filename=f"l{i}.jpg",
+            original_filename=f"l{i}.jpg",
+            file_path=f"/l/{i}",
+            file_size=1,
+            s3_bucket="bucket",
+            s3_key=f"l/{i}",
+            s3_url=f"https://bucket/l/{i}",
+            uploaded_by_id=owner.id
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(photos)
+    db_session.flush()
+    for photo in photos:
+        db_session.add_all([
+            PhotoTag(photo_id=photo.id, tag_name="a"),
+            PhotoTag(photo_id=photo.id, tag_name="b"),
+            Face(
+                face_id=f"face-{photo.id}",
+                confidence=0.9,
+                bounding_box={"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2},
+                photo_id=photo.id
+            ),
+        ])
+    db_session.flush()
+    db_session.expunge_all()
+    return [photo.id for photo in photos]
+
+
+class TestLoadingProfiles:
+    """조회 용도별 로딩 프로필 테스트"""
+
+    def test_photo_card_blocks_relationships(self, db_session: Session, owner, photos):
+        """카드 프로필은 관계 접근을 지연 로딩 대신 예외로 막음"""
+        result = PhotoRepository(db_session).get_photos(uploaded_by_id=owner.id, profile=PHOTO_CARD)
+
+        assert len(result) == 5
+        with pytest.raises(InvalidRequestError):
+            result[0].tags
+
+    def test_photo_detail_loads_in_constant_queries(self, db_session: Session, owner, photos, query_counter):
+        """상세 프로필은 사진 수와 관계없이 사진 + 태그 + 얼굴 3회 조회"""
+        result = PhotoRepository(db_session).get_photos(uploaded_by_id=owner.id, profile=PHOTO_DETAIL)
+
+        assert [len(photo.tags) for photo in result] == [2] * 5
+        assert [len(photo.faces) for photo in result] == [1] * 5
+        assert query_counter.count == 3
+        with pytest.raises(InvalidRequestError):
+            result[0].uploaded_by
+
+    def test_album_with_cover(self, db_session: Session, owner, photos, query_counter):
+        """앨범 목록은 커버 사진을 한 쿼리로 함께 로딩"""
+        repo = AlbumRepository(db_session)
+        for i, photo_id in enumerate(photos):
+            repo.create({
+                "name": f"A{i}",
+                "album_type": "personal",
+                "created_by_id": owner.id,
+                "cover_photo_id": photo_id
+            })
+        db_session.flush()
+        db_session.expunge_all()
+        query_counter.reset()
+
+        albums = repo.get_albums(created_by_id=owner.id, profile=ALBUM_WITH_COVER)
+
+        assert {album.cover_photo_url for album in albums} == {f"https://bucket/l/{i}" for i in range(5)}
+        assert query_counter.count == 1
+
+    def test_memberships_with_user(self, db_session: Session, owner, query_counter):
+        """멤버 목록은 멤버십과 사용자를 한 쿼리로 로딩"""
+        group = Group(name="G", group_type="class", invite_code="LOAD0001", created_by_id=owner.id)
+        db_session.add(group)
+        db_session.flush()
+        db_session.add(GroupMembership(group_id=group.id, user_id=owner.id, role="admin"))
+        db_session.flush()
+        db_session.expunge_all()
+        query_counter.reset()
+
+        memberships = GroupRepository(db_session).get_active_memberships(group.id, profile=MEMBERSHIP_WITH_USER)
+
+        assert [membership.user.username for membership in memberships] == ["loading"]
+        assert query_counter.count == 1
+        with pytest.raises(InvalidRequestError):
+            memberships[0].group
@@ -0,0 +1,191 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+
+from app.domain.user import User
+from app.domain.photo import Photo
+from app.domain.face import FaceMatch
+from app.infra.album_repository import AlbumRepository
+from app.infra.face_repository import FaceRepository
+from app.infra.photo_repository import PhotoRepository
+from app.infra.user_repository import UserRepository
+from app.infra.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+def _walk(fetch, key, limit):
+    """커서를 따라 모든 페이지를 순회하며 ID 목록 반환"""
+    ids, cursor = [], None
+    while True:
+        page = fetch(cursor=cursor, limit=limit)
+        ids.extend(item.id for item in page)
+        cursor = next_cursor(page, limit, key)
+        if cursor is None:
+            return ids
+
+
+class TestCursorEncoding:
+    """커서 인코딩/디코딩 테스트"""
+
+    def test_round_trip_datetime(self):
+        """날짜 정렬 값 왕복"""
+        value = datetime(2025, 3, 1, 12, 30, 15, 123456)
+        assert decode_cursor(encode_cursor(value, 42)) == (value, 42)
+
+    def test_round_trip_float(self):
+        """유사도 정렬 값 왕복"""
+        assert decode_cursor(encode_cursor(0.875, 7)) == (0.875, 7)
+
+    def test_cursor_is_opaque(self):
+        """커서는 URL에 안전한 문자열"""
+        cursor = encode_cursor(datetime(2025, 1, 1), 1)
+        assert "=" not in cursor and "/" not in cursor and "+" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["garbage", "", "W251bGwsICJ4Il0"])
+    def test_invalid_cursor(self, cursor):
+        """잘못된 커서는 InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_next_cursor_last_page(self):
+        """마지막 페이지에서는 None"""
+        assert next_cursor([], 10, lambda x: (x, x)) is None
+        assert next_cursor([1, 2], 3, lambda x: (x, x)) is None
+        assert next_cursor([1, 2, 3], 3, lambda x: (x, x)) is not None
+
+
+class TestKeysetPagination:
+    """저장소 키셋 페이지네이션 테스트"""
+
+    @pytest.fixture
+    def user(self, db_session: Session):
+        user = User(email="pager@example.com", username="pager", hashed_password="x")
+        db_session.add(user)
+        db_session.flush()
+        return user
+
+    def _photo(self, db_session: Session, user: User, index: int, **kwargs) -> Photo:
+        photo = Photo(
+            filename=f"p{index}.jpg",
+            original_filename=f"p{index}.jpg",
+            file_path=f"/p/{index}",
+            file_size=1,
+            s3_bucket="bucket",
+            s3_key=f"p/{index}",
+            s3_url=f"https://bucket/p/{index}",
+            uploaded_by_id=user.id,
+            **kwargs
+        )
+        db_session.add(photo)
+        return photo
+
+    def test_photos_with_identical_timestamps(self, db_session: Session, user):
+        """같은 created_at(초 단위 서버 기본값)을 가진 행도 중복/누락 없이 순회"""
+        for i in range(7):
+            self._photo(db_session, user, i)
+        db_session.flush()
+        repo = PhotoRepository(db_session)
+
+        ids = _walk(repo.get_photos, lambda p: (p.created_at, p.id), limit=3)
+
+        assert ids == [p.id for p in repo.get_photos(limit=100)]
+        assert len(ids) == len(set(ids)) == 7
+
+    def test_photos_match_offset_order(self, db_session: Session, user):
+        """서로 다른 시각이 섞여 있어도 OFFSET 방식과 같은 순서"""
+        base = datetime(2025, 1, 1)
+        for i in range(10):
+            self._photo(db_session, user, i, created_at=base + timedelta(minutes=i % 4))
+        db_session.flush()
+        repo = PhotoRepository(db_session)
+
+        ids = _walk(repo.get_photos, lambda p: (p.created_at, p.id), limit=4)
+        offset_ids = [p.id for skip in range(0, 10, 4) for p in repo.get_photos(skip=skip, limit=4)]
+
+        assert ids == offset_ids
+
+    def test_photos_cursor_respects_filters(self, db_session: Session, user):
+        """커서와 필터 동시 적용"""
+        other = User(email="other@example.com", username="other", hashed_password="x")
+        db_session.add(other)
+        db_session.flush()
+        for i in range(4):
+            self._photo(db_session, user, i)
+        photo = self._photo(db_session, other, 99)
+        db_session.flush()
+        repo = PhotoRepository(db_session)
+
+        fetch = lambda **kw: repo.get_photos(uploaded_by_id=user.id, **kw)
+        ids = _walk(fetch, lambda p: (p.created_at, p.id), limit=2)
+
+        assert len(ids) == 4
+        assert photo.id not in ids
+
+    def test_album_photos_by_added_at(self, db_session: Session, user):
+        """앨범 사진은 added_at 기준 키셋"""
+        repo = AlbumRepository(db_session)
+        album = repo.create({"name": "A", "album_type": "personal", "created_by_id": user.id})
+        photos = [self._photo(db_session, user, i) for i in range(5)]
+        db_session.flush()
+        for photo in photos:
+            repo.add_photo_to_album(album.id, photo.id)
+
+        fetch = lambda **kw: repo.get_album_photos(album.id, **kw)
+        ids = _walk(fetch, lambda p: (None, p.id), limit=2)
+
+        assert ids == [p.id for p in repo.get_album_photos(album.id, limit=100)]
+        assert sorted(ids) == sorted(p.id for p in photos)
+
+    def test_albums_by_updated_at(self, db_session: Session, user):
+        """앨범 목록은 updated_at 기준 키셋"""
+        repo = AlbumRepository(db_session)
+        for i in range(5):
+            repo.create({"name": f"A{i}", "album_type": "personal", "created_by_id": user.id})
+
+        ids = _walk(repo.get_albums, lambda a: (a.updated_at, a.id), limit=2)
+
+        assert ids == [a.id for a in repo.get_albums(limit=100)]
+        assert len(set(ids)) == 5
+
+    def test_unconfirmed_matches_by_similarity(self, db_session: Session, user):
+        """미확인 매칭은 similarity 기준 키셋 (동점 포함)"""
+        photo = self._photo(db_session, user, 0)
+        db_session.flush()
+        repo = FaceRepository(db_session)
+        faces = [
+            repo.create_face({
+                "face_id": f"f{i}",
+                "confidence": 0.9,
+                "bounding_box": {},
+                "photo_id": photo.id
+            })
+            for i in range(2)
+        ]
+        for similarity in [0.9, 0.9, 0.95, 0.85, 0.9]:
+            db_session.add(FaceMatch(
+                face1_id=faces[0].id,
+                face2_id=faces[1].id,
+                similarity=similarity,
+                match_method="manual"
+            ))
+        db_session.flush()
+
+        ids = _walk(repo.get_unconfirmed_matches, lambda m: (m.similarity, m.id), limit=2)
+
+        assert ids == [m.id for m in repo.get_unconfirmed_matches(limit=100)]
+        assert len(set(ids)) == 5
+
+    def test_users_by_id(self, db_session: Session, user):
+        """ID만으로 정렬하는 목록"""
+        repo = UserRepository(db_session)
+        for i in range(4):
+            repo.create({"email": f"u{i}@example.com", "username": f"u{i}", "hashed_password": "x"})
+
+        ids = _walk(repo.get_all_active, lambda u: (u.id, u.id), limit=2)
+
+        assert ids == sorted(ids)
+        assert len(ids) == 5
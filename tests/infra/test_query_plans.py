@@ -0,0 +1,239 @@
+import re
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.domain.user import User
+from app.domain.group import Group, GroupMembership
+from app.domain.photo import Photo, PhotoTag
+from app.domain.album import Album, AlbumShare, album_photos
+from app.domain.face import Face, FaceCollection, FaceMatch
+from app.infra.album_repository import AlbumRepository
+from app.infra.face_repository import FaceRepository
+from app.infra.group_repository import GroupRepository
+from app.infra.pagination import encode_cursor
+from app.infra.photo_repository import PhotoRepository
+from app.infra.user_repository import UserRepository
+
+USERS = 200
+GROUPS = 20
+PHOTOS = 4000
+BASE_TIME = datetime(2025, 1, 1)
+
+# 순차 스캔이 허용되지 않는 테이블 (데이터가 사용자/사진 수에 비례해 커지는 테이블)
+LARGE_TABLES = {
+    "users", "groups", "group_memberships", "photos", "photo_tags", "albums",
+    "album_photos", "album_shares", "faces", "face_matches", "face_collections",
+}
+
+# 인덱스로 해결할 수 없는 스캔 (쿼리 이름 -> 허용 테이블)
+SCAN_ALLOWLIST = {
+    # 부분 문자열 검색(ILIKE '%tag%')은 B-tree 인덱스를 사용할 수 없어 조인 중 한쪽은 전체 스캔
+    "search_photos_by_tag": {"photo_tags", "photos"},
+    # 첫 페이지는 기본 키 순서로 읽다가 LIMIT에서 멈춤 (이후 페이지는 id 범위 검색)
+    "user.get_all_active": {"users"},
+    "group.get_all_active": {"groups"},
+}
+
+SEQ_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+def _queries(user_id: int, group_id: int, album_id: int, photo_id: int, face_id: int):
+    """저장소의 모든 조회 메서드 호출 목록 (이름, 호출 함수)"""
+    cursor = encode_cursor(BASE_TIME + timedelta(minutes=PHOTOS // 2), PHOTOS // 2)
+    similarity_cursor = encode_cursor(0.9, 10)
+    id_cursor = encode_cursor(50, 50)
+    start, end = BASE_TIME, BASE_TIME + timedelta(days=1)
+
+    return [
+        ("user.get_by_email", lambda r: r.users.get_by_email("u1@example.com")),
+        ("user.get_by_username", lambda r: r.users.get_by_username("u1")),
+        ("user.get_by_apple_id", lambda r: r.users.get_by_apple_id("apple-1")),
+        ("user.get_by_google_id", lambda r: r.users.get_by_google_id("google-1")),
+        ("user.get_all_active", lambda r: r.users.get_all_active(limit=20)),
+        ("user.get_all_active.cursor", lambda r: r.users.get_all_active(limit=20, cursor=id_cursor)),
+        ("group.get_by_invite_code", lambda r: r.groups.get_by_invite_code("CODE0001")),
+        ("group.get_membership", lambda r: r.groups.get_membership(group_id, user_id)),
+        ("group.get_active_memberships", lambda r: r.groups.get_active_memberships(group_id)),
+        ("group.get_active_member_count", lambda r: r.groups.get_active_member_count(group_id)),
+        ("group.get_user_groups", lambda r: r.groups.get_user_groups(user_id)),
+        ("group.get_all_active", lambda r: r.groups.get_all_active(limit=20)),
+        ("photo.get_by_hash", lambda r: r.photos.get_by_hash("hash-1")),
+        ("photo.get_photos.group", lambda r: r.photos.get_photos(group_id=group_id, limit=20)),
+        ("photo.get_photos.group.cursor",
+         lambda r: r.photos.get_photos(group_id=group_id, limit=20, cursor=cursor)),
+        ("photo.get_photos.uploader", lambda r: r.photos.get_photos(uploaded_by_id=user_id, limit=20)),
+        ("photo.get_photos.uploader.cursor",
+         lambda r: r.photos.get_photos(uploaded_by_id=user_id, limit=20, cursor=cursor)),
+        ("photo.get_photo_cards.group", lambda r: r.photos.get_photo_cards(group_id=group_id, limit=20)),
+        ("photo.get_unprocessed_photos", lambda r: r.photos.get_unprocessed_photos()),
+        ("photo.get_photo_tags", lambda r: r.photos.get_photo_tags(photo_id)),
+        ("search_photos_by_tag", lambda r: r.photos.search_photos_by_tag("tag")),
+        ("photo.get_photos_by_date_range.group",
+         lambda r: r.photos.get_photos_by_date_range(start, end, group_id=group_id)),
+        ("album.get_albums.creator", lambda r: r.albums.get_albums(created_by_id=user_id, limit=20)),
+        ("album.get_albums.group", lambda r: r.albums.get_albums(group_id=group_id, limit=20)),
+        ("album.get_album_cards.creator", lambda r: r.albums.get_album_cards(created_by_id=user_id, limit=20)),
+        ("album.is_photo_in_album", lambda r: r.albums.is_photo_in_album(album_id, photo_id)),
+        ("album.get_album_photos", lambda r: r.albums.get_album_photos(album_id, limit=20)),
+        ("album.get_album_photos.cursor",
+         lambda r: r.albums.get_album_photos(album_id, limit=20, cursor=encode_cursor(None, photo_id))),
+        ("album.get_album_photo_count", lambda r: r.albums.get_album_photo_count(album_id)),
+        ("album.get_album_share", lambda r: r.albums.get_album_share(album_id, user_id)),
+        ("album.get_album_shares", lambda r: r.albums.get_album_shares(album_id)),
+        ("album.get_shared_albums", lambda r: r.albums.get_shared_albums(user_id)),
+        ("album.get_public_albums", lambda r: r.albums.get_public_albums(limit=20)),
+        ("album.get_user_albums", lambda r: r.albums.get_user_albums(user_id, limit=20)),
+        ("face.get_face_by_face_id", lambda r: r.faces.get_face_by_face_id("face-1")),
+        ("face.get_faces_by_photo", lambda r: r.faces.get_faces_by_photo(photo_id)),
+        ("face.get_faces_by_user", lambda r: r.faces.get_faces_by_user(user_id)),
+        ("face.get_unidentified_faces", lambda r: r.faces.get_unidentified_faces(limit=20)),
+        ("face.get_unidentified_faces.cursor",
+         lambda r: r.faces.get_unidentified_faces(limit=20, cursor=cursor)),
+        ("face.get_unidentified_face_cards", lambda r: r.faces.get_unidentified_face_cards(limit=20)),
+        ("face.get_collections_by_owner", lambda r: r.faces.get_collections_by_owner("user", user_id)),
+        ("face.get_face_matches", lambda r: r.faces.get_face_matches(face_id)),
+        ("face.get_unconfirmed_matches", lambda r: r.faces.get_unconfirmed_matches(limit=20)),
+        ("face.get_unconfirmed_matches.cursor",
+         lambda r: r.faces.get_unconfirmed_matches(limit=20, cursor=similarity_cursor)),
+        ("face.get_face_count_by_user", lambda r: r.faces.get_face_count_by_user(user_id)),
+        ("face.get_face_count_by_photo", lambda r: r.faces.get_face_count_by_photo(photo_id)),
+    ]
+
+
+class Repositories:
+    """한 세션에 묶인 저장소 모음"""
+
+    def __init__(self, session):
+        self.users = UserRepository(session)
+        self.groups = GroupRepository(session)
+        self.photos = PhotoRepository(session)
+        self.albums = AlbumRepository(session)
+        self.faces = FaceRepository(session)
+
+
+def _seed(conn):
+    """실제 분포와 비슷한 데이터 적재 후 ANALYZE"""
+    conn.execute(insert(User), [
+        {"id": i, "email": f"u{i}@example.com", "username": f"u{i}", "hashed_password": "x",
+         "apple_id": f"apple-{i}", "google_id": f"google-{i}", "is_active": True}
+        for i in range(1, USERS + 1)
+    ])
+    conn.execute(insert(Group), [
+        {"id": i, "name": f"g{i}", "group_type": "class", "invite_code": f"CODE{i:04d}",
+         "created_by_id": i, "is_active": True}
+        for i in range(1, GROUPS + 1)
+    ])
+    conn.execute(insert(GroupMembership), [
+        {"group_id": (u % GROUPS) + 1, "user_id": u, "role": "member", "is_active": True}
+        for u in range(1, USERS + 1)
+    ])
+    conn.execute(insert(Photo), [
+        {"id": i, "filename": f"p{i}.jpg", "original_filename": f"p{i}.jpg",
+         "file_path": f"/p/{i}", "file_size": 1, "s3_bucket": "b", "s3_key": f"p/{i}",
+         "s3_url": f"https://b/p/{i}", "file_hash": f"hash-{i}",
+         "uploaded_by_id": (i % USERS) + 1, "group_id": (i % GROUPS) + 1,
+         "is_active": i % 50 != 0, "is_processed": i % 10 != 0,
+         "taken_at": BASE_TIME + timedelta(hours=i),
+         "created_at": BASE_TIME + timedelta(minutes=i), "updated_at": BASE_TIME}
+        for i in range(1, PHOTOS + 1)
+    ])
+    conn.execute(insert(PhotoTag), [
+        {"photo_id": i, "tag_name": f"tag{i % 30}", "confidence": 0.9}
+        for i in range(1, PHOTOS + 1)
+    ])
+    conn.execute(insert(Face), [
+        {"id": i, "face_id": f"face-{i}", "confidence": 0.9, "bounding_box": {},
+         "photo_id": i, "identified_user_id": (i % USERS) + 1 if i % 3 else None,
+         "is_active": True, "created_at": BASE_TIME + timedelta(minutes=i)}
+        for i in range(1, PHOTOS + 1)
+    ])
+    conn.execute(insert(FaceMatch), [
+        {"face1_id": i, "face2_id": i + 1, "similarity": 0.8 + (i % 20) / 100,
+         "match_method": "aws", "is_confirmed": i % 4 == 0, "is_active": True}
+        for i in range(1, PHOTOS)
+    ])
+    conn.execute(insert(FaceCollection), [
+        {"collection_id": f"col-{i}", "name": f"col-{i}", "owner_type": "user",
+         "owner_id": i, "is_active": True}
+        for i in range(1, USERS + 1)
+    ])
+    conn.execute(insert(Album), [
+        {"id": i, "name": f"a{i}", "album_type": "personal", "created_by_id": (i % USERS) + 1,
+         "group_id": (i % GROUPS) + 1, "is_public": i % 5 == 0, "is_active": True,
+         "updated_at": BASE_TIME + timedelta(minutes=i)}
+        for i in range(1, 400 + 1)
+    ])
+    conn.execute(insert(album_photos), [
+        {"album_id": (i % 400) + 1, "photo_id": i, "added_at": BASE_TIME + timedelta(minutes=i)}
+        for i in range(1, PHOTOS + 1)
+    ])
+    conn.execute(insert(AlbumShare), [
+        {"album_id": (i % 400) + 1, "shared_with_id": (i % USERS) + 1,
+         "permission": "view", "is_active": True}
+        for i in range(1, 1000 + 1)
+    ])
+    conn.exec_driver_sql("ANALYZE")
+
+
+@pytest.fixture(scope="module")
+def plan_engine(tmp_path_factory):
+    """모델 인덱스가 적용된 시드 DB"""
+    path = tmp_path_factory.mktemp("plans") / "plans.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        _seed(conn)
+    yield engine
+    engine.dispose()
+
+
+def _capture(engine, call):
+    """저장소 호출이 실행한 SQL 문과 파라미터 수집"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    session = sessionmaker(bind=engine)()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        call(Repositories(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        session.rollback()
+        session.close()
+    return statements
+
+
+def _sequential_scans(engine, statement, parameters):
+    """EXPLAIN QUERY PLAN 결과에서 인덱스 없이 테이블 전체를 읽는 단계 추출"""
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    scans = set()
+    for row in plan:
+        match = SEQ_SCAN.match(row[-1])
+        if match and match.group(1) in LARGE_TABLES:
+            scans.add(match.group(1))
+    return scans, [row[-1] for row in plan]
+
+
+@pytest.mark.parametrize(
+    "name,call",
+    _queries(user_id=7, group_id=3, album_id=5, photo_id=44, face_id=44),
+    ids=lambda value: value if isinstance(value, str) else ""
+)
+def test_repository_queries_use_indexes(plan_engine, name, call):
+    """저장소 조회 쿼리는 큰 테이블을 순차 스캔하지 않아야 함"""
+    statements = _capture(plan_engine, call)
+    assert statements, f"{name} did not execute any SQL"
+
+    allowed = SCAN_ALLOWLIST.get(name, set())
+    for statement, parameters in statements:
+        scans, plan = _sequential_scans(plan_engine, statement, parameters)
+        unexpected = scans - allowed
+        assert not unexpected, (
+            f"{name} scans {sorted(unexpected)} sequentially\n{statement}\n" + "\n".join(plan)
+        )
@@ -0,0 +1,110 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.api.album_router import AlbumListResponse
+from app.api.face_router import FaceListResponse
+from app.api.photo_router import PhotoListResponse
+from app.domain.face import Face
+from app.domain.photo import Photo
+from app.domain.user import User
+from app.infra.album_repository import AlbumRepository
+from app.infra.face_repository import FaceRepository
+from app.infra.loading import ALBUM_WITH_COVER
+from app.infra.pagination import paginate
+from app.infra.photo_repository import PhotoRepository
+from app.infra.read_models import PhotoCard, dump_page
+
+
+@pytest.fixture
+def seeded(db_session: Session):
+    """사진 3장(각 미식별 얼굴 1개), 커버가 있는 앨범 1개와 없는 앨범 1개"""
+    user = User(email="cards@example.com", username="cards", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    base = datetime(2025, 1, 1)
+    photos = [
+        Photo(
+            filename=f"c{i}.jpg",
+            original_filename=f"c{i}.jpg",
+            file_path=f"/c/{i}",
+            file_size=1,
+            s3_bucket="bucket",
+            s3_key=f"c/{i}",
+            s3_url=f"https://bucket/c/{i}",
+            uploaded_by_id=user.id,
+            width=640,
+            taken_at=base,
+            created_at=base + timedelta(minutes=i)
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(photos)
+    db_session.flush()
+    db_session.add_all(
+        Face(
+            face_id=f"card-{photo.id}",
+            confidence=0.9,
+            bounding_box={"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2},
+            photo_id=photo.id,
+            created_at=photo.created_at
+        )
+        for photo in photos
+    )
+    albums = AlbumRepository(db_session)
+    albums.create({"name": "Cover", "album_type": "personal", "created_by_id": user.id, "cover_photo_id": photos[0].id})
+    albums.create({"name": "Plain", "album_type": "personal", "created_by_id": user.id})
+    db_session.flush()
+    db_session.expunge_all()
+    return user.id
+
+
+def _orm_json(response_model, items, limit, key) -> dict:
+    """기존 경로: ORM 객체 -> 응답 모델 검증 -> JSON"""
+    return json.loads(response_model.model_validate(paginate(items, limit, key)).model_dump_json())
+
+
+class TestReadModels:
+    """읽기 모델 경로가 ORM + 응답 모델 경로와 같은 JSON을 만드는지 테스트"""
+
+    def test_photo_cards(self, db_session: Session, seeded):
+        repo = PhotoRepository(db_session)
+        key = lambda photo: (photo.created_at, photo.id)
+
+        cards = repo.get_photo_cards(uploaded_by_id=seeded, limit=2)
+        expected = _orm_json(PhotoListResponse, repo.get_photos(uploaded_by_id=seeded, limit=2), 2, key)
+
+        assert json.loads(dump_page(cards, 2, key)) == expected
+        assert expected["next_cursor"] is not None
+
+    def test_album_cards_with_cover_url(self, db_session: Session, seeded):
+        repo = AlbumRepository(db_session)
+        key = lambda album: (album.updated_at, album.id)
+
+        cards = repo.get_album_cards(created_by_id=seeded)
+        expected = _orm_json(
+            AlbumListResponse, repo.get_albums(created_by_id=seeded, profile=ALBUM_WITH_COVER), 50, key
+        )
+
+        assert json.loads(dump_page(cards, 50, key)) == expected
+        assert {card.name: card.cover_photo_url for card in cards} == {"Cover": "https://bucket/c/0", "Plain": None}
+
+    def test_face_cards(self, db_session: Session, seeded):
+        repo = FaceRepository(db_session)
+        key = lambda face: (face.created_at, face.id)
+
+        cards = repo.get_unidentified_face_cards(limit=2)
+        expected = _orm_json(FaceListResponse, repo.get_unidentified_faces(limit=2), 2, key)
+
+        assert json.loads(dump_page(cards, 2, key)) == expected
+
+    def test_does_not_populate_identity_map(self, db_session: Session, seeded):
+        """ORM 객체를 만들지 않으므로 세션에 아무것도 추적되지 않음"""
+        cards = PhotoRepository(db_session).get_photo_cards(uploaded_by_id=seeded)
+
+        assert len(cards) == 3
+        assert len(db_session.identity_map) == 0
+        assert not hasattr(cards[0], "__dict__")
+        assert isinstance(cards[0], PhotoCard)
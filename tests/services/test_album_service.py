@@ -158,7 +158,9 @@ class TestAlbumService:
             group_id=5,
             album_type="personal",
             skip=10,
-            limit=20
+            limit=20,
+            cursor=None,
+            profile=None
         )
 
     def test_get_albums_default_params(self, mock_service, mock_repo, sample_album):
@@ -173,42 +175,20 @@ class TestAlbumService:
             group_id=None,
             album_type=None,
             skip=0,
-            limit=50
+            limit=50,
+            cursor=None,
+            profile=None
         )
 
-    def test_get_user_albums(self, mock_service, mock_repo, sample_album, sample_album_share):
-        """사용자의 모든 앨범 조회 테스트"""
-        # 생성한 앨범
-        created_album = Album(id=1, name="Created Album", album_type="personal", created_by_id=1)
-        # 공유받은 앨범
-        shared_album = Album(id=2, name="Shared Album", album_type="personal", created_by_id=2)
-
-        sample_album_share.album = shared_album
-
-        mock_repo.get_albums.return_value = [created_album]
-        mock_repo.get_shared_albums.return_value = [sample_album_share]
-
-        result = mock_service.get_user_albums(1)
-
-        assert len(result) == 2
-        assert created_album in result
-        assert shared_album in result
-        mock_repo.get_albums.assert_called_once_with(created_by_id=1)
-        mock_repo.get_shared_albums.assert_called_once_with(1)
+    def test_get_user_albums(self, mock_service, mock_repo, sample_album):
+        """사용자의 모든 앨범과 유효 권한 조회 테스트 (단일 저장소 쿼리에 위임)"""
+        mock_repo.get_user_albums.return_value = [(sample_album, "owner")]
 
-    def test_get_user_albums_no_duplicates(self, mock_service, mock_repo, sample_album, sample_album_share):
-        """사용자 앨범 조회 시 중복 제거 테스트"""
-        # 같은 앨범이 생성 목록과 공유 목록에 모두 있는 경우
-        album = Album(id=1, name="Album", album_type="personal", created_by_id=1)
-        sample_album_share.album = album
+        result = mock_service.get_user_albums(1, limit=20, cursor="c")
 
-        mock_repo.get_albums.return_value = [album]
-        mock_repo.get_shared_albums.return_value = [sample_album_share]
-
-        result = mock_service.get_user_albums(1)
-
-        assert len(result) == 1
-        assert album in result
+        assert result == [(sample_album, "owner")]
+        mock_repo.get_user_albums.assert_called_once_with(1, limit=20, cursor="c", profile=None)
+        mock_repo.get_shared_albums.assert_not_called()
 
     def test_update_album(self, mock_service, mock_repo, sample_album):
         """앨범 정보 수정 테스트"""
@@ -249,17 +229,19 @@ class TestAlbumService:
         mock_repo.delete.assert_called_once_with(999)
 
     def test_add_photos_to_album_success(self, mock_service, mock_repo, sample_album):
-        """앨범에 사진들 추가 성공 테스트"""
+        """앨범에 사진들 일괄 추가 성공 테스트"""
         mock_repo.get_by_id.return_value = sample_album
-        mock_repo.is_photo_in_album.side_effect = [False, False, True]  # 첫 두 개는 없고, 세 번째는 이미 있음
-        mock_repo.add_photo_to_album.return_value = True
+        mock_repo.add_photos_to_album.return_value = 2  # 세 번째는 이미 있음
 
-        result = mock_service.add_photos_to_album(1, [101, 102, 103])
+        result = mock_service.add_photos_to_album(1, [101, 102, 103, 103])
 
-        assert result is True
+        assert result == {"added": 2, "skipped": 1}
         mock_repo.get_by_id.assert_called_once_with(1)
-        assert mock_repo.is_photo_in_album.call_count == 3
-        assert mock_repo.add_photo_to_album.call_count == 2  # 첫 두 개만 추가
+        mock_repo.add_photos_to_album.assert_called_once_with(
+            1, [101, 102, 103, 103], visible_to_user_id=None
+        )
+        mock_repo.is_photo_in_album.assert_not_called()
+        mock_repo.add_photo_to_album.assert_not_called()
 
     def test_add_photos_to_album_album_not_found(self, mock_service, mock_repo):
         """존재하지 않는 앨범에 사진 추가 테스트"""
@@ -267,9 +249,31 @@ class TestAlbumService:
 
         result = mock_service.add_photos_to_album(999, [101, 102])
 
-        assert result is False
+        assert result is None
         mock_repo.get_by_id.assert_called_once_with(999)
-        mock_repo.add_photo_to_album.assert_not_called()
+        mock_repo.add_photos_to_album.assert_not_called()
+
+    def test_remove_photos_from_album_clears_cover(self, mock_service, mock_repo, sample_album):
+        """커버 사진이 제거되면 커버 해제"""
+        sample_album.cover_photo_id = 102
+        mock_repo.get_by_id.return_value = sample_album
+        mock_repo.remove_photos_from_album.return_value = 2
+
+        result = mock_service.remove_photos_from_album(1, [101, 102, 103])
+
+        assert result == {"removed": 2, "skipped": 1}
+        mock_repo.update.assert_called_once_with(1, {"cover_photo_id": None})
+
+    def test_can_edit_album(self, mock_service, mock_repo, sample_album):
+        """생성자와 edit 권한 공유 사용자만 편집 가능"""
+        sample_album.id = 1
+        sample_album.created_by_id = 1
+        mock_repo.get_album_share.side_effect = [Mock(permission="edit"), Mock(permission="view"), None]
+
+        assert mock_service.can_edit_album(sample_album, 1) is True
+        assert mock_service.can_edit_album(sample_album, 2) is True
+        assert mock_service.can_edit_album(sample_album, 3) is False
+        assert mock_service.can_edit_album(sample_album, 4) is False
 
     def test_remove_photo_from_album(self, mock_service, mock_repo):
         """앨범에서 사진 제거 테스트"""
@@ -288,7 +292,7 @@ class TestAlbumService:
         result = mock_service.get_album_photos(1, skip=10, limit=20)
 
         assert result == photos
-        mock_repo.get_album_photos.assert_called_once_with(1, 10, 20)
+        mock_repo.get_album_photos.assert_called_once_with(1, 10, 20, None)
 
     def test_get_album_photos_default_params(self, mock_service, mock_repo):
         """기본 매개변수로 앨범 사진 조회 테스트"""
@@ -298,7 +302,7 @@ class TestAlbumService:
         result = mock_service.get_album_photos(1)
 
         assert result == photos
-        mock_repo.get_album_photos.assert_called_once_with(1, 0, 50)
+        mock_repo.get_album_photos.assert_called_once_with(1, 0, 50, None)
 
     def test_set_cover_photo_success(self, mock_service, mock_repo, sample_album):
         """커버 사진 설정 성공 테스트"""
@@ -3,10 +3,29 @@ from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta
 from fastapi import HTTPException
 
+from app.core.principal import Principal
+from app.core.security import AuthContext
 from app.services.auth_service import AuthService
 from app.domain.user import User
 from app.domain.auth import SessionData
 
+ACCESS_PAYLOAD = {"sub": "1", "sid": "sid-1", "jti": "access-jti"}
+REFRESH_PAYLOAD = {"sub": "1", "sid": "sid-1", "jti": "refresh-jti", "type": "refresh"}
+
+
+def _session(**overrides) -> SessionData:
+    """테스트용 세션 (기본값은 ACCESS_PAYLOAD/REFRESH_PAYLOAD와 맞춤)"""
+    data = {
+        "user_id": 1,
+        "session_id": "sid-1",
+        "access_jti": "access-jti",
+        "refresh_jti": "refresh-jti",
+        "created_at": datetime.utcnow(),
+        "expires_at": datetime.utcnow() + timedelta(hours=1),
+        **overrides
+    }
+    return SessionData(**data)
+
 
 class TestAuthService:
     """AuthService 테스트 클래스"""
@@ -28,6 +47,7 @@ class TestAuthService:
         user.is_active = True
         user.is_verified = True
         user.role = "user"
+        user.token_version = 0
         user.profile_image_url = None
         user.created_at = datetime.utcnow()
         return user
@@ -37,13 +57,15 @@ class TestAuthService:
         """AuthService 인스턴스"""
         service = AuthService(mock_db)
         service.auth_repository = AsyncMock()
+        service.login_throttle = AsyncMock()
+        service.login_throttle.retry_after.return_value = 0
         return service
 
     @pytest.mark.asyncio
     async def test_login_success(self, auth_service, mock_user):
         """로그인 성공 테스트"""
         # Mock repository 설정
-        auth_service.user_repository.get_by_email = Mock(return_value=mock_user)
+        auth_service.user_repository.get_by_email = AsyncMock(return_value=mock_user)
         auth_service.auth_repository.store_session = AsyncMock(return_value="session_123")
 
         # Mock 비밀번호 검증 및 토큰 생성
@@ -61,10 +83,26 @@ class TestAuthService:
         assert result["session_id"] == "session_123"
         auth_service.auth_repository.store_session.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_login_throttled_before_password_check(self, auth_service):
+        """시도 제한을 넘으면 사용자 조회/비밀번호 검증 없이 429와 Retry-After"""
+        auth_service.login_throttle.retry_after.return_value = 2.5
+        auth_service.user_repository.get_by_email = AsyncMock()
+
+        with patch('app.services.auth_service.verify_password') as verify:
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_service.login("test@example.com", "password", ip_address="203.0.113.7")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers == {"Retry-After": "3"}
+        auth_service.login_throttle.retry_after.assert_awaited_once_with("test@example.com", "203.0.113.7")
+        auth_service.user_repository.get_by_email.assert_not_awaited()
+        verify.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_login_user_not_found(self, auth_service):
         """존재하지 않는 사용자로 로그인 시도 테스트"""
-        auth_service.user_repository.get_by_email = Mock(return_value=None)
+        auth_service.user_repository.get_by_email = AsyncMock(return_value=None)
 
         with pytest.raises(HTTPException) as exc_info:
             await auth_service.login("nonexistent@example.com", "password")
@@ -75,7 +113,7 @@ class TestAuthService:
     @pytest.mark.asyncio
     async def test_login_wrong_password(self, auth_service, mock_user):
         """잘못된 비밀번호로 로그인 시도 테스트"""
-        auth_service.user_repository.get_by_email = Mock(return_value=mock_user)
+        auth_service.user_repository.get_by_email = AsyncMock(return_value=mock_user)
 
         with patch('app.services.auth_service.verify_password', return_value=False):
             with pytest.raises(HTTPException) as exc_info:
@@ -88,7 +126,7 @@ class TestAuthService:
     async def test_login_inactive_user(self, auth_service, mock_user):
         """비활성화된 사용자 로그인 시도 테스트"""
         mock_user.is_active = False
-        auth_service.user_repository.get_by_email = Mock(return_value=mock_user)
+        auth_service.user_repository.get_by_email = AsyncMock(return_value=mock_user)
 
         with patch('app.services.auth_service.verify_password', return_value=True):
             with pytest.raises(HTTPException) as exc_info:
@@ -103,18 +141,20 @@ class TestAuthService:
         auth_service.auth_repository.is_token_blacklisted = AsyncMock(return_value=False)
         auth_service.auth_repository.invalidate_session = AsyncMock()
 
-        with patch('app.services.auth_service.verify_token', return_value={"sub": "1"}):
+        with patch('app.services.auth_service.verify_token', return_value=ACCESS_PAYLOAD):
             await auth_service.logout("valid_token")
 
-        auth_service.auth_repository.invalidate_session.assert_called_once_with(1, "valid_token")
+        auth_service.auth_repository.is_token_blacklisted.assert_called_once_with("access-jti")
+        auth_service.auth_repository.invalidate_session.assert_called_once_with(1, "sid-1")
 
     @pytest.mark.asyncio
     async def test_logout_blacklisted_token(self, auth_service):
         """블랙리스트된 토큰으로 로그아웃 시도 테스트"""
         auth_service.auth_repository.is_token_blacklisted = AsyncMock(return_value=True)
 
-        with pytest.raises(HTTPException) as exc_info:
-            await auth_service.logout("blacklisted_token")
+        with patch('app.services.auth_service.verify_token', return_value=ACCESS_PAYLOAD):
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_service.logout("blacklisted_token")
 
         assert exc_info.value.status_code == 401
         assert "Token is already invalidated" in exc_info.value.detail
@@ -134,10 +174,10 @@ class TestAuthService:
     @pytest.mark.asyncio
     async def test_refresh_token_success(self, auth_service, mock_user):
         """토큰 갱신 성공 테스트"""
-        auth_service.user_repository.get_by_id = Mock(return_value=mock_user)
-        auth_service.auth_repository.update_session = AsyncMock(return_value="new_session_123")
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
+        auth_service.auth_repository.update_session = AsyncMock(return_value="sid-1")
 
-        with patch('app.services.auth_service.verify_refresh_token', return_value={"sub": "1"}), \
+        with patch('app.services.auth_service.verify_refresh_token', return_value=REFRESH_PAYLOAD), \
              patch('app.services.auth_service.create_access_token', return_value="new_access_token"), \
              patch('app.services.auth_service.create_refresh_token', return_value="new_refresh_token"):
 
@@ -146,7 +186,9 @@ class TestAuthService:
         assert result["access_token"] == "new_access_token"
         assert result["refresh_token"] == "new_refresh_token"
         assert result["user_id"] == 1
-        assert result["session_id"] == "new_session_123"
+        assert result["session_id"] == "sid-1"
+        kwargs = auth_service.auth_repository.update_session.call_args.kwargs
+        assert kwargs["session_id"] == "sid-1" and kwargs["old_refresh_jti"] == "refresh-jti"
 
     @pytest.mark.asyncio
     async def test_refresh_token_invalid_token(self, auth_service):
@@ -161,9 +203,9 @@ class TestAuthService:
     @pytest.mark.asyncio
     async def test_refresh_token_user_not_found(self, auth_service):
         """사용자를 찾을 수 없을 때 토큰 갱신 시도 테스트"""
-        auth_service.user_repository.get_by_id = Mock(return_value=None)
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=None)
 
-        with patch('app.services.auth_service.verify_refresh_token', return_value={"sub": "999"}):
+        with patch('app.services.auth_service.verify_refresh_token', return_value={**REFRESH_PAYLOAD, "sub": "999"}):
             with pytest.raises(HTTPException) as exc_info:
                 await auth_service.refresh_token("refresh_token")
 
@@ -173,10 +215,10 @@ class TestAuthService:
     @pytest.mark.asyncio
     async def test_refresh_token_session_not_found(self, auth_service, mock_user):
         """세션을 찾을 수 없을 때 토큰 갱신 시도 테스트"""
-        auth_service.user_repository.get_by_id = Mock(return_value=mock_user)
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
         auth_service.auth_repository.update_session = AsyncMock(return_value=None)
 
-        with patch('app.services.auth_service.verify_refresh_token', return_value={"sub": "1"}), \
+        with patch('app.services.auth_service.verify_refresh_token', return_value=REFRESH_PAYLOAD), \
              patch('app.services.auth_service.create_access_token', return_value="new_access_token"), \
              patch('app.services.auth_service.create_refresh_token', return_value="new_refresh_token"):
 
@@ -187,58 +229,46 @@ class TestAuthService:
         assert "Session not found or expired" in exc_info.value.detail
 
     @pytest.mark.asyncio
-    async def test_get_current_user_success(self, auth_service, mock_user):
-        """현재 사용자 정보 조회 성공 테스트"""
-        mock_session = SessionData(
-            user_id=1,
-            access_token="access_token",
-            refresh_token="refresh_token",
-            created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            ip_address="127.0.0.1",
-            user_agent="test-agent"
+    async def test_get_profile_success(self, auth_service, mock_user):
+        """현재 사용자 프로필 조회 성공 테스트 (세션은 인증 의존성이 확인한 것을 사용)"""
+        context = AuthContext(
+            principal=Principal(id=1, is_active=True, role="user"),
+            payload=ACCESS_PAYLOAD,
+            session=_session(ip_address="127.0.0.1", user_agent="test-agent")
         )
+        auth_service.auth_repository.get_session = AsyncMock()
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
 
-        auth_service.auth_repository.is_token_blacklisted = AsyncMock(return_value=False)
-        auth_service.auth_repository.get_session_by_token = AsyncMock(return_value=mock_session)
-        auth_service.user_repository.get_by_id = Mock(return_value=mock_user)
-
-        with patch('app.services.auth_service.verify_token', return_value={"sub": "1"}):
-            result = await auth_service.get_current_user("access_token")
+        result = await auth_service.get_profile(context)
 
+        auth_service.auth_repository.get_session.assert_not_called()
         assert result["id"] == 1
         assert result["email"] == "test@example.com"
         assert result["username"] == "testuser"
         assert result["role"] == "user"
-        assert "session_info" in result
+        assert result["session_info"]["session_id"] == "sid-1"
 
     @pytest.mark.asyncio
-    async def test_get_current_user_blacklisted_token(self, auth_service):
-        """블랙리스트된 토큰으로 현재 사용자 조회 시도 테스트"""
-        auth_service.auth_repository.is_token_blacklisted = AsyncMock(return_value=True)
+    async def test_get_profile_inactive_user(self, auth_service, mock_user):
+        """프로필 조회 중 비활성화된 사용자 테스트"""
+        mock_user.is_active = False
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
+        context = AuthContext(principal=Principal(id=1, is_active=True, role="user"), payload=ACCESS_PAYLOAD)
 
         with pytest.raises(HTTPException) as exc_info:
-            await auth_service.get_current_user("blacklisted_token")
+            await auth_service.get_profile(context)
 
         assert exc_info.value.status_code == 401
-        assert "Token is invalidated" in exc_info.value.detail
+        assert "User not found or inactive" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_validate_token_success(self, auth_service, mock_user):
         """토큰 유효성 검사 성공 테스트"""
-        mock_session = SessionData(
-            user_id=1,
-            access_token="access_token",
-            refresh_token="refresh_token",
-            created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(hours=1)
-        )
-
         auth_service.auth_repository.is_token_blacklisted = AsyncMock(return_value=False)
-        auth_service.auth_repository.get_session_by_token = AsyncMock(return_value=mock_session)
-        auth_service.user_repository.get_by_id = Mock(return_value=mock_user)
+        auth_service.auth_repository.get_session = AsyncMock(return_value=_session())
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
 
-        with patch('app.services.auth_service.verify_token', return_value={"sub": "1"}):
+        with patch('app.services.auth_service.decode_access_token', return_value=(ACCESS_PAYLOAD, False)):
             result = await auth_service.validate_token("valid_token")
 
         assert result is True
@@ -248,11 +278,19 @@ class TestAuthService:
         """토큰 유효성 검사 실패 테스트"""
         auth_service.auth_repository.is_token_blacklisted = AsyncMock(return_value=False)
 
-        with patch('app.services.auth_service.verify_token', side_effect=Exception("Invalid token")):
+        with patch('app.services.auth_service.decode_access_token', side_effect=Exception("Invalid token")):
             result = await auth_service.validate_token("invalid_token")
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_validate_stateless_token_skips_session_store(self, auth_service):
+        """무상태 액세스 토큰은 서명/만료 검증만으로 유효 (Redis/DB 조회 없음)"""
+        with patch('app.services.auth_service.decode_access_token', return_value=(ACCESS_PAYLOAD, True)):
+            assert await auth_service.validate_token("stateless_token") is True
+
+        assert not auth_service.auth_repository.mock_calls
+
     @pytest.mark.asyncio
     async def test_logout_all_sessions(self, auth_service):
         """모든 세션 로그아웃 테스트"""
@@ -266,24 +304,8 @@ class TestAuthService:
     async def test_get_user_sessions(self, auth_service):
         """사용자 세션 목록 조회 테스트"""
         mock_sessions = [
-            SessionData(
-                user_id=1,
-                access_token="token1",
-                refresh_token="refresh1",
-                created_at=datetime.utcnow(),
-                expires_at=datetime.utcnow() + timedelta(hours=1),
-                ip_address="127.0.0.1",
-                user_agent="agent1"
-            ),
-            SessionData(
-                user_id=1,
-                access_token="token2",
-                refresh_token="refresh2",
-                created_at=datetime.utcnow(),
-                expires_at=datetime.utcnow() + timedelta(hours=1),
-                ip_address="192.168.1.1",
-                user_agent="agent2"
-            )
+            _session(session_id="sid-1", ip_address="127.0.0.1", user_agent="agent1"),
+            _session(session_id="sid-2", ip_address="192.168.1.1", user_agent="agent2")
         ]
 
         auth_service.auth_repository.get_user_sessions = AsyncMock(return_value=mock_sessions)
@@ -293,12 +315,13 @@ class TestAuthService:
         assert len(result) == 2
         assert result[0]["ip_address"] == "127.0.0.1"
         assert result[1]["ip_address"] == "192.168.1.1"
+        assert [session["session_id"] for session in result] == ["sid-1", "sid-2"]
 
     @pytest.mark.asyncio
     async def test_change_password_success(self, auth_service, mock_user):
         """비밀번호 변경 성공 테스트"""
-        auth_service.user_repository.get_by_id = Mock(return_value=mock_user)
-        auth_service.user_repository.update = Mock()
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
+        auth_service.user_repository.update = AsyncMock()
         auth_service.auth_repository.invalidate_all_sessions = AsyncMock()
 
         with patch('app.services.auth_service.verify_password', return_value=True), \
@@ -306,13 +329,13 @@ class TestAuthService:
 
             await auth_service.change_password(1, "current_password", "new_password")
 
-        auth_service.user_repository.update.assert_called_once()
+        auth_service.user_repository.update.assert_awaited_once()
         auth_service.auth_repository.invalidate_all_sessions.assert_called_once_with(1)
 
     @pytest.mark.asyncio
     async def test_change_password_wrong_current_password(self, auth_service, mock_user):
         """잘못된 현재 비밀번호로 변경 시도 테스트"""
-        auth_service.user_repository.get_by_id = Mock(return_value=mock_user)
+        auth_service.user_repository.get_by_id = AsyncMock(return_value=mock_user)
 
         with patch('app.services.auth_service.verify_password', return_value=False):
             with pytest.raises(HTTPException) as exc_info:
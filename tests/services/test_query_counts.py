@@ -0,0 +1,168 @@
+import io
+import pytest
+from unittest.mock import patch
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.services.user_service import UserService
+from app.services.group_service import GroupService
+from app.services.album_service import AlbumService
+from app.services.photo_service import PhotoService
+from app.services.face_service import FaceService
+
+
+@pytest.fixture
+def owner(db_session: Session):
+    """커밋된 테스트 사용자"""
+    user = UserService(db_session).create_user(
+        email="owner@example.com",
+        username="owner",
+        password="password123"
+    )
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def photo(db_session: Session, owner):
+    """커밋된 테스트 사진"""
+    service = PhotoService(db_session)
+    photo = service.upload_photo(_image_file(), "photo.jpg", owner.id)
+    db_session.commit()
+    db_session.refresh(photo)
+    return photo
+
+
+def _image_file(color: str = "red") -> io.BytesIO:
+    """테스트용 JPEG 파일"""
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, format="JPEG")
+    buffer.seek(0)
+    return buffer
+
+
+class TestServiceRoundTrips:
+    """서비스 작업별 DB 왕복 횟수 테스트 (저장소는 flush만, 커밋은 요청 경계에서 1회)"""
+
+    def test_create_user(self, db_session: Session, query_counter):
+        """이메일/사용자명 중복 검사 2회 + INSERT ... RETURNING 1회"""
+        UserService(db_session).create_user("new@example.com", "newuser", "password123")
+
+        assert query_counter.count == 3
+        assert query_counter.commits == 0
+
+    def test_create_group(self, db_session: Session, owner, query_counter):
+        """초대 코드 검사 + 그룹 INSERT + member_count 증가 + 관리자 멤버십 INSERT (refresh SELECT 없음)"""
+        group = GroupService(db_session).create_group("Group", owner.id, "class")
+
+        assert group.member_count == 1
+        assert query_counter.count == 4
+        assert not any(s.startswith("SELECT groups.updated_at") for s in query_counter.statements)
+        assert query_counter.commits == 0
+
+    def test_add_member(self, db_session: Session, owner, query_counter):
+        """그룹 조회는 identity map 사용, 멤버십 확인 + 정원 확인/member_count 증가 UPDATE + INSERT"""
+        service = GroupService(db_session)
+        group = service.create_group("Group", owner.id, "class")
+        member = UserService(db_session).create_user("m@example.com", "member", "password123")
+        query_counter.reset()
+
+        assert service.add_member(group.id, member.id) is True
+        assert query_counter.count == 3
+        assert group.member_count == 2
+        assert query_counter.commits == 0
+
+    def test_update_group(self, db_session: Session, owner, query_counter):
+        """UPDATE ... RETURNING updated_at 한 번으로 갱신"""
+        service = GroupService(db_session)
+        group = service.create_group("Group", owner.id, "class")
+        query_counter.reset()
+
+        updated = service.update_group(group.id, {"name": "Renamed"})
+
+        assert updated.updated_at is not None
+        assert query_counter.count == 1
+        assert query_counter.statements[0].startswith("UPDATE groups")
+
+    def test_create_album(self, db_session: Session, owner, query_counter):
+        """앨범 INSERT ... RETURNING 1회"""
+        album = AlbumService(db_session).create_album("Album", owner.id, "personal")
+
+        assert album.created_at is not None
+        assert query_counter.count == 1
+        assert query_counter.commits == 0
+
+    def test_share_album(self, db_session: Session, owner, query_counter):
+        """기존 공유 확인 + INSERT"""
+        service = AlbumService(db_session)
+        album = service.create_album("Album", owner.id, "personal")
+        query_counter.reset()
+
+        service.share_album(album.id, owner.id)
+
+        assert query_counter.count == 2
+        assert query_counter.commits == 0
+
+    def test_upload_photo(self, db_session: Session, owner, query_counter):
+        """해시 중복 검사 + INSERT"""
+        PhotoService(db_session).upload_photo(_image_file(), "a.jpg", owner.id)
+
+        assert query_counter.count == 2
+        assert query_counter.commits == 0
+
+    def test_mark_as_processed(self, db_session: Session, photo, query_counter):
+        """사진 조회 + UPDATE ... RETURNING"""
+        assert PhotoService(db_session).mark_as_processed(photo.id) is True
+
+        assert query_counter.count == 2
+        assert query_counter.commits == 0
+
+    @patch("app.services.face_service.boto3")
+    def test_identify_face(self, mock_boto3, db_session: Session, owner, photo, query_counter):
+        """얼굴 조회 1회 + UPDATE + 사용자 face_count 증가 (중복 조회 없음)"""
+        service = FaceService(db_session)
+        face = service.repository.create_face({
+            "face_id": "face-1",
+            "confidence": 0.9,
+            "bounding_box": {"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2},
+            "photo_id": photo.id
+        })
+        owner_id = owner.id
+        query_counter.reset()
+
+        assert service.identify_face(face.id, owner_id, owner_id) is True
+        assert query_counter.count == 3
+        assert face.identified_at is not None
+        assert query_counter.commits == 0
+
+
+class TestRequestUnitOfWork:
+    """get_db 의존성의 요청 단위 커밋/롤백 테스트"""
+
+    def test_commits_once_on_success(self):
+        """정상 종료 시 한 번만 커밋"""
+        with patch("app.core.database.SessionLocal") as session_factory:
+            db = session_factory.return_value
+            dependency = get_db()
+            assert next(dependency) is db
+            with pytest.raises(StopIteration):
+                next(dependency)
+
+        db.commit.assert_called_once()
+        db.rollback.assert_not_called()
+        db.close.assert_called_once()
+
+    def test_rolls_back_on_error(self):
+        """예외 발생 시 커밋 없이 롤백"""
+        with patch("app.core.database.SessionLocal") as session_factory:
+            db = session_factory.return_value
+            dependency = get_db()
+            next(dependency)
+            with pytest.raises(ValueError):
+                dependency.throw(ValueError("boom"))
+
+        db.commit.assert_not_called()
+        db.rollback.assert_called_once()
+        db.close.assert_called_once()
@@ -0,0 +1,203 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.metrics import metrics
+from app.domain.album import AlbumShare, album_photos
+from app.domain.face import Face, FaceMatch
+from app.domain.photo import Photo, PhotoTag
+from app.domain.user import User
+from app.infra.album_repository import AlbumRepository
+from app.infra.face_repository import FaceRepository
+from app.infra.photo_repository import PhotoRepository
+from app.services.retention_service import RetentionService
+
+LONG_AGO = datetime.now(timezone.utc) - timedelta(days=90)
+
+
+class FakeS3:
+    """delete_objects 호출 기록 (failing에 있는 키는 실패 응답)"""
+
+    def __init__(self, failing=()):
+        self.deleted = []
+        self.failing = set(failing)
+
+    def delete_objects(self, Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        self.deleted.extend((Bucket, key) for key in keys if key not in self.failing)
+        return {"Errors": [
+            {"Key": key, "Code": "AccessDenied", "Message": "Access Denied"} for key in keys if key in self.failing
+        ]}
+
+
+@pytest.fixture
+def owner(db_session: Session):
+    user = User(email="retention@example.com", username="retention", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def _photo(db_session: Session, user_id: int, name: str) -> Photo:
+    return PhotoRepository(db_session).create({
+        "filename": f"{name}.jpg",
+        "original_filename": f"{name}.jpg",
+        "file_path": f"/r/{name}",
+        "file_size": 1,
+        "s3_bucket": "bucket",
+        "s3_key": f"r/{name}",
+        "s3_url": f"https://bucket/r/{name}",
+        "uploaded_by_id": user_id
+    })
+
+
+def _face(db_session: Session, photo_id: int, face_id: str, **kwargs) -> Face:
+    return FaceRepository(db_session).create_face({
+        "face_id": face_id,
+        "confidence": 0.9,
+        "bounding_box": {"left": 0.1, "top": 0.1, "width": 0.2, "height": 0.2},
+        "photo_id": photo_id,
+        **kwargs
+    })
+
+
+def _age(db_session: Session, *models):
+    """소프트 삭제 시각을 보존 기간 이전으로 이동"""
+    for model in models:
+        db_session.execute(update(model).where(model.is_active == False).values(deleted_at=LONG_AGO))
+    db_session.commit()
+
+
+def _count(db_session: Session, table) -> int:
+    return db_session.execute(select(func.count()).select_from(table)).scalar()
+
+
+class TestSoftDeleteTimestamp:
+    """소프트 삭제 시각 기록 테스트"""
+
+    def test_deleted_at_follows_is_active(self, db_session: Session, owner):
+        photo = _photo(db_session, owner.id, "p")
+        assert photo.deleted_at is None
+
+        PhotoRepository(db_session).delete(photo.id)
+        deleted_at = photo.deleted_at
+        assert deleted_at is not None
+
+        photo.is_active = False
+        assert photo.deleted_at is deleted_at
+
+        photo.is_active = True
+        assert photo.deleted_at is None
+
+
+class TestRetentionService:
+    """보존 기간 정리 테스트"""
+
+    def test_purges_photo_with_dependents(self, db_session: Session, owner):
+        """사진과 딸린 매칭/얼굴/태그/앨범 연결을 지우고 저장소 객체 삭제, 카운터 유지"""
+        dead, alive = _photo(db_session, owner.id, "dead"), _photo(db_session, owner.id, "alive")
+        dead_face = _face(db_session, dead.id, "dead-face", identified_user_id=owner.id)
+        alive_face = _face(db_session, alive.id, "alive-face", identified_user_id=owner.id)
+        db_session.add(FaceMatch(face1_id=alive_face.id, face2_id=dead_face.id, similarity=0.9, match_method="manual"))
+        db_session.add(PhotoTag(photo_id=dead.id, tag_name="beach"))
+        albums = AlbumRepository(db_session)
+        album = albums.create({"name": "A", "album_type": "personal", "created_by_id": owner.id})
+        albums.add_photos_to_album(album.id, [dead.id, alive.id])
+        albums.update(album.id, {"cover_photo_id": dead.id})
+        PhotoRepository(db_session).delete(dead.id)
+        _age(db_session, Photo)
+        s3 = FakeS3()
+
+        purged = RetentionService(db_session, s3_client=s3).purge(max_age_days=30, batch_size=1)
+
+        assert purged == {
+            "face_matches": 1, "faces": 1, "photo_tags": 1,
+            "album_photos": 1, "photos": 1, "album_shares": 0,
+        }
+        assert s3.deleted == [("bucket", "r/dead")]
+        db_session.expire_all()
+        assert db_session.get(Photo, alive.id) is not None
+        assert (album.cover_photo_id, album.photo_count, owner.face_count) == (None, 1, 1)
+        assert _count(db_session, album_photos) == 1
+
+    def test_purges_only_expired_rows_in_batches(self, db_session: Session, owner):
+        """보존 기간이 지나지 않은 행은 남기고, 매칭/얼굴/공유는 각각 정리"""
+        photo = _photo(db_session, owner.id, "p")
+        faces = [_face(db_session, photo.id, f"f{i}") for i in range(3)]
+        match = FaceMatch(face1_id=faces[0].id, face2_id=faces[1].id, similarity=0.9, match_method="manual")
+        album = AlbumRepository(db_session).create({"name": "A", "album_type": "personal", "created_by_id": owner.id})
+        share = AlbumShare(album_id=album.id, shared_with_id=owner.id)
+        db_session.add_all([match, share])
+        db_session.flush()
+        match.is_active = False
+        share.is_active = False
+        for face in faces[:2]:
+            FaceRepository(db_session).delete_face(face.id)
+        _age(db_session, FaceMatch, Face, AlbumShare)
+        FaceRepository(db_session).delete_face(faces[2].id)  # 방금 삭제 (보존 기간 이내)
+        db_session.commit()
+        before = metrics.counter("retention.deleted", table="faces")
+
+        purged = RetentionService(db_session).purge(max_age_days=30, batch_size=1)
+
+        assert (purged["face_matches"], purged["faces"], purged["album_shares"]) == (1, 2, 1)
+        assert _count(db_session, Face.__table__) == 1
+        assert metrics.counter("retention.deleted", table="faces") == before + 2
+        assert RetentionService(db_session).purge(max_age_days=30)["faces"] == 0
+
+    def test_storage_failure_keeps_only_failed_photos(self, db_session: Session, owner):
+        """삭제하지 못한 객체의 사진만 남기고 다음 배치와 다음 테이블은 계속 정리"""
+        stuck, gone = _photo(db_session, owner.id, "stuck"), _photo(db_session, owner.id, "gone")
+        album = AlbumRepository(db_session).create({"name": "A", "album_type": "personal", "created_by_id": owner.id})
+        share = AlbumShare(album_id=album.id, shared_with_id=owner.id)
+        db_session.add(share)
+        db_session.flush()
+        share.is_active = False
+        for photo in (stuck, gone):
+            PhotoRepository(db_session).delete(photo.id)
+        _age(db_session, Photo, AlbumShare)
+        stuck_id, gone_id = stuck.id, gone.id
+        s3 = FakeS3(failing={"r/stuck"})
+        before = metrics.counter("retention.storage_errors")
+
+        purged = RetentionService(db_session, s3_client=s3).purge(max_age_days=30, batch_size=1)
+
+        assert (purged["photos"], purged["album_shares"]) == (1, 1)
+        assert s3.deleted == [("bucket", "r/gone")]
+        assert metrics.counter("retention.storage_errors") == before + 1
+        db_session.expire_all()
+        assert db_session.get(Photo, stuck_id) is not None  # 다음 실행에서 다시 시도
+        assert db_session.get(Photo, gone_id) is None
+
+    def test_failed_batch_does_not_stop_purge(self, db_session: Session, owner, monkeypatch):
+        """배치 하나가 실패해도 롤백 후 다음 배치로 넘어감"""
+        photos = [_photo(db_session, owner.id, f"p{i}") for i in range(2)]
+        for photo in photos:
+            PhotoRepository(db_session).delete(photo.id)
+        _age(db_session, Photo)
+        service = RetentionService(db_session)
+        delete_photos = service.repository.delete_photos
+
+        def flaky(photo_ids):
+            if photos[0].id in photo_ids:
+                raise RuntimeError("boom")
+            return delete_photos(photo_ids)
+
+        monkeypatch.setattr(service.repository, "delete_photos", flaky)
+
+        assert service.purge(max_age_days=30, batch_size=1)["photos"] == 1
+        assert _count(db_session, Photo.__table__) == 1
+
+    def test_archive_receives_rows_before_delete(self, db_session: Session, owner):
+        """archive 콜백은 지우기 직전의 행을 테이블별로 받음"""
+        photo = _photo(db_session, owner.id, "p")
+        PhotoRepository(db_session).delete(photo.id)
+        _age(db_session, Photo)
+        archived = {}
+
+        RetentionService(db_session, archive=lambda table, rows: archived.setdefault(table, []).extend(rows)).purge(30)
+
+        assert list(archived) == ["photos"]
+        assert archived["photos"][0]["s3_key"] == "r/p"
@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_passwords, verify_password
+from app.domain.group import GroupMembership
+from app.infra.group_repository import GroupRepository
+from app.infra.user_repository import UserRepository
+from app.services.group_service import GroupService
+from app.services.roster_service import RosterFormatError, RosterService, parse_roster
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def class_group(db_session: Session):
+    teacher = UserService(db_session).create_user(
+        email="teacher@example.com", username="teacher", password="password123"
+    )
+    group = GroupService(db_session).create_group(
+        name="3-1", created_by_id=teacher.id, group_type="class", max_members=5
+    )
+    db_session.commit()
+    return group
+
+
+def _student(i: int, **kwargs) -> dict:
+    return {"email": f"s{i}@example.com", "username": f"s{i}", "password": f"pw-{i}", **kwargs}
+
+
+class TestParseRoster:
+    """명단 파일 파싱 테스트"""
+
+    def test_csv_with_bom_and_blank_optional_fields(self):
+        content = "﻿email,username,password,full_name\ns1@example.com,s1,pw,\n".encode()
+        assert parse_roster(content, "csv", max_rows=10) == [
+            {"email": "s1@example.com", "username": "s1", "password": "pw"}
+        ]
+
+    def test_rejects_malformed_json_and_too_many_rows(self):
+        with pytest.raises(RosterFormatError):
+            parse_roster(b'{"email": "x"}', "json", max_rows=10)
+        with pytest.raises(RosterFormatError):
+            parse_roster(b'[{}, {}]', "json", max_rows=1)
+
+
+class TestRosterService:
+    """명단 일괄 가져오기 테스트"""
+
+    def test_creates_users_and_memberships(self, db_session: Session, class_group):
+        result = RosterService(db_session).import_roster(
+            class_group.id, [_student(1, full_name="Kim"), _student(2, role="admin")], max_workers=1
+        )
+        db_session.commit()
+
+        assert (result.created, result.added, result.skipped, result.errors) == (2, 2, 0, [])
+        student = UserRepository(db_session).get_by_email("s1@example.com")
+        assert student.full_name == "Kim"
+        assert verify_password("pw-1", student.hashed_password)
+        db_session.refresh(class_group)
+        assert class_group.member_count == 3
+        roles = {m.user.username: m.role for m in GroupService(db_session).get_group_members(class_group.id)}
+        assert roles == {"teacher": "admin", "s1": "member", "s2": "admin"}
+
+    def test_reports_row_errors_and_reuses_existing_accounts(self, db_session: Session, class_group):
+        """형식/중복/사용자명 충돌 행은 사유와 함께 건너뛰고, 기존 이메일은 멤버십만 추가"""
+        existing = UserService(db_session).create_user(
+            email="old@example.com", username="old", password="password123"
+        )
+        db_session.commit()
+        rows = [
+            _student(1),
+            {"email": "not-an-email", "username": "x", "password": "pw"},
+            _student(1, username="other"),  # 파일 안 이메일 중복
+            {"email": "new@example.com", "username": "old", "password": "pw"},  # 사용자명 충돌
+            {"email": "old@example.com", "username": "ignored", "password": "ignored"},
+            {"email": "teacher@example.com", "username": "teacher", "password": "x"},  # 이미 멤버
+        ]
+
+        result = RosterService(db_session).import_roster(class_group.id, rows, max_workers=1)
+
+        assert (result.created, result.added, result.skipped) == (1, 2, 1)
+        assert [error.row for error in result.errors] == [2, 3, 4]
+        assert result.errors[0].message.startswith("email: value is not a valid email address")
+        assert [error.message for error in result.errors[1:]] == [
+            "Duplicate email in roster", "Username already taken"
+        ]
+        assert GroupService(db_session).is_member(class_group.id, existing.id)
+
+    def test_capacity_and_rejoin(self, db_session: Session, class_group):
+        """정원을 넘는 행은 Group is full, 탈퇴한 멤버는 재가입"""
+        RosterService(db_session).import_roster(class_group.id, [_student(1)], max_workers=1)
+        student = UserRepository(db_session).get_by_email("s1@example.com")
+        GroupService(db_session).remove_member(class_group.id, student.id)
+
+        result = RosterService(db_session).import_roster(
+            class_group.id, [_student(i) for i in range(1, 7)], max_workers=1
+        )
+
+        assert (result.created, result.added) == (3, 4)
+        assert [(error.row, error.message) for error in result.errors] == [
+            (5, "Group is full"), (6, "Group is full")
+        ]
+        assert GroupRepository(db_session).get_membership_states(class_group.id, [student.id]) == {student.id: True}
+        assert db_session.query(GroupMembership).filter_by(user_id=student.id).count() == 1
+        db_session.refresh(class_group)
+        assert class_group.member_count == 5
+
+    def test_missing_group(self, db_session: Session):
+        assert RosterService(db_session).import_roster(999, [_student(1)]) is None
+
+
+def test_hash_passwords_in_threads():
+    """스레드 병렬 해싱도 입력 순서를 유지"""
+    hashed = hash_passwords(["a", "b", "c"], max_workers=2)
+    assert [verify_password(p, h) for p, h in zip("abc", hashed)] == [True, True, True]